@@ -4,6 +4,10 @@
 # A value of 0 indicates unlimited maximum length
 DEFAULT_MAX_LENGTH = 16382
 
+# The default maximum total size of the P-DATA waiting to be sent to the
+#   peer by an association (in bytes)
+DEFAULT_SEND_BUFFER_SIZE = 4194304
+
 # DICOM Application Context Name - see Part 7, Annex A.2.1
 APPLICATION_CONTEXT_NAME = '1.2.840.10008.3.1.1.1'
 
@@ -3,7 +3,7 @@
 import logging
 
 from pynetdicom import evt
-from pynetdicom._globals import APPLICATION_CONTEXT_NAME
+from pynetdicom._globals import APPLICATION_CONTEXT_NAME, MODE_ACCEPTOR
 from pynetdicom.pdu_primitives import (
     A_ASSOCIATE, A_RELEASE, A_ABORT, A_P_ABORT,
     AsynchronousOperationsWindowNegotiation,
@@ -12,8 +12,9 @@ from pynetdicom.pdu_primitives import (
     UserIdentityNegotiation,
 )
 from pynetdicom.presentation import (
-    negotiate_as_requestor, negotiate_as_acceptor
+    negotiate_as_requestor, NegotiationCache
 )
+from pynetdicom.tracing import traced
 from pynetdicom.utils import pretty_bytes
 
 
@@ -246,6 +247,7 @@ class ACSE(object):
 
         return False
 
+    @traced('ACSE.negotiate_association')
     def negotiate_association(self, assoc):
         """Perform an association negotiation as either the requestor or
         acceptor.
@@ -322,10 +324,8 @@ class ACSE(object):
 
         ## DUL Presentation Related Rejections
         # Maximum number of associations reached (local-limit-exceeded)
-        active_acceptors = [
-            tt for tt in assoc.ae.active_associations if tt.is_acceptor
-        ]
-        if len(active_acceptors) > assoc.ae.maximum_associations:
+        nr_acceptors = assoc.ae.registry.count(mode=MODE_ACCEPTOR)
+        if nr_acceptors > assoc.ae.maximum_associations:
             reject_assoc_rsd = [0x02, 0x03, 0x02]
 
         if reject_assoc_rsd:
@@ -344,13 +344,19 @@ class ACSE(object):
             for uid, item in assoc.requestor.role_selection.items()
         }
 
-        result, ac_roles = negotiate_as_acceptor(
-            assoc_rq.presentation_context_definition_list,
-            assoc.acceptor.supported_contexts,
-            rq_roles
+        # pylint: disable=protected-access
+        # The results for the AE's supported contexts are cached, however
+        #   the association's may have been changed since it was created
+        ac_contexts = assoc.acceptor._get_shared_contexts()
+        cache = assoc.ae._negotiation_cache
+        if cache is None or not cache.is_valid_for(ac_contexts):
+            cache = NegotiationCache(ac_contexts)
+            assoc.ae._negotiation_cache = cache
+
+        result, ac_roles = cache.negotiate(
+            assoc_rq.presentation_context_definition_list, rq_roles
         )
 
-        # pylint: disable=protected-access
         # Accepted contexts are stored as {context ID : context}
         assoc._accepted_cx = {
             cx.context_id:cx for cx in result if cx.result == 0x00
@@ -9,15 +9,20 @@ import threading
 
 from pydicom.uid import UID
 
-from pynetdicom.association import Association
-from pynetdicom.presentation import PresentationContext
+from pynetdicom.association import Association, AssociationRegistry
+from pynetdicom.dimse import MemoryBudget
+from pynetdicom.metrics import MetricsRegistry
+from pynetdicom.pdu import AssociateRQCache
+from pynetdicom.presentation import PresentationContext, _context_signature
 from pynetdicom.transport import (
-    AssociationSocket, AssociationServer, ThreadedAssociationServer
+    AdmissionControl, AssociationSocket, AssociationServer,
+    ThreadedAssociationServer
 )
 from pynetdicom.utils import validate_ae_title
 from pynetdicom._globals import (
     MODE_REQUESTOR,
     DEFAULT_MAX_LENGTH,
+    DEFAULT_SEND_BUFFER_SIZE,
     DEFAULT_TRANSFER_SYNTAXES
 )
 
@@ -36,11 +41,35 @@ class ApplicationEntity(object):
     acse_timeout : int or float or None
         The maximum amount of time (in seconds) to wait for association related
         messages. A value of ``None`` means no timeout. (default: 30)
+    admission_queue_size : int
+        The maximum number of association requests that may be waiting to be
+        admitted (default 10). (Association acceptor only).
+    admission_timeout : int or float or None
+        The maximum amount of time (in seconds) that association requests
+        may wait to be admitted when accepting them would exceed the
+        association limits, after which they're rejected. A value of ``None``
+        means requests are rejected immediately (default). (Association
+        acceptor only).
     ae_title : bytes
         The local AE's AE title.
+    capability_cache : presentation.PeerCapabilityCache or None
+        If a ``PeerCapabilityCache`` then the presentation contexts accepted
+        and rejected by peers will be recorded and later requests to the same
+        peer will skip the transfer syntaxes it's known to reject and
+        propose those it's known to accept first. If ``None`` (default)
+        then all the requested contexts are always proposed. (Association
+        requestor only).
     dimse_timeout : int or float or None
         The maximum amount of time (in seconds) to wait for DIMSE related
         messages. A value of ``None`` means no timeout. (default: 30)
+    event_dispatcher : events.EventDispatcher or None
+        If an ``EventDispatcher`` then the handlers bound to notification
+        events will be called from the dispatcher's worker threads rather
+        than the thread that triggered the event. If ``None`` (default) then
+        handlers are called synchronously.
+    metrics : metrics.MetricsRegistry
+        The AE's runtime metrics, recording is disabled by default and may be
+        enabled with ``AE.metrics.enabled = True``.
     network_timeout : int or float or None
         The maximum amount of time (in seconds) to wait for network messages.
         A value of ``None`` means no timeout. (default: 60)
@@ -48,9 +77,36 @@ class ApplicationEntity(object):
         The maximum number of simultaneous associations requested by remote
         AEs. Note that this does not include the number of associations
         requested by the local AE (default 10).
+    maximum_associations_per_ae : int or None
+        The maximum number of simultaneous associations requested by remote
+        AEs with the same *Calling AE Title*. A value of ``None`` means no
+        limit (default).
     maximum_pdu_size : int
         The maximum PDU receive size in bytes. A value of 0 means there is no
         maximum size (default: 16382)
+    memory_budget : dimse.MemoryBudget
+        The byte budget for the DIMSE data in-flight across all the AE's
+        associations, which are the received messages until they've been
+        processed and the P-DATA waiting to be sent. Set
+        ``AE.memory_budget.maxbytes`` to limit the budget, its ``nr_bytes``
+        and ``high_water`` attributes give the current and peak usage.
+        Unlimited by default.
+    priority_ae_titles : list of bytes
+        The *Calling AE Title* values of association requests that may use
+        the ``reserved_associations`` (default an empty list). (Association
+        acceptor only).
+    receive_buffer_messages : int or None
+        The maximum number of received DIMSE messages waiting to be
+        processed by each association before it stops reading from the peer.
+        A value of ``None`` means no limit (default: ``None``).
+    receive_buffer_size : int or None
+        The maximum total size in bytes of the received DIMSE message
+        datasets waiting to be processed by each association before it
+        stops reading from the peer. A value of ``None`` means no limit
+        (default: ``None``).
+    registry : association.AssociationRegistry
+        The AE's running associations, which may be used to count them by
+        mode, peer address or server.
     require_calling_aet : list of bytes
         If not an empty list, the association request's *Calling AE Title*
         value must match one of the values in `require_calling_aet`. If an
@@ -59,6 +115,20 @@ class ApplicationEntity(object):
     require_called_aet : bool
         If True, the association request's *Called AE Title* value
         must match AE.ae_title (default False). (Association acceptor only).
+    reserved_associations : int
+        The number of the ``maximum_associations`` that may only be used by
+        requests from the ``priority_ae_titles`` (default 0). (Association
+        acceptor only).
+    send_buffer_size : int or None
+        The maximum total size in bytes of the P-DATA waiting to be sent
+        to the peer by each association. Sending a DIMSE message blocks while
+        the limit would be exceeded. A value of ``None`` means no limit
+        (default: 4194304).
+    tracer : tracing.Tracer or None
+        If a ``Tracer`` then spans will be recorded for association
+        negotiation, DIMSE operations, dataset encoding and decoding and
+        service class handling. If ``None`` (default) then no spans are
+        recorded.
     """
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(self, ae_title=b'PYNETDICOM'):
@@ -84,13 +154,44 @@ class ApplicationEntity(object):
         self._requested_contexts = []
         # {abstract_syntax : PresentationContext}
         self._supported_contexts = {}
+        # Cached acceptor presentation context negotiation, reset whenever
+        #   the supported contexts change
+        self._negotiation_cache = None
+        # (signature, copy) of the supported contexts shared by acceptors
+        self._supported_snapshot = None
+        # Encoded A-ASSOCIATE-RQ PDUs sent as the association requestor
+        self._associate_rq_cache = AssociateRQCache()
+        # The resolved address of the local host, see _get_local_address()
+        self._local_address = None
+        # The presentation contexts accepted and rejected by peers
+        self.capability_cache = None
+
+        # The running associations
+        self.registry = AssociationRegistry()
 
         # Default maximum simultaneous associations
         self.maximum_associations = 10
+        self.maximum_associations_per_ae = None
+        # Admission control for association requests
+        self._admission = AdmissionControl(self)
+        self.admission_queue_size = 10
+        self.admission_timeout = None
+        self.priority_ae_titles = []
+        self.reserved_associations = 0
 
         # Default maximum PDU receive size (in bytes)
         self.maximum_pdu_size = DEFAULT_MAX_LENGTH
 
+        # Default maximum size of the queued outgoing P-DATA (in bytes)
+        self.send_buffer_size = DEFAULT_SEND_BUFFER_SIZE
+
+        # The in-flight DIMSE data of all associations, unlimited by default
+        self.memory_budget = MemoryBudget()
+
+        # Default limits on the received messages waiting to be processed
+        self.receive_buffer_messages = None
+        self.receive_buffer_size = None
+
         # Default timeouts - None means no timeout
         self.acse_timeout = 30
         self.dimse_timeout = 30
@@ -100,6 +201,15 @@ class ApplicationEntity(object):
         self.require_calling_aet = []
         self.require_called_aet = False
 
+        # Off-thread delivery of notification events, None for synchronous
+        self.event_dispatcher = None
+
+        # Runtime metrics, disabled by default
+        self.metrics = MetricsRegistry(self)
+
+        # Tracing of operations, None to disable
+        self.tracer = None
+
         self._servers = []
 
     @property
@@ -130,12 +240,11 @@ class ApplicationEntity(object):
         -------
         list of association.Association
             A list of all active association threads, both requestors and
-            acceptors.
+            acceptors. Acceptors run by a server's worker threads are
+            included, they aren't started as threads but their
+            ``is_alive()`` and ``join()`` reflect the worker running them.
         """
-        threads = threading.enumerate()
-        t_assocs = [tt for tt in threads if isinstance(tt, Association)]
-
-        return [tt for tt in t_assocs if tt.ae == self]
+        return self.registry.associations()
 
     def add_requested_context(self, abstract_syntax, transfer_syntax=None):
         """Add a presentation context to be proposed when requesting an
@@ -391,6 +500,8 @@ class ApplicationEntity(object):
             transfer_syntax = [transfer_syntax]
         transfer_syntax = [UID(syntax) for syntax in transfer_syntax]
 
+        self._negotiation_cache = None
+
         # If the abstract syntax is already supported then update the transfer
         #   syntaxes
         if abstract_syntax in self._supported_contexts:
@@ -408,6 +519,44 @@ class ApplicationEntity(object):
 
             self._supported_contexts[abstract_syntax] = context
 
+    @property
+    def admission_queue_size(self):
+        """Return the maximum number of association requests waiting to be
+        admitted.
+        """
+        return self._admission_queue_size
+
+    @admission_queue_size.setter
+    def admission_queue_size(self, value):
+        """Set the maximum number of association requests waiting to be
+        admitted.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if isinstance(value, int) and value >= 0:
+            self._admission_queue_size = value
+        else:
+            LOGGER.warning("admission_queue_size set to 10")
+            self._admission_queue_size = 10
+
+    @property
+    def admission_timeout(self):
+        """Return the time association requests may wait to be admitted."""
+        return self._admission_timeout
+
+    @admission_timeout.setter
+    def admission_timeout(self, value):
+        """Set the time (in seconds) association requests may wait to be
+        admitted.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if value is None:
+            self._admission_timeout = None
+        elif isinstance(value, (int, float)) and value >= 0:
+            self._admission_timeout = value
+        else:
+            LOGGER.warning("admission_timeout set to None")
+            self._admission_timeout = None
+
     @property
     def ae_title(self):
         """Return the AE title as length 16 ``bytes``."""
@@ -509,7 +658,7 @@ class ApplicationEntity(object):
         assoc.acceptor.port = port
 
         # Association Requestor object -> local AE
-        assoc.requestor.address = socket.gethostbyname(socket.gethostname())
+        assoc.requestor.address = self._get_local_address()
         assoc.requestor.port = bind_address[1]
         assoc.requestor.ae_title = self.ae_title
         assoc.requestor.maximum_length = max_pdu
@@ -536,6 +685,13 @@ class ApplicationEntity(object):
                 "before associating with a peer"
             )
 
+        # Only propose what the peer is known to support
+        cache = self.capability_cache
+        if cache is not None:
+            contexts = cache.filter_contexts(
+                addr, port, assoc.acceptor.ae_title, contexts
+            )
+
         # Set using a copy of the original to play nicely
         contexts = deepcopy(contexts)
 
@@ -553,6 +709,11 @@ class ApplicationEntity(object):
         # Send an A-ASSOCIATE request to the peer and start negotiation
         assoc.request()
 
+        # Record the negotiated contexts, if any
+        if cache is not None:
+            if assoc.accepted_contexts or assoc.rejected_contexts:
+                cache.update(assoc)
+
         # If the result of the negotiation was acceptance then start up
         #   the Association thread
         if assoc.is_established:
@@ -631,6 +792,21 @@ class ApplicationEntity(object):
             LOGGER.warning("maximum_associations set to 1")
             self._maximum_associations = 1
 
+    @property
+    def maximum_associations_per_ae(self):
+        """Return the maximum number of associations per calling AE title."""
+        return self._maximum_associations_per_ae
+
+    @maximum_associations_per_ae.setter
+    def maximum_associations_per_ae(self, value):
+        """Set the maximum number of associations per calling AE title."""
+        # pylint: disable=attribute-defined-outside-init
+        if value is None or (isinstance(value, int) and value >= 1):
+            self._maximum_associations_per_ae = value
+        else:
+            LOGGER.warning("maximum_associations_per_ae set to None")
+            self._maximum_associations_per_ae = None
+
     @property
     def maximum_pdu_size(self):
         """Return the maximum PDU size accepted by the AE as int."""
@@ -671,6 +847,68 @@ class ApplicationEntity(object):
         for assoc in self.active_associations:
             assoc.network_timeout = self.network_timeout
 
+    @property
+    def priority_ae_titles(self):
+        """Return the AE titles that may use the reserved associations."""
+        return self._priority_ae_titles
+
+    @priority_ae_titles.setter
+    def priority_ae_titles(self, ae_titles):
+        """Set the AE titles that may use the reserved associations.
+
+        Parameters
+        ----------
+        ae_titles : list of bytes
+            The *Calling AE Title* values of the association requests that
+            may be admitted using the ``reserved_associations``.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self._priority_ae_titles = [
+            validate_ae_title(aet) for aet in ae_titles
+        ]
+        # Used by the admission control
+        self._priority_titles = set(
+            [aet.strip() for aet in self._priority_ae_titles]
+        )
+
+    @property
+    def receive_buffer_messages(self):
+        """Return the maximum number of queued received DIMSE messages."""
+        return self._receive_buffer_messages
+
+    @receive_buffer_messages.setter
+    def receive_buffer_messages(self, value):
+        """Set the maximum number of queued received DIMSE messages."""
+        # pylint: disable=attribute-defined-outside-init
+        if value is None or (isinstance(value, int) and value > 0):
+            self._receive_buffer_messages = value
+        else:
+            LOGGER.warning("receive_buffer_messages set to None")
+            self._receive_buffer_messages = None
+
+        for assoc in self.active_associations:
+            assoc.receive_buffer_messages = self.receive_buffer_messages
+
+    @property
+    def receive_buffer_size(self):
+        """Return the maximum size of the queued received DIMSE datasets."""
+        return self._receive_buffer_size
+
+    @receive_buffer_size.setter
+    def receive_buffer_size(self, value):
+        """Set the maximum size of the queued received DIMSE datasets (in
+        bytes).
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if value is None or (isinstance(value, int) and value > 0):
+            self._receive_buffer_size = value
+        else:
+            LOGGER.warning("receive_buffer_size set to None")
+            self._receive_buffer_size = None
+
+        for assoc in self.active_associations:
+            assoc.receive_buffer_size = self.receive_buffer_size
+
     def remove_requested_context(self, abstract_syntax, transfer_syntax=None):
         """Remove a requested presentation context.
 
@@ -903,6 +1141,8 @@ class ApplicationEntity(object):
         if isinstance(transfer_syntax, str):
             transfer_syntax = [transfer_syntax]
 
+        self._negotiation_cache = None
+
         # Check abstract syntax is actually present
         #   we don't warn if not present because by not being present its not
         #   supported and hence the user's intent has been satisfied
@@ -1041,8 +1281,47 @@ class ApplicationEntity(object):
             validate_ae_title(aet) for aet in ae_titles
         ]
 
+    @property
+    def reserved_associations(self):
+        """Return the number of associations reserved for priority AEs."""
+        return self._reserved_associations
+
+    @reserved_associations.setter
+    def reserved_associations(self, value):
+        """Set the number of associations reserved for priority AEs."""
+        # pylint: disable=attribute-defined-outside-init
+        if isinstance(value, int) and value >= 0:
+            self._reserved_associations = value
+        else:
+            LOGGER.warning("reserved_associations set to 0")
+            self._reserved_associations = 0
+
+    @property
+    def send_buffer_size(self):
+        """Return the maximum size of the queued outgoing P-DATA."""
+        return self._send_buffer_size
+
+    @send_buffer_size.setter
+    def send_buffer_size(self, value):
+        """Set the maximum size of the queued outgoing P-DATA (in bytes)."""
+        # pylint: disable=attribute-defined-outside-init
+        if value is None:
+            self._send_buffer_size = None
+        elif isinstance(value, int) and value > 0:
+            self._send_buffer_size = value
+        else:
+            LOGGER.warning(
+                "send_buffer_size set to {}".format(DEFAULT_SEND_BUFFER_SIZE)
+            )
+            self._send_buffer_size = DEFAULT_SEND_BUFFER_SIZE
+
+        for assoc in self.active_associations:
+            assoc.send_buffer_size = self.send_buffer_size
+
     def start_server(self, address, block=True, ssl_context=None,
-                     evt_handlers=None):
+                     evt_handlers=None, request_queue_size=None,
+                     thread_stack_size=None, worker_threads=None,
+                     worker_queue_size=10):
         """Start the AE as an association acceptor.
 
         If set to non-blocking then a running ``ThreadedAssociationServer``
@@ -1067,6 +1346,27 @@ class ApplicationEntity(object):
             parameter and may return or yield objects depending on the exact
             event that the handler is bound to. For more information see the
             :ref:`documentation<user_events>`.
+        request_queue_size : int, optional
+            The maximum number of connections waiting to be accepted that will
+            be queued by the OS, if not used then defaults to ``5``. Increase
+            this if bursts of association requests are expected, the OS may
+            cap it to a lower value (``somaxconn`` on Linux).
+        thread_stack_size : int, optional
+            The stack size (in bytes) to use for the threads started for the
+            server's associations, must be at least 32 KiB. If not used then
+            the default stack size will be used. Reducing it lowers the memory
+            used by each association, but too small a value may cause a crash.
+        worker_threads : int, optional
+            Non-blocking servers only. If used then connection requests will
+            be processed by a fixed pool of `worker_threads` reusable threads,
+            which are started with the server. Each worker runs one
+            association at a time, so this also limits the number of
+            concurrent associations. If not used then a new thread will be
+            started for each request (default).
+        worker_queue_size : int, optional
+            Non-blocking servers only. The maximum number of connection
+            requests waiting for a free worker thread when `worker_threads` is
+            used (default ``10``), further requests will be rejected.
 
         Returns
         -------
@@ -1100,7 +1400,9 @@ class ApplicationEntity(object):
         if block:
             # Blocking server
             server = AssociationServer(
-                self, address, ssl_context, evt_handlers=evt_handlers
+                self, address, ssl_context, evt_handlers=evt_handlers,
+                request_queue_size=request_queue_size,
+                thread_stack_size=thread_stack_size
             )
             self._servers.append(server)
 
@@ -1113,7 +1415,11 @@ class ApplicationEntity(object):
             # Non-blocking server
             timestamp = datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
             server = ThreadedAssociationServer(
-                self, address, ssl_context, evt_handlers=evt_handlers
+                self, address, ssl_context, evt_handlers=evt_handlers,
+                request_queue_size=request_queue_size,
+                thread_stack_size=thread_stack_size,
+                worker_threads=worker_threads,
+                worker_queue_size=worker_queue_size
             )
 
             thread = threading.Thread(
@@ -1193,6 +1499,43 @@ class ApplicationEntity(object):
 
         return str_out
 
+    def _get_local_address(self):
+        """Return the IPv4 address of the local host.
+
+        The address is only resolved the first time it's required as the
+        lookup may take a significant amount of time on some systems.
+
+        Returns
+        -------
+        str
+            The IPv4 address of the local host.
+        """
+        if self._local_address is None:
+            self._local_address = socket.gethostbyname(socket.gethostname())
+
+        return self._local_address
+
+    def _get_supported_snapshot(self):
+        """Return a copy of the supported presentation contexts to be shared
+        by association acceptors.
+
+        The copy is only remade when the supported contexts have changed, the
+        acceptors must make their own copy before modifying it.
+
+        Returns
+        -------
+        list of presentation.PresentationContext
+            The shared copy of the supported presentation contexts.
+        """
+        contexts = self.supported_contexts
+        signature = _context_signature(contexts)
+        snapshot = self._supported_snapshot
+        if snapshot is None or snapshot[0] != signature:
+            snapshot = (signature, deepcopy(contexts))
+            self._supported_snapshot = snapshot
+
+        return snapshot[1]
+
     @property
     def supported_contexts(self):
         """Return a list of the supported ``PresentationContexts`` items.
@@ -1246,6 +1589,7 @@ class ApplicationEntity(object):
         """
         if not contexts:
             self._supported_contexts = {}
+            self._negotiation_cache = None
 
         for item in contexts:
             if not isinstance(item, PresentationContext):
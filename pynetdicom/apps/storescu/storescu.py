@@ -12,14 +12,26 @@ from logging.config import fileConfig
 import os
 import socket
 import sys
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2 compatibility
 
 from pydicom import dcmread
+from pydicom.dataset import Dataset
 from pydicom.uid import (
-    ExplicitVRLittleEndian, ImplicitVRLittleEndian,
-    ExplicitVRBigEndian, DeflatedExplicitVRLittleEndian
+    ExplicitVRLittleEndian, ImplicitVRLittleEndian, ExplicitVRBigEndian
 )
 
-from pynetdicom import AE, StoragePresentationContexts
+from pynetdicom import AE
+from pynetdicom.presentation import PeerCapabilityCache
+from pynetdicom.storeutils import (
+    FileQueue, Journal, STORED_STATUSES, get_files, plan_associations,
+    scan_files
+)
 
 
 VERSION = '0.2.1'
@@ -35,7 +47,7 @@ def _setup_argparser():
                     "Storage Service Class Provider (SCP) and waits for a "
                     "response. The application can be used to transmit DICOM "
                     "images and other composite objectes.",
-        usage="storescu [options] peer port dcmfile-in")
+        usage="storescu [options] peer port dcmfile-in [dcmfile-in...]")
 
     # Parameters
     req_opts = parser.add_argument_group('Parameters')
@@ -44,7 +56,8 @@ def _setup_argparser():
     req_opts.add_argument("dcmfile_in",
                           metavar="dcmfile-in",
                           help="DICOM file or directory to be transmitted",
-                          type=str)
+                          type=str,
+                          nargs='+')
 
     # General Options
     gen_opts = parser.add_argument_group('General Options')
@@ -70,6 +83,29 @@ def _setup_argparser():
                           help="use config file f for the logger",
                           type=str)
 
+    # Input Options
+    in_opts = parser.add_argument_group('Input Options')
+    in_opts.add_argument("-r", "--recurse",
+                         help="recurse into sub-directories of any "
+                              "directories",
+                         action="store_true")
+
+    in_opts.add_argument("--prefetch", metavar='[n]umber',
+                         help="read up to n files ahead of the file being "
+                              "sent (default: 4)",
+                         type=int,
+                         default=4)
+    in_opts.add_argument("--journal", metavar='[f]ilename',
+                         help="record the files stored by the peer in file "
+                              "f and skip any already recorded",
+                         type=str)
+
+    # Output Options
+    out_opts = parser.add_argument_group('Output Options')
+    out_opts.add_argument("--progress", metavar='[s]econds',
+                          help="print the throughput and ETA every s seconds",
+                          type=float)
+
     # Network Options
     net_opts = parser.add_argument_group('Network Options')
     net_opts.add_argument("-aet", "--calling-aet", metavar='[a]etitle',
@@ -80,6 +116,11 @@ def _setup_argparser():
                           help="set called AE title of peer (default: ANY-SCP)",
                           type=str,
                           default='ANY-SCP')
+    net_opts.add_argument("-n", "--associations", metavar='[n]umber',
+                          help="send using n concurrent associations "
+                               "(default: 1)",
+                          type=int,
+                          default=1)
 
     # Transfer Syntaxes
     ts_opts = parser.add_mutually_exclusive_group()
@@ -93,6 +134,14 @@ def _setup_argparser():
                          help="request implicit VR little endian TS only",
                          action="store_true")
 
+    # Association Negotiation
+    neg_opts = parser.add_argument_group('Association Negotiation')
+    neg_opts.add_argument("--capability-cache", metavar='[f]ilename',
+                          help="record the presentation contexts accepted "
+                               "by the peer in file f and only propose "
+                               "those to the peer",
+                          type=str)
+
     return parser.parse_args()
 
 args = _setup_argparser()
@@ -146,22 +195,231 @@ if args.log_config:
 APP_LOGGER.debug('storescu.py v{0!s}'.format(VERSION))
 APP_LOGGER.debug('')
 
-# Check file exists and is readable and DICOM
+class Progress(object):
+    """Track and report the number of files and bytes sent."""
+    def __init__(self, nr_files, nr_bytes, interval=None):
+        """Create a new Progress.
+
+        Parameters
+        ----------
+        nr_files : int
+            The total number of files to send.
+        nr_bytes : int
+            The total size of the files to send, in bytes.
+        interval : float, optional
+            If used then report the progress to stderr every `interval`
+            seconds.
+        """
+        self.nr_files = nr_files
+        self.nr_bytes = nr_bytes
+        self.interval = interval
+        self.files = 0
+        self.failed = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._stop = threading.Event()
+
+    def update(self, nr_bytes, stored=True):
+        """Record that a file of `nr_bytes` has been sent or failed."""
+        with self._lock:
+            self.files += 1
+            self.bytes += nr_bytes
+            if not stored:
+                self.failed += 1
+
+    def report(self):
+        """Return the current progress as a str."""
+        with self._lock:
+            files, failed, nr_bytes = self.files, self.failed, self.bytes
+
+        elapsed = max(time.time() - self._start, 1e-6)
+        rate = nr_bytes / elapsed
+        eta = '--:--:--'
+        if nr_bytes:
+            seconds = int((self.nr_bytes - nr_bytes) / rate)
+            eta = '{0:d}:{1:02d}:{2:02d}'.format(
+                seconds // 3600, seconds % 3600 // 60, seconds % 60
+            )
+
+        return (
+            'Sent {0:d}/{1:d} files ({2:d} failed), {3:.1f} MB/s, '
+            '{4:.1f} files/s, ETA {5!s}'.format(
+                files, self.nr_files, failed, rate / 1e6, files / elapsed, eta
+            )
+        )
+
+    def start(self):
+        """Start reporting the progress, if an interval has been set."""
+        if not self.interval:
+            return
+
+        def _run():
+            while not self._stop.wait(self.interval):
+                sys.stderr.write(self.report() + '\n')
+
+        thread = threading.Thread(target=_run, name='storescu-progress')
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        """Stop reporting the progress and write the final report."""
+        self._stop.set()
+        if self.interval:
+            sys.stderr.write(self.report() + '\n')
+
+
+def read_files(work, prefetched, rejected, stop):
+    """Read the files from `work` ahead of them being sent.
+
+    Parameters
+    ----------
+    work : storeutils.FileQueue
+        The (SOP Class UID, Transfer Syntax UID) and path of the files to be
+        read, shared between the readers.
+    prefetched : queue.Queue
+        The bounded queue to put the (key, path, dataset) of each file on,
+        the dataset is None if the file couldn't be read. None is put on
+        the queue once there are no more files.
+    rejected : set
+        The groups that can't be sent, files in these groups aren't read.
+    stop : threading.Event
+        If set then stop reading.
+    """
+    while True:
+        # Waits while other associations still have files outstanding, in
+        #   case they're aborted and put them back
+        item = work.get(stop)
+        if item is None:
+            break
+
+        key, fpath = item
+        ds = None
+        if key not in rejected:
+            try:
+                ds = dcmread(fpath, force=True)
+                if 'TransferSyntaxUID' not in getattr(ds, 'file_meta', []):
+                    ds.file_meta = getattr(ds, 'file_meta', Dataset())
+                    ds.file_meta.TransferSyntaxUID = key[1]
+            except Exception as exc:
+                APP_LOGGER.error('Cannot read input file {0!s}'.format(fpath))
+                APP_LOGGER.debug('{0!s}'.format(exc))
+
+        prefetched.put((key, fpath, ds))
+
+    prefetched.put(None)
+
+
+def send_files(ae, contexts, work, rejected, progress, journal=None):
+    """Associate with the peer and send files from `work` until it's empty.
+
+    Parameters
+    ----------
+    ae : ae.ApplicationEntity
+        The local AE.
+    contexts : list of PresentationContext
+        The presentation contexts to request.
+    work : storeutils.FileQueue
+        The (SOP Class UID, Transfer Syntax UID) and path of the files to be
+        sent, shared between the associations.
+    rejected : set
+        The groups with no accepted presentation context, shared between the
+        associations.
+    progress : Progress
+        Used to record the files that have been sent.
+    journal : Journal, optional
+        If used then the files that have been stored are recorded in it.
+    """
+    assoc = ae.associate(
+        args.peer, args.port, contexts=contexts, ae_title=args.called_aet
+    )
+    if not assoc.is_established:
+        APP_LOGGER.error('Association not established')
+        return
+
+    # Read the upcoming files while the current one is being sent
+    prefetched = queue.Queue(maxsize=max(args.prefetch, 1))
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=read_files, args=(work, prefetched, rejected, stop)
+    )
+    reader.daemon = True
+    reader.start()
+
+    while True:
+        item = prefetched.get()
+        if item is None:
+            break
+
+        key, fpath, ds = item
+        if stop.is_set():
+            # Return the files to the queue so another association can send
+            work.put_back((key, fpath))
+            continue
+
+        size = os.path.getsize(fpath)
+        if ds is None:
+            progress.update(size, stored=False)
+            work.done()
+            continue
+
+        APP_LOGGER.info('Sending file: {0!s}'.format(fpath))
+        try:
+            status = assoc.send_c_store(ds)
+        except ValueError as exc:
+            # No accepted presentation context for the group
+            if key not in rejected:
+                rejected.add(key)
+                APP_LOGGER.error('Unable to send files: {0!s}'.format(exc))
+
+            progress.update(size, stored=False)
+            work.done()
+            continue
+
+        if not assoc.is_established:
+            APP_LOGGER.error('The association was aborted')
+            stop.set()
+            work.put_back((key, fpath))
+            continue
+
+        stored = bool(status) and status.Status in STORED_STATUSES
+        if status and not stored:
+            APP_LOGGER.error(
+                'Store failed for {0!s} with status 0x{1:04X}'
+                .format(fpath, status.Status)
+            )
+
+        if stored and journal:
+            journal.add(fpath)
+
+        progress.update(size, stored)
+        work.done()
+
+    reader.join()
+    if assoc.is_established:
+        assoc.release()
+
+
+# Get the files to send and group them by SOP Class and Transfer Syntax
 APP_LOGGER.debug('Checking input files')
-try:
-    f = open(args.dcmfile_in, 'rb')
-    dataset = dcmread(f, force=True)
-    f.close()
-except IOError:
-    APP_LOGGER.error('Cannot read input file {0!s}'.format(args.dcmfile_in))
+fpaths = get_files(args.dcmfile_in, args.recurse)
+
+journal = None
+if args.journal:
+    journal = Journal(args.journal)
+    nr_files = len(fpaths)
+    fpaths = journal.filter(fpaths)
+    APP_LOGGER.debug(
+        'Skipping {0:d} files already stored'.format(nr_files - len(fpaths))
+    )
+
+groups = scan_files(fpaths)
+if not groups:
+    APP_LOGGER.error('No files to send')
     sys.exit()
 
 # Set Transfer Syntax options
-transfer_syntax = [ExplicitVRLittleEndian,
-                   ImplicitVRLittleEndian,
-                   DeflatedExplicitVRLittleEndian,
-                   ExplicitVRBigEndian]
-
+transfer_syntax = None
 if args.request_little:
     transfer_syntax = [ExplicitVRLittleEndian]
 elif args.request_big:
@@ -172,15 +430,53 @@ elif args.request_implicit:
 # Bind to port 0, OS will pick an available port
 ae = AE(ae_title=args.calling_aet)
 
-for context in StoragePresentationContexts:
-    ae.add_requested_context(context.abstract_syntax, transfer_syntax)
+if args.capability_cache:
+    ae.capability_cache = PeerCapabilityCache(args.capability_cache)
 
-# Request association with remote
-assoc = ae.associate(args.peer, args.port, ae_title=args.called_aet)
-
-if assoc.is_established:
-    APP_LOGGER.info('Sending file: {0!s}'.format(args.dcmfile_in))
+plan = plan_associations(groups, transfer_syntax)
+nr_files = sum([len(fpaths) for fpaths in groups.values()])
+APP_LOGGER.debug(
+    'Sending {0:d} files in {1:d} groups using {2:d} set(s) of up to {3:d} '
+    'concurrent associations'
+    .format(nr_files, len(groups), len(plan), args.associations)
+)
 
-    status = assoc.send_c_store(dataset)
+progress = Progress(
+    nr_files,
+    sum([os.path.getsize(fpath) for fpaths in groups.values()
+         for fpath in fpaths]),
+    args.progress
+)
+progress.start()
 
-    assoc.release()
+rejected = set()
+try:
+    for contexts, keys in plan:
+        work = FileQueue(
+            [(key, fpath) for key in keys for fpath in groups[key]]
+        )
+
+        # Send using concurrent associations
+        threads = []
+        for ii in range(min(args.associations, len(work))):
+            thread = threading.Thread(
+                target=send_files,
+                args=(ae, contexts, work, rejected, progress, journal)
+            )
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        # Join with a timeout so KeyboardInterrupt is raised
+        while any([thread.is_alive() for thread in threads]):
+            for thread in threads:
+                thread.join(0.5)
+
+        if len(work):
+            APP_LOGGER.error(
+                'Unable to send {0:d} files'.format(len(work))
+            )
+finally:
+    progress.stop()
+    if journal:
+        journal.close()
@@ -1,19 +1,25 @@
 """
 Defines the Association class which handles associating with peers.
 """
+from collections import OrderedDict
+from copy import deepcopy
 import gc
 from io import BytesIO
 import logging
 import threading
-import time
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2 compatibility
 
+from pydicom import dcmread
 from pydicom.dataset import Dataset
 from pydicom.uid import UID
 
 # pylint: disable=no-name-in-module
 from pynetdicom.acse import ACSE
 from pynetdicom import _config, evt
-from pynetdicom.dimse import DIMSEServiceProvider
+from pynetdicom.dimse import DIMSEServiceProvider, _BudgetAccount
 from pynetdicom.dimse_primitives import (
     C_ECHO, C_MOVE, C_STORE, C_GET, C_FIND, C_CANCEL,
     N_EVENT_REPORT, N_GET, N_SET, N_CREATE, N_ACTION, N_DELETE
@@ -71,6 +77,8 @@ from pynetdicom.sop_class import (
     ProtocolApprovalInformationModelGet,
     ProtocolApprovalInformationModelMove,
 )
+from pynetdicom.tracing import start_span, traced
+from pynetdicom.transport import _thread_stack_size
 from pynetdicom.pdu_primitives import (
     UserIdentityNegotiation,
     MaximumLengthNotification,
@@ -80,6 +88,7 @@ from pynetdicom.pdu_primitives import (
     SOPClassExtendedNegotiation,
     SOPClassCommonExtendedNegotiation,
     SCP_SCU_RoleSelectionNegotiation,
+    UserInformationList,
 )
 from pynetdicom.status import code_to_category, STORAGE_SERVICE_CLASS_STATUS
 
@@ -88,6 +97,41 @@ from pynetdicom.status import code_to_category, STORAGE_SERVICE_CLASS_STATUS
 LOGGER = logging.getLogger('pynetdicom.assoc')
 
 
+def _conversion_cost(original, target):
+    """Return the relative cost of converting between transfer syntaxes.
+
+    Parameters
+    ----------
+    original : pydicom.uid.UID
+        The transfer syntax of the dataset to be sent.
+    target : pydicom.uid.UID
+        The transfer syntax of the presentation context.
+
+    Returns
+    -------
+    int or None
+        ``0`` if no conversion is needed, ``1`` if only the VR encoding
+        differs, ``2`` if the byte ordering also differs or ``None`` if the
+        dataset can't be converted because one of the transfer syntaxes is
+        compressed or unknown.
+    """
+    if original == target:
+        return 0
+
+    try:
+        # Compressed transfer syntaxes are not convertable
+        if original.is_compressed or target.is_compressed:
+            return None
+
+        if original.is_little_endian == target.is_little_endian:
+            return 1
+    except ValueError:
+        # Private or unknown transfer syntaxes
+        return None
+
+    return 2
+
+
 class Association(threading.Thread):
     """Manage an Association with a peer AE.
 
@@ -137,6 +181,13 @@ class Association(threading.Thread):
         # If acceptor this is the parent AssociationServer, used to identify
         #   the thread when updating bound event-handlers
         self._server = None
+        # If acceptor this is the admission given by the AE's admission
+        #   control, released once the association ends
+        self._admission = None
+        # If run by a server's worker thread rather than its own thread then
+        #   the worker thread and an event set once the reactor has stopped
+        self._worker = None
+        self._worker_stopped = None
 
         # Represents the association requestor and acceptor users
         self.requestor = ServiceUser(self, MODE_REQUESTOR)
@@ -151,6 +202,9 @@ class Association(threading.Thread):
         # Accepted and rejected presentation contexts
         self._accepted_cx = {}
         self._rejected_cx = []
+        # Index of the accepted contexts, see _get_valid_context()
+        self._cx_index = {}
+        self._cx_index_source = (None, 0)
 
         # Service providers
         self.acse = ACSE(self)
@@ -162,12 +216,23 @@ class Association(threading.Thread):
         self.dimse_timeout = self.ae.dimse_timeout
         self.network_timeout = self.ae.network_timeout
 
+        # Limit on the queued outgoing P-DATA (in bytes)
+        self.send_buffer_size = self.ae.send_buffer_size
+        # Limits on the received DIMSE messages waiting to be processed
+        self.receive_buffer_messages = self.ae.receive_buffer_messages
+        self.receive_buffer_size = self.ae.receive_buffer_size
+        # The association's share of the AE's in-flight DIMSE data
+        self._budget = _BudgetAccount(self.ae.memory_budget, self.dul.wake)
+        self.dul.to_provider_queue.budget = self._budget
+
         # Event handlers
         self._handlers = {}
         self._bind_defaults()
 
         # Kills the thread loop in run()
         self._kill = False
+        # Set while the local AE is negotiating association release
+        self._is_releasing = False
         # Flag for whether or not the DUL thread has been started
         self._started_dul = False
         # Used to pause the association reactor until the DUL is ready
@@ -186,8 +251,10 @@ class Association(threading.Thread):
             evt.trigger(self, evt.EVT_ABORTED, {})
             self.kill()
 
-        # Add short delay to ensure everything shuts down
-        time.sleep(0.1)
+        # Give the reactor a short time to exit
+        current = threading.current_thread()
+        if self.is_alive() and current not in (self, self._worker):
+            self.join(0.1)
 
     @property
     def accepted_contexts(self):
@@ -325,9 +392,49 @@ class Association(threading.Thread):
 
         return self._handlers[event]
 
+    def _get_context_index(self):
+        """Return the index of the accepted presentation contexts.
+
+        The index is built the first time it's needed after the accepted
+        contexts have been set and is used to find a suitable context
+        without searching through all of them.
+
+        Returns
+        -------
+        dict
+            The index as {(abstract syntax, role) : list of
+            presentation.PresentationContext} for the contexts that can be
+            used with each role, in order of context ID. Also contains
+            the results of previous searches as {(abstract syntax, transfer
+            syntax, role) : presentation.PresentationContext or None}.
+        """
+        accepted = self._accepted_cx
+        source, nr_contexts = self._cx_index_source
+        if source is accepted and nr_contexts == len(accepted):
+            return self._cx_index
+
+        index = {}
+        for cx in self.accepted_contexts:
+            # Cover both False and None
+            if cx.as_scu is True:
+                index.setdefault((cx.abstract_syntax, 'scu'), []).append(cx)
+
+            if cx.as_scp is True:
+                index.setdefault((cx.abstract_syntax, 'scp'), []).append(cx)
+
+        self._cx_index = index
+        self._cx_index_source = (accepted, len(accepted))
+
+        return index
+
     def _get_valid_context(self, ab_syntax, tr_syntax, role, context_id=None):
         """Return a valid presentation context matching the parameters.
 
+        If more than one accepted context matches then the one with the same
+        transfer syntax as `tr_syntax` is preferred so the dataset doesn't
+        need to be converted, followed by the one with the cheapest
+        conversion, followed by the one with the lowest context ID.
+
         Parameters
         ----------
         ab_syntax : str or pydicom.uid.UID
@@ -351,35 +458,24 @@ class Association(threading.Thread):
         ab_syntax = UID(ab_syntax)
         tr_syntax = UID(tr_syntax)
 
-        possible_contexts = []
+        index = self._get_context_index()
         if context_id is None:
-            possible_contexts = self.accepted_contexts
+            key = (ab_syntax, tr_syntax, role)
+            try:
+                context = index[key]
+            except KeyError:
+                context = index[key] = self._select_context(
+                    index.get((ab_syntax, role), []), tr_syntax
+                )
         else:
-            for cx in self.accepted_contexts:
-                if cx.context_id == context_id:
-                    possible_contexts = [cx]
-                    break
-
-        for cx in possible_contexts:
-            if cx.abstract_syntax != ab_syntax:
-                continue
+            possible_contexts = [
+                cx for cx in index.get((ab_syntax, role), [])
+                if cx.context_id == context_id
+            ]
+            context = self._select_context(possible_contexts, tr_syntax)
 
-            # Cover both False and None
-            if role == 'scu' and cx.as_scu is not True:
-                continue
-
-            if role == 'scp' and cx.as_scp is not True:
-                continue
-
-            # Allow us to skip the transfer syntax check
-            if tr_syntax and tr_syntax != cx.transfer_syntax[0]:
-                # Compressed transfer syntaxes are not convertable
-                if (tr_syntax.is_compressed
-                        or cx.transfer_syntax[0].is_compressed):
-                    continue
-
-            # Only a valid presentation context can reach this point
-            return cx
+        if context is not None:
+            return context
 
         msg = (
             "No suitable presentation context for the {} role has been "
@@ -392,6 +488,41 @@ class Association(threading.Thread):
         LOGGER.error(msg)
         raise ValueError(msg)
 
+    @staticmethod
+    def _select_context(contexts, tr_syntax):
+        """Return the context that's the best match for `tr_syntax`.
+
+        Parameters
+        ----------
+        contexts : list of presentation.PresentationContext
+            The accepted contexts with a matching abstract syntax and role,
+            in order of context ID.
+        tr_syntax : pydicom.uid.UID
+            The transfer syntax of the dataset to be sent, if empty then it
+            won't be used for matching.
+
+        Returns
+        -------
+        presentation.PresentationContext or None
+            The context that requires the cheapest conversion of the dataset
+            or None if there are no suitable contexts.
+        """
+        if not tr_syntax:
+            return contexts[0] if contexts else None
+
+        context, cost = None, None
+        for cx in contexts:
+            cx_cost = _conversion_cost(tr_syntax, cx.transfer_syntax[0])
+            if cx_cost is None:
+                continue
+
+            if cost is None or cx_cost < cost:
+                context, cost = cx, cx_cost
+                if cost == 0:
+                    break
+
+        return context
+
     @property
     def is_acceptor(self):
         """Return ``True`` if the local AE is the association *Acceptor*."""
@@ -406,8 +537,18 @@ class Association(threading.Thread):
         """Kill the ``Association`` thread."""
         self._kill = True
         self.is_established = False
-        while self.dul.is_alive() and not self.dul.stop_dul():
-            time.sleep(0.01)
+        # Wake the reactor so it sees it's been killed
+        self.dul.notify_waiters()
+        while True:
+            generation = self.dul.generation
+            if not self.dul.is_alive() or self.dul.stop_dul():
+                break
+
+            # Wait for the DUL to reach Sta1
+            self.dul.wait_for_change(generation, 0.5)
+
+        # Anything still in-flight will never be sent or processed
+        self._budget.close()
 
     @property
     def local(self):
@@ -466,6 +607,7 @@ class Association(threading.Thread):
         """Send an A-RELEASE request and initiate association release."""
         if self.is_established:
             LOGGER.info('Releasing Association')
+            self._is_releasing = True
             self.acse.negotiate_release(self)
 
     @property
@@ -492,11 +634,86 @@ class Association(threading.Thread):
         LOGGER.info("Requesting Association")
         self.acse.negotiate_association(self)
 
+    def start(self):
+        """Start the ``Association`` thread and add it to the AE's registry
+        of running associations.
+        """
+        is_added = self.ae.registry.add(self)
+        try:
+            threading.Thread.start(self)
+        except Exception:
+            # Don't remove it if it was already running
+            if is_added:
+                self.ae.registry.remove(self)
+
+            raise
+
+    def _run_in_worker(self):
+        """Run the ``Association`` in the current thread instead of starting
+        a new one, used by servers with a pool of worker threads.
+
+        The ``Association`` is never started as a thread, instead
+        :meth:`is_alive` and :meth:`join` reflect the reactor running in the
+        worker thread.
+        """
+        self._worker = threading.current_thread()
+        self._worker_stopped = threading.Event()
+        self.ae.registry.add(self)
+        self.run()
+
+    def is_alive(self):
+        """Return True if the ``Association`` reactor is running, either in
+        its own thread or in a server's worker thread.
+        """
+        if self._worker_stopped is not None:
+            return not self._worker_stopped.is_set()
+
+        return threading.Thread.is_alive(self)
+
+    def join(self, timeout=None):
+        """Wait until the ``Association`` reactor has stopped, either in its
+        own thread or in a server's worker thread.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            The maximum time to wait for (in seconds), default ``None`` to
+            wait indefinitely.
+        """
+        if self._worker_stopped is None:
+            threading.Thread.join(self, timeout)
+            return
+
+        if threading.current_thread() is self._worker:
+            raise RuntimeError("cannot join current thread")
+
+        self._worker_stopped.wait(timeout)
+
     def run(self):
         """The main ``Association`` reactor."""
+        try:
+            self._run()
+        finally:
+            self.ae.registry.remove(self)
+            # Allow any waiting association requests to be admitted
+            if self._admission is not None:
+                self.ae._admission.release(self._admission)
+                self._admission = None
+
+            if self._worker_stopped is not None:
+                self._worker_stopped.set()
+
+    def _run(self):
+        """Run the ``Association`` reactor."""
         # Start the DUL thread if not already started
         if not self._started_dul:
-            self.dul.start()
+            stack_size = None
+            if self._server:
+                stack_size = self._server.thread_stack_size
+
+            with _thread_stack_size(stack_size):
+                self.dul.start()
+
             self._started_dul = True
             # Wait until the DUL is up and running
             self._dul_ready.wait()
@@ -544,7 +761,8 @@ class Association(threading.Thread):
             If timed out then kill thread
         """
         while not self._kill:
-            time.sleep(0.001)
+            # Anything the reactor is waiting on changes the DUL's generation
+            generation = self.dul.generation
 
             # Check with the DIMSE provider to see if a completely decoded
             #   message is available
@@ -591,7 +809,11 @@ class Association(threading.Thread):
                 try:
                     # Clear out any C-CANCEL requests received beforehand
                     self.dimse.cancel_req = {}
-                    service_class.SCP(msg, context)
+                    with start_span(self.ae.tracer, 'ServiceClass.SCP') as span:
+                        span.set_attribute(
+                            'service_class', service_class.__class__.__name__
+                        )
+                        service_class.SCP(msg, context)
                     # Clear out any unacted upon requests received during
                     self.dimse.cancel_req = {}
                 except NotImplementedError:
@@ -607,8 +829,11 @@ class Association(threading.Thread):
                     self.abort()
                     return
 
+            # While we're releasing the peer's reply is handled by the ACSE
+            if self._is_releasing:
+                pass
             # Check for release request
-            if self.acse.is_release_requested(self):
+            elif self.acse.is_release_requested(self):
                 # Send A-RELEASE response
                 self.acse.send_release(self, is_response=True)
                 LOGGER.info('Association Released')
@@ -619,7 +844,7 @@ class Association(threading.Thread):
                 return
 
             # Check for abort
-            if self.acse.is_aborted(self):
+            elif self.acse.is_aborted(self):
                 LOGGER.info('Association Aborted')
                 self.is_aborted = True
                 self.is_established = False
@@ -639,14 +864,23 @@ class Association(threading.Thread):
                 self.kill()
                 return
 
+            # Wait for the DUL unless there may be more messages to handle,
+            #   the timeout is only a safeguard
+            if not msg:
+                self.dul.wait_for_change(generation, 0.5)
+
     def _run_as_requestor(self):
         """Run the association as the requestor."""
         # Listen for further messages from the peer
         while not self._kill:
-            time.sleep(0.1)
+            # Anything the reactor is waiting on changes the DUL's generation
+            generation = self.dul.generation
 
+            # While we're releasing the peer's reply is handled by the ACSE
+            if self._is_releasing:
+                pass
             # Check for release request
-            if self.acse.is_release_requested(self):
+            elif self.acse.is_release_requested(self):
                 # Send A-RELEASE response
                 self.acse.send_release(self, is_response=True)
                 LOGGER.info('Association Released')
@@ -657,7 +891,7 @@ class Association(threading.Thread):
                 return
 
             # Check for abort
-            if self.acse.is_aborted(self):
+            elif self.acse.is_aborted(self):
                 LOGGER.info('Association Aborted')
                 self.is_aborted = True
                 self.is_established = False
@@ -678,6 +912,19 @@ class Association(threading.Thread):
                 self.kill()
                 return
 
+            # The timeout is only a safeguard
+            self.dul.wait_for_change(generation, 0.5)
+
+    @property
+    def send_buffer_size(self):
+        """Return the maximum size of the queued outgoing P-DATA."""
+        return self.dul.to_provider_queue.maxbytes
+
+    @send_buffer_size.setter
+    def send_buffer_size(self, value):
+        """Set the maximum size of the queued outgoing P-DATA (in bytes)."""
+        self.dul.to_provider_queue.maxbytes = value
+
     def set_socket(self, socket):
         """Set the socket to use for communicating with the peer.
 
@@ -819,6 +1066,7 @@ class Association(threading.Thread):
         # Send C-STORE confirmation back to peer
         self.dimse.send_msg(rsp, context.context_id)
 
+    @traced('Association.send_c_cancel')
     def send_c_cancel(self, msg_id, context_id):
         """Send a C-CANCEL request to the peer AE.
 
@@ -847,6 +1095,7 @@ class Association(threading.Thread):
         # Send C-CANCEL request
         self.dimse.send_msg(primitive, context_id)
 
+    @traced('Association.send_c_echo')
     def send_c_echo(self, msg_id=1):
         """Send a C-ECHO request to the peer AE.
 
@@ -937,6 +1186,7 @@ class Association(threading.Thread):
 
         return status
 
+    @traced('Association.send_c_find')
     def send_c_find(self, dataset, msg_id=1, priority=2, query_model='P'):
         """Send a C-FIND request to the peer AE.
 
@@ -1176,6 +1426,7 @@ class Association(threading.Thread):
         #   may end up being sent first unless next() is called
         return self._wrap_find_responses(transfer_syntax)
 
+    @traced('Association.send_c_get')
     def send_c_get(self, dataset, msg_id=1, priority=2, query_model='P'):
         """Send a C-GET request to the peer AE.
 
@@ -1402,6 +1653,7 @@ class Association(threading.Thread):
         #   may end up being sent first unless next() is called
         return self._wrap_get_move_responses(transfer_syntax)
 
+    @traced('Association.send_c_move')
     def send_c_move(self, dataset, move_aet, msg_id=1, priority=2,
                     query_model='P'):
         """Send a C-MOVE request to the peer AE.
@@ -1615,6 +1867,7 @@ class Association(threading.Thread):
         #   may end up being sent first unless next() is called
         return self._wrap_get_move_responses(transfer_syntax)
 
+    @traced('Association.send_c_store')
     def send_c_store(self, dataset, msg_id=1, priority=2, originator_aet=None,
                      originator_id=None):
         """Send a C-STORE request to the peer AE.
@@ -1726,6 +1979,44 @@ class Association(threading.Thread):
             raise RuntimeError("The association with a peer SCP must be "
                                "established before sending a C-STORE request")
 
+        req, context_id = self._prepare_c_store(
+            dataset, msg_id, priority, originator_aet, originator_id
+        )
+
+        return self._send_c_store_request(req, context_id)
+
+    def _prepare_c_store(self, dataset, msg_id=1, priority=2,
+                         originator_aet=None, originator_id=None,
+                         encoded=None):
+        """Return a C-STORE request primitive for `dataset`.
+
+        Parameters
+        ----------
+        encoded : dict, optional
+            If used then the encoded `dataset` is taken from, or added to,
+            `encoded` as {(is_implicit_VR, is_little_endian) : bytes}, so
+            that requests for the same dataset share the encoding.
+
+        See ``send_c_store()`` for the other parameters.
+
+        Returns
+        -------
+        dimse_primitives.C_STORE
+            The C-STORE request with the `dataset` encoded using the
+            agreed transfer syntax.
+        int
+            The ID of the presentation context to use to send the request.
+
+        Raises
+        ------
+        AttributeError
+            If `dataset` is missing (0008,0016) *SOP Class UID*,
+            (0008,0018) *SOP Instance UID* elements or the (0002,0010)
+            *Transfer Syntax UID* file meta information element.
+        ValueError
+            If no accepted Presentation Context for `dataset` exists or if
+            unable to encode the `dataset`.
+        """
         # Check `dataset` has required elements
         if 'SOPClassUID' not in dataset:
             raise AttributeError(
@@ -1769,9 +2060,15 @@ class Association(threading.Thread):
 
         # Encode the `dataset` using the agreed transfer syntax
         #   Will return None if failed to encode
-        bytestream = encode(dataset,
-                            transfer_syntax.is_implicit_VR,
-                            transfer_syntax.is_little_endian)
+        encoding = (
+            transfer_syntax.is_implicit_VR, transfer_syntax.is_little_endian
+        )
+        if encoded is not None and encoding in encoded:
+            bytestream = encoded[encoding]
+        else:
+            bytestream = encode(dataset, *encoding)
+            if encoded is not None:
+                encoded[encoding] = bytestream
 
         if bytestream is not None:
             req.DataSet = BytesIO(bytestream)
@@ -1779,8 +2076,25 @@ class Association(threading.Thread):
             LOGGER.error("Failed to encode the supplied Dataset")
             raise ValueError('Failed to encode the supplied Dataset')
 
+        return req, context.context_id
+
+    def _send_c_store_request(self, req, context_id):
+        """Send a C-STORE request to the peer and return the response status.
+
+        Parameters
+        ----------
+        req : dimse_primitives.C_STORE
+            The C-STORE request to send.
+        context_id : int
+            The ID of the presentation context to use.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset
+            The status of the C-STORE operation, see ``send_c_store()``.
+        """
         # Send C-STORE request to the peer via DIMSE and wait for the response
-        self.dimse.send_msg(req, context.context_id)
+        self.dimse.send_msg(req, context_id)
         cx_id, rsp = self.dimse.get_msg(block=True)
 
         # If `rsp` is None then the DIMSE timeout expired so abort
@@ -1795,6 +2109,190 @@ class Association(threading.Thread):
 
         return status
 
+    @traced('Association.send_c_store_iter')
+    def send_c_store_iter(self, datasets, prefetch=4, readers=2, msg_id=1,
+                          priority=2):
+        """Send C-STORE requests for `datasets`, preparing them in advance.
+
+        While each C-STORE request is being sent and the peer's response
+        waited on, the datasets that follow it are read and encoded using
+        the agreed transfer syntax by a pool of background threads. At most
+        `prefetch` datasets are prepared ahead of the one being sent, which
+        bounds the memory used.
+
+        Parameters
+        ----------
+        datasets : iterable of (str or pydicom.dataset.Dataset)
+            The datasets to send or the paths to the DICOM files containing
+            them. Iterated over on a background thread as the datasets are
+            needed, so may be a generator.
+        prefetch : int, optional
+            The maximum number of datasets to prepare ahead of the one being
+            sent (default ``4``).
+        readers : int, optional
+            The number of threads used to read and encode the datasets
+            (default ``2``).
+        msg_id : int, optional
+            The DIMSE *Message ID* of the first C-STORE request, incremented
+            for each following request (default ``1``).
+        priority : int, optional
+            The C-STORE operation *Priority*, see ``send_c_store()``.
+
+        Yields
+        ------
+        item : str or pydicom.dataset.Dataset
+            The item from `datasets`.
+        status : pydicom.dataset.Dataset or None
+            The status of the C-STORE operation, as returned by
+            ``send_c_store()``, or ``None`` if the dataset couldn't be read,
+            has no accepted presentation context or couldn't be encoded.
+
+        Raises
+        ------
+        RuntimeError
+            If ``send_c_store_iter`` is called with no established
+            association.
+        ValueError
+            If `prefetch` or `readers` is less than 1.
+
+        Examples
+        --------
+
+        >>> for path, status in assoc.send_c_store_iter(paths, prefetch=8):
+        ...     if status is None or status.Status != 0x0000:
+        ...         print('Failed to store {}'.format(path))
+
+        Notes
+        -----
+        If the association is released or aborted then no further requests
+        are sent and the generator stops, the items taken from `datasets`
+        but not yet sent aren't yielded.
+
+        See Also
+        --------
+        send_c_store
+        """
+        # Can't send a C-STORE without an Association
+        if not self.is_established:
+            raise RuntimeError("The association with a peer SCP must be "
+                               "established before sending a C-STORE request")
+
+        if prefetch < 1 or readers < 1:
+            raise ValueError(
+                "'prefetch' and 'readers' must be greater than or equal to 1"
+            )
+
+        # Wrap the generator so the parameters are checked immediately
+        return self._wrap_c_store_iter(
+            datasets, prefetch, readers, msg_id, priority
+        )
+
+    def _wrap_c_store_iter(self, datasets, prefetch, readers, msg_id,
+                           priority):
+        """Wrapper for the ``send_c_store_iter()`` generator.
+
+        The feeder thread takes the items from `datasets` and adds them to
+        the bounded `pending` queue, in order, and to the `tasks` queue for
+        the reader threads, which prepare the C-STORE requests.
+
+        Parameters
+        ----------
+        See ``send_c_store_iter()``.
+
+        Yields
+        ------
+        See ``send_c_store_iter()``.
+        """
+        stop = threading.Event()
+        # Each slot is [item, message ID, prepared event, (req, context ID)]
+        pending = queue.Queue(maxsize=prefetch)
+        tasks = queue.Queue()
+
+        def _put(slot):
+            """Add `slot` to `pending`, unless stopped while waiting."""
+            while not stop.is_set():
+                try:
+                    pending.put(slot, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+
+            return False
+
+        def _feed():
+            next_id = msg_id
+            items = iter(datasets)
+            try:
+                while not stop.is_set():
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        break
+
+                    slot = [item, next_id, threading.Event(), None]
+                    if not _put(slot):
+                        break
+
+                    tasks.put(slot)
+                    next_id = next_id + 1 if next_id < 65535 else 1
+            except Exception as exc:
+                LOGGER.error("Unable to get the next dataset to send")
+                LOGGER.exception(exc)
+            finally:
+                for _ in range(readers):
+                    tasks.put(None)
+
+                _put(None)
+
+        def _read():
+            while True:
+                slot = tasks.get()
+                if slot is None:
+                    break
+
+                item, slot_id, ready = slot[:3]
+                try:
+                    if not stop.is_set():
+                        ds = item
+                        if not isinstance(item, Dataset):
+                            ds = dcmread(item)
+
+                        slot[3] = self._prepare_c_store(ds, slot_id, priority)
+                except Exception as exc:
+                    LOGGER.error(
+                        "Unable to send the dataset '{}': {}".format(item, exc)
+                    )
+                finally:
+                    ready.set()
+
+        threads = [threading.Thread(target=_feed)]
+        threads.extend([threading.Thread(target=_read) for _ in range(readers)])
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                slot = pending.get()
+                if slot is None or not self.is_established:
+                    break
+
+                item, _, ready, _ = slot
+                ready.wait()
+                if slot[3] is None:
+                    yield item, None
+                    continue
+
+                yield item, self._send_c_store_request(*slot[3])
+        finally:
+            # Stop preparing datasets and unblock the feeder
+            stop.set()
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+
     def _wrap_find_responses(self, transfer_syntax):
         """Wrapper for the C-FIND response generator.
 
@@ -2035,6 +2533,7 @@ class Association(threading.Thread):
             break
 
     # DIMSE-N services provided by the Association
+    @traced('Association.send_n_action')
     def send_n_action(self, dataset, action_type, class_uid, instance_uid,
                       msg_id=1):
         """Send an N-ACTION request message to the peer AE.
@@ -2186,6 +2685,7 @@ class Association(threading.Thread):
 
         return status, action_reply
 
+    @traced('Association.send_n_create')
     def send_n_create(self, dataset, class_uid, instance_uid=None, msg_id=1):
         """Send an N-CREATE request message to the peer AE.
 
@@ -2375,6 +2875,7 @@ class Association(threading.Thread):
 
         return status, attribute_list
 
+    @traced('Association.send_n_delete')
     def send_n_delete(self, class_uid, instance_uid, msg_id=1):
         """Send an N-DELETE request message to the peer AE.
 
@@ -2469,6 +2970,7 @@ class Association(threading.Thread):
 
         return status
 
+    @traced('Association.send_n_event_report')
     def send_n_event_report(self, dataset, event_type, class_uid,
                             instance_uid, msg_id=1):
         """Send an N-EVENT-REPORT request message to the peer AE.
@@ -2625,6 +3127,7 @@ class Association(threading.Thread):
 
         return status, event_reply
 
+    @traced('Association.send_n_get')
     def send_n_get(self, identifier_list, class_uid, instance_uid, msg_id=1):
         """Send an N-GET request message to the peer AE.
 
@@ -2788,6 +3291,7 @@ class Association(threading.Thread):
 
         return status, attribute_list
 
+    @traced('Association.send_n_set')
     def send_n_set(self, dataset, class_uid, instance_uid, msg_id=1):
         """Send an N-SET request message to the peer AE.
 
@@ -2991,6 +3495,235 @@ class Association(threading.Thread):
         return status, attribute_list
 
 
+def fan_out_c_store(dataset, associations, msg_id=1, priority=2):
+    """Send a C-STORE request for `dataset` to several peers at once.
+
+    The `dataset` is only encoded once for each distinct transfer syntax
+    encoding agreed with the peers, with the encoded bytes shared between
+    the requests. The requests are then sent concurrently, one thread per
+    association, and the responses waited on.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The DICOM dataset to send to the peers, see
+        ``Association.send_c_store()``.
+    associations : list of association.Association
+        The established associations to send the `dataset` over.
+    msg_id : int, optional
+        The DIMSE *Message ID* to use for each request (default ``1``).
+    priority : int, optional
+        The C-STORE operation *Priority*, see
+        ``Association.send_c_store()``.
+
+    Returns
+    -------
+    list of (pydicom.dataset.Dataset or None)
+        The status of the C-STORE operation for each association, in the
+        same order as `associations`, see ``Association.send_c_store()``.
+        The status is ``None`` if the association isn't established, has no
+        accepted presentation context for `dataset` or the `dataset`
+        couldn't be encoded.
+
+    Raises
+    ------
+    Exception
+        If sending any of the requests raised an exception then it's logged
+        and, once all the requests have finished, the first one is raised
+        again.
+
+    Examples
+    --------
+
+    >>> from pynetdicom.association import fan_out_c_store
+    >>> statuses = fan_out_c_store(ds, [assoc_a, assoc_b, assoc_c])
+    """
+    # {(is_implicit_VR, is_little_endian) : bytes}
+    encoded = {}
+    statuses = [None] * len(associations)
+    requests = []
+    for ii, assoc in enumerate(associations):
+        if not assoc.is_established:
+            LOGGER.error(
+                "Unable to send the C-STORE request as the association "
+                "with the peer isn't established"
+            )
+            continue
+
+        try:
+            req, context_id = assoc._prepare_c_store(
+                dataset, msg_id, priority, encoded=encoded
+            )
+        except (AttributeError, ValueError) as exc:
+            LOGGER.error(
+                "Unable to send the C-STORE request: {}".format(exc)
+            )
+            continue
+
+        requests.append((ii, assoc, req, context_id))
+
+    errors = []
+
+    def _send(ii, assoc, req, context_id):
+        # pylint: disable=broad-except
+        try:
+            statuses[ii] = assoc._send_c_store_request(req, context_id)
+        except Exception as exc:
+            LOGGER.error("Exception raised while sending a C-STORE request")
+            LOGGER.exception(exc)
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=_send, args=args) for args in requests
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return statuses
+
+
+class AssociationRegistry(object):
+    """A registry of an AE's running associations.
+
+    Associations are added when their thread is started and removed once
+    their reactor has finished. The number of associations per mode, per
+    peer address and per server is kept up to date so that checking them
+    doesn't depend on the number of associations or threads.
+
+    Examples
+    --------
+
+    >>> from pynetdicom import AE
+    >>> ae = AE()
+    >>> ae.registry.count(mode='acceptor')
+    0
+    """
+    def __init__(self):
+        """Create a new AssociationRegistry."""
+        self._lock = threading.Lock()
+        # {Association : its keys in `_counts`}, in the order added
+        self._associations = OrderedDict()
+        # {(criterion, value) : number of associations}
+        self._counts = {}
+
+    def __len__(self):
+        """Return the number of running associations."""
+        return len(self._associations)
+
+    def add(self, assoc):
+        """Add a running association.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association to add.
+
+        Returns
+        -------
+        bool
+            ``True`` if added, ``False`` if `assoc` was already registered.
+        """
+        if assoc.is_requestor:
+            peer = assoc.acceptor.address
+        else:
+            peer = assoc.requestor.address
+
+        keys = (('mode', assoc.mode), ('peer', peer), ('server', assoc._server))
+        with self._lock:
+            if assoc in self._associations:
+                return False
+
+            self._associations[assoc] = keys
+            for key in keys:
+                self._counts[key] = self._counts.get(key, 0) + 1
+
+        return True
+
+    def associations(self, mode=None, server=None):
+        """Return a list of the running associations.
+
+        Parameters
+        ----------
+        mode : str, optional
+            If used then only return associations with a matching `mode`,
+            one of ``'requestor'`` or ``'acceptor'``.
+        server : transport.AssociationServer, optional
+            If used then only return the associations started by `server`.
+
+        Returns
+        -------
+        list of association.Association
+            The running associations in the order they were started.
+        """
+        with self._lock:
+            items = list(self._associations.items())
+
+        if mode is None and server is None:
+            return [assoc for assoc, _ in items]
+
+        return [
+            assoc for assoc, keys in items
+            if (mode is None or keys[0][1] == mode)
+            and (server is None or keys[2][1] is server)
+        ]
+
+    def count(self, mode=None, peer=None, server=None):
+        """Return the number of running associations.
+
+        Parameters
+        ----------
+        mode : str, optional
+            If used then only count associations with a matching `mode`.
+        peer : str, optional
+            If used then only count associations with a matching peer
+            IP address.
+        server : transport.AssociationServer, optional
+            If used then only count the associations started by `server`.
+
+        Returns
+        -------
+        int
+            The number of matching associations.
+        """
+        criteria = [
+            key for key in (('mode', mode), ('peer', peer), ('server', server))
+            if key[1] is not None
+        ]
+        if not criteria:
+            return len(self._associations)
+
+        if len(criteria) == 1:
+            return self._counts.get(criteria[0], 0)
+
+        with self._lock:
+            return len([
+                keys for keys in self._associations.values()
+                if all([key in keys for key in criteria])
+            ])
+
+    def remove(self, assoc):
+        """Remove an association that's no longer running.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association to remove.
+        """
+        with self._lock:
+            keys = self._associations.pop(assoc, None)
+            for key in keys or []:
+                self._counts[key] -= 1
+                if not self._counts[key]:
+                    del self._counts[key]
+
+
 class ServiceUser(object):
     """Convenience class for the ``Association`` service user.
 
@@ -3066,9 +3799,12 @@ class ServiceUser(object):
         # If Requestor this is the requested contexts, otherwise this is
         #   the supported contexts
         self._contexts = []
+        # If the contexts are shared with other associations and must be
+        #   copied before they can be modified
+        self._is_shared = False
 
         # User Information items
-        self._user_info = []
+        self._user_info = UserInformationList()
         # Must always be set
         self.maximum_length = DEFAULT_MAX_LENGTH
         self.implementation_class_uid = assoc.ae.implementation_class_uid
@@ -3164,12 +3900,14 @@ class ServiceUser(object):
                     item.maximum_number_operations_performed
                 )
         else:
-            for item in self.user_information:
-                if isinstance(item, AsynchronousOperationsWindowNegotiation):
-                    return (
-                        item.maximum_number_operations_invoked,
-                        item.maximum_number_operations_performed
-                    )
+            item = self.primitive.user_information.get_item(
+                AsynchronousOperationsWindowNegotiation
+            )
+            if item is not None:
+                return (
+                    item.maximum_number_operations_invoked,
+                    item.maximum_number_operations_performed
+                )
 
         return (1, 1)
 
@@ -3206,6 +3944,29 @@ class ServiceUser(object):
 
         return items
 
+    def _get_shared_contexts(self):
+        """Return the contexts without copying them if they're shared, must
+        not be modified.
+        """
+        return self._contexts
+
+    def _share_contexts(self, contexts):
+        """Set the supported presentation contexts to `contexts`, which are
+        shared with other associations.
+
+        The contexts will be copied before they're returned by
+        :meth:`get_contexts` so any changes don't affect the other
+        associations.
+
+        Parameters
+        ----------
+        contexts : list of presentation.PresentationContext
+            The shared presentation contexts to support when acting as the
+            association acceptor.
+        """
+        self.supported_contexts = contexts
+        self._is_shared = True
+
     def get_contexts(self, cx_type):
         """Return a list of PresentationContext corresponding to `cx_type`.
 
@@ -3235,6 +3996,11 @@ class ServiceUser(object):
             presentation contexts from the A-ASSOCIATE (accept) primitive's
             Presentation Context Definition Results List parameter.
         """
+        if self._is_shared and cx_type in ['requested', 'supported']:
+            # Copy-on-write, the contexts may be modified once returned
+            self._contexts = deepcopy(self._contexts)
+            self._is_shared = False
+
         contexts = {'requested' : self._contexts, 'supported' : self._contexts}
         if not self.writeable:
             contexts.update({
@@ -3276,15 +4042,13 @@ class ServiceUser(object):
             if the acceptor and they have rejected the negotiation.
         """
         if not self.writeable:
-            for item in self.user_information:
-                if isinstance(item, ImplementationClassUIDNotification):
-                    return item.implementation_class_uid
-
-            return None
+            user_info = self.primitive.user_information
+        else:
+            user_info = self._user_info
 
-        for item in self._user_info:
-            if isinstance(item, ImplementationClassUIDNotification):
-                return item.implementation_class_uid
+        item = user_info.get_item(ImplementationClassUIDNotification)
+        if item is not None:
+            return item.implementation_class_uid
 
         return None
 
@@ -3303,10 +4067,9 @@ class ServiceUser(object):
                 "has started"
             )
 
-        for item in self._user_info:
-            if isinstance(item, ImplementationClassUIDNotification):
-                item.implementation_class_uid = value
-                break
+        item = self._user_info.get_item(ImplementationClassUIDNotification)
+        if item is not None:
+            item.implementation_class_uid = value
         else:
             item = ImplementationClassUIDNotification()
             item.implementation_class_uid = value
@@ -3325,15 +4088,13 @@ class ServiceUser(object):
             the Implementation Version Name.
         """
         if not self.writeable:
-            for item in self.user_information:
-                if isinstance(item, ImplementationVersionNameNotification):
-                    return item.implementation_version_name
-
-            return None
+            user_info = self.primitive.user_information
+        else:
+            user_info = self._user_info
 
-        for item in self._user_info:
-            if isinstance(item, ImplementationVersionNameNotification):
-                return item.implementation_version_name
+        item = user_info.get_item(ImplementationVersionNameNotification)
+        if item is not None:
+            return item.implementation_version_name
 
         return None
 
@@ -3352,10 +4113,9 @@ class ServiceUser(object):
                 "has started"
             )
 
-        for item in self._user_info:
-            if isinstance(item, ImplementationVersionNameNotification):
-                item.implementation_version_name = value
-                break
+        item = self._user_info.get_item(ImplementationVersionNameNotification)
+        if item is not None:
+            item.implementation_version_name = value
         else:
             item = ImplementationVersionNameNotification()
             item.implementation_version_name = value
@@ -3397,15 +4157,13 @@ class ServiceUser(object):
             if the acceptor and they have rejected the negotiation.
         """
         if not self.writeable:
-            for item in self.user_information:
-                if isinstance(item, MaximumLengthNotification):
-                    return item.maximum_length_received
-
-            return None
+            user_info = self.primitive.user_information
+        else:
+            user_info = self._user_info
 
-        for item in self._user_info:
-            if isinstance(item, MaximumLengthNotification):
-                return item.maximum_length_received
+        item = user_info.get_item(MaximumLengthNotification)
+        if item is not None:
+            return item.maximum_length_received
 
         return None
 
@@ -3423,10 +4181,9 @@ class ServiceUser(object):
                 "Can't set the Maximum Length after negotiation has started"
             )
 
-        for item in self._user_info:
-            if isinstance(item, MaximumLengthNotification):
-                item.maximum_length_received = value
-                break
+        item = self._user_info.get_item(MaximumLengthNotification)
+        if item is not None:
+            item.maximum_length_received = value
         else:
             item = MaximumLengthNotification()
             item.maximum_length_received = value
@@ -3472,6 +4229,7 @@ class ServiceUser(object):
             )
 
         self._contexts = value
+        self._is_shared = False
 
     def remove_negotiation_item(self, item):
         """Remove an extended negotiation item from the user information.
@@ -3555,9 +4313,9 @@ class ServiceUser(object):
 
             return roles
 
-        for item in self.user_information:
-            if isinstance(item, SCP_SCU_RoleSelectionNegotiation):
-                roles[item.sop_class_uid] = item
+        user_info = self.primitive.user_information
+        for item in user_info.get_items(SCP_SCU_RoleSelectionNegotiation):
+            roles[item.sop_class_uid] = item
 
         return roles
 
@@ -3583,9 +4341,9 @@ class ServiceUser(object):
 
             return sop_classes
 
-        for item in self.user_information:
-            if isinstance(item, SOPClassCommonExtendedNegotiation):
-                sop_classes[item.sop_class_uid] = item
+        user_info = self.primitive.user_information
+        for item in user_info.get_items(SOPClassCommonExtendedNegotiation):
+            sop_classes[item.sop_class_uid] = item
 
         return sop_classes
 
@@ -3608,11 +4366,11 @@ class ServiceUser(object):
 
             return sop_classes
 
-        for item in self.user_information:
-            if isinstance(item, SOPClassExtendedNegotiation):
-                sop_classes[item.sop_class_uid] = (
-                    item.service_class_application_information
-                )
+        user_info = self.primitive.user_information
+        for item in user_info.get_items(SOPClassExtendedNegotiation):
+            sop_classes[item.sop_class_uid] = (
+                item.service_class_application_information
+            )
 
         return sop_classes
 
@@ -3657,6 +4415,7 @@ class ServiceUser(object):
             )
 
         self._contexts = value
+        self._is_shared = False
 
     @property
     def user_identity(self):
@@ -3675,11 +4434,9 @@ class ServiceUser(object):
 
             return None
 
-        for item in self.user_information:
-            if isinstance(item, UserIdentityNegotiation):
-                return item
-
-        return None
+        return self.primitive.user_information.get_item(
+            UserIdentityNegotiation
+        )
 
     @property
     def user_information(self):
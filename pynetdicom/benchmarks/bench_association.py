@@ -0,0 +1,284 @@
+"""Performance tests for association establishment and release."""
+
+import select
+import socket
+import time
+
+from pydicom.uid import ImplicitVRLittleEndian, ExplicitVRLittleEndian
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from pynetdicom import AE, StoragePresentationContexts, build_context
+from pynetdicom.association import Association, ServiceUser
+from pynetdicom.pdu_primitives import (
+    A_ASSOCIATE, SCP_SCU_RoleSelectionNegotiation
+)
+from pynetdicom.sop_class import VerificationSOPClass
+from pynetdicom.tests.encoded_pdu_items import a_associate_rq
+
+
+class TimeAssociation(object):
+    def setup(self):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        self.scp = ae.start_server(('', 11112), block=False)
+
+    def teardown(self):
+        """Clear any active threads"""
+        self.scp.shutdown()
+
+    def _cycle(self, nr_cycles):
+        """Associate, send a C-ECHO and release `nr_cycles` times."""
+        ae = self.ae
+        for ii in range(nr_cycles):
+            assoc = ae.associate('localhost', 11112)
+            if not assoc.is_established:
+                raise RuntimeError('Unable to associate with the echo SCP')
+
+            assoc.send_c_echo()
+            assoc.release()
+
+    def time_associate_echo_release(self):
+        """Time 10 associate, C-ECHO and release cycles."""
+        self._cycle(10)
+
+    def time_associate_abort(self):
+        """Time 10 associate and abort cycles."""
+        ae = self.ae
+        for ii in range(10):
+            assoc = ae.associate('localhost', 11112)
+            assoc.abort()
+
+    def track_cycles_per_second(self):
+        """Track the number of associate, C-ECHO and release cycles per
+        second.
+        """
+        start = time.time()
+        self._cycle(20)
+        return 20 / (time.time() - start)
+
+    track_cycles_per_second.unit = 'cycles/s'
+
+
+class TrackAssociateRelease(object):
+    """Track associate and release cycles per second with 1 and 128
+    requested presentation contexts.
+    """
+    params = [1, 128]
+    param_names = ['nr_contexts']
+
+    def setup(self, nr_contexts):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.supported_contexts = StoragePresentationContexts
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        for cx in StoragePresentationContexts[:nr_contexts - 1]:
+            ae.add_requested_context(cx.abstract_syntax)
+
+        self.scp = ae.start_server(('', 11112), block=False)
+
+    def teardown(self, nr_contexts):
+        """Clear any active threads"""
+        self.scp.shutdown()
+
+    def track_cycles_per_second(self, nr_contexts):
+        """Track the number of associate and release cycles per second."""
+        ae = self.ae
+        start = time.time()
+        for ii in range(20):
+            assoc = ae.associate('localhost', 11112)
+            if not assoc.is_established:
+                raise RuntimeError('Unable to associate with the SCP')
+
+            assoc.release()
+
+        return 20 / (time.time() - start)
+
+    track_cycles_per_second.unit = 'cycles/s'
+
+
+class TimeShortAssociations(object):
+    """Time short associations with and without a pool of worker threads."""
+    params = [None, 4]
+    param_names = ['worker_threads']
+
+    def setup(self, worker_threads):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        self.scp = ae.start_server(
+            ('', 11112), block=False, worker_threads=worker_threads
+        )
+
+    def teardown(self, worker_threads):
+        """Clear any active threads"""
+        self.scp.shutdown()
+
+    def time_associate_echo_release(self, worker_threads):
+        """Time 50 associate, C-ECHO and release cycles."""
+        ae = self.ae
+        for ii in range(50):
+            assoc = ae.associate('localhost', 11112)
+            assoc.send_c_echo()
+            assoc.release()
+
+
+class TrackAcceptStorm(object):
+    """Track the accept latency when 1000 associations are requested at
+    once.
+    """
+    timeout = 600
+
+    def setup_cache(self):
+        """Request 1000 simultaneous associations and return the latency
+        of each, in milliseconds.
+        """
+        if not hasattr(select, 'poll'):
+            raise NotImplementedError('select.poll() is unavailable')
+
+        nr_assoc = 1000
+        if resource:
+            # Each association uses a client and a server socket
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if hard == resource.RLIM_INFINITY or hard > 4096:
+                hard = 4096
+
+            if soft < hard:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+        ae = AE()
+        ae.maximum_associations = nr_assoc
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(
+            ('', 11112), block=False, request_queue_size=nr_assoc
+        )
+
+        # Connect and send the A-ASSOCIATE-RQ for every association before
+        #   waiting for any of the A-ASSOCIATE-ACs
+        started = {}
+        for ii in range(nr_assoc):
+            start = time.time()
+            sock = socket.create_connection(('localhost', 11112))
+            sock.sendall(a_associate_rq)
+            started[sock] = start
+
+        # select() can't be used with more than 1024 sockets
+        poller = select.poll()
+        pending = {}
+        for sock in started:
+            poller.register(sock, select.POLLIN)
+            pending[sock.fileno()] = sock
+
+        latencies = []
+        deadline = time.time() + 240
+        while pending and time.time() < deadline:
+            for fd, _ in poller.poll(1000):
+                sock = pending.pop(fd)
+                poller.unregister(fd)
+                # Only the start of the A-ASSOCIATE-AC is needed
+                sock.recv(1)
+                latencies.append((time.time() - started[sock]) * 1000)
+
+        for sock in started:
+            sock.close()
+
+        scp.shutdown()
+
+        if pending:
+            raise RuntimeError(
+                '{} association requests weren\'t accepted'
+                .format(len(pending))
+            )
+
+        return sorted(latencies)
+
+    def _percentile(self, latencies, percent):
+        """Return the `percent` percentile of `latencies`."""
+        index = int(round(percent / 100.0 * (len(latencies) - 1)))
+        return latencies[index]
+
+    def track_accept_latency_p50(self, latencies):
+        """Track the median accept latency."""
+        return self._percentile(latencies, 50)
+
+    def track_accept_latency_p90(self, latencies):
+        """Track the 90th percentile accept latency."""
+        return self._percentile(latencies, 90)
+
+    def track_accept_latency_p99(self, latencies):
+        """Track the 99th percentile accept latency."""
+        return self._percentile(latencies, 99)
+
+    def track_accept_latency_max(self, latencies):
+        """Track the maximum accept latency."""
+        return latencies[-1]
+
+    track_accept_latency_p50.unit = 'ms'
+    track_accept_latency_p90.unit = 'ms'
+    track_accept_latency_p99.unit = 'ms'
+    track_accept_latency_max.unit = 'ms'
+
+
+class TimeServiceUserLookups(object):
+    """Time looking up the negotiated user information items."""
+    def setup(self):
+        """Run prior to each test"""
+        primitive = A_ASSOCIATE()
+        primitive.maximum_length_received = 16382
+        primitive.implementation_class_uid = '1.2.3'
+        for cx in StoragePresentationContexts:
+            item = SCP_SCU_RoleSelectionNegotiation()
+            item.sop_class_uid = cx.abstract_syntax
+            item.scu_role = True
+            item.scp_role = True
+            primitive.user_information.append(item)
+
+        self.user = ServiceUser(Association(AE(), 'requestor'), 'acceptor')
+        self.user.primitive = primitive
+
+    def time_lookups(self):
+        """Time looking up the user information 1000 times"""
+        user = self.user
+        for ii in range(1000):
+            user.maximum_length
+            user.implementation_class_uid
+            user.implementation_version_name
+            user.asynchronous_operations
+            user.user_identity
+
+
+class TimeGetValidContext(object):
+    """Time finding the accepted presentation context for a dataset."""
+    def setup(self):
+        """Run prior to each test"""
+        # The maximum of 128 contexts, 2 for each of 64 SOP Classes
+        self.sop_classes = [
+            cx.abstract_syntax for cx in StoragePresentationContexts[:64]
+        ]
+        self.assoc = assoc = Association(AE(), 'requestor')
+        syntaxes = [ImplicitVRLittleEndian, ExplicitVRLittleEndian]
+        for ii, sop_class in enumerate(self.sop_classes):
+            for jj, syntax in enumerate(syntaxes):
+                cx = build_context(sop_class, syntax)
+                cx.context_id = 4 * ii + 2 * jj + 1
+                cx.result = 0x00
+                cx._as_scu = True
+                cx._as_scp = False
+                assoc._accepted_cx[cx.context_id] = cx
+
+    def time_get_valid_context(self):
+        """Time finding contexts for 1000 datasets"""
+        assoc = self.assoc
+        sop_classes = self.sop_classes
+        nr_classes = len(sop_classes)
+        for ii in range(1000):
+            assoc._get_valid_context(
+                sop_classes[ii % nr_classes], ExplicitVRLittleEndian, 'scu'
+            )
@@ -6,7 +6,8 @@ import time
 
 from pydicom import dcmread
 
-from pynetdicom import AE
+from pynetdicom import AE, evt
+from pynetdicom.association import fan_out_c_store
 from pynetdicom.sop_class import CTImageStorage, VerificationSOPClass
 from pynetdicom.tests.dummy_c_scp import (
     DummyVerificationSCP, DummyStorageSCP, DummyFindSCP, DummyBaseSCP,
@@ -85,3 +86,80 @@ class TestSendCStore(object):
             self.assoc.release()
         else:
             raise RuntimeError('Unable to associate with the echo SCP')
+
+
+class TestSendCStoreIter(object):
+    def setup(self):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        handlers = [(evt.EVT_C_STORE, lambda event: 0x0000)]
+        self.scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage)
+        self.assoc = ae.associate('localhost', 11112)
+        self.paths = [os.path.join(DS_DIR, 'CTImageStorage.dcm')] * 100
+
+    def teardown(self):
+        """Clear any active threads"""
+        self.ae.shutdown()
+
+    def time_send_c_store_files(self):
+        "Test reading and sending 100 files using send_c_store."
+        if self.assoc.is_established:
+            for path in self.paths:
+                rsp = self.assoc.send_c_store(dcmread(path))
+                assert rsp.Status == 0x0000
+
+            self.assoc.release()
+        else:
+            raise RuntimeError('Unable to associate with the storage SCP')
+
+    def time_send_c_store_iter(self):
+        "Test reading and sending 100 files using send_c_store_iter."
+        if self.assoc.is_established:
+            for path, rsp in self.assoc.send_c_store_iter(self.paths):
+                assert rsp.Status == 0x0000
+
+            self.assoc.release()
+        else:
+            raise RuntimeError('Unable to associate with the storage SCP')
+
+
+class TestFanOutCStore(object):
+    def setup(self):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.add_supported_context(CTImageStorage)
+        handlers = [(evt.EVT_C_STORE, lambda event: 0x0000)]
+        self.scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=handlers
+        )
+
+        ae.add_requested_context(CTImageStorage)
+        self.assocs = [ae.associate('localhost', 11112) for ii in range(4)]
+
+    def teardown(self):
+        """Clear any active threads"""
+        self.ae.shutdown()
+
+    def time_send_c_store(self):
+        "Test sending 25 datasets to 4 peers using send_c_store."
+        for ii in range(25):
+            for assoc in self.assocs:
+                rsp = assoc.send_c_store(DATASET)
+                assert rsp.Status == 0x0000
+
+        for assoc in self.assocs:
+            assoc.release()
+
+    def time_fan_out_c_store(self):
+        "Test sending 25 datasets to 4 peers using fan_out_c_store."
+        for ii in range(25):
+            for rsp in fan_out_c_store(DATASET, self.assocs):
+                assert rsp.Status == 0x0000
+
+        for assoc in self.assocs:
+            assoc.release()
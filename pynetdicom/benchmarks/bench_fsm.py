@@ -0,0 +1,89 @@
+"""Performance tests for the fsm module."""
+
+import time
+
+from pynetdicom import AE, evt
+from pynetdicom.fsm import StateMachine
+from pynetdicom.pdu_primitives import P_DATA
+
+
+class DummySocket(object):
+    def send(self, bytestream):
+        pass
+
+
+class DummyDIMSE(object):
+    def receive_primitive(self, primitive):
+        pass
+
+
+class DummyAssociation(object):
+    def __init__(self):
+        self.ae = AE()
+        self.dimse = DummyDIMSE()
+        self._handlers = {}
+
+    def get_handlers(self, event):
+        return self._handlers.get(event, [])
+
+
+class DummyDUL(object):
+    def __init__(self):
+        self.assoc = DummyAssociation()
+        self.socket = DummySocket()
+        self.primitive = None
+
+
+def _p_data():
+    """Return a P-DATA primitive with a single 64 byte PDV."""
+    primitive = P_DATA()
+    primitive.presentation_data_value_list = [[1, b'\x03' + b'\x00' * 63]]
+    return primitive
+
+
+class TimeStateMachine(object):
+    def setup(self):
+        """Setup the test"""
+        self.dul = DummyDUL()
+        self.fsm = StateMachine(self.dul)
+        # Association established
+        self.fsm.current_state = 'Sta6'
+        self.primitive = _p_data()
+
+    def _send_and_receive(self, nr_pdus):
+        """Pass `nr_pdus` sent and received P-DATA-TF PDUs through the FSM"""
+        fsm = self.fsm
+        dul = self.dul
+        for ii in range(nr_pdus // 2):
+            # P-DATA request primitive (local user) -> DT-1
+            dul.primitive = self.primitive
+            fsm.do_action('Evt9')
+            # P-DATA-TF PDU received -> DT-2
+            dul.primitive = self.primitive
+            fsm.do_action('Evt10')
+
+    def time_data_transfer(self):
+        """Time sending and receiving 10000 P-DATA-TF PDUs."""
+        self._send_and_receive(10000)
+
+    def time_data_transfer_handler_bound(self):
+        """Time 10000 P-DATA-TF PDUs with EVT_FSM_TRANSITION bound."""
+        def handle(event):
+            pass
+
+        self.dul.assoc._handlers[evt.EVT_FSM_TRANSITION] = [handle]
+        self._send_and_receive(10000)
+
+    def time_receive(self):
+        """Time receiving 10000 P-DATA-TF PDUs."""
+        fsm = self.fsm
+        for ii in range(10000):
+            fsm.do_action('Evt10')
+
+    def track_pdus_per_second(self):
+        """Track the number of P-DATA-TF PDUs per second through the FSM."""
+        start = time.time()
+        self._send_and_receive(20000)
+        return 20000 / (time.time() - start)
+
+    track_pdus_per_second.unit = 'PDUs/s'
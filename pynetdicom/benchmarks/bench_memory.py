@@ -0,0 +1,146 @@
+"""Performance tests for memory use."""
+
+from io import BytesIO
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from pydicom.dataset import Dataset
+
+from pynetdicom import AE
+from pynetdicom.dimse_messages import C_STORE_RQ
+from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dsutils import encode
+from pynetdicom.pdu import P_DATA_TF
+from pynetdicom.sop_class import CTImageStorage, VerificationSOPClass
+
+
+def _traced(func, nr_calls):
+    """Return the number of memory blocks and bytes allocated by `func`.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call, its return value is kept until the
+        allocations have been measured.
+    nr_calls : int
+        The number of times to call `func`.
+
+    Returns
+    -------
+    float, float
+        The number of memory blocks and the number of bytes still allocated
+        after each call to `func`.
+    """
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(filters)
+        results = [func() for ii in range(nr_calls)]
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    nr_blocks = sum([stat.count_diff for stat in stats])
+    nr_bytes = sum([stat.size_diff for stat in stats])
+
+    return nr_blocks / nr_calls, nr_bytes / nr_calls
+
+
+class TrackIdleAssociationMemory(object):
+    """Track the memory used by idle associations, including both the
+    requestor and acceptor.
+    """
+    def setup(self):
+        """Run prior to each test"""
+        if tracemalloc is None:
+            raise NotImplementedError
+
+        self.ae = ae = AE()
+        ae.maximum_associations = 20
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        self.scp = ae.start_server(('', 11112), block=False)
+
+        # So the one-off allocations aren't included
+        assoc = ae.associate('localhost', 11112)
+        assoc.release()
+
+    def teardown(self):
+        """Clear any active threads"""
+        self.scp.shutdown()
+
+    def track_bytes_per_idle_association(self):
+        """Track the bytes used by each idle association."""
+        ae = self.ae
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            assocs = [ae.associate('localhost', 11112) for ii in range(10)]
+            # Allow the acceptors to finish starting
+            time.sleep(0.5)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        for assoc in assocs:
+            assoc.release()
+
+        return (after - before) / 10
+
+    track_bytes_per_idle_association.unit = 'bytes'
+
+
+class TrackCStoreAllocations(object):
+    """Track the memory allocated by the primitives, messages and PDUs used
+    to send a C-STORE request.
+    """
+    def setup(self):
+        """Run prior to each test"""
+        if tracemalloc is None:
+            raise NotImplementedError
+
+        ds = Dataset()
+        ds.PatientName = 'Test^Test'
+        ds.SOPClassUID = CTImageStorage
+        ds.SOPInstanceUID = '1.2.3.4'
+        self.dataset = encode(ds, True, True)
+
+        # So the one-off allocations aren't included
+        self._c_store()
+
+    def _c_store(self):
+        """Return the objects created to send a C-STORE request."""
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = CTImageStorage
+        primitive.AffectedSOPInstanceUID = '1.2.3.4'
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(self.dataset)
+
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+
+        pdus = []
+        for p_data in msg.encode_msg(1, 16382):
+            pdu = P_DATA_TF()
+            pdu.from_primitive(p_data)
+            pdus.append((p_data, pdu))
+
+        return primitive, msg, pdus
+
+    def track_allocations_per_c_store(self):
+        """Track the number of memory blocks allocated for each C-STORE."""
+        return _traced(self._c_store, 100)[0]
+
+    track_allocations_per_c_store.unit = 'blocks'
+
+    def track_bytes_per_c_store(self):
+        """Track the number of bytes allocated for each C-STORE."""
+        return _traced(self._c_store, 100)[1]
+
+    track_bytes_per_c_store.unit = 'bytes'
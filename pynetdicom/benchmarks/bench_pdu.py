@@ -2,7 +2,12 @@
 
 from io import BytesIO
 
+from pynetdicom import StoragePresentationContexts
 from pynetdicom.pdu import PDU, PDU_TYPES
+from pynetdicom.pdu_primitives import (
+    A_ASSOCIATE, MaximumLengthNotification, ImplementationClassUIDNotification
+)
+from pynetdicom.presentation import build_context
 from pynetdicom.tests.encoded_pdu_items import (
     presentation_context_rq,
     a_associate_rq,
@@ -122,3 +127,48 @@ class TimePDUEncode(object):
         """Time encoding an A-ABORT-RQ PDU."""
         for ii in range(1000):
             self.abort_rq.encode()
+
+
+class TimeLargeAssociateRQ(object):
+    """Time decoding and encoding an A-ASSOCIATE-RQ with 128 presentation
+    contexts, each with 6 transfer syntaxes.
+    """
+    def setup(self):
+        """Setup the test"""
+        transfer_syntaxes = [
+            '1.2.840.10008.1.2', '1.2.840.10008.1.2.1', '1.2.840.10008.1.2.2',
+            '1.2.840.10008.1.2.4.50', '1.2.840.10008.1.2.4.70',
+            '1.2.840.10008.1.2.4.90',
+        ]
+        contexts = []
+        for ii, cx in enumerate(StoragePresentationContexts):
+            context = build_context(cx.abstract_syntax, transfer_syntaxes)
+            context.context_id = 2 * ii + 1
+            contexts.append(context)
+
+        max_length = MaximumLengthNotification()
+        max_length.maximum_length_received = 16382
+        class_uid = ImplementationClassUIDNotification()
+        class_uid.implementation_class_uid = '1.2.826.0.1.3680043.9.3811'
+
+        primitive = A_ASSOCIATE()
+        primitive.application_context_name = '1.2.840.10008.3.1.1.1'
+        primitive.calling_ae_title = b'STORESCU'
+        primitive.called_ae_title = b'STORESCP'
+        primitive.presentation_context_definition_list = contexts
+        primitive.user_information = [max_length, class_uid]
+
+        self.pdu = PDU_TYPES[0x01]()
+        self.pdu.from_primitive(primitive)
+        self.encoded = self.pdu.encode()
+
+    def time_decode(self):
+        """Time decoding the A-ASSOCIATE-RQ PDU."""
+        for ii in range(10):
+            pdu = PDU_TYPES[0x01]()
+            pdu.decode(self.encoded)
+
+    def time_encode(self):
+        """Time encoding the A-ASSOCIATE-RQ PDU."""
+        for ii in range(10):
+            self.pdu.encode()
@@ -5,8 +5,9 @@ from copy import deepcopy
 from pydicom._uid_dict import UID_dictionary
 from pydicom.uid import UID
 
-from pynetdicom import StoragePresentationContexts, build_context
+from pynetdicom import AE, StoragePresentationContexts, build_context
 from pynetdicom.presentation import (
+    NegotiationCache,
     PresentationContext,
     negotiate_as_acceptor,
     negotiate_as_requestor
@@ -189,3 +190,69 @@ class TimePresentationRequestor(object):
                 self.requestor_contexts,
                 self.acceptor_contexts
             )
+
+
+class TimeNegotiationCache(object):
+    """Time presentation context negotiation as acceptor with 128 proposed
+    contexts, with and without the negotiation cache.
+    """
+    def setup(self):
+        # A modality proposing 128 storage contexts, each with the usual
+        #   uncompressed and a JPEG transfer syntax
+        transfer_syntaxes = [
+            '1.2.840.10008.1.2.4.50',
+            '1.2.840.10008.1.2.1',
+            '1.2.840.10008.1.2',
+        ]
+        uids = [cx.abstract_syntax for cx in StoragePresentationContexts]
+        uids += [
+            uid for uid in sorted(UID_dictionary)
+            if UID_dictionary[uid][1] == 'SOP Class' and uid not in uids
+        ]
+        self.requestor_contexts = []
+        for ii, uid in enumerate(uids[:128]):
+            cx = build_context(uid, transfer_syntaxes)
+            cx.context_id = (ii * 2 + 1) % 256
+            self.requestor_contexts.append(cx)
+
+        # Only uncompressed transfer syntaxes supported
+        self.acceptor_contexts = [
+            build_context(uid) for uid in uids[:128]
+        ]
+        self.cache = NegotiationCache(self.acceptor_contexts)
+        self.cache.negotiate(self.requestor_contexts)
+
+    def time_negotiate_uncached(self):
+        """Time 100 negotiations without the cache."""
+        for ii in range(100):
+            negotiate_as_acceptor(
+                self.requestor_contexts,
+                self.acceptor_contexts
+            )
+
+    def time_negotiate_cached(self):
+        """Time 100 negotiations using the cache, including the check
+        that it's valid for the supported contexts.
+        """
+        cache = self.cache
+        for ii in range(100):
+            if cache.is_valid_for(self.acceptor_contexts):
+                cache.negotiate(self.requestor_contexts)
+
+
+class TimeContextCopy(object):
+    """Time copying the supported presentation contexts for new acceptors."""
+    def setup(self):
+        self.ae = ae = AE()
+        ae.supported_contexts = StoragePresentationContexts
+
+    def time_deepcopy(self):
+        """Time 100 copies of the supported contexts."""
+        for ii in range(100):
+            deepcopy(self.ae.supported_contexts)
+
+    def time_shared_snapshot(self):
+        """Time getting the shared copy of the supported contexts 100 times.
+        """
+        for ii in range(100):
+            self.ae._get_supported_snapshot()
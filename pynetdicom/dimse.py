@@ -1,8 +1,10 @@
 """
 Implementation of the DIMSE service provider.
 """
+from collections import deque, OrderedDict
 from io import BytesIO
 import logging
+import threading
 try:
     import queue
 except ImportError:
@@ -12,6 +14,7 @@ from pynetdicom import evt
 from pynetdicom.dimse_messages import *
 from pynetdicom.dimse_primitives import *
 from pynetdicom.pdu_primitives import P_DATA
+from pynetdicom.tracing import traced
 
 
 LOGGER = logging.getLogger('pynetdicom.dimse')
@@ -167,7 +170,7 @@ class DIMSEServiceProvider(object):
         operations and is limited to a maximum of 10 messages.
     message : dimse_messages.DIMSEMessage
         The DIMSE message.
-    msg_queue: queue.queue of dimse_messages.DIMSEMessage
+    msg_queue: dimse.MessageQueue
         A queue holding decoded DIMSE Message primitives received from the
         peer, except for C-CANCEL requests.
 
@@ -188,7 +191,10 @@ class DIMSEServiceProvider(object):
 
         self.cancel_req = {}
         self.message = None
-        self.msg_queue = queue.Queue()
+        self.msg_queue = MessageQueue()
+        # The size of the data set of the message last taken from the queue,
+        #   which is held in the memory budget until it's been processed
+        self._processing_bytes = 0
 
     @property
     def assoc(self):
@@ -220,12 +226,53 @@ class DIMSEServiceProvider(object):
             The next available (context ID, DIMSE message), which is taken off
             the queue, or (None, None) if no messages are available within
             the `dimse_timeout` period.
+
+        Notes
+        -----
+        The data set of the returned message is held in the AE's memory
+        budget until ``get_msg()`` is next called, by which time the message
+        has been processed.
         """
+        # The message last taken from the queue has been processed
+        if self._processing_bytes:
+            self.assoc._budget.release(self._processing_bytes)
+            self._processing_bytes = 0
+
         try:
-            return self.msg_queue.get(block=block, timeout=self.dimse_timeout)
+            item = self.msg_queue.get(block=block, timeout=self.dimse_timeout)
         except queue.Empty:
             return None, None
 
+        self._processing_bytes = MessageQueue._size(item)
+        # The DUL may have stopped reading while the queue was full
+        self.dul.wake()
+
+        return item
+
+    @property
+    def is_receive_full(self):
+        """Return True if the received messages waiting to be processed
+        have reached the association's ``receive_buffer_messages`` or
+        ``receive_buffer_size`` limits or if the AE's ``memory_budget`` is
+        exhausted, False otherwise.
+
+        While the memory budget is exhausted only the association receiving
+        the oldest partially received message continues reading, see
+        ``MemoryBudget``.
+        """
+        max_messages = self.assoc.receive_buffer_messages
+        if max_messages and self.msg_queue.qsize() >= max_messages:
+            return True
+
+        max_bytes = self.assoc.receive_buffer_size
+        if max_bytes and self.msg_queue.nr_bytes >= max_bytes:
+            return True
+
+        if self.assoc._budget.must_wait:
+            return True
+
+        return False
+
     @property
     def maximum_pdu_size(self):
         """Return the peer's maximum PDU length."""
@@ -248,6 +295,7 @@ class DIMSEServiceProvider(object):
         except (queue.Empty, IndexError):
             return None, None
 
+    @traced('DIMSEServiceProvider.receive_primitive')
     def receive_primitive(self, primitive):
         """Process a P-DATA primitive received from the remote.
 
@@ -265,10 +313,22 @@ class DIMSEServiceProvider(object):
         primitive : pdu_primitives.P_DATA
             A P-DATA primitive received from the peer to be processed.
         """
+        budget = self.assoc._budget
         if self.message is None:
             self.message = DIMSEMessage()
+            budget.start_message()
+
+        if self.message.decode_msg(primitive, budget):
+            # The complete message's data set stays in the budget until the
+            #   message has been taken from the queue and processed
+            budget.end_message()
+
+            metrics = self.assoc.ae.metrics
+            if metrics.enabled:
+                metrics.dimse_received.inc(
+                    1, self.message.__class__.__name__.replace('_', '-')
+                )
 
-        if self.message.decode_msg(primitive):
             # Trigger event
             evt.trigger(
                 self.assoc, evt.EVT_DIMSE_RECV, {'message' : self.message}
@@ -280,6 +340,7 @@ class DIMSEServiceProvider(object):
             except Exception as exc:
                 LOGGER.error("Received an invalid DIMSE message")
                 LOGGER.exception(exc)
+                budget.release(self.message.data_set.tell())
                 self.dul.event_queue.put('Evt19')
                 return
 
@@ -288,6 +349,7 @@ class DIMSEServiceProvider(object):
             if isinstance(primitive, C_CANCEL) and len(self.cancel_req) < 10:
                 msg_id = primitive.MessageIDBeingRespondedTo
                 self.cancel_req[msg_id] = primitive
+                budget.release(self.message.data_set.tell())
             else:
                 self.msg_queue.put((context_id, primitive))
 
@@ -297,9 +359,14 @@ class DIMSEServiceProvider(object):
             self.message.data_set = BytesIO()
             self.message = None
 
+    @traced('DIMSEServiceProvider.send_msg')
     def send_msg(self, primitive, context_id):
         """Send a DIMSE-C or DIMSE-N message to the peer AE.
 
+        The message is split into P-DATA primitives as it's queued for
+        sending, and blocks while queuing another would exceed the
+        association's ``send_buffer_size``.
+
         Parameters
         ----------
         primitive : dimse_primitives DIMSE Primitive class
@@ -317,6 +384,12 @@ class DIMSEServiceProvider(object):
         dimse_msg.primitive_to_message(primitive)
         dimse_msg.context_id = context_id
 
+        metrics = self.assoc.ae.metrics
+        if metrics.enabled:
+            metrics.dimse_sent.inc(
+                1, dimse_msg.__class__.__name__.replace('_', '-')
+            )
+
         # Trigger event
         evt.trigger(
             self.assoc, evt.EVT_DIMSE_SENT, {'message' : dimse_msg}
@@ -326,3 +399,279 @@ class DIMSEServiceProvider(object):
         #   each below the max_pdu size
         for pdata in dimse_msg.encode_msg(context_id, self.maximum_pdu_size):
             self.dul.send_pdu(pdata)
+
+
+class MemoryBudget(object):
+    """A byte budget for the DIMSE data in-flight across all of an AE's
+    associations.
+
+    The in-flight data is the data sets of the messages being received, of
+    the received messages waiting to be processed and of the message being
+    processed, as well as the P-DATA waiting to be sent.
+
+    While the budget is exhausted associations stop reading from their peers
+    at the next PDU and block when queuing more P-DATA to send. The
+    association receiving the oldest partially received message keeps
+    reading, so that one message can always be completed and processed and
+    its data released. If no message is partially received then each
+    association may read the first PDU of its next message, so an
+    association never waits on one whose peer isn't sending. Associations
+    that stopped reading are woken once data has been released or it's
+    their turn.
+
+    Attributes
+    ----------
+    high_water : int
+        The largest value `nr_bytes` has reached (in bytes).
+    maxbytes : int or None
+        The total size of the in-flight data that exhausts the budget (in
+        bytes), ``None`` for no limit (default).
+    nr_bytes : int
+        The current total size of the in-flight data (in bytes).
+    """
+    def __init__(self, maxbytes=None):
+        """Create a new MemoryBudget.
+
+        Parameters
+        ----------
+        maxbytes : int or None, optional
+            The total size of the in-flight data that exhausts the budget (in
+            bytes), default ``None`` for no limit.
+        """
+        self.maxbytes = maxbytes
+        self.nr_bytes = 0
+        self.high_water = 0
+        self._lock = threading.Lock()
+        # The accounts with a partially received message, oldest first
+        self._receiving = OrderedDict()
+        # The accounts that have stopped reading
+        self._waiting = OrderedDict()
+
+    def acquire(self, nr_bytes):
+        """Add `nr_bytes` to the in-flight data, never blocks."""
+        with self._lock:
+            self.nr_bytes += nr_bytes
+            if self.nr_bytes > self.high_water:
+                self.high_water = self.nr_bytes
+
+    @property
+    def is_exhausted(self):
+        """Return True if the in-flight data has reached `maxbytes`."""
+        return bool(self.maxbytes) and self.nr_bytes >= self.maxbytes
+
+    def _must_wait(self, account):
+        """Return True if `account` must stop reading from its peer."""
+        with self._lock:
+            if not self.is_exhausted:
+                return False
+
+            # Only the oldest partially received message continues, or if
+            #   there are none then each association may start one
+            if not self._receiving or next(iter(self._receiving)) is account:
+                return False
+
+            self._waiting[account] = None
+            return True
+
+    def release(self, nr_bytes):
+        """Remove `nr_bytes` from the in-flight data."""
+        with self._lock:
+            self.nr_bytes -= nr_bytes
+            waiting = self._take_waiting()
+
+        for account in waiting:
+            account.wake()
+
+    def _remove(self, account):
+        """Remove the closed `account`."""
+        with self._lock:
+            self._waiting.pop(account, None)
+            waiting = []
+            if self._receiving.pop(account, None) is not None:
+                waiting = self._take_waiting(is_next_changed=True)
+
+        for account in waiting:
+            account.wake()
+
+    def reset_high_water(self):
+        """Reset `high_water` to the current in-flight data size."""
+        with self._lock:
+            self.high_water = self.nr_bytes
+
+    def _start_receiving(self, account):
+        """Record that `account` has started receiving a message."""
+        with self._lock:
+            self._receiving[account] = True
+
+    def _stop_receiving(self, account):
+        """Record that `account` has finished receiving a message."""
+        with self._lock:
+            self._receiving.pop(account, None)
+            waiting = self._take_waiting(is_next_changed=True)
+
+        for account in waiting:
+            account.wake()
+
+    def _take_waiting(self, is_next_changed=False):
+        """Return the waiting accounts that may continue reading, must hold
+        the lock.
+
+        Parameters
+        ----------
+        is_next_changed : bool, optional
+            True if the account with the oldest partially received message
+            may have changed.
+        """
+        if not self._waiting:
+            return []
+
+        if not self.is_exhausted:
+            waiting = list(self._waiting)
+            self._waiting.clear()
+            return waiting
+
+        if not is_next_changed:
+            return []
+
+        if not self._receiving:
+            waiting = list(self._waiting)
+            self._waiting.clear()
+            return waiting
+
+        account = next(iter(self._receiving))
+        if account in self._waiting:
+            del self._waiting[account]
+            return [account]
+
+        return []
+
+
+class MessageQueue(queue.Queue):
+    """A FIFO queue of received (context ID, DIMSE primitive) that keeps
+    track of the total size of the primitives' datasets.
+
+    Attributes
+    ----------
+    nr_bytes : int
+        The current total size of the queued datasets (in bytes).
+    """
+    def __init__(self):
+        """Create a new MessageQueue."""
+        queue.Queue.__init__(self)
+        self.nr_bytes = 0
+        # The size of each queued item, in the same order as the items
+        self._sizes = deque()
+
+    @staticmethod
+    def _size(item):
+        """Return the size of the dataset in the (context ID, primitive)
+        `item`.
+        """
+        dataset = getattr(item[1], '_dataset', None)
+        if dataset is None:
+            return 0
+
+        # Avoid copying the dataset just to get its length
+        position = dataset.tell()
+        dataset.seek(0, 2)
+        size = dataset.tell()
+        dataset.seek(position)
+
+        return size
+
+    def _get(self):
+        """Remove and return the next item, must hold the mutex."""
+        self.nr_bytes -= self._sizes.popleft()
+        return self.queue.popleft()
+
+    def _put(self, item):
+        """Add `item` to the queue, must hold the mutex."""
+        size = self._size(item)
+        self._sizes.append(size)
+        self.nr_bytes += size
+        self.queue.append(item)
+
+
+class _BudgetAccount(object):
+    """An association's share of a ``MemoryBudget``.
+
+    Closing the account releases everything it still holds and further
+    use is ignored, so the data of an aborted association isn't counted
+    against the budget forever.
+    """
+    def __init__(self, budget, wake=None):
+        """Create a new _BudgetAccount.
+
+        Parameters
+        ----------
+        budget : dimse.MemoryBudget
+            The AE's budget.
+        wake : callable, optional
+            Called when the association may continue reading from its peer
+            after ``must_wait`` returned True.
+        """
+        self.budget = budget
+        self.nr_bytes = 0
+        self._is_closed = False
+        self._lock = threading.Lock()
+        self._wake = wake
+
+    def acquire(self, nr_bytes):
+        """Add `nr_bytes` to the in-flight data."""
+        with self._lock:
+            if not self._is_closed:
+                self.nr_bytes += nr_bytes
+                self.budget.acquire(nr_bytes)
+
+    def close(self):
+        """Release the account's in-flight data from the budget."""
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self._is_closed = True
+            nr_bytes = self.nr_bytes
+            self.nr_bytes = 0
+
+        self.budget._remove(self)
+        self.budget.release(nr_bytes)
+
+    def end_message(self):
+        """Record that a message has been completely received."""
+        if not self._is_closed:
+            self.budget._stop_receiving(self)
+
+    @property
+    def is_exhausted(self):
+        """Return True if the AE's budget is exhausted."""
+        return self.budget.is_exhausted
+
+    @property
+    def must_wait(self):
+        """Return True if the association must stop reading from its peer
+        until the budget allows, at which point `wake` is called.
+        """
+        if self._is_closed:
+            return False
+
+        return self.budget._must_wait(self)
+
+    def release(self, nr_bytes):
+        """Remove `nr_bytes` from the in-flight data."""
+        with self._lock:
+            if self._is_closed:
+                return
+
+            self.nr_bytes -= nr_bytes
+
+        self.budget.release(nr_bytes)
+
+    def start_message(self):
+        """Record that a message has started being received."""
+        if not self._is_closed:
+            self.budget._start_receiving(self)
+
+    def wake(self):
+        """Wake the association so it continues reading from its peer."""
+        if self._wake is not None:
+            self._wake()
@@ -216,7 +216,7 @@ class DIMSEMessage(object):
         self.encoded_command_set = BytesIO()
         self.data_set = BytesIO()
 
-    def decode_msg(self, primitive):
+    def decode_msg(self, primitive, budget=None):
         """Converts P-DATA primitives into a DIMSEMessage sub-class.
 
         Decodes the data from the P-DATA service primitive (which
@@ -228,6 +228,10 @@ class DIMSEMessage(object):
         ----------
         primitive : pdu_primitives.P_DATA
             The P-DATA service primitive to be decoded into a DIMSE message.
+        budget : dimse.MemoryBudget, optional
+            If used then the size of the data set fragments will be acquired
+            from the budget as they're received, it's up to the caller to
+            release them.
 
         Returns
         -------
@@ -317,6 +321,8 @@ class DIMSEMessage(object):
                 #   a number of fragments in each P-DATA primitive and a
                 #   number of P-DATA primitives.
                 self.data_set.write(data[1:])
+                if budget is not None:
+                    budget.acquire(len(data) - 1)
 
                 # The final data set fragment (xxxxxx10) has been added
                 if control_header_byte & 2 != 0:
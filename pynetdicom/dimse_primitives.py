@@ -33,6 +33,11 @@ LOGGER = logging.getLogger('pynetdicom.dimse_primitives')
 # pylint: disable=anomalous-backslash-in-string
 class DIMSEPrimitive(object):
     """Base class for the DIMSE primitives."""
+    __slots__ = (
+        '_affected_sop_class_uid', '_dataset', '_status', '_message_id',
+        '_message_id_being_responded_to', '_context_id'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = ()
     REQUEST_KEYWORDS = ()
     RESPONSE_KEYWORDS = ('MessageIDBeingRespondedTo', 'Status')
@@ -263,6 +268,12 @@ class C_STORE(DIMSEPrimitive):
         An optional status related field containing a text description
         of the error detected. 64 characters maximum.
     """
+    __slots__ = (
+        'OffendingElement', 'ErrorComment', '_affected_sop_instance_uid',
+        '_move_originator_application_entity_title', '_priority',
+        '_move_originator_message_id'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = ('OffendingElement', 'ErrorComment', )
     REQUEST_KEYWORDS = (
         'MessageID', 'AffectedSOPClassUID', 'AffectedSOPInstanceUID',
@@ -479,6 +490,8 @@ class C_FIND(DIMSEPrimitive):
         An optional status related field containing a text
         description of the error detected. 64 characters maximum.
     """
+    __slots__ = ('OffendingElement', 'ErrorComment', '_priority')
+
     STATUS_OPTIONAL_KEYWORDS = ('OffendingElement', 'ErrorComment', )
     REQUEST_KEYWORDS = (
         'MessageID', 'AffectedSOPClassUID', 'Priority', 'Identifier'
@@ -618,6 +631,14 @@ class C_GET(DIMSEPrimitive):
         An optional status related field containing a text
         description of the error detected. 64 characters maximum.
     """
+    __slots__ = (
+        'ErrorComment', 'OffendingElement', '_priority',
+        '_number_of_completed_suboperations',
+        '_number_of_failed_suboperations',
+        '_number_of_remaining_suboperations',
+        '_number_of_warning_suboperations'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = (
         'ErrorComment', 'OffendingElement', 'NumberOfRemainingSuboperations',
         'NumberOfCompletedSuboperations', 'NumberOfFailedSuboperations',
@@ -849,6 +870,14 @@ class C_MOVE(DIMSEPrimitive):
         An optional status related field containing a text
         description of the error detected. 64 characters maximum.
     """
+    __slots__ = (
+        'OffendingElement', 'ErrorComment', '_move_destination', '_priority',
+        '_number_of_completed_suboperations',
+        '_number_of_failed_suboperations',
+        '_number_of_remaining_suboperations',
+        '_number_of_warning_suboperations'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = (
         'ErrorComment', 'OffendingElement', 'NumberOfRemainingSuboperations',
         'NumberOfCompletedSuboperations', 'NumberOfFailedSuboperations',
@@ -1054,6 +1083,8 @@ class C_ECHO(DIMSEPrimitive):
         An optional status related field containing a text description
         of the error detected. 64 characters maximum.
     """
+    __slots__ = ('ErrorComment',)
+
     STATUS_OPTIONAL_KEYWORDS = ('ErrorComment', )
     REQUEST_KEYWORDS = ('MessageID', 'AffectedSOPClassUID')
 
@@ -1100,6 +1131,8 @@ class C_CANCEL(object):
 
     * DICOM Standard, Part 7, Section 9.3.2.3-4
     """
+    __slots__ = ('_message_id_being_responded_to', '_context_id')
+
     def __init__(self):
         """Initialise the C_CANCEL"""
         # Variable names need to match the corresponding DICOM Element keywords
@@ -1193,6 +1226,11 @@ class N_EVENT_REPORT(DIMSEPrimitive):
     Status : int
         The error or success notification of the operation.
     """
+    __slots__ = (
+        'ErrorComment', 'ErrorID', '_affected_sop_instance_uid',
+        '_event_type_id'
+    )
+
     # Optional status element keywords other than 'Status'
     STATUS_OPTIONAL_KEYWORDS = (
         'AffectedSOPClassUID', 'AffectedSOPInstanceUID', 'EventTypeID',
@@ -1351,6 +1389,12 @@ class N_GET(DIMSEPrimitive):
     Status : int
         The error or success notification of the operation.
     """
+    __slots__ = (
+        'ErrorComment', 'ErrorID', '_affected_sop_instance_uid',
+        '_requested_sop_class_uid', '_requested_sop_instance_uid',
+        '_attribute_identifier_list'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = ('ErrorComment', 'ErrorID', )
     REQUEST_KEYWORDS = (
         'MessageID', 'RequestedSOPClassUID', 'RequestedSOPInstanceUID'
@@ -1593,6 +1637,12 @@ class N_SET(DIMSEPrimitive):
     Status : int
         The error or success notification of the operation.
     """
+    __slots__ = (
+        'ErrorComment', 'ErrorID', 'AttributeIdentifierList',
+        '_affected_sop_instance_uid', '_requested_sop_class_uid',
+        '_requested_sop_instance_uid'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = (
         'ErrorComment', 'ErrorID', 'AttributeIdentifierList'
     )
@@ -1818,6 +1868,12 @@ class N_ACTION(DIMSEPrimitive):
     Status : int
         The error or success notification of the operation.
     """
+    __slots__ = (
+        'ErrorComment', 'ErrorID', '_affected_sop_instance_uid',
+        '_requested_sop_class_uid', '_requested_sop_instance_uid',
+        '_action_type_id'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = (
         'ErrorComment', 'ErrorID', 'AttributeIdentifierList'
     )
@@ -2042,6 +2098,8 @@ class N_CREATE(DIMSEPrimitive):
         The error or success notification of the operation. It shall be
         one of the following values:
     """
+    __slots__ = ('ErrorComment', 'ErrorID', '_affected_sop_instance_uid')
+
     STATUS_OPTIONAL_KEYWORDS = ('ErrorComment', 'ErrorID', )
     REQUEST_KEYWORDS = ('MessageID', 'AffectedSOPClassUID')
 
@@ -2160,6 +2218,11 @@ class N_DELETE(DIMSEPrimitive):
     Status : int
         The error or success notification of the operation.
     """
+    __slots__ = (
+        'ErrorComment', 'ErrorID', '_affected_sop_instance_uid',
+        '_requested_sop_class_uid', '_requested_sop_instance_uid'
+    )
+
     STATUS_OPTIONAL_KEYWORDS = ('ErrorComment', 'ErrorID', )
     REQUEST_KEYWORDS = (
         'MessageID', 'RequestedSOPClassUID', 'RequestedSOPInstanceUID'
@@ -7,6 +7,8 @@ from pydicom.filebase import DicomBytesIO
 from pydicom.filereader import read_dataset
 from pydicom.filewriter import write_dataset, write_data_element
 
+from pynetdicom.tracing import start_span
+
 LOGGER = logging.getLogger('pynetdicom.dsutils')
 
 def decode(bytestring, is_implicit_vr, is_little_endian):
@@ -38,7 +40,8 @@ def decode(bytestring, is_implicit_vr, is_little_endian):
     ## Decode the dataset
     # Rewind to the start of the stream
     bytestring.seek(0)
-    return read_dataset(bytestring, is_implicit_vr, is_little_endian)
+    with start_span(None, 'dsutils.decode'):
+        return read_dataset(bytestring, is_implicit_vr, is_little_endian)
 
 def encode(ds, is_implicit_vr, is_little_endian):
     """Encode a pydicom Dataset `ds` to bytes.
@@ -63,7 +66,8 @@ def encode(ds, is_implicit_vr, is_little_endian):
     fp.is_implicit_VR = is_implicit_vr
     fp.is_little_endian = is_little_endian
     try:
-        write_dataset(fp, ds)
+        with start_span(None, 'dsutils.encode'):
+            write_dataset(fp, ds)
     except Exception as ex:
         LOGGER.error("pydicom.write_dataset() failed:")
         LOGGER.error(ex)
@@ -7,10 +7,11 @@ try:
     import queue
 except ImportError:
     import Queue as queue  # Python 2 compatibility
+import select
 import socket
 from struct import unpack
 import struct
-from threading import Thread
+from threading import Condition, Lock, Thread, current_thread
 import time
 
 from pynetdicom import evt
@@ -23,6 +24,7 @@ from pynetdicom.pdu_primitives import (
     A_ASSOCIATE, A_RELEASE, A_ABORT, A_P_ABORT, P_DATA
 )
 from pynetdicom.timer import Timer
+from pynetdicom.transport import _Waker, _wait_readable
 
 
 LOGGER = logging.getLogger('pynetdicom.dul')
@@ -37,9 +39,9 @@ class DULServiceProvider(Thread):
         The ARTIM timer
     socket : transport.AssociationSocket
         A wrapped socket.socket object used to communicate with the peer.
-    to_provider_queue : queue.Queue
+    to_provider_queue : dul.ByteLimitedQueue
         Queue of PDUs from the DUL service user to be processed by the DUL
-        provider
+        provider, limited by the total size of the queued P-DATA
     to_user_queue : queue.Queue
         Queue of primitives from the DUL service to be processed by the DUL user
     event_queue : queue.Queue
@@ -63,29 +65,49 @@ class DULServiceProvider(Thread):
         self.primitive = None
         self.pdu = None
 
+        # Wakes the DUL thread while it's waiting for something to do
+        self._waker = _Waker()
+
         # Tracks the events the state machine needs to process
-        self.event_queue = queue.Queue()
+        self.event_queue = _EventQueue(self._waker)
         # These queues provide communication between the DUL service
         #   user and the DUL service provider.
         # An event occurs when the DUL service user adds to
         #   the to_provider_queue
-        self.to_provider_queue = queue.Queue()
+        # Limiting the size of the queued P-DATA means a service user that's
+        #   sending faster than the peer is receiving gets blocked
+        self.to_provider_queue = ByteLimitedQueue()
         # A primitive is sent to the service user when the DUL service provider
         # adds to the to_user_queue.
         self.to_user_queue = queue.Queue()
 
         # Set the (network) idle and ARTIM timers
         # Timeouts gets set after DUL init so these are temporary
-        self._idle_timer = Timer(60)
-        self.artim_timer = Timer(30)
+        # Their expiry is handled by the shared timer scheduler rather than
+        #   by checking them every loop
+        self._idle_timer = Timer(60, callback=self._idle_timer_fired)
+        self._idle_expired = False
+        # Set while the socket isn't being read because the received
+        #   messages haven't been processed
+        self._is_reading_paused = False
+        self.artim_timer = Timer(30, callback=self._artim_timer_fired)
+        self._artim_expired = False
 
         # State machine - PS3.8 Section 9.2
         self.state_machine = StateMachine(self)
 
-        # Controls the minimum delay between loops in run()
-        # TODO: try and make this event based rather than running loops
+        # The delay between loops in run() if the DUL can't wait for the
+        #   socket and the waker, such as when socket.socketpair() isn't
+        #   available
         self._run_loop_delay = 0.001
 
+        # Used to wake threads waiting on the DUL, the generation is
+        #   incremented every time something happens that may interest them
+        self._state_changed = Condition()
+        self._generation = 0
+        # Set once run() has finished
+        self._is_stopped = False
+
         Thread.__init__(self)
         self.daemon = False
         self._kill_thread = False
@@ -142,6 +164,36 @@ class DULServiceProvider(Thread):
 
         return pdu, event
 
+    def _artim_timer_fired(self):
+        """Called by the timer scheduler when the ARTIM timer expires."""
+        # Evt18 is issued by the DUL thread so it's serialised with the
+        #   state machine actions that stop the timer
+        self._artim_expired = True
+        self._waker.set()
+
+    def _check_artim_timer(self):
+        """Issue Evt18 if the ARTIM timer has expired."""
+        if not self._artim_expired:
+            return
+
+        self._artim_expired = False
+        # The timer may have been stopped or restarted since it expired
+        timer = self.artim_timer
+        if timer.deadline is not None and timer.expired:
+            # Evt18: ARTIM timer expired
+            self.event_queue.put('Evt18')
+
+    @property
+    def generation(self):
+        """Return the current generation, for use with ``wait_for_change()``.
+        """
+        return self._generation
+
+    def _idle_timer_fired(self):
+        """Called by the timer scheduler when the idle timer expires."""
+        self._idle_expired = True
+        self.notify_waiters()
+
     def idle_timer_expired(self):
         """
         Checks if the idle timer has expired
@@ -151,7 +203,12 @@ class DULServiceProvider(Thread):
         bool
             True if the idle timer has expired, False otherwise.
         """
-        return self._idle_timer.expired
+        return self._idle_expired
+
+    def _restart_idle_timer(self):
+        """Restart the idle timer."""
+        self._idle_expired = False
+        self._idle_timer.restart()
 
     def _is_transport_event(self):
         """Check to see if the socket has incoming data
@@ -182,6 +239,20 @@ class DULServiceProvider(Thread):
         # By this point the connection should be established
         #   If theres incoming data on the connection then check the PDU
         #   type
+        # Stop reading while the received messages are waiting to be
+        #   processed so TCP flow control throttles the peer, unless we're
+        #   releasing and need the peer's reply
+        if self.assoc.dimse.is_receive_full and not self.assoc._is_releasing:
+            # The peer isn't idle while we're busy with its messages
+            self._is_reading_paused = True
+            self._idle_timer.stop()
+
+            return False
+
+        if self._is_reading_paused:
+            self._is_reading_paused = False
+            self._restart_idle_timer()
+
         # Fix for #28 - caused by peer disconnecting before run loop is
         #   stopped by assoc.release()
         if self.socket and self.socket.ready:
@@ -190,9 +261,16 @@ class DULServiceProvider(Thread):
 
         return False
 
+    def notify_waiters(self):
+        """Wake any threads waiting in ``wait_for_change()``."""
+        with self._state_changed:
+            self._generation += 1
+            self._state_changed.notify_all()
+
     def kill_dul(self):
         """Immediately interrupts the thread"""
         self._kill_thread = True
+        self._waker.set()
 
     @property
     def network_timeout(self):
@@ -309,6 +387,10 @@ class DULServiceProvider(Thread):
             self.event_queue.put('Evt17')
             return
 
+        metrics = self.assoc.ae.metrics
+        if metrics.enabled:
+            metrics.record_pdu(pdu_type, len(bytestream), is_received=True)
+
         try:
             # Decode the PDU data, get corresponding FSM event
             pdu, event = self._decode_pdu(bytestream)
@@ -372,65 +454,82 @@ class DULServiceProvider(Thread):
         connection for incoming data. When incoming data is received it
         categorises it and add its to the `to_user_queue`.
         """
-        # Main DUL loop
-        self._idle_timer.start()
-
-        while True:
-            # Let the assoc reactor off the leash
-            if not self.assoc._dul_ready.is_set():
-                self.assoc._dul_ready.set()
-
-            # This effectively controls how quickly the DUL does anything
-            time.sleep(self._run_loop_delay)
-
-            if self._kill_thread:
-                break
-
-            # Check the ARTIM timer first so its event is placed on the queue
-            #   ahead of any other events this loop
-            if self.artim_timer.expired:
-                self.event_queue.put('Evt18')
-
-            # Check the connection for incoming data
-            try:
-                # We can either encode and send a primitive **OR**
-                #   receive and decode a PDU per loop of the reactor
-                if self._check_incoming_primitive():
-                    pass
-                elif self._is_transport_event():
-                    self._idle_timer.restart()
-            except Exception as exc:
-                LOGGER.error("Exception in DUL.run(), aborting association")
-                LOGGER.exception(exc)
-                # Bypass the state machine and send an A-ABORT
-                #   we do it this way because an exception here will mess up
-                #   the state machine and we can't guarantee it'll get sent
-                #   otherwise
-                abort_pdu = A_ABORT_RQ()
-                abort_pdu.source = 0x02
-                abort_pdu.reason_diagnostic = 0x00
-                self.socket.send(abort_pdu.encode())
-                self.assoc.is_aborted = True
-                self.assoc.is_established = False
-                # Hard shutdown of the Association and DUL reactors
-                self.assoc._kill = True
-                self._kill_thread = True
-                return
-
-            # Check the event queue to see if there is anything to do
-            try:
-                event = self.event_queue.get(block=False)
-            # If the queue is empty, return to the start of the loop
-            except queue.Empty:
-                continue
-
-            self.state_machine.do_action(event)
+        try:
+            # Main DUL loop
+            self._waker.open()
+            self._restart_idle_timer()
+
+            while True:
+                # Let the assoc reactor off the leash
+                if not self.assoc._dul_ready.is_set():
+                    self.assoc._dul_ready.set()
+
+                # Anything that happens after this wakes the next wait
+                self._waker.clear()
+
+                if self._kill_thread:
+                    break
+
+                # Check the ARTIM timer first so its event is placed on the
+                #   queue ahead of any other events this loop
+                self._check_artim_timer()
+
+                # Check the connection for incoming data
+                try:
+                    # We can either encode and send a primitive **OR**
+                    #   receive and decode a PDU per loop of the reactor
+                    if self._check_incoming_primitive():
+                        pass
+                    elif self._is_transport_event():
+                        self._restart_idle_timer()
+                except Exception as exc:
+                    LOGGER.error(
+                        "Exception in DUL.run(), aborting association"
+                    )
+                    LOGGER.exception(exc)
+                    # Bypass the state machine and send an A-ABORT
+                    #   we do it this way because an exception here will mess
+                    #   up the state machine and we can't guarantee it'll get
+                    #   sent otherwise
+                    abort_pdu = A_ABORT_RQ()
+                    abort_pdu.source = 0x02
+                    abort_pdu.reason_diagnostic = 0x00
+                    self.socket.send(abort_pdu.encode())
+                    self.assoc.is_aborted = True
+                    self.assoc.is_established = False
+                    # Hard shutdown of the Association and DUL reactors
+                    self.assoc._kill = True
+                    self._kill_thread = True
+                    return
+
+                # Check the event queue to see if there is anything to do
+                try:
+                    event = self.event_queue.get(block=False)
+                # If the queue is empty, wait for something to happen
+                except queue.Empty:
+                    self._wait()
+                    continue
+
+                self.state_machine.do_action(event)
+                self.notify_waiters()
+        finally:
+            # Waiters check whether the DUL is alive, which is still True
+            #   here, so `wait_for_change()` joins the thread once stopped
+            with self._state_changed:
+                self._is_stopped = True
+
+            # Nothing will be sent so don't block anything waiting to queue
+            self.to_provider_queue.close()
+            self._waker.close()
+            self.notify_waiters()
 
     def send_pdu(self, primitive):
         """Place a primitive in the provider queue to be sent to the peer.
 
         Primitives are converted to the corresponding PDU and encoded before
-        sending.
+        sending. Placing a P-DATA primitive blocks while the queue's size
+        limit would be exceeded, until the DUL has sent enough of the queued
+        P-DATA or stopped running.
 
         Parameters
         ----------
@@ -446,6 +545,7 @@ class DULServiceProvider(Thread):
             )
 
         self.to_provider_queue.put(primitive)
+        self._waker.set()
 
     def stop_dul(self):
         """
@@ -458,11 +558,237 @@ class DULServiceProvider(Thread):
         """
         if self.state_machine.current_state == 'Sta1':
             self._kill_thread = True
+            self._waker.set()
             # Fix for Issue 39
             # Give the DUL thread time to exit
-            while self.is_alive():
-                time.sleep(0.001)
+            if self.is_alive() and current_thread() is not self:
+                self.join()
 
             return True
 
         return False
+
+    def _wait(self):
+        """Block until there may be something for the DUL to do.
+
+        Returns once the transport connection has data to be read, unless
+        reading is paused, or the DUL has been woken by an event being
+        queued, a primitive being sent, the ARTIM timer expiring or the
+        received messages being processed or the AE's memory budget allowing
+        reading to continue. While there's no connection the wait is limited
+        to ``_run_loop_delay`` seconds.
+        """
+        if not self._waker.is_available:
+            time.sleep(self._run_loop_delay)
+            return
+
+        socks = [self._waker]
+        timeout = None
+        transport = self.socket
+        if (transport is None or transport.socket is None
+                or not transport._is_connected):
+            # The connection may be made without waking the DUL
+            timeout = self._run_loop_delay
+        elif not self._is_reading_paused:
+            # Data already decrypted by the TLS layer isn't seen by poll()
+            pending = getattr(transport.socket, 'pending', None)
+            if pending is not None and pending():
+                return
+
+            socks.append(transport.socket)
+
+        try:
+            _wait_readable(socks, timeout)
+        except (select.error, socket.error, ValueError):
+            # The socket has been closed, which is found on the next loop
+            time.sleep(self._run_loop_delay)
+
+    def wake(self):
+        """Wake the DUL's thread if it's waiting for something to do.
+
+        Used when the DUL may be able to continue reading from the peer,
+        such as after received messages have been processed.
+        """
+        self._waker.set()
+
+    def wait_for_change(self, generation, timeout=None):
+        """Block until the DUL's generation differs from `generation`.
+
+        The generation changes after each state machine event is processed,
+        when the idle timer expires and when the DUL stops running.
+
+        Parameters
+        ----------
+        generation : int
+            The value of ``generation`` prior to checking whatever state
+            the caller is waiting on.
+        timeout : float or None, optional
+            The maximum number of seconds to wait for, default None to wait
+            indefinitely.
+
+        Returns
+        -------
+        int
+            The current generation.
+        """
+        with self._state_changed:
+            if self._generation == generation and not self._is_stopped:
+                self._state_changed.wait(timeout)
+
+            generation = self._generation
+            is_stopped = self._is_stopped
+
+        # The final notification is sent just before the thread exits
+        if is_stopped and self.is_alive() and current_thread() is not self:
+            self.join(timeout)
+
+        return generation
+
+
+class _EventQueue(queue.Queue):
+    """A FIFO queue of state machine events that wakes the DUL's thread
+    when an event is added.
+    """
+    def __init__(self, waker):
+        """Create a new _EventQueue.
+
+        Parameters
+        ----------
+        waker : transport._Waker
+            The waker for the DUL's thread.
+        """
+        queue.Queue.__init__(self)
+        self._waker = waker
+
+    def _put(self, item):
+        """Add `item` to the queue, must hold the mutex."""
+        self.queue.append(item)
+        self._waker.set()
+
+
+class ByteLimitedQueue(queue.Queue):
+    """A FIFO queue of primitives limited by the size of its P-DATA.
+
+    Putting a P-DATA primitive blocks while the queue already contains
+    P-DATA and adding the primitive would take the total size of the queued
+    presentation data values over `maxbytes`, or while the queue already
+    contains P-DATA and `budget` is exhausted. A single P-DATA larger than
+    `maxbytes` is allowed when there's no other P-DATA queued. Other
+    primitives never block so an A-ABORT can always be sent.
+
+    Attributes
+    ----------
+    budget : dimse.MemoryBudget or None
+        If used then the queued P-DATA is acquired from the budget until
+        it's taken off the queue.
+    maxbytes : int or None
+        The maximum total size of the queued P-DATA (in bytes), ``None``
+        for no limit.
+    nr_bytes : int
+        The current total size of the queued P-DATA (in bytes).
+    """
+    def __init__(self, maxbytes=None, budget=None):
+        """Create a new ByteLimitedQueue.
+
+        Parameters
+        ----------
+        maxbytes : int or None, optional
+            The maximum total size of the queued P-DATA (in bytes), default
+            ``None`` for no limit.
+        budget : dimse.MemoryBudget or None, optional
+            The memory budget to acquire the queued P-DATA from, default
+            ``None`` for no budget.
+        """
+        queue.Queue.__init__(self)
+        self.budget = budget
+        self.maxbytes = maxbytes
+        self.nr_bytes = 0
+        self._is_closed = False
+
+    @staticmethod
+    def _size(item):
+        """Return the size of the presentation data values in `item`."""
+        if item.__class__ is not P_DATA:
+            return 0
+
+        return sum([len(pdv[1]) for pdv in item.presentation_data_value_list])
+
+    def _get(self):
+        """Remove and return the next item, must hold the mutex."""
+        item = self.queue.popleft()
+        size = self._size(item)
+        self.nr_bytes -= size
+        if size and self.budget is not None:
+            self.budget.release(size)
+        # Producers may be waiting on different sized items
+        self.not_full.notify_all()
+        return item
+
+    def _put(self, item):
+        """Add `item` to the queue, must hold the mutex."""
+        size = self._size(item)
+        self.nr_bytes += size
+        if size and self.budget is not None:
+            self.budget.acquire(size)
+
+        self.queue.append(item)
+
+    def _is_full(self, size):
+        """Return True if P-DATA of `size` can't be queued yet, must hold
+        the mutex.
+        """
+        # Items already queued will release their budget when sent
+        if not self.nr_bytes:
+            return False
+
+        if self.maxbytes and self.nr_bytes + size > self.maxbytes:
+            return True
+
+        return self.budget is not None and self.budget.is_exhausted
+
+    def close(self):
+        """Stop putting from blocking, used once the queue is no longer
+        being consumed.
+        """
+        with self.mutex:
+            self._is_closed = True
+            self.not_full.notify_all()
+
+    def put(self, item, block=True, timeout=None):
+        """Put `item` into the queue.
+
+        Parameters
+        ----------
+        item : pdu_primitives primitive
+            The primitive to add.
+        block : bool, optional
+            If ``True`` (default) then block while the queue is full,
+            otherwise raise ``queue.Full`` if full.
+        timeout : float or None, optional
+            The maximum number of seconds to block for before raising
+            ``queue.Full``, default ``None`` to block indefinitely.
+        """
+        size = self._size(item)
+        with self.not_full:
+            if size:
+                endtime = None
+                if timeout is not None:
+                    endtime = time.time() + timeout
+
+                while not self._is_closed and self._is_full(size):
+                    if not block:
+                        raise queue.Full
+
+                    if endtime is None:
+                        self.not_full.wait()
+                        continue
+
+                    remaining = endtime - time.time()
+                    if remaining <= 0:
+                        raise queue.Full
+
+                    self.not_full.wait(remaining)
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
@@ -6,11 +6,18 @@ from collections import namedtuple
 from datetime import datetime
 import inspect
 import logging
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2 compatibility
 import sys
+import threading
 
 from pydicom.dataset import Dataset
 
 from pynetdicom.dsutils import decode
+from pynetdicom.metrics import clock
+from pynetdicom.tracing import current_span, start_span
 
 
 LOGGER = logging.getLogger('pynetdicom.events')
@@ -148,6 +155,10 @@ def trigger(assoc, event, attrs=None):
         exception will be raised. If an exception occurs in a notification
         handler then the exception will be caught and logged instead.
     """
+    metrics = assoc.ae.metrics
+    if metrics.enabled:
+        metrics.record_event(assoc, event)
+
     # Get the handler(s) bound to the event
     #   notification events: returns a list of callable
     #   intervention events: returns a callable or None
@@ -157,26 +168,301 @@ def trigger(assoc, event, attrs=None):
 
     evt = Event(assoc, event, attrs or {})
 
-    try:
-        # Intervention event - only single handler allowed
-        if event.is_intervention:
-            return handlers(evt)
+    # Intervention event - only single handler allowed
+    if event.is_intervention:
+        start = clock() if metrics.enabled else None
+        try:
+            # Only trace the handler if tracing is being used
+            tracer = assoc.ae.tracer
+            if tracer is None and current_span() is None:
+                return handlers(evt)
+
+            with start_span(tracer, 'handler.{}'.format(event.name)):
+                return handlers(evt)
+        finally:
+            if start is not None:
+                metrics.handler_duration.observe(clock() - start, event.name)
+
+    # Notification event - multiple handlers are allowed
+    dispatcher = assoc.ae.event_dispatcher
+    if dispatcher is not None and dispatcher.is_dispatched(event):
+        dispatcher.dispatch(handlers, evt)
+        return
+
+    _notify(handlers, evt)
 
-        # Notification event - multiple handlers are allowed
+
+def _notify(handlers, evt):
+    """Call the notification `handlers` with `evt`.
+
+    Parameters
+    ----------
+    handlers : list of callable
+        The handlers bound to the notification event.
+    evt : events.Event
+        The event to pass to the handlers.
+    """
+    start = None
+    if evt.assoc is not None and evt.assoc.ae.metrics.enabled:
+        metrics = evt.assoc.ae.metrics
+        start = clock()
+
+    # pylint: disable=broad-except
+    try:
         for func in handlers:
             func(evt)
     except Exception as exc:
-        # Intervention exceptions get raised
-        if event.is_intervention:
-            raise
-
         # Capture exceptions for notification events
         LOGGER.error(
             "Exception raised in user's 'evt.{}' event handler '{}'"
-            .format(event.name, func.__name__)
+            .format(evt.name, func.__name__)
         )
         LOGGER.exception(exc)
 
+    if start is not None:
+        metrics.handler_duration.observe(clock() - start, evt.name)
+
+
+class EventDispatcher(object):
+    """Deliver notification events to their handlers off-thread.
+
+    By default the handlers bound to notification events are called
+    synchronously from within the thread that triggered the event, which for
+    events such as ``EVT_DATA_RECV``, ``EVT_PDU_RECV`` and
+    ``EVT_FSM_TRANSITION`` is the DUL thread. A slow handler will therefore
+    delay the protocol exchange with the peer. When an ``EventDispatcher`` is
+    assigned to ``ApplicationEntity.event_dispatcher`` the triggered
+    notification events are instead placed on a bounded queue and the bound
+    handlers called by a pool of worker threads.
+
+    Intervention events are never dispatched off-thread.
+
+    Examples
+    --------
+
+    >>> from pynetdicom import AE, evt
+    >>> from pynetdicom.events import EventDispatcher
+    >>> ae = AE()
+    >>> ae.event_dispatcher = EventDispatcher(
+    ...     nr_workers=2, maxsize=500, policy='drop'
+    ... )
+
+    Attributes
+    ----------
+    events : list of events.NotificationEvent or None
+        The notification events that will be dispatched off-thread, if
+        ``None`` then all notification events will be.
+    maxsize : int
+        The maximum number of events that may be waiting for delivery.
+    policy : str
+        The policy to use when the queue is full, one of:
+
+        * ``'block'`` - the triggering thread waits until there's room in
+          the queue.
+        * ``'drop'`` - the new event is dropped.
+        * ``'sample'`` - every `sample_interval`-th overflowing event replaces
+          the oldest queued event, the others are dropped.
+    sample_interval : int
+        When `policy` is ``'sample'``, the interval used to pick which
+        overflowing events are kept.
+    """
+    _POLICIES = ('block', 'drop', 'sample')
+
+    def __init__(self, nr_workers=1, maxsize=1000, policy='drop',
+                 sample_interval=10, events=None):
+        """Create a new EventDispatcher and start its workers.
+
+        Parameters
+        ----------
+        nr_workers : int, optional
+            The number of worker threads used to call the handlers
+            (default ``1``). With a single worker the handlers are called
+            in the same order the events were triggered.
+        maxsize : int, optional
+            The maximum number of queued events (default ``1000``).
+        policy : str, optional
+            The overflow policy, one of ``'block'``, ``'drop'`` (default) or
+            ``'sample'``.
+        sample_interval : int, optional
+            The sampling interval used with the ``'sample'`` policy (default
+            ``10``).
+        events : list of events.NotificationEvent, optional
+            If used then only these events will be dispatched off-thread,
+            the handlers for any other events will be called synchronously
+            as usual. By default all notification events are dispatched.
+
+        Raises
+        ------
+        ValueError
+            If `policy` isn't a valid overflow policy, if `nr_workers`,
+            `maxsize` or `sample_interval` are less than 1 or if `events`
+            contains an intervention event.
+        """
+        if policy not in self._POLICIES:
+            raise ValueError(
+                "Invalid 'policy' value, must be 'block', 'drop' or 'sample'"
+            )
+
+        for name, value in [('nr_workers', nr_workers), ('maxsize', maxsize),
+                            ('sample_interval', sample_interval)]:
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(
+                    "'{}' must be an int greater than 0".format(name)
+                )
+
+        if events is not None:
+            if [ii for ii in events if not ii.is_notification]:
+                raise ValueError(
+                    "Only notification events can be dispatched off-thread"
+                )
+            events = list(events)
+
+        self.events = events
+        self.maxsize = maxsize
+        self.policy = policy
+        self.sample_interval = sample_interval
+
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        # Overflow statistics
+        self._dropped = {}
+        self._nr_overflow = 0
+        self._nr_delivered = 0
+
+        self._workers = []
+        for ii in range(nr_workers):
+            thread = threading.Thread(
+                target=self._run, name="EventDispatcher-{}".format(ii)
+            )
+            thread.daemon = True
+            thread.start()
+            self._workers.append(thread)
+
+    def dispatch(self, handlers, evt):
+        """Queue `evt` for delivery to `handlers`.
+
+        Parameters
+        ----------
+        handlers : list of callable
+            The handlers bound to the event.
+        evt : events.Event
+            The event to deliver.
+
+        Returns
+        -------
+        bool
+            ``True`` if the event was queued, ``False`` if it was dropped.
+        """
+        # Copy the handlers so later (un)binding doesn't affect delivery
+        item = (list(handlers), evt)
+        if self.policy == 'block':
+            self._queue.put(item)
+            return True
+
+        try:
+            self._queue.put(item, block=False)
+            return True
+        except queue.Full:
+            pass
+
+        with self._lock:
+            self._nr_overflow += 1
+            is_sampled = (
+                self.policy == 'sample'
+                and self._nr_overflow % self.sample_interval == 0
+            )
+
+        if is_sampled:
+            # Make room for the sampled event by dropping the oldest
+            try:
+                _, oldest = self._queue.get(block=False)
+                self._record_drop(oldest)
+                self._queue.task_done()
+            except queue.Empty:
+                pass
+
+            try:
+                self._queue.put(item, block=False)
+                return True
+            except queue.Full:
+                pass
+
+        self._record_drop(evt)
+        return False
+
+    @property
+    def dropped(self):
+        """Return the total number of dropped events as int."""
+        with self._lock:
+            return sum(self._dropped.values())
+
+    @property
+    def dropped_events(self):
+        """Return the number of dropped events as {event name : int}."""
+        with self._lock:
+            return dict(self._dropped)
+
+    @property
+    def delivered(self):
+        """Return the number of events delivered to their handlers as int."""
+        with self._lock:
+            return self._nr_delivered
+
+    def is_dispatched(self, event):
+        """Return ``True`` if `event` should be dispatched off-thread.
+
+        Parameters
+        ----------
+        event : events.NotificationEvent or events.InterventionEvent
+            The event to check.
+        """
+        if not event.is_notification:
+            return False
+
+        return self.events is None or event in self.events
+
+    def join(self):
+        """Block until all the queued events have been delivered."""
+        self._queue.join()
+
+    @property
+    def pending(self):
+        """Return the approximate number of queued events as int."""
+        return self._queue.qsize()
+
+    def _record_drop(self, evt):
+        """Update the overflow statistics for the dropped `evt`."""
+        with self._lock:
+            self._dropped[evt.name] = self._dropped.get(evt.name, 0) + 1
+
+        LOGGER.debug(
+            "Event dispatcher queue full, dropped 'evt.{}'".format(evt.name)
+        )
+
+    def _run(self):
+        """The worker thread's run loop."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                _notify(*item)
+                with self._lock:
+                    self._nr_delivered += 1
+            finally:
+                self._queue.task_done()
+
+    def stop(self):
+        """Stop the workers once the currently queued events are delivered."""
+        for _ in self._workers:
+            self._queue.put(None)
+
+        for thread in self._workers:
+            thread.join()
+
+        self._workers = []
+
 
 class Event(object):
     """Representation of an event.
@@ -25,8 +25,6 @@ class StateMachine(object):
 
     Attributes
     ----------
-    current_state : str
-        The current state of the state machine, 'Sta1' to 'Sta13'.
     dul : dul.DULServiceProvider
         The DICOM Upper Layer service instance for the local AE
 
@@ -43,9 +41,32 @@ class StateMachine(object):
         dul : dul.DULServiceProvider
             The DICOM Upper Layer Service instance for the association.
         """
-        self.current_state = 'Sta1'
+        # The index of the current state in _STATE_NAMES, 0 for 'Sta1'
+        self._state = 0
         self.dul = dul
 
+    @property
+    def current_state(self):
+        """Return the current state of the state machine as str.
+
+        Returns
+        -------
+        str
+            The current state, 'Sta1' to 'Sta13'.
+        """
+        return _STATE_NAMES[self._state]
+
+    @current_state.setter
+    def current_state(self, state):
+        """Set the current state of the state machine.
+
+        Parameters
+        ----------
+        state : str
+            The state, 'Sta1' to 'Sta13'.
+        """
+        self._state = _STATE_INDEX[state]
+
     def do_action(self, event):
         """Execute the action triggered by `event`.
 
@@ -55,7 +76,12 @@ class StateMachine(object):
             The event to be processed, 'Evt1' to 'Evt19'
         """
         # Check (event + state) is valid
-        if (event, self.current_state) not in TRANSITION_TABLE:
+        try:
+            action_name = _DISPATCH[_EVENT_INDEX[event]][self._state]
+        except KeyError:
+            action_name = None
+
+        if action_name is None:
             msg = (
                 "Invalid event '{}' for the current state '{}'"
                 .format(event, self.current_state)
@@ -63,8 +89,6 @@ class StateMachine(object):
             LOGGER.error(msg)
             raise InvalidEventError(msg)
 
-        action_name = TRANSITION_TABLE[(event, self.current_state)]
-
         # action is the (description, function, state) tuple
         #   associated with the action_name
         action = ACTIONS[action_name]
@@ -75,17 +99,19 @@ class StateMachine(object):
             # Execute the required action
             next_state = action[1](self.dul)
 
-            # Event handler - FSM transition
-            evt.trigger(
-                self.dul.assoc,
-                evt.EVT_FSM_TRANSITION,
-                {
-                    'action' : action_name,
-                    'current_state' : self.current_state,
-                    'fsm_event' : event,
-                    'next_state' : next_state
-                }
-            )
+            # Event handler - FSM transition, only if a handler is bound
+            #   as this is called for every PDU sent and received
+            if self.dul.assoc.get_handlers(evt.EVT_FSM_TRANSITION):
+                evt.trigger(
+                    self.dul.assoc,
+                    evt.EVT_FSM_TRANSITION,
+                    {
+                        'action' : action_name,
+                        'current_state' : self.current_state,
+                        'fsm_event' : event,
+                        'next_state' : next_state
+                    }
+                )
             #print(
             #    "{} + {} -> {} -> {}"
             #    .format(self.current_state, event, action_name, next_state)
@@ -116,9 +142,9 @@ class StateMachine(object):
             If `state` is not a valid state.
         """
         # Validate that state is acceptable
-        if state in STATES.keys():
-            self.current_state = state
-        else:
+        try:
+            self._state = _STATE_INDEX[state]
+        except KeyError:
             msg = "Invalid state '{}' for State Machine".format(state)
             LOGGER.error(msg)
             raise ValueError(msg)
@@ -184,11 +210,10 @@ def AE_2(dul):
     str
         'Sta5', the next state of the state machine.
     """
-    # Send A-ASSOCIATE-RQ PDU
-    dul.pdu = A_ASSOCIATE_RQ()
-    dul.pdu.from_primitive(dul.primitive)
+    # Send A-ASSOCIATE-RQ PDU, reusing the encoding of an identical request
+    dul.pdu, encoded = dul.assoc.ae._associate_rq_cache.encode(dul.primitive)
 
-    dul.socket.send(dul.pdu.encode())
+    dul.socket.send(encoded)
     evt.trigger(dul.assoc, evt.EVT_PDU_SENT, {'pdu' : dul.pdu})
 
     return 'Sta5'
@@ -1066,9 +1091,6 @@ def AA_8(dul):
     dul.pdu.reason_diagnostic = 0x00
 
     dul.primitive = dul.pdu.to_primitive()
-    dul.primitive.abort_source = 0x02
-    dul.primitive.result = 0x01
-    dul.primitive.diagnostic = 0x01
 
     dul.socket.send(dul.pdu.encode())
     evt.trigger(dul.assoc, evt.EVT_PDU_SENT, {'pdu' : dul.pdu})
@@ -1298,3 +1320,18 @@ TRANSITION_TABLE = {('Evt1', 'Sta1'): 'AE-1',
                     ('Evt19', 'Sta11'): 'AA-8',
                     ('Evt19', 'Sta12'): 'AA-8',
                     ('Evt19', 'Sta13'): 'AA-7'}
+
+
+# Compiled dispatch table, the states and events are represented by their
+#   index in _STATE_NAMES and _EVENT_NAMES, so 'Sta1' is 0 and 'Evt19' is 18
+_STATE_NAMES = tuple('Sta{}'.format(ii) for ii in range(1, len(STATES) + 1))
+_EVENT_NAMES = tuple('Evt{}'.format(ii) for ii in range(1, len(EVENTS) + 1))
+_STATE_INDEX = {name : ii for ii, name in enumerate(_STATE_NAMES)}
+_EVENT_INDEX = {name : ii for ii, name in enumerate(_EVENT_NAMES)}
+# _DISPATCH[event index][state index] is the name of the action in ACTIONS
+#   or None if the event is invalid for the state. The action names rather
+#   than functions are used so that changes to ACTIONS take effect
+_DISPATCH = tuple(
+    tuple(TRANSITION_TABLE.get((event, state)) for state in _STATE_NAMES)
+    for event in _EVENT_NAMES
+)
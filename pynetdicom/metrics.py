@@ -0,0 +1,496 @@
+"""Collection of runtime metrics and their Prometheus text exposition."""
+
+from bisect import bisect_left
+import logging
+import threading
+try:
+    from time import perf_counter as clock
+except ImportError:
+    # Python 2 compatibility
+    from time import time as clock
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    # Python 2 compatibility
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+LOGGER = logging.getLogger('pynetdicom.metrics')
+
+# The PDU type names, used as label values
+PDU_TYPES = {
+    0x01 : 'A-ASSOCIATE-RQ',
+    0x02 : 'A-ASSOCIATE-AC',
+    0x03 : 'A-ASSOCIATE-RJ',
+    0x04 : 'P-DATA-TF',
+    0x05 : 'A-RELEASE-RQ',
+    0x06 : 'A-RELEASE-RP',
+    0x07 : 'A-ABORT-RQ',
+}
+
+# The default latency histogram bucket upper bounds (in seconds)
+DEFAULT_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+)
+
+
+def _format_labels(names, values):
+    """Return the Prometheus label set for `names` and `values` as str."""
+    if not names:
+        return ''
+
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace('\\', r'\\').replace('"', r'\"')
+        value = value.replace('\n', r'\n')
+        pairs.append('{}="{}"'.format(name, value))
+
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value):
+    """Return a sample `value` formatted as str."""
+    if isinstance(value, float):
+        if value == float('inf'):
+            return '+Inf'
+
+        return repr(value)
+
+    return str(value)
+
+
+class _Metric(object):
+    """Base class for the metric types.
+
+    Attributes
+    ----------
+    description : str
+        The description of the metric, used for the ``# HELP`` line.
+    labels : tuple of str
+        The names of the metric's labels.
+    name : str
+        The name of the metric.
+    """
+    metric_type = None
+
+    def __init__(self, name, description, labels=()):
+        """Create a new metric.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metric.
+        description : str
+            The description of the metric.
+        labels : tuple of str, optional
+            The names of the metric's labels.
+        """
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        # {label values : sample}
+        self._samples = {}
+
+    def clear(self):
+        """Remove all the recorded samples."""
+        with self._lock:
+            self._samples = {}
+
+    def render(self):
+        """Return the metric in the Prometheus text format as list of str."""
+        lines = [
+            '# HELP {} {}'.format(self.name, self.description),
+            '# TYPE {} {}'.format(self.name, self.metric_type),
+        ]
+        with self._lock:
+            samples = sorted(self._samples.items())
+
+        for values, sample in samples:
+            lines.append('{}{} {}'.format(
+                self.name,
+                _format_labels(self.labels, values),
+                _format_value(sample)
+            ))
+
+        return lines
+
+    def value(self, *values):
+        """Return the current sample for the label `values`."""
+        with self._lock:
+            return self._samples.get(values, 0)
+
+
+class Counter(_Metric):
+    """A metric whose value only ever increases."""
+    metric_type = 'counter'
+
+    def inc(self, amount=1, *values):
+        """Increment the counter for the label `values` by `amount`."""
+        with self._lock:
+            self._samples[values] = self._samples.get(values, 0) + amount
+
+
+class Gauge(_Metric):
+    """A metric whose value may increase or decrease."""
+    metric_type = 'gauge'
+
+    def set(self, amount, *values):
+        """Set the gauge for the label `values` to `amount`."""
+        with self._lock:
+            self._samples[values] = amount
+
+    def set_all(self, samples):
+        """Replace all the recorded samples with `samples`.
+
+        Parameters
+        ----------
+        samples : dict
+            The new samples as {label values : amount}, where the label
+            values are a tuple of str.
+        """
+        samples = dict(samples)
+        with self._lock:
+            self._samples = samples
+
+
+class Histogram(_Metric):
+    """A metric that samples observations into cumulative buckets."""
+    metric_type = 'histogram'
+
+    def __init__(self, name, description, labels=(), buckets=None):
+        """Create a new histogram.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metric.
+        description : str
+            The description of the metric.
+        labels : tuple of str, optional
+            The names of the metric's labels.
+        buckets : tuple of float, optional
+            The bucket upper bounds, in increasing order, default
+            ``DEFAULT_BUCKETS``.
+        """
+        super(Histogram, self).__init__(name, description, labels)
+        self.buckets = tuple(buckets or DEFAULT_BUCKETS)
+
+    def observe(self, amount, *values):
+        """Add the observation `amount` for the label `values`."""
+        with self._lock:
+            try:
+                counts, total = self._samples[values]
+            except KeyError:
+                # One count for each bucket plus the implicit +Inf bucket
+                counts, total = [0] * (len(self.buckets) + 1), 0
+
+            counts[bisect_left(self.buckets, amount)] += 1
+            self._samples[values] = (counts, total + amount)
+
+    def render(self):
+        """Return the metric in the Prometheus text format as list of str."""
+        lines = [
+            '# HELP {} {}'.format(self.name, self.description),
+            '# TYPE {} {}'.format(self.name, self.metric_type),
+        ]
+        with self._lock:
+            samples = sorted(
+                (kk, (list(vv[0]), vv[1])) for kk, vv in self._samples.items()
+            )
+
+        names = self.labels + ('le', )
+        bounds = self.buckets + (float('inf'), )
+        for values, (counts, total) in samples:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append('{}_bucket{} {}'.format(
+                    self.name,
+                    _format_labels(names, values + (_format_value(bound), )),
+                    cumulative
+                ))
+
+            labels = _format_labels(self.labels, values)
+            lines.append(
+                '{}_sum{} {}'.format(self.name, labels, _format_value(total))
+            )
+            lines.append('{}_count{} {}'.format(self.name, labels, cumulative))
+
+        return lines
+
+    def value(self, *values):
+        """Return the number of observations for the label `values`."""
+        with self._lock:
+            try:
+                return sum(self._samples[values][0])
+            except KeyError:
+                return 0
+
+
+class MetricsRegistry(object):
+    """A registry of metrics recorded by an ``ApplicationEntity``.
+
+    Recording is disabled by default, in which case the instrumented code
+    paths only perform a single attribute check. Once enabled the following
+    metrics are recorded:
+
+    * ``pynetdicom_associations_active`` - the number of active associations
+      per *Calling AE Title*, collected when rendered.
+    * ``pynetdicom_associations_accepted_total``,
+      ``pynetdicom_associations_rejected_total``,
+      ``pynetdicom_associations_aborted_total`` and
+      ``pynetdicom_associations_released_total`` per *Calling AE Title*.
+    * ``pynetdicom_bytes_received_total`` and ``pynetdicom_bytes_sent_total``
+    * ``pynetdicom_pdus_received_total`` and ``pynetdicom_pdus_sent_total``
+      per PDU type.
+    * ``pynetdicom_dimse_messages_received_total`` and
+      ``pynetdicom_dimse_messages_sent_total`` per DIMSE message type.
+    * ``pynetdicom_handler_duration_seconds`` - a histogram of the time
+      taken by the handlers bound to each event.
+    * ``pynetdicom_dul_queue_depth`` - the total number of items waiting in
+      each of the DUL queues of the active associations, collected when
+      rendered.
+    * ``pynetdicom_memory_budget_bytes`` - the current and peak size of the
+      DIMSE data in-flight in the AE's memory budget, collected when
+      rendered.
+
+    Examples
+    --------
+
+    >>> from pynetdicom import AE
+    >>> ae = AE()
+    >>> ae.metrics.enabled = True
+    >>> print(ae.metrics.render())
+
+    Attributes
+    ----------
+    enabled : bool
+        ``True`` if metrics are being recorded, ``False`` otherwise (default).
+    """
+    def __init__(self, ae=None):
+        """Create a new MetricsRegistry.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity, optional
+            The AE whose active associations are used when collecting the
+            association, DUL queue and memory budget gauges.
+        """
+        self._ae = ae
+        self.enabled = False
+        self._metrics = []
+
+        _assoc = ('calling_ae', )
+        self.associations_active = self.add(Gauge(
+            'pynetdicom_associations_active',
+            'The number of active associations', _assoc
+        ))
+        self.associations_accepted = self.add(Counter(
+            'pynetdicom_associations_accepted_total',
+            'The number of accepted associations', _assoc
+        ))
+        self.associations_rejected = self.add(Counter(
+            'pynetdicom_associations_rejected_total',
+            'The number of rejected associations', _assoc
+        ))
+        self.associations_aborted = self.add(Counter(
+            'pynetdicom_associations_aborted_total',
+            'The number of aborted associations', _assoc
+        ))
+        self.associations_released = self.add(Counter(
+            'pynetdicom_associations_released_total',
+            'The number of released associations', _assoc
+        ))
+        self.bytes_received = self.add(Counter(
+            'pynetdicom_bytes_received_total',
+            'The number of PDU bytes received from peers'
+        ))
+        self.bytes_sent = self.add(Counter(
+            'pynetdicom_bytes_sent_total',
+            'The number of PDU bytes sent to peers'
+        ))
+        self.pdus_received = self.add(Counter(
+            'pynetdicom_pdus_received_total',
+            'The number of PDUs received from peers', ('type', )
+        ))
+        self.pdus_sent = self.add(Counter(
+            'pynetdicom_pdus_sent_total',
+            'The number of PDUs sent to peers', ('type', )
+        ))
+        self.dimse_received = self.add(Counter(
+            'pynetdicom_dimse_messages_received_total',
+            'The number of DIMSE messages received from peers', ('type', )
+        ))
+        self.dimse_sent = self.add(Counter(
+            'pynetdicom_dimse_messages_sent_total',
+            'The number of DIMSE messages sent to peers', ('type', )
+        ))
+        self.handler_duration = self.add(Histogram(
+            'pynetdicom_handler_duration_seconds',
+            'The time taken by the handlers bound to an event', ('event', )
+        ))
+        self.dul_queue_depth = self.add(Gauge(
+            'pynetdicom_dul_queue_depth',
+            'The number of items waiting in the DUL queues', ('queue', )
+        ))
+        self.memory_budget_bytes = self.add(Gauge(
+            'pynetdicom_memory_budget_bytes',
+            'The size of the in-flight DIMSE data', ('usage', )
+        ))
+
+        # The association counters incremented by record_event()
+        self._event_counters = {
+            'EVT_ACCEPTED' : self.associations_accepted,
+            'EVT_REJECTED' : self.associations_rejected,
+            'EVT_ABORTED' : self.associations_aborted,
+            'EVT_RELEASED' : self.associations_released,
+        }
+
+    def add(self, metric):
+        """Add a `metric` to the registry and return it.
+
+        Parameters
+        ----------
+        metric : metrics.Counter, metrics.Gauge or metrics.Histogram
+            The metric to add.
+
+        Returns
+        -------
+        metrics.Counter, metrics.Gauge or metrics.Histogram
+            The added metric.
+        """
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self):
+        """Remove all the recorded samples."""
+        for metric in self._metrics:
+            metric.clear()
+
+    def _collect(self):
+        """Update the gauges that are sampled from the active associations."""
+        if self._ae is None:
+            return
+
+        active = {}
+        depths = {'event' : 0, 'to_provider' : 0, 'to_user' : 0}
+        for assoc in self._ae.active_associations:
+            calling_ae = _ae_title(assoc.requestor.ae_title)
+            key = (calling_ae, )
+            active[key] = active.get(key, 0) + 1
+            depths['event'] += assoc.dul.event_queue.qsize()
+            depths['to_provider'] += assoc.dul.to_provider_queue.qsize()
+            depths['to_user'] += assoc.dul.to_user_queue.qsize()
+
+        # Swap in the new samples so a concurrent render never sees an
+        #   empty gauge
+        self.associations_active.set_all(active)
+        self.dul_queue_depth.set_all(
+            ((name, ), depth) for name, depth in depths.items()
+        )
+        budget = self._ae.memory_budget
+        self.memory_budget_bytes.set_all(
+            [(('current', ), budget.nr_bytes),
+             (('high_water', ), budget.high_water)]
+        )
+
+    def record_event(self, assoc, event):
+        """Record the association related notification `event`.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association the event occurred in.
+        event : events.NotificationEvent or events.InterventionEvent
+            The triggered event.
+        """
+        counter = self._event_counters.get(event.name)
+        if counter is not None:
+            counter.inc(1, _ae_title(assoc.requestor.ae_title))
+
+    def record_pdu(self, pdu_type, nr_bytes, is_received):
+        """Record a PDU sent to or received from a peer.
+
+        Parameters
+        ----------
+        pdu_type : int
+            The PDU type, 0x01 to 0x07.
+        nr_bytes : int
+            The total length of the encoded PDU.
+        is_received : bool
+            ``True`` if the PDU was received, ``False`` if sent.
+        """
+        name = PDU_TYPES.get(pdu_type, 'unknown')
+        if is_received:
+            self.pdus_received.inc(1, name)
+            self.bytes_received.inc(nr_bytes)
+        else:
+            self.pdus_sent.inc(1, name)
+            self.bytes_sent.inc(nr_bytes)
+
+    def render(self):
+        """Return the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The rendered metrics.
+        """
+        self._collect()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, address=('127.0.0.1', 9102)):
+        """Start serving the rendered metrics over HTTP in a new thread.
+
+        Parameters
+        ----------
+        address : 2-tuple, optional
+            The ``(host, port)`` to listen on, default
+            ``('127.0.0.1', 9102)``.
+
+        Returns
+        -------
+        http.server.HTTPServer
+            The running server, stop it using ``shutdown()`` followed by
+            ``server_close()``.
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            """Respond to GET requests with the rendered metrics."""
+            def do_GET(self):
+                """Send the rendered metrics."""
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type', 'text/plain; version=0.0.4; charset=utf-8'
+                )
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                """Don't log the requests to stderr."""
+                pass
+
+        server = HTTPServer(address, MetricsHandler)
+        thread = threading.Thread(
+            target=server.serve_forever, name='MetricsServer'
+        )
+        thread.daemon = True
+        thread.start()
+
+        return server
+
+
+def _ae_title(ae_title):
+    """Return the `ae_title` as a stripped str suitable for use as a label."""
+    if isinstance(ae_title, bytes):
+        ae_title = ae_title.decode('ascii', errors='replace')
+
+    return ae_title.strip()
@@ -20,8 +20,10 @@ There are seven different PDUs:
 """
 
 import codecs
+from collections import OrderedDict
 import logging
 from struct import Struct
+import threading
 
 from pynetdicom.pdu_items import (
     ApplicationContextItem,
@@ -29,7 +31,10 @@ from pynetdicom.pdu_items import (
     PresentationContextItemAC,
     UserInformationItem,
     PresentationDataValueItem,
-    PDU_ITEM_TYPES
+    PDU_ITEM_TYPES,
+    UNPACK_ITEM_HEADER,
+    _get_decoders,
+    _get_encoders
 )
 from pynetdicom.utils import validate_ae_title
 
@@ -72,6 +77,13 @@ class PDU(object):
         bytestream : bytes
             The PDU data to be decoded.
         """
+        decoders = _get_decoders(self)
+        if decoders is not None:
+            for decode in decoders:
+                decode(self, bytestream)
+
+            return
+
         for (offset, length), attr_name, func, args in self._decoders:
             # Allow us to use None as a `length`
             if length:
@@ -96,6 +108,10 @@ class PDU(object):
         bytes
             The encoded PDU.
         """
+        encoders = _get_encoders(self)
+        if encoders is not None:
+            return b''.join([encode(self) for encode in encoders])
+
         bytestream = bytes()
         for attr_name, func, args in self._encoders:
             # If attr_name is None then the field is usually reserved
@@ -189,9 +205,9 @@ class PDU(object):
            `9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
         """
         offset = 0
-        while bytestream[offset:offset + 1]:
-            item_type = UNPACK_UCHAR(bytestream[offset:offset + 1])[0]
-            item_length = UNPACK_UINT2(bytestream[offset + 2:offset + 4])[0]
+        total_length = len(bytestream)
+        while offset < total_length:
+            item_type, item_length = UNPACK_ITEM_HEADER(bytestream, offset)
             item_data = bytestream[offset:offset + 4 + item_length]
             assert len(item_data) == 4 + item_length
             yield item_type, item_data
@@ -217,11 +233,12 @@ class PDU(object):
     @property
     def pdu_type(self):
         """Return the *PDU Type* field value an int."""
-        key_val = PDU_TYPES.items()
-        keys = [key for (key, val) in key_val]
-        vals = [val for (key, val) in key_val]
-
-        return keys[vals.index(self.__class__)]
+        try:
+            return _PDU_TYPE_VALUES[type(self)]
+        except KeyError:
+            raise ValueError(
+                "No PDU Type is defined for {}".format(type(self).__name__)
+            )
 
     @staticmethod
     def _wrap_bytes(bytestream):
@@ -242,11 +259,7 @@ class PDU(object):
         bytes
             The encoded items.
         """
-        bytestream = bytes()
-        for item in items:
-            bytestream += item.encode()
-
-        return bytestream
+        return b''.join([item.encode() for item in items])
 
     @staticmethod
     def _wrap_encode_uid(uid):
@@ -706,6 +719,100 @@ class A_ASSOCIATE_RQ(PDU):
         return None
 
 
+class AssociateRQCache(object):
+    """Cached encoding of A-ASSOCIATE-RQ PDUs.
+
+    A requestor that repeatedly associates with the same peer using the same
+    presentation contexts and extended negotiation sends an identical
+    A-ASSOCIATE-RQ each time, so the encoded PDU is kept and reused rather
+    than being rebuilt and encoded for every association.
+
+    The PDUs are keyed on the AE titles, the application context name, the
+    presentation contexts and the encoded User Information item, which
+    contains the maximum PDU length, implementation class UID and version
+    name and any extended negotiation items.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of encoded PDUs to keep, the least recently used
+        PDUs are discarded first (default ``16``).
+
+    Examples
+    --------
+
+    >>> from pynetdicom.pdu import AssociateRQCache
+    >>> cache = AssociateRQCache()
+    >>> pdu, encoded = cache.encode(primitive)
+    """
+    def __init__(self, maxsize=16):
+        """Create a new AssociateRQCache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The maximum number of encoded PDUs to keep (default ``16``).
+        """
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        # {key : (A_ASSOCIATE_RQ, bytes)}
+        self._pdus = OrderedDict()
+
+    def __len__(self):
+        """Return the number of cached PDUs."""
+        return len(self._pdus)
+
+    def clear(self):
+        """Discard all the cached PDUs."""
+        with self._lock:
+            self._pdus.clear()
+
+    def encode(self, primitive):
+        """Return the A-ASSOCIATE-RQ PDU and its encoding for `primitive`.
+
+        Parameters
+        ----------
+        primitive : pdu_primitives.A_ASSOCIATE
+            The A-ASSOCIATE (request) primitive to encode.
+
+        Returns
+        -------
+        A_ASSOCIATE_RQ, bytes
+            The PDU and its encoded value. The PDU may be shared with other
+            associations and must not be modified.
+        """
+        user_information = UserInformationItem()
+        user_information.from_primitive(primitive.user_information)
+        key = (
+            primitive.calling_ae_title,
+            primitive.called_ae_title,
+            primitive.application_context_name,
+            tuple([
+                (cx.context_id, cx.abstract_syntax, tuple(cx.transfer_syntax))
+                for cx in primitive.presentation_context_definition_list
+            ]),
+            user_information.encode()
+        )
+
+        with self._lock:
+            result = self._pdus.pop(key, None)
+            if result is not None:
+                self._pdus[key] = result
+                return result
+
+        pdu = A_ASSOCIATE_RQ()
+        pdu.from_primitive(primitive)
+        result = (pdu, pdu.encode())
+
+        with self._lock:
+            self._pdus[key] = result
+            while len(self._pdus) > self.maxsize:
+                self._pdus.popitem(last=False)
+
+        return result
+
+
 class A_ASSOCIATE_AC(PDU):
     """An A-ASSOCIATE-AC PDU.
 
@@ -2018,3 +2125,6 @@ PDU_TYPES = {
     0x06 : A_RELEASE_RP,
     0x07 : A_ABORT_RQ,
 }
+
+# PDU types, indexed by their class
+_PDU_TYPE_VALUES = {vv: kk for kk, vv in PDU_TYPES.items()}
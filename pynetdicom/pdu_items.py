@@ -42,6 +42,7 @@
 
 import codecs
 import logging
+from operator import attrgetter
 from struct import Struct
 
 from pydicom.uid import UID
@@ -65,6 +66,248 @@ PACK_UCHAR = UCHAR.pack
 PACK_UINT2 = UINT2.pack
 PACK_UINT4 = UINT4.pack
 
+# The *Item Type* and *Item Length* fields of PDU items and sub-items
+UNPACK_ITEM_HEADER = Struct('>BxH').unpack_from
+
+# {class : compiled encoders or decoders}, see _get_encoders/_get_decoders
+_COMPILED_ENCODERS = {}
+_COMPILED_DECODERS = {}
+
+
+def _struct_format(func):
+    """Return the struct format used by `func` or None if not a Struct method.
+    """
+    packer = getattr(func, '__self__', None)
+    if isinstance(packer, Struct):
+        return packer.format.lstrip('>')
+
+    return None
+
+
+def _unbind(func, template):
+    """Return `func` and whether it must be passed the PDU or item instance.
+
+    Parameters
+    ----------
+    func : callable
+        A callable from the field encoders or decoders of `template`.
+    template : pdu.PDU or pdu_items.PDUItem
+        The instance the field encoders or decoders were taken from.
+    """
+    if getattr(func, '__self__', None) is template:
+        return func.__func__, True
+
+    return func, False
+
+
+def _compile_encoders(encoders, template):
+    """Return a list of callables that encode the fields in `encoders`.
+
+    Consecutive fixed length fields are packed together using a single
+    Struct with reserved fields as pad bytes, the remaining fields are
+    encoded using their callable.
+
+    Parameters
+    ----------
+    encoders : list of tuple
+        The field encoders, as returned by the ``_encoders`` property.
+    template : pdu.PDU or pdu_items.PDUItem
+        The instance `encoders` were taken from.
+
+    Returns
+    -------
+    list of callable
+        The compiled encoders, each takes the PDU or item instance to encode
+        and returns the encoded fields as bytes.
+    """
+    compiled = []
+    fmt, names = '', []
+
+    def _pack_fields(fmt, names):
+        packer = Struct('>' + fmt)
+        if not names:
+            value = packer.pack()
+            return lambda obj: value
+
+        if len(names) == 1:
+            getter = attrgetter(names[0])
+            pack = packer.pack
+            return lambda obj: pack(getter(obj))
+
+        getter = attrgetter(*names)
+        pack = packer.pack
+        return lambda obj: pack(*getter(obj))
+
+    def _encode_field(attr_name, func, args):
+        func, is_bound = _unbind(func, template)
+        if is_bound:
+            return lambda obj: func(obj, getattr(obj, attr_name), *args)
+
+        if attr_name:
+            return lambda obj: func(getattr(obj, attr_name), *args)
+
+        return lambda obj: func(*args)
+
+    for attr_name, func, args in encoders:
+        if attr_name and not args and _struct_format(func):
+            fmt += _struct_format(func)
+            names.append(attr_name)
+            continue
+
+        if (attr_name is None and func.__name__ == '_wrap_pack'
+                and args[0] == 0 and _struct_format(args[1])):
+            # Reserved field
+            fmt += '{}x'.format(args[1].__self__.size)
+            continue
+
+        if fmt:
+            compiled.append(_pack_fields(fmt, names))
+            fmt, names = '', []
+
+        compiled.append(_encode_field(attr_name, func, args))
+
+    if fmt:
+        compiled.append(_pack_fields(fmt, names))
+
+    return compiled
+
+
+def _compile_decoders(decoders, template):
+    """Return a list of callables that decode the fields in `decoders`.
+
+    Consecutive fixed length fields are unpacked together using a single
+    Struct, the remaining fields are decoded using their callable.
+
+    Parameters
+    ----------
+    decoders : list of tuple
+        The field decoders, as returned by the ``_decoders`` property.
+    template : pdu.PDU or pdu_items.PDUItem
+        The instance `decoders` were taken from.
+
+    Returns
+    -------
+    list of callable
+        The compiled decoders, each takes the PDU or item instance and the
+        encoded data and sets the decoded field values.
+    """
+    compiled = []
+    start, fmt, names = None, '', []
+
+    def _unpack_fields(start, fmt, names):
+        unpack_from = Struct('>' + fmt).unpack_from
+
+        def _decode(obj, bytestream):
+            for attr_name, value in zip(names, unpack_from(bytestream, start)):
+                setattr(obj, attr_name, value)
+
+        return _decode
+
+    def _decode_field(offset, length, attr_name, func, args):
+        func, is_bound = _unbind(func, template)
+        end = offset + length if length else None
+        if is_bound:
+            def _decode(obj, bytestream):
+                setattr(
+                    obj, attr_name, func(obj, bytestream[offset:end], *args)
+                )
+        else:
+            def _decode(obj, bytestream):
+                setattr(obj, attr_name, func(bytestream[offset:end], *args))
+
+        return _decode
+
+    for (offset, length), attr_name, func, args in decoders:
+        field_fmt = None
+        if getattr(func, '__name__', None) == '_wrap_unpack':
+            field_fmt = _struct_format(args[0])
+
+        # Only fields with a length matching their format can be unpacked
+        #   together, otherwise the length of the data must be checked
+        if field_fmt and Struct('>' + field_fmt).size == length:
+            if fmt and offset >= start + Struct('>' + fmt).size:
+                pad = offset - start - Struct('>' + fmt).size
+                fmt += '{}x{}'.format(pad, field_fmt)
+                names.append(attr_name)
+                continue
+
+            if fmt:
+                compiled.append(_unpack_fields(start, fmt, names))
+
+            start, fmt, names = offset, field_fmt, [attr_name]
+            continue
+
+        if fmt:
+            compiled.append(_unpack_fields(start, fmt, names))
+            start, fmt, names = None, '', []
+
+        compiled.append(_decode_field(offset, length, attr_name, func, args))
+
+    if fmt:
+        compiled.append(_unpack_fields(start, fmt, names))
+
+    return compiled
+
+
+def _get_encoders(obj):
+    """Return the compiled field encoders for the class of `obj`.
+
+    The encoders are compiled the first time they're required by each class.
+
+    Parameters
+    ----------
+    obj : pdu.PDU or pdu_items.PDUItem
+        The PDU or item to be encoded.
+
+    Returns
+    -------
+    list of callable or None
+        The compiled encoders or None if the class' field encoders aren't
+        fixed and so can't be compiled.
+    """
+    cls = type(obj)
+    try:
+        return _COMPILED_ENCODERS[cls]
+    except KeyError:
+        encoders = obj._encoders
+        if isinstance(encoders, list):
+            encoders = _compile_encoders(encoders, obj)
+        else:
+            encoders = None
+
+        _COMPILED_ENCODERS[cls] = encoders
+        return encoders
+
+
+def _get_decoders(obj):
+    """Return the compiled field decoders for the class of `obj`.
+
+    The decoders are compiled the first time they're required by each class.
+
+    Parameters
+    ----------
+    obj : pdu.PDU or pdu_items.PDUItem
+        The PDU or item to be decoded.
+
+    Returns
+    -------
+    list of callable or None
+        The compiled decoders or None if the class' field decoders depend
+        on previously decoded values and so can't be compiled.
+    """
+    cls = type(obj)
+    try:
+        return _COMPILED_DECODERS[cls]
+    except KeyError:
+        decoders = obj._decoders
+        if isinstance(decoders, list):
+            decoders = _compile_decoders(decoders, obj)
+        else:
+            decoders = None
+
+        _COMPILED_DECODERS[cls] = decoders
+        return decoders
+
 
 class PDUItem(object):
     """Base class for PDU Items and Sub-items.
@@ -73,6 +316,7 @@ class PDUItem(object):
     --------
     pdu.PDU
     """
+    __slots__ = ()
 
     def decode(self, bytestream):
         """Decode `bytestream` and use the result to set the field values of
@@ -83,6 +327,13 @@ class PDUItem(object):
         bytestream : bytes
             The PDU data to be decoded.
         """
+        decoders = _get_decoders(self)
+        if decoders is not None:
+            for decode in decoders:
+                decode(self, bytestream)
+
+            return
+
         for (offset, length), attr_name, func, args in self._decoders:
             # Allow us to use None as a `length`
             if length:
@@ -105,6 +356,10 @@ class PDUItem(object):
         bytes
             The encoded PDU.
         """
+        encoders = _get_encoders(self)
+        if encoders is not None:
+            return b''.join([encode(self) for encode in encoders])
+
         bytestream = bytes()
         for attr_name, func, args in self._encoders:
             # If attr_name is None then the field is usually reserved
@@ -197,9 +452,9 @@ class PDUItem(object):
            `9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
         """
         offset = 0
-        while bytestream[offset:offset + 1]:
-            item_type = UNPACK_UCHAR(bytestream[offset:offset + 1])[0]
-            item_length = UNPACK_UINT2(bytestream[offset + 2:offset + 4])[0]
+        total_length = len(bytestream)
+        while offset < total_length:
+            item_type, item_length = UNPACK_ITEM_HEADER(bytestream, offset)
             item_data = bytestream[offset:offset + 4 + item_length]
             assert len(item_data) == 4 + item_length
             yield item_type, item_data
@@ -217,7 +472,7 @@ class PDUItem(object):
     @property
     def item_type(self):
         """Return the item's *Item Type* field value as an int."""
-        return {vv: kk for kk, vv in PDU_ITEM_TYPES.items()}[type(self)]
+        return _PDU_ITEM_TYPE_VALUES[type(self)]
 
     def __len__(self):
         """Return the total length of the encoded item as an int."""
@@ -254,11 +509,7 @@ class PDUItem(object):
         bytes
             The encoded items.
         """
-        bytestream = bytes()
-        for item in items:
-            bytestream += item.encode()
-
-        return bytestream
+        return b''.join([item.encode() for item in items])
 
     @staticmethod
     def _wrap_encode_uid(uid):
@@ -416,6 +667,7 @@ class ApplicationContextItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_application_context_name',)
 
     def __init__(self):
         """Initialise a new Application Context Item."""
@@ -585,6 +837,9 @@ class PresentationContextItemRQ(PDUItem):
     .. [#] DICOM Standard, Part 8, Section
        `9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        'presentation_context_id', 'abstract_transfer_syntax_sub_items'
+    )
 
     def __init__(self):
         """Initialise a new Presentation Context (RQ) Item."""
@@ -819,6 +1074,9 @@ class PresentationContextItemAC(PDUItem):
     .. [#] DICOM Standard, Part 8, Section
        `9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        'presentation_context_id', 'result_reason', 'transfer_syntax_sub_item'
+    )
 
     def __init__(self):
         """Initialise a new Presentation Context (AC) Item."""
@@ -1067,6 +1325,7 @@ class UserInformationItem(PDUItem):
        `9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
 
     """
+    __slots__ = ('user_data',)
 
     def __init__(self):
         """Initialise a new User Information Item."""
@@ -1334,6 +1593,7 @@ class AbstractSyntaxSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_abstract_syntax_name',)
 
     def __init__(self):
         """Initialise a new Abstract Syntax Item."""
@@ -1504,6 +1764,7 @@ class TransferSyntaxSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_skip_validation', '_transfer_syntax_name')
 
     def __init__(self):
         """Initialise a new Abstract Syntax Item."""
@@ -1664,6 +1925,7 @@ class MaximumLengthSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('maximum_length_received',)
 
     def __init__(self):
         """Initialise a new Maximum Length Item."""
@@ -1803,6 +2065,7 @@ class ImplementationClassUIDSubItem(PDUItem):
     .. [2] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_implementation_class_uid',)
 
     def __init__(self):
         """Initialise a new Implementation Class UID Item."""
@@ -1983,6 +2246,7 @@ class ImplementationVersionNameSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_implementation_version_name',)
 
     def __init__(self):
         """Initialise a new Implementation Version Name Item."""
@@ -2144,6 +2408,10 @@ class AsynchronousOperationsWindowSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        'maximum_number_operations_invoked',
+        'maximum_number_operations_performed'
+    )
 
     def __init__(self):
         """Initialise a new Asynchronous Operations Window Item."""
@@ -2336,6 +2604,7 @@ class SCP_SCU_RoleSelectionSubItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('_uid_length', '_sop_class_uid', '_scu_role', '_scp_role')
 
     def __init__(self):
         """Initialise a new SCP/SCU Role Selection Item."""
@@ -2607,6 +2876,10 @@ class SOPClassExtendedNegotiationSubItem(PDUItem):
     .. [2] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        '_sop_class_uid_length', 'service_class_application_information',
+        '_sop_class_uid'
+    )
 
     def __init__(self):
         """Initialise a new SOP Class Extended Negotiation Item."""
@@ -2882,6 +3155,11 @@ class SOPClassCommonExtendedNegotiationSubItem(PDUItem):
     .. [2] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        'sub_item_version', '_sop_length', '_service_length',
+        '_related_general_sop_class_identification', '_sop_class_uid',
+        '_service_class_uid'
+    )
 
     def __init__(self):
         """Initialise a new Implementation Version Name Item."""
@@ -3308,6 +3586,10 @@ class UserIdentitySubItemRQ(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = (
+        'user_identity_type', 'positive_response_requested', '_primary_length',
+        'primary_field', '_secondary_length', 'secondary_field'
+    )
 
     def __init__(self):
         """Initialise a new User Identity (RQ) Item."""
@@ -3566,6 +3848,7 @@ class UserIdentitySubItemAC(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('server_response',)
 
     def __init__(self):
         """Initialise a new User Identity (AC) Item."""
@@ -3718,6 +4001,7 @@ class PresentationDataValueItem(PDUItem):
     .. [#] DICOM Standard, Part 8,
        `Section 9.3.1 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.1>`_
     """
+    __slots__ = ('presentation_context_id', 'presentation_data_value')
 
     def __init__(self):
         """Initialise a new Presentation Data Value Item."""
@@ -3842,3 +4126,6 @@ PDU_ITEM_TYPES = {
     0x58 : UserIdentitySubItemRQ,
     0x59 : UserIdentitySubItemAC
 }
+
+# PDU item and sub-item types, indexed by their class
+_PDU_ITEM_TYPE_VALUES = {vv: kk for kk, vv in PDU_ITEM_TYPES.items()}
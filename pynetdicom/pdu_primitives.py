@@ -27,11 +27,15 @@ LOGGER = logging.getLogger('pynetdicom.pdu_primitives')
 # TODO: Rename to UserInformation
 class ServiceParameter(object):
     """ Base class for Service Parameters """
+    __slots__ = ()
 
     def __eq__(self, other):
         """Equality of two ServiceParameters"""
         if isinstance(other, self.__class__):
-            return other.__dict__ == self.__dict__
+            return all(
+                getattr(other, name) == getattr(self, name)
+                for name in self.__slots__
+            )
 
         return False
 
@@ -40,6 +44,162 @@ class ServiceParameter(object):
         return not self == other
 
 
+class UserInformationList(list):
+    """A list of User Information items that's indexed by item type.
+
+    Used for the User Information parameter of the A-ASSOCIATE primitive so
+    that the items of a given type can be found without iterating through
+    the entire list. The index is kept up to date when items are added or
+    removed using the standard :class:`list` methods.
+
+    Examples
+    --------
+
+    >>> from pynetdicom.pdu_primitives import (
+    ...     UserInformationList, MaximumLengthNotification
+    ... )
+    >>> item = MaximumLengthNotification()
+    >>> user_info = UserInformationList([item])
+    >>> user_info.get_item(MaximumLengthNotification) is item
+    True
+    """
+    __slots__ = ('_index', )
+
+    def __init__(self, items=()):
+        """Create a new UserInformationList.
+
+        Parameters
+        ----------
+        items : iterable, optional
+            The User Information items to add to the list.
+        """
+        super(UserInformationList, self).__init__(items)
+        self._reindex()
+
+    def __reduce__(self):
+        """Return the arguments needed to copy or pickle the list."""
+        return (self.__class__, (list(self), ))
+
+    def _reindex(self):
+        """Rebuild the index of items by type."""
+        index = {}
+        for item in self:
+            index.setdefault(type(item), []).append(item)
+
+        self._index = index
+
+    def get_item(self, item_type):
+        """Return the first item of `item_type` or None if not present.
+
+        Parameters
+        ----------
+        item_type : class
+            The class of the User Information item to return, such as
+            :class:`MaximumLengthNotification`.
+
+        Returns
+        -------
+        object or None
+            The first item that's an instance of `item_type`, or None if
+            there are no matching items.
+        """
+        items = self._index.get(item_type)
+        if items:
+            return items[0]
+
+        return None
+
+    def get_items(self, item_type):
+        """Return a list of the items of `item_type`.
+
+        Parameters
+        ----------
+        item_type : class
+            The class of the User Information items to return, such as
+            :class:`SCP_SCU_RoleSelectionNegotiation`.
+
+        Returns
+        -------
+        list
+            The items that are instances of `item_type`, in the same order
+            as they are in the list.
+        """
+        return list(self._index.get(item_type, []))
+
+    # Methods that modify the list
+    def append(self, item):
+        """Append `item` to the end of the list."""
+        super(UserInformationList, self).append(item)
+        self._index.setdefault(type(item), []).append(item)
+
+    def clear(self):
+        """Remove all the items from the list."""
+        del self[:]
+
+    def extend(self, items):
+        """Extend the list with `items`."""
+        super(UserInformationList, self).extend(items)
+        self._reindex()
+
+    def insert(self, index, item):
+        """Insert `item` before `index`."""
+        super(UserInformationList, self).insert(index, item)
+        self._reindex()
+
+    def pop(self, *args):
+        """Remove and return the item at the given index (default last)."""
+        item = super(UserInformationList, self).pop(*args)
+        self._reindex()
+        return item
+
+    def remove(self, item):
+        """Remove the first occurrence of `item`."""
+        super(UserInformationList, self).remove(item)
+        self._reindex()
+
+    def reverse(self):
+        """Reverse the list in place."""
+        super(UserInformationList, self).reverse()
+        self._reindex()
+
+    def sort(self, *args, **kwargs):
+        """Sort the list in place."""
+        super(UserInformationList, self).sort(*args, **kwargs)
+        self._reindex()
+
+    def __delitem__(self, index):
+        """Delete the item(s) at `index`."""
+        super(UserInformationList, self).__delitem__(index)
+        self._reindex()
+
+    def __delslice__(self, start, stop):
+        """Delete the items from `start` to `stop` (Python 2 only)."""
+        super(UserInformationList, self).__delslice__(start, stop)
+        self._reindex()
+
+    def __iadd__(self, items):
+        """Extend the list with `items`."""
+        super(UserInformationList, self).__iadd__(items)
+        self._reindex()
+        return self
+
+    def __imul__(self, value):
+        """Repeat the list contents `value` times."""
+        super(UserInformationList, self).__imul__(value)
+        self._reindex()
+        return self
+
+    def __setitem__(self, index, value):
+        """Set the item(s) at `index` to `value`."""
+        super(UserInformationList, self).__setitem__(index, value)
+        self._reindex()
+
+    def __setslice__(self, start, stop, items):
+        """Set the items from `start` to `stop` (Python 2 only)."""
+        super(UserInformationList, self).__setslice__(start, stop, items)
+        self._reindex()
+
+
 # Association Service primitives
 class A_ASSOCIATE(object):
     """
@@ -167,9 +327,10 @@ class A_ASSOCIATE(object):
         Identifies the AE that contains the actual acceptor of the
         A-ASSOCIATE service. Shall always contain the same value as the
         Called AE Title of the A-ASSOCIATE indication
-    user_information : list
+    user_information : UserInformationList
         Used by Requestor and Acceptor to include AE user information. See
-        PS3.8 Annex D and PS3.7 Annex D.3
+        PS3.8 Annex D and PS3.7 Annex D.3. May be set using a list, which is
+        converted to a UserInformationList so the items can be found by type.
     result : int
         Provided either by the Acceptor of the A-ASSOCIATE request, the UL
         service provider (ACSE related) or the UL service provider
@@ -245,6 +406,14 @@ class A_ASSOCIATE(object):
 
     * DICOM Standard, Part 8, Section 7.1.1
     """
+    __slots__ = (
+        '_application_context_name', '_user_information', '_result',
+        '_result_source', '_diagnostic', '_calling_ae_title',
+        '_called_ae_title', '_presentation_context_definition_list',
+        '_presentation_context_definition_results_list',
+        '_calling_presentation_address', '_called_presentation_address'
+    )
+
     # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
@@ -396,7 +565,7 @@ class A_ASSOCIATE(object):
             LOGGER.error("A_ASSOCIATE.user_information must be a list")
             raise TypeError("A_ASSOCIATE.user_information must be a list")
 
-        self._user_information = valid_usr_info_items
+        self._user_information = UserInformationList(valid_usr_info_items)
 
     @property
     def result(self):
@@ -702,9 +871,9 @@ class A_ASSOCIATE(object):
     @property
     def maximum_length_received(self):
         """Get the Maximum Length Received."""
-        for item in self.user_information:
-            if isinstance(item, MaximumLengthNotification):
-                return item.maximum_length_received
+        item = self.user_information.get_item(MaximumLengthNotification)
+        if item is not None:
+            return item.maximum_length_received
 
         return None
 
@@ -726,15 +895,12 @@ class A_ASSOCIATE(object):
         #   done by the MaximumLengthNotification class
 
         # Check for a MaximumLengthNotification item
-        found_item = False
-
-        for item in self.user_information:
-            if isinstance(item, MaximumLengthNotification):
-                found_item = True
-                item.maximum_length_received = value
+        items = self.user_information.get_items(MaximumLengthNotification)
+        for item in items:
+            item.maximum_length_received = value
 
         # No MaximumLengthNotification item found
-        if not found_item:
+        if not items:
             max_length = MaximumLengthNotification()
             max_length.maximum_length_received = value
             self.user_information.append(max_length)
@@ -742,14 +908,16 @@ class A_ASSOCIATE(object):
     @property
     def implementation_class_uid(self):
         """Return the Implementation Class UID."""
-        for item in self.user_information:
-            if isinstance(item, ImplementationClassUIDNotification):
-                if item.implementation_class_uid is None:
-                    LOGGER.error("Implementation Class UID has not been set")
-                    raise ValueError("Implementation Class UID has not "
-                                     "been set")
+        item = self.user_information.get_item(
+            ImplementationClassUIDNotification
+        )
+        if item is not None:
+            if item.implementation_class_uid is None:
+                LOGGER.error("Implementation Class UID has not been set")
+                raise ValueError("Implementation Class UID has not "
+                                 "been set")
 
-                return item.implementation_class_uid
+            return item.implementation_class_uid
 
         LOGGER.error("Implementation Class UID has not been set")
         raise ValueError("Implementation Class UID has not been set")
@@ -773,14 +941,14 @@ class A_ASSOCIATE(object):
         #   done by the ImplementationClassUIDNotification class
 
         # Check for a ImplementationClassUIDNotification item
-        found_item = False
-        for item in self.user_information:
-            if isinstance(item, ImplementationClassUIDNotification):
-                found_item = True
-                item.implementation_class_uid = value
+        items = self.user_information.get_items(
+            ImplementationClassUIDNotification
+        )
+        for item in items:
+            item.implementation_class_uid = value
 
         # No ImplementationClassUIDNotification item found
-        if not found_item:
+        if not items:
             imp_uid = ImplementationClassUIDNotification()
             imp_uid.implementation_class_uid = value
             self.user_information.append(imp_uid)
@@ -856,6 +1024,8 @@ class A_RELEASE(object):
     ----------
     * DICOM Standard, Part 8, Section 7.2
     """
+    __slots__ = ('_result',)
+
     def __init__(self):
         self.result = None
 
@@ -913,6 +1083,7 @@ class A_ABORT(object):
 
     * DICOM Standard, Part 8, Section 7.3.1
     """
+    __slots__ = ('_abort_source',)
 
     def __init__(self):
         self.abort_source = None
@@ -977,6 +1148,7 @@ class A_P_ABORT(object):
 
     * DICOM Standard, Part 8, Section 7.4.1
     """
+    __slots__ = ('_provider_reason',)
 
     def __init__(self):
         self.provider_reason = None
@@ -1039,6 +1211,8 @@ class P_DATA(object):
 
     * DICOM Standard, Part 8, Section 7.6.1
     """
+    __slots__ = ('_presentation_data_value_list',)
+
     def __init__(self):
         self.presentation_data_value_list = []
 
@@ -1133,6 +1307,8 @@ class MaximumLengthNotification(ServiceParameter):
     * DICOM Standard, Part 7, Annex D.3.3.1
     * DICOM Standard, Part 8, Annex D.1
     """
+    __slots__ = ('_maximum_length',)
+
     def __init__(self):
         self.maximum_length_received = DEFAULT_MAX_LENGTH
 
@@ -1230,6 +1406,8 @@ class ImplementationClassUIDNotification(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.2
     """
+    __slots__ = ('_implementation_class_uid',)
+
     def __init__(self):
         self.implementation_class_uid = None
 
@@ -1345,6 +1523,8 @@ class ImplementationVersionNameNotification(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.2
     """
+    __slots__ = ('_implementation_version_name',)
+
     def __init__(self):
         self.implementation_version_name = None
 
@@ -1452,6 +1632,10 @@ class AsynchronousOperationsWindowNegotiation(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.3
     """
+    __slots__ = (
+        '_maximum_number_operations_invoked',
+        '_maximum_number_operations_performed'
+    )
 
     def __init__(self):
         self.maximum_number_operations_invoked = 1
@@ -1598,6 +1782,8 @@ class SCP_SCU_RoleSelectionNegotiation(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.4
     """
+    __slots__ = ('_scp_role', '_scu_role', '_sop_class_uid')
+
     def __init__(self):
         self.sop_class_uid = None
         self.scu_role = None
@@ -1779,6 +1965,8 @@ class SOPClassExtendedNegotiation(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.5
     """
+    __slots__ = ('_service_class_application_information', '_sop_class_uid')
+
     def __init__(self):
         self.sop_class_uid = None
         self.service_class_application_information = None
@@ -1927,6 +2115,11 @@ class SOPClassCommonExtendedNegotiation(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.6
     """
+    __slots__ = (
+        '_service_class_uid', '_sop_class_uid',
+        '_related_general_sop_class_identification'
+    )
+
     def __init__(self):
         self.sop_class_uid = None
         self.service_class_uid = None
@@ -2184,6 +2377,10 @@ class UserIdentityNegotiation(ServiceParameter):
 
     * DICOM Standard, Part 7, Annex D.3.3.7
     """
+    __slots__ = (
+        '_positive_response_requested', '_primary_field', '_secondary_field',
+        '_server_response', '_user_identity_type'
+    )
 
     def __init__(self):
         self.user_identity_type = None
@@ -1,6 +1,12 @@
 """Implementation of the Presentation service."""
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from copy import deepcopy
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
 
 from pydicom.uid import UID
 
@@ -212,6 +218,11 @@ class PresentationContext(object):
       `9.3.3.2 <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#sect_9.3.3.2>`_
       and `Annex B <http://dicom.nema.org/medical/dicom/current/output/html/part08.html#chapter_B>`_
     """
+    __slots__ = (
+        '_context_id', '_abstract_syntax', '_transfer_syntax', 'result',
+        '_scu_role', '_scp_role', '_as_scp', '_as_scu'
+    )
+
     def __init__(self):
         """Create a new PresentationContext."""
         self._context_id = None
@@ -353,13 +364,31 @@ class PresentationContext(object):
             return True
 
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return all(
+                getattr(self, name) == getattr(other, name)
+                for name in self.__slots__
+            )
 
         return NotImplemented
 
     # Python 2: Classes defining __eq__ should flag themselves as unhashable
     __hash__ = None
 
+    def __deepcopy__(self, memo):
+        """Return a copy of the presentation context.
+
+        The UIDs are immutable so only the list of transfer syntaxes needs
+        to be copied, which is much faster than copying every UID.
+        """
+        context = self.__class__.__new__(self.__class__)
+        for name in self.__slots__:
+            setattr(context, name, getattr(self, name))
+
+        context._transfer_syntax = list(self._transfer_syntax)
+        memo[id(self)] = context
+
+        return context
+
     def __ne__(self, other):
         """Return True if `self` does not equal `other`."""
         return not self == other
@@ -497,6 +526,302 @@ class PresentationContext(object):
             self.add_transfer_syntax(syntax)
 
 
+class NegotiationCache(object):
+    """Cached presentation context negotiation as the association acceptor.
+
+    The acceptor's supported presentation contexts are compiled into an
+    index when the cache is created and the results of negotiating each
+    distinct set of proposed contexts and SCP/SCU roles are kept, so
+    requestors that repeatedly propose the same contexts only need to be
+    negotiated once.
+
+    The cache only applies to the supported contexts it was created with,
+    use :meth:`is_valid_for` to check whether it can be used with the current
+    supported contexts.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of negotiation results to keep, the least
+        recently used results are discarded first (default ``128``).
+
+    Examples
+    --------
+
+    >>> from pynetdicom import build_context, StoragePresentationContexts
+    >>> from pynetdicom.presentation import NegotiationCache
+    >>> cache = NegotiationCache(StoragePresentationContexts)
+    >>> context = build_context('1.2.840.10008.5.1.4.1.1.2')
+    >>> context.context_id = 1
+    >>> contexts, roles = cache.negotiate([context])
+    >>> contexts[0].status
+    'Accepted'
+    """
+    def __init__(self, ac_contexts, maxsize=128):
+        """Create a new NegotiationCache.
+
+        Parameters
+        ----------
+        ac_contexts : list of PresentationContext
+            The presentation contexts supported by the acceptor.
+        maxsize : int, optional
+            The maximum number of negotiation results to keep (default
+            ``128``).
+        """
+        self.maxsize = maxsize
+
+        self._signature = _context_signature(ac_contexts)
+        self._index = _build_index(ac_contexts)
+        self._lock = threading.Lock()
+        # {signature of proposed contexts and roles : (results, roles)}
+        self._results = OrderedDict()
+
+    def __len__(self):
+        """Return the number of cached negotiation results."""
+        return len(self._results)
+
+    def clear(self):
+        """Discard all the cached negotiation results."""
+        with self._lock:
+            self._results.clear()
+
+    def is_valid_for(self, ac_contexts):
+        """Return ``True`` if the cache applies to `ac_contexts`.
+
+        Parameters
+        ----------
+        ac_contexts : list of PresentationContext
+            The presentation contexts currently supported by the acceptor.
+
+        Returns
+        -------
+        bool
+            ``True`` if `ac_contexts` are the same as the contexts the cache
+            was created with, ``False`` otherwise.
+        """
+        return _context_signature(ac_contexts) == self._signature
+
+    def negotiate(self, rq_contexts, roles=None):
+        """Negotiate the requestor's proposed presentation contexts.
+
+        Parameters
+        ----------
+        rq_contexts : list of PresentationContext
+            The Presentation Contexts proposed by the peer.
+        roles : dict or None
+            If the requestor has included one or more SCP/SCU Role Selection
+            Negotiation items then this will be a dict of
+            {SOP Class UID : (SCU role, SCP role)}, otherwise None (default)
+
+        Returns
+        -------
+        list of PresentationContext
+            The negotiated presentation contexts, as with
+            :func:`negotiate_as_acceptor`. New items are returned each time.
+        list of SCP_SCU_RoleSelectionNegotiation
+            The SCP/SCU Role Selection Negotiation reply items.
+        """
+        roles = roles or {}
+        if not rq_contexts or not self._index:
+            return negotiate_as_acceptor(rq_contexts, [], roles)
+
+        key = (
+            tuple([
+                (cx._context_id, cx._abstract_syntax,
+                 tuple(cx._transfer_syntax)) for cx in rq_contexts
+            ]),
+            tuple(sorted(roles.items())),
+        )
+        with self._lock:
+            outcome = self._results.get(key, None)
+            if outcome is not None:
+                # Mark as most recently used
+                del self._results[key]
+                self._results[key] = outcome
+
+        if outcome is None:
+            outcome = _negotiate_as_acceptor(rq_contexts, self._index, roles)
+            with self._lock:
+                self._results[key] = outcome
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+
+        return _as_negotiation_results(*outcome)
+
+
+def _as_negotiation_results(results, roles):
+    """Return the results of an acceptor negotiation as presentation contexts
+    and SCP/SCU Role Selection Negotiation items.
+
+    Parameters
+    ----------
+    results : list of tuple
+        The negotiated contexts as ``(context ID, abstract syntax, transfer
+        syntax, result, as_scu, as_scp)``.
+    roles : list of tuple
+        The role selection replies as ``(SOP Class UID, SCU role, SCP role)``.
+
+    Returns
+    -------
+    list of PresentationContext
+        The negotiated presentation contexts.
+    list of SCP_SCU_RoleSelectionNegotiation
+        The SCP/SCU Role Selection Negotiation reply items.
+    """
+    from pynetdicom.pdu_primitives import SCP_SCU_RoleSelectionNegotiation
+
+    result_contexts = []
+    for (context_id, ab_syntax, tr_syntax, result, as_scu, as_scp) in results:
+        # The UIDs have already been validated so skip the setters
+        context = PresentationContext()
+        context._context_id = context_id
+        context._abstract_syntax = ab_syntax
+        # An empty transfer syntax isn't added, as with add_transfer_syntax()
+        context._transfer_syntax = [tr_syntax] if tr_syntax else []
+        context.result = result
+        context._as_scu = as_scu
+        context._as_scp = as_scp
+        result_contexts.append(context)
+
+    reply_roles = []
+    for (uid, scu_role, scp_role) in roles:
+        role = SCP_SCU_RoleSelectionNegotiation()
+        role.sop_class_uid = uid
+        role.scu_role = scu_role
+        role.scp_role = scp_role
+        reply_roles.append(role)
+
+    return result_contexts, reply_roles
+
+
+def _build_index(ac_contexts):
+    """Return the acceptor's supported presentation contexts as
+    {abstract syntax : (set of transfer syntax, (scu_role, scp_role))}.
+    """
+    # Acceptor supported SOP Classes must be unique so we can use UID as
+    #   the key
+    return {
+        cx.abstract_syntax:(
+            frozenset(cx.transfer_syntax), (cx.scu_role, cx.scp_role)
+        ) for cx in ac_contexts
+    }
+
+
+def _context_signature(contexts):
+    """Return a hashable signature for the acceptor's supported `contexts`,
+    which changes whenever the negotiation outcome may change.
+    """
+    # Called for every association so skip the properties
+    return tuple([
+        (cx._abstract_syntax, tuple(cx._transfer_syntax), cx._scu_role,
+         cx._scp_role) for cx in contexts
+    ])
+
+
+def _negotiate_as_acceptor(rq_contexts, index, roles):
+    """Negotiate the requestor's presentation contexts against an `index`
+    of the acceptor's supported contexts.
+
+    Parameters
+    ----------
+    rq_contexts : list of PresentationContext
+        The Presentation Contexts proposed by the peer.
+    index : dict
+        The acceptor's supported contexts, as returned by ``_build_index()``.
+    roles : dict
+        The proposed SCP/SCU roles as {SOP Class UID : (SCU role, SCP role)}.
+
+    Returns
+    -------
+    list of tuple
+        The negotiated contexts as ``(context ID, abstract syntax, transfer
+        syntax, result, as_scu, as_scp)``, sorted by context ID.
+    list of tuple
+        The role selection replies as ``(SOP Class UID, SCU role, SCP
+        role)``, sorted by SOP Class UID.
+    """
+    results = []
+    reply_roles = {}
+
+    # Optimisation notes (for iterating through contexts only, not
+    #   including actual context negotiation)
+    # - Create dict, use set intersection/difference of dict keys: ~600 us
+    # - Create dict, iterate over dict keys: ~400 us
+    # - Iterate over lists: ~52000 us
+
+    # Requestor may use the same Abstract Syntax in multiple Presentation
+    #   Contexts so we need a more specific key than UID
+    requestor_contexts = {
+        (cx.context_id, cx.abstract_syntax):cx for cx in rq_contexts
+    }
+
+    for (cntx_id, ab_syntax), rq_context in requestor_contexts.items():
+        # Check if the acceptor supports the Abstract Syntax
+        if ab_syntax not in index:
+            # Reject context - abstract syntax not supported
+            results.append(
+                (cntx_id, ab_syntax, rq_context.transfer_syntax[0], 0x03,
+                 False, False)
+            )
+            continue
+
+        ac_syntaxes, ac_roles = index[ab_syntax]
+        rq_roles = roles.get(ab_syntax, (None, None))
+        has_role = ab_syntax in roles
+
+        # Abstract syntax supported so check Transfer Syntax
+        for tr_syntax in rq_context.transfer_syntax:
+            if tr_syntax in ac_syntaxes:
+                break
+        else:
+            # Reject context - transfer syntax not supported
+            results.append(
+                (cntx_id, ab_syntax, rq_context.transfer_syntax[0], 0x04,
+                 False, False)
+            )
+            continue
+
+        ## SCP/SCU Role Selection Negotiation
+        #   Only for (provisionally) accepted contexts
+        if None in ac_roles:
+            # Default roles
+            as_scu, as_scp = False, True
+            # If either aq.scu_role or ac.scp_role is None then
+            #   don't send an SCP/SCU negotiation reply
+            has_role = False
+        else:
+            # Use a LUT to make changes to outcomes easier
+            #   also its much simpler than coding if/then branches
+            outcome = SCP_SCU_ROLES[rq_roles][ac_roles]
+            as_scu, as_scp = outcome[2], outcome[3]
+
+        # If can't act as either SCU nor SCP then reject the context
+        if as_scu is False and as_scp is False:
+            # User rejection
+            results.append(
+                (cntx_id, ab_syntax, tr_syntax, 0x01, as_scu, as_scp)
+            )
+            continue
+
+        results.append((cntx_id, ab_syntax, tr_syntax, 0x00, as_scu, as_scp))
+        if has_role:
+            # Can't return 0x01 if proposed 0x00
+            reply_roles[ab_syntax] = (
+                ab_syntax,
+                False if rq_roles[0] is False else ac_roles[0],
+                False if rq_roles[1] is False else ac_roles[1],
+            )
+
+    # Sort by presentation context ID
+    #   This isn't required by the DICOM Standard but its a nice thing to do
+    results = sorted(results, key=lambda x: x[0])
+
+    # Sort role selection by abstract syntax, also not required but nice
+    reply_roles = sorted(reply_roles.values(), key=lambda x: x[0])
+
+    return results, reply_roles
+
+
 def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
     """Process the Presentation Contexts as an Association acceptor.
 
@@ -524,11 +849,8 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
         If `roles` is not None then this is a list of SCP/SCU Role Selection
         Negotiation items that can be sent back to the requestor.
     """
-    from pynetdicom.pdu_primitives import SCP_SCU_RoleSelectionNegotiation
-
     roles = roles or {}
     result_contexts = []
-    reply_roles = {}
 
     # No requestor presentation contexts
     if not rq_contexts:
@@ -545,113 +867,11 @@ def negotiate_as_acceptor(rq_contexts, ac_contexts, roles=None):
             result_contexts.append(context)
         return result_contexts, []
 
-    # Optimisation notes (for iterating through contexts only, not
-    #   including actual context negotiation)
-    # - Create dict, use set intersection/difference of dict keys: ~600 us
-    # - Create dict, iterate over dict keys: ~400 us
-    # - Iterate over lists: ~52000 us
+    results, reply_roles = _negotiate_as_acceptor(
+        rq_contexts, _build_index(ac_contexts), roles
+    )
 
-    # Requestor may use the same Abstract Syntax in multiple Presentation
-    #   Contexts so we need a more specific key than UID
-    requestor_contexts = {
-        (cx.context_id, cx.abstract_syntax):cx for cx in rq_contexts
-    }
-    # Acceptor supported SOP Classes must be unique so we can use UID as
-    #   the key
-    acceptor_contexts = {cx.abstract_syntax:cx for cx in ac_contexts}
-
-    for (cntx_id, ab_syntax) in requestor_contexts:
-        # Convenience variable
-        rq_context = requestor_contexts[(cntx_id, ab_syntax)]
-
-        # Create a new PresentationContext item that will store the
-        #   results of the negotiation
-        context = PresentationContext()
-        context.context_id = cntx_id
-        context.abstract_syntax = ab_syntax
-        context._as_scu = False
-        context._as_scp = False
-
-        # Check if the acceptor supports the Abstract Syntax
-        if ab_syntax in acceptor_contexts:
-            # Convenience variables
-            ac_context = acceptor_contexts[ab_syntax]
-            ac_roles = (ac_context.scu_role, ac_context.scp_role)
-            try:
-                rq_roles = roles[ab_syntax]
-                has_role = True
-            except KeyError:
-                rq_roles = (None, None)
-                has_role = False
-
-            # Abstract syntax supported so check Transfer Syntax
-            for tr_syntax in rq_context.transfer_syntax:
-                # If transfer syntax supported then (provisionally) accept
-                if tr_syntax in ac_context.transfer_syntax:
-                    context.transfer_syntax = [tr_syntax]
-                    context.result = 0x00
-                    result_contexts.append(context)
-                    break
-
-            ## SCP/SCU Role Selection Negotiation
-            #   Only for (provisionally) accepted contexts
-            if context.result == 0x00:
-                if None in ac_roles:
-                    # Default roles
-                    context._as_scu = False
-                    context._as_scp = True
-                    # If either aq.scu_role or ac.scp_role is None then
-                    #   don't send an SCP/SCU negotiation reply
-                    has_role = False
-                else:
-                    # Use a LUT to make changes to outcomes easier
-                    #   also its much simpler than coding if/then branches
-                    outcome = SCP_SCU_ROLES[rq_roles][ac_roles]
-                    context._as_scu = outcome[2]
-                    context._as_scp = outcome[3]
-
-                # If can't act as either SCU nor SCP then reject the context
-                if context.as_scu is False and context.as_scp is False:
-                    # User rejection
-                    context.result = 0x01
-
-            # Need to check against None as 0x00 is a possible value
-            if context.result is None:
-                # Reject context - transfer syntax not supported
-                context.result = 0x04
-                context.transfer_syntax = [rq_context.transfer_syntax[0]]
-                result_contexts.append(context)
-            elif context.result == 0x00 and has_role:
-                # Create new SCP/SCU Role Selection Negotiation item
-                role = SCP_SCU_RoleSelectionNegotiation()
-                role.sop_class_uid = context.abstract_syntax
-
-                # Can't return 0x01 if proposed 0x00
-                if rq_roles[0] is False:
-                    role.scu_role = False
-                else:
-                    role.scu_role = ac_context.scu_role
-
-                if rq_roles[1] is False:
-                    role.scp_role = False
-                else:
-                    role.scp_role = ac_context.scp_role
-
-                reply_roles[context.abstract_syntax] = role
-        else:
-            # Reject context - abstract syntax not supported
-            context.result = 0x03
-            context.transfer_syntax = [rq_context.transfer_syntax[0]]
-            result_contexts.append(context)
-
-    # Sort by presentation context ID
-    #   This isn't required by the DICOM Standard but its a nice thing to do
-    result_contexts = sorted(result_contexts, key=lambda x: x.context_id)
-
-    # Sort role selection by abstract syntax, also not required but nice
-    reply_roles = sorted(reply_roles.values(), key=lambda x: x.sop_class_uid)
-
-    return result_contexts, reply_roles
+    return _as_negotiation_results(results, reply_roles)
 
 
 def negotiate_as_requestor(rq_contexts, ac_contexts, roles=None):
@@ -759,6 +979,363 @@ def negotiate_as_requestor(rq_contexts, ac_contexts, roles=None):
     return sorted(output, key=lambda x: x.context_id)
 
 
+class PeerCapabilityCache(object):
+    """The presentation contexts previously accepted and rejected by peers.
+
+    Used by the association requestor to record the abstract and transfer
+    syntax pairs that each peer, identified by its (address, port, AE
+    title), has accepted and rejected. Later requests to the same peer can
+    then skip the transfer syntaxes and contexts the peer has rejected,
+    which keeps the A-ASSOCIATE-RQ small, and propose the transfer syntaxes
+    it has already accepted first.
+
+    Attributes
+    ----------
+    max_age : int or float or None
+        The maximum age (in seconds) of a peer's capabilities before they're
+        no longer used, ``None`` for no limit (default).
+    path : str or None
+        The path to the JSON file the capabilities are loaded from and saved
+        to, if ``None`` then they're only kept in memory (default).
+
+    Examples
+    --------
+
+    >>> from pynetdicom import AE, StoragePresentationContexts
+    >>> from pynetdicom.presentation import PeerCapabilityCache
+    >>> ae = AE()
+    >>> ae.requested_contexts = StoragePresentationContexts
+    >>> ae.capability_cache = PeerCapabilityCache('capabilities.json')
+    """
+    def __init__(self, path=None, max_age=None):
+        """Create a new PeerCapabilityCache.
+
+        Parameters
+        ----------
+        path : str, optional
+            The path to the JSON file to load the capabilities from and save
+            them to. If the file doesn't exist then it'll be created when
+            the capabilities are first recorded.
+        max_age : int or float, optional
+            The maximum age (in seconds) of a peer's capabilities before
+            they're no longer used (default no limit).
+        """
+        self.path = path
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        # Serialises saving so an older save never replaces a newer one
+        self._save_lock = threading.Lock()
+        # {(address, port, AE title) : {'updated' : float,
+        #   'accepted' : {abstract syntax : set of transfer syntax},
+        #   'rejected' : {abstract syntax : set of transfer syntax}}}
+        self._peers = {}
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self):
+        """Return the number of peers in the cache."""
+        return len(self._peers)
+
+    def clear(self):
+        """Remove the capabilities of all the peers."""
+        with self._lock:
+            self._peers.clear()
+
+    def filter_contexts(self, address, port, ae_title, contexts):
+        """Return the presentation contexts to propose to a peer.
+
+        For each of the `contexts`:
+
+        * Any transfer syntaxes the peer has previously rejected are removed
+          and the context is skipped if none are left.
+        * Any transfer syntaxes the peer has previously accepted are moved to
+          the front, the others are still proposed in their original order.
+
+        Parameters
+        ----------
+        address : str
+            The peer's IP address.
+        port : int
+            The peer's listen port number.
+        ae_title : bytes or str
+            The peer's AE title.
+        contexts : list of PresentationContext
+            The presentation contexts to be proposed.
+
+        Returns
+        -------
+        list of PresentationContext
+            The presentation contexts to propose. If nothing is known about
+            the peer, or all the contexts would be skipped, then `contexts`
+            is returned unchanged, otherwise new contexts are returned.
+        """
+        peer = self._get_peer(address, port, ae_title)
+        if peer is None:
+            return contexts
+
+        accepted, rejected = peer['accepted'], peer['rejected']
+        filtered = []
+        for context in contexts:
+            ab_syntax = context.abstract_syntax
+            tr_syntaxes = context.transfer_syntax
+            syntaxes = [
+                ts for ts in tr_syntaxes
+                if ts not in rejected.get(ab_syntax, ())
+            ]
+            if not syntaxes:
+                continue
+
+            # Propose the previously accepted transfer syntaxes first
+            previous = accepted.get(ab_syntax, ())
+            syntaxes = (
+                [ts for ts in syntaxes if ts in previous]
+                + [ts for ts in syntaxes if ts not in previous]
+            )
+
+            if syntaxes != tr_syntaxes:
+                context = deepcopy(context)
+                context.transfer_syntax = syntaxes
+
+            filtered.append(context)
+
+        if not filtered:
+            LOGGER.debug(
+                "The peer has rejected all the requested presentation "
+                "contexts previously, proposing them anyway"
+            )
+            return contexts
+
+        return filtered
+
+    def get_capabilities(self, address, port, ae_title):
+        """Return the capabilities of a peer.
+
+        Parameters
+        ----------
+        address : str
+            The peer's IP address.
+        port : int
+            The peer's listen port number.
+        ae_title : bytes or str
+            The peer's AE title.
+
+        Returns
+        -------
+        dict or None
+            The peer's capabilities as ``{'accepted' : {abstract syntax :
+            list of transfer syntax}, 'rejected' : {abstract syntax : list
+            of transfer syntax}}`` or ``None`` if the peer isn't in the cache
+            or its capabilities are older than `max_age`.
+        """
+        peer = self._get_peer(address, port, ae_title)
+        if peer is None:
+            return None
+
+        return {
+            'accepted' : {
+                uid:sorted(syntaxes)
+                for uid, syntaxes in peer['accepted'].items()
+            },
+            'rejected' : {
+                uid:sorted(syntaxes)
+                for uid, syntaxes in peer['rejected'].items()
+            },
+        }
+
+    def _get_peer(self, address, port, ae_title):
+        """Return the cache entry for a peer or ``None`` if not available."""
+        with self._lock:
+            peer = self._peers.get(_peer_key(address, port, ae_title))
+
+        if peer is None:
+            return None
+
+        if self.max_age is not None:
+            if time.time() - peer['updated'] > self.max_age:
+                return None
+
+        return peer
+
+    def load(self):
+        """Load the capabilities from the file at `path`.
+
+        Any capabilities in the cache are replaced. If the file can't be
+        read or decoded then a warning is logged and the cache is cleared.
+        """
+        peers = {}
+        try:
+            with open(self.path, 'r') as fp:
+                data = json.load(fp)
+
+            for peer in data['peers']:
+                key = _peer_key(peer['address'], peer['port'],
+                                peer['ae_title'])
+                peers[key] = {
+                    'updated' : float(peer['updated']),
+                    'accepted' : {
+                        UID(uid):set([UID(ts) for ts in syntaxes])
+                        for uid, syntaxes in peer['accepted'].items()
+                    },
+                    'rejected' : {
+                        UID(uid):set([UID(ts) for ts in syntaxes])
+                        for uid, syntaxes in peer['rejected'].items()
+                    },
+                }
+        except (IOError, OSError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning(
+                "Unable to load the peer capabilities from '{}': {}"
+                .format(self.path, exc)
+            )
+            peers = {}
+
+        with self._lock:
+            self._peers = peers
+
+    def remove(self, address, port, ae_title):
+        """Remove the capabilities of a peer.
+
+        Parameters
+        ----------
+        address : str
+            The peer's IP address.
+        port : int
+            The peer's listen port number.
+        ae_title : bytes or str
+            The peer's AE title.
+        """
+        with self._lock:
+            self._peers.pop(_peer_key(address, port, ae_title), None)
+
+    def save(self):
+        """Save the capabilities to the file at `path`."""
+        with self._save_lock:
+            self._save()
+
+    def _save(self):
+        """Save the capabilities to the file at `path`, must hold the save
+        lock.
+        """
+        with self._lock:
+            peers = [
+                {
+                    'address' : key[0],
+                    'port' : key[1],
+                    'ae_title' : key[2],
+                    'updated' : peer['updated'],
+                    'accepted' : {
+                        uid:sorted(syntaxes)
+                        for uid, syntaxes in peer['accepted'].items()
+                    },
+                    'rejected' : {
+                        uid:sorted(syntaxes)
+                        for uid, syntaxes in peer['rejected'].items()
+                    },
+                } for key, peer in sorted(self._peers.items())
+            ]
+
+        # Write to a uniquely named temporary file in the same directory
+        #   first so the file is never left partially written, even when
+        #   saved by more than one process
+        path = self.path
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + '.', suffix='.tmp',
+            dir=os.path.dirname(os.path.abspath(path))
+        )
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump({'peers' : peers}, fp, indent=2, sort_keys=True)
+
+            try:
+                os.replace(tmp_path, path)
+            except AttributeError:
+                # Python 2
+                if os.path.exists(path):
+                    os.remove(path)
+
+                os.rename(tmp_path, path)
+        except (IOError, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+            raise
+
+    def update(self, assoc):
+        """Record the results of an association's presentation context
+        negotiation.
+
+        If `path` is set then the capabilities are also saved to the file.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association, as the requestor, after its presentation
+            contexts have been negotiated.
+        """
+        requested = {
+            cx.context_id:cx for cx in assoc.requestor.requested_contexts
+        }
+        accepted = {}
+        for cx in assoc.accepted_contexts:
+            accepted.setdefault(cx.abstract_syntax, set()).add(
+                cx.transfer_syntax[0]
+            )
+
+        rejected = {}
+        for cx in assoc.rejected_contexts:
+            # Only the abstract syntax and transfer syntax rejections
+            #   are a result of the peer's capabilities
+            if cx.result not in (0x03, 0x04):
+                continue
+
+            if cx.context_id not in requested:
+                continue
+
+            syntaxes = rejected.setdefault(cx.abstract_syntax, set())
+            syntaxes.update(requested[cx.context_id].transfer_syntax)
+
+        key = _peer_key(
+            assoc.acceptor.address, assoc.acceptor.port,
+            assoc.acceptor.ae_title
+        )
+        with self._lock:
+            peer = self._peers.setdefault(
+                key, {'updated' : None, 'accepted' : {}, 'rejected' : {}}
+            )
+            peer['updated'] = time.time()
+            for uid, syntaxes in accepted.items():
+                peer['accepted'].setdefault(uid, set()).update(syntaxes)
+                peer['rejected'].get(uid, set()).difference_update(syntaxes)
+
+            for uid, syntaxes in rejected.items():
+                syntaxes = syntaxes - accepted.get(uid, set())
+                peer['rejected'].setdefault(uid, set()).update(syntaxes)
+                peer['accepted'].get(uid, set()).difference_update(syntaxes)
+
+            # Remove any abstract syntaxes without transfer syntaxes
+            for syntaxes in (peer['accepted'], peer['rejected']):
+                for uid in [uid for uid, ts in syntaxes.items() if not ts]:
+                    del syntaxes[uid]
+
+        if self.path:
+            try:
+                self.save()
+            except (IOError, OSError) as exc:
+                LOGGER.warning(
+                    "Unable to save the peer capabilities to '{}': {}"
+                    .format(self.path, exc)
+                )
+
+
+def _peer_key(address, port, ae_title):
+    """Return the key used to identify a peer in the PeerCapabilityCache."""
+    if isinstance(ae_title, bytes):
+        ae_title = ae_title.decode('ascii')
+
+    return (address, int(port), ae_title.strip())
+
+
 def build_context(abstract_syntax, transfer_syntax=None):
     """Return a PresentationContext built from the `abstract_syntax`.
 
@@ -0,0 +1,320 @@
+"""Utilities for sending collections of DICOM files using the Storage
+Service.
+"""
+
+from collections import OrderedDict, deque
+import logging
+import os
+import threading
+
+from pydicom import dcmread
+from pydicom.uid import (
+    ExplicitVRLittleEndian, ImplicitVRLittleEndian, ExplicitVRBigEndian
+)
+
+from pynetdicom.presentation import build_context
+
+
+LOGGER = logging.getLogger('pynetdicom.storeutils')
+
+# The C-STORE statuses that mean the instance has been stored
+STORED_STATUSES = (0x0000, 0xB000, 0xB006, 0xB007)
+
+
+class FileQueue(object):
+    """A queue of the files to be sent, shared between concurrent
+    associations.
+
+    A file taken from the queue is outstanding until it's marked as done or
+    put back, such as when its association is aborted. While files are
+    outstanding :meth:`get` waits rather than reporting the queue as
+    finished, so a file put back is always sent by one of the remaining
+    associations.
+
+    Examples
+    --------
+
+    >>> from pynetdicom.storeutils import FileQueue
+    >>> files = FileQueue([(key, '/path/to/file.dcm')])
+    >>> item = files.get()
+    >>> files.done()
+    >>> files.get() is None
+    True
+    """
+    def __init__(self, items=None):
+        """Create a new FileQueue.
+
+        Parameters
+        ----------
+        items : list, optional
+            The items to add to the queue.
+        """
+        self._items = deque(items or [])
+        self._nr_outstanding = 0
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        """Return the number of files waiting in the queue."""
+        with self._cond:
+            return len(self._items)
+
+    def done(self):
+        """Mark an outstanding file as done."""
+        with self._cond:
+            self._nr_outstanding -= 1
+            self._cond.notify_all()
+
+    def get(self, stop=None):
+        """Return the next file to send.
+
+        Parameters
+        ----------
+        stop : threading.Event, optional
+            If used then stop waiting once it's set.
+
+        Returns
+        -------
+        object or None
+            The next item in the queue, which is outstanding until
+            :meth:`done` or :meth:`put_back` is called for it. ``None`` if
+            the queue is empty and no files are outstanding, or if `stop`
+            has been set.
+        """
+        with self._cond:
+            while True:
+                if stop is not None and stop.is_set():
+                    return None
+
+                if self._items:
+                    self._nr_outstanding += 1
+                    return self._items.popleft()
+
+                if not self._nr_outstanding:
+                    return None
+
+                self._cond.wait()
+
+    @property
+    def nr_outstanding(self):
+        """Return the number of files taken but not yet done."""
+        return self._nr_outstanding
+
+    def put_back(self, item):
+        """Return the outstanding `item` to the queue to be sent again."""
+        with self._cond:
+            self._nr_outstanding -= 1
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def wake(self):
+        """Wake any waiting :meth:`get` calls so they check their `stop`."""
+        with self._cond:
+            self._cond.notify_all()
+
+
+def get_files(paths, recurse=False):
+    """Return the paths to the files in `paths`.
+
+    Parameters
+    ----------
+    paths : list of str
+        The paths to the files and directories to be sent.
+    recurse : bool, optional
+        If True then also include the files in the sub-directories of any
+        directories in `paths` (default False).
+
+    Returns
+    -------
+    list of str
+        The paths to the files, the files in each directory are sorted by
+        name.
+    """
+    fpaths = []
+    for path in paths:
+        if not os.path.isdir(path):
+            fpaths.append(path)
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            fpaths.extend([os.path.join(root, fname) for fname in sorted(files)])
+            if not recurse:
+                break
+
+    return fpaths
+
+
+def get_transfer_syntax(ds):
+    """Return the Transfer Syntax UID `ds` is encoded with.
+
+    Datasets read without any File Meta Information use the transfer syntax
+    pydicom has determined from the encoding.
+    """
+    meta = getattr(ds, 'file_meta', None)
+    if meta is not None and 'TransferSyntaxUID' in meta:
+        return meta.TransferSyntaxUID
+
+    if ds.is_implicit_VR:
+        return ImplicitVRLittleEndian
+
+    if ds.is_little_endian:
+        return ExplicitVRLittleEndian
+
+    return ExplicitVRBigEndian
+
+
+def is_uncompressed(uid):
+    """Return True if `uid` is an uncompressed, non-deflated transfer syntax.
+    """
+    try:
+        return not (uid.is_compressed or uid.is_deflated)
+    except ValueError:
+        # Private transfer syntax
+        return False
+
+
+class Journal(object):
+    """A checkpoint journal of the files that have been stored by the peer.
+
+    The absolute path to each stored file is appended to the journal as a
+    new line, so an interrupted run can be resumed without resending them.
+
+    Attributes
+    ----------
+    stored : set of str
+        The absolute paths of the files in the journal when it was opened.
+    """
+    def __init__(self, path):
+        """Create a new Journal, loading any existing entries.
+
+        Parameters
+        ----------
+        path : str
+            The path to the journal file.
+        """
+        self.stored = set()
+        if os.path.exists(path):
+            with open(path, 'r') as fp:
+                self.stored = set([ll.rstrip('\n') for ll in fp if ll.strip()])
+
+        self._fp = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def add(self, fpath):
+        """Record that the file at `fpath` has been stored."""
+        with self._lock:
+            self._fp.write(os.path.abspath(fpath) + '\n')
+            self._fp.flush()
+
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            self._fp.close()
+
+    def filter(self, fpaths):
+        """Return the paths in `fpaths` that haven't been stored."""
+        return [
+            fpath for fpath in fpaths
+            if os.path.abspath(fpath) not in self.stored
+        ]
+
+
+def plan_associations(groups, transfer_syntax=None, max_contexts=128):
+    """Return the presentation contexts to use for each association.
+
+    Each group of files needs a presentation context for its SOP Class and
+    transfer syntax. The groups of a SOP Class with an uncompressed transfer
+    syntax share a context proposing all the uncompressed transfer syntaxes,
+    as they can be converted between, while compressed groups use a context
+    for their transfer syntax only. The contexts are then split between as
+    few associations as possible.
+
+    Parameters
+    ----------
+    groups : dict
+        The files to be sent as {(SOP Class UID, Transfer Syntax UID) :
+        list of str}, such as returned by :func:`scan_files`.
+    transfer_syntax : list of pydicom.uid.UID, optional
+        If used then the uncompressed transfer syntaxes to propose, otherwise
+        each context will propose those of its groups followed by the
+        default uncompressed transfer syntaxes.
+    max_contexts : int, optional
+        The maximum number of presentation contexts per association
+        (default 128).
+
+    Returns
+    -------
+    list of (list of PresentationContext, list of tuple)
+        The presentation contexts to request for each association and the
+        (SOP Class UID, Transfer Syntax UID) of the groups to send using it.
+    """
+    default = [
+        ExplicitVRLittleEndian, ImplicitVRLittleEndian, ExplicitVRBigEndian
+    ]
+
+    # [(abstract syntax, list of transfer syntax, list of group keys)]
+    contexts = []
+    uncompressed = {}
+    for key in groups:
+        sop_class, syntax = key
+        if not is_uncompressed(syntax):
+            contexts.append((sop_class, [syntax], [key]))
+            continue
+
+        if sop_class not in uncompressed:
+            uncompressed[sop_class] = (sop_class, [], [])
+            contexts.append(uncompressed[sop_class])
+
+        uncompressed[sop_class][2].append(key)
+
+    for sop_class, syntaxes, keys in uncompressed.values():
+        if transfer_syntax:
+            syntaxes.extend(transfer_syntax)
+            continue
+
+        # Most files first, as the peer will usually accept the first
+        keys.sort(key=lambda key: len(groups[key]), reverse=True)
+        syntaxes.extend([key[1] for key in keys])
+        syntaxes.extend([ts for ts in default if ts not in syntaxes])
+
+    plan = []
+    for ii in range(0, len(contexts), max_contexts):
+        plan.append((
+            [build_context(*cx[:2]) for cx in contexts[ii:ii + max_contexts]],
+            [key for cx in contexts[ii:ii + max_contexts] for key in cx[2]]
+        ))
+
+    return plan
+
+
+def scan_files(fpaths):
+    """Return the files grouped by SOP Class UID and Transfer Syntax UID.
+
+    Only the dataset's header is read, not its *Pixel Data*. Files that
+    can't be read are logged and skipped.
+
+    Parameters
+    ----------
+    fpaths : list of str
+        The paths to the files to be sent.
+
+    Returns
+    -------
+    collections.OrderedDict
+        The paths to the files as {(SOP Class UID, Transfer Syntax UID) :
+        list of str}, in order of the first file in each group.
+    """
+    groups = OrderedDict()
+    for fpath in fpaths:
+        try:
+            ds = dcmread(fpath, force=True, stop_before_pixels=True,
+                         specific_tags=['SOPClassUID'])
+            key = (ds.SOPClassUID, get_transfer_syntax(ds))
+        except Exception as exc:
+            LOGGER.error('Cannot read input file {0!s}'.format(fpath))
+            LOGGER.debug('{0!s}'.format(exc))
+            continue
+
+        groups.setdefault(key, []).append(fpath)
+
+    return groups
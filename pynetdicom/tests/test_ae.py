@@ -9,7 +9,7 @@ import pytest
 
 from pydicom import read_file
 from pydicom.dataset import Dataset
-from pydicom.uid import UID, ImplicitVRLittleEndian
+from pydicom.uid import UID, ImplicitVRLittleEndian, ExplicitVRLittleEndian
 
 from pynetdicom import (
     AE, evt, debug_logger,
@@ -19,8 +19,10 @@ from pynetdicom import (
     PYNETDICOM_IMPLEMENTATION_UID,
     PYNETDICOM_IMPLEMENTATION_VERSION
 )
-from pynetdicom.presentation import build_context
-from pynetdicom.sop_class import RTImageStorage, VerificationSOPClass
+from pynetdicom.presentation import build_context, PeerCapabilityCache
+from pynetdicom.sop_class import (
+    CTImageStorage, RTImageStorage, VerificationSOPClass
+)
 
 
 #debug_logger()
@@ -294,6 +296,84 @@ class TestAEGoodAssociation(object):
 
         scp.shutdown()
 
+    def test_associate_repeated(self):
+        """Check repeated associations reuse the address and A-ASSOCIATE-RQ"""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        addresses = []
+        get_local_address = ae._get_local_address
+        def _get_local_address():
+            addresses.append(get_local_address())
+            return addresses[-1]
+
+        ae._get_local_address = _get_local_address
+        ae.add_requested_context(VerificationSOPClass)
+        for ii in range(3):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            assert assoc.requestor.address == addresses[0]
+            assoc.release()
+            assert assoc.is_released
+
+        assert len(addresses) == 3
+        assert ae._local_address == addresses[0]
+        assert len(ae._associate_rq_cache) == 1
+
+        # Different extended negotiation isn't sent using the cached PDU
+        assoc = ae.associate('localhost', 11112, max_pdu=12345)
+        assert assoc.is_established
+        assert scp.active_associations[0].requestor.maximum_length == 12345
+        assoc.release()
+        assert len(ae._associate_rq_cache) == 2
+
+        scp.shutdown()
+
+    def test_associate_capability_cache(self):
+        """Check the contexts the peer rejects aren't proposed"""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_supported_context(RTImageStorage, ExplicitVRLittleEndian)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.capability_cache = PeerCapabilityCache()
+        ae.add_requested_context(VerificationSOPClass)
+        ae.add_requested_context(RTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assert len(assoc.requestor.requested_contexts) == 3
+        assert len(assoc.accepted_contexts) == 2
+        assoc.release()
+        assert len(ae.capability_cache) == 1
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        contexts = assoc.requestor.requested_contexts
+        assert len(contexts) == 2
+        # The accepted transfer syntaxes are proposed first
+        assert contexts[0].abstract_syntax == VerificationSOPClass
+        assert contexts[0].transfer_syntax[0] == ImplicitVRLittleEndian
+        assert len(contexts[0].transfer_syntax) == 3
+        assert contexts[1].abstract_syntax == RTImageStorage
+        assert contexts[1].transfer_syntax[0] == ExplicitVRLittleEndian
+        assert len(contexts[1].transfer_syntax) == 3
+        assert len(assoc.rejected_contexts) == 0
+        assoc.release()
+
+        # The requested contexts are unchanged
+        assert len(ae.requested_contexts) == 3
+        assert len(ae.requested_contexts[1].transfer_syntax) == 3
+
+        scp.shutdown()
+
     def test_associate_max_pdu(self):
         """ Check Association has correct max PDUs on either end """
         self.ae = ae = AE()
@@ -486,6 +566,98 @@ class TestAEGoodMiscSetters(object):
         ae.maximum_pdu_size = 5000
         assert ae.maximum_pdu_size == 5000
 
+    def test_send_buffer_size(self):
+        """Test AE.send_buffer_size"""
+        self.ae = ae = AE()
+        assert ae.send_buffer_size == 4194304
+        ae.send_buffer_size = None
+        assert ae.send_buffer_size is None
+        ae.send_buffer_size = 0
+        assert ae.send_buffer_size == 4194304
+        ae.send_buffer_size = 'a'
+        assert ae.send_buffer_size == 4194304
+        ae.send_buffer_size = 16384
+        assert ae.send_buffer_size == 16384
+
+        def handle(event):
+            return 0x0000
+
+        ae.add_supported_context(RTImageStorage)
+        ae.add_requested_context(RTImageStorage)
+        scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_STORE, handle)]
+        )
+
+        # A buffer smaller than a single P-DATA still sends the dataset
+        assoc = ae.associate('localhost', 11112, max_pdu=8192)
+        assert assoc.send_buffer_size == 16384
+        ae.send_buffer_size = 1
+        assert assoc.send_buffer_size == 1
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        scp.shutdown()
+
+    def test_receive_buffer(self):
+        """Test AE.receive_buffer_messages and AE.receive_buffer_size"""
+        self.ae = ae = AE()
+        assert ae.receive_buffer_messages is None
+        assert ae.receive_buffer_size is None
+        ae.receive_buffer_messages = 10
+        ae.receive_buffer_size = 1024
+        assert ae.receive_buffer_messages == 10
+        assert ae.receive_buffer_size == 1024
+        ae.receive_buffer_messages = 0
+        ae.receive_buffer_size = 'a'
+        assert ae.receive_buffer_messages is None
+        assert ae.receive_buffer_size is None
+
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        ae.receive_buffer_messages = 1
+        ae.receive_buffer_size = 1
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.receive_buffer_messages == 1
+        assert assoc.receive_buffer_size == 1
+        ae.receive_buffer_messages = 2
+        assert assoc.receive_buffer_messages == 2
+        assert scp.active_associations[0].receive_buffer_messages == 2
+
+        # The limits still allow one message to be received at a time
+        assert assoc.send_c_echo().Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+    def test_memory_budget(self):
+        """Test AE.memory_budget"""
+        def handle(event):
+            return 0x0000
+
+        self.ae = ae = AE()
+        assert ae.memory_budget.maxbytes is None
+        ae.memory_budget.maxbytes = 1024
+        ae.add_supported_context(RTImageStorage)
+        ae.add_requested_context(RTImageStorage)
+        scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_STORE, handle)]
+        )
+
+        # The budget is only a soft limit, so never stops the transfer
+        assoc = ae.associate('localhost', 11112, max_pdu=8192)
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+        scp.shutdown()
+
+        assert ae.memory_budget.nr_bytes == 0
+        assert ae.memory_budget.high_water >= 8192
+
     def test_require_calling_aet(self):
         """Test AE.require_calling_aet"""
         self.ae = ae = AE()
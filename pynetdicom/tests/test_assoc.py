@@ -20,6 +20,7 @@ from pydicom.uid import (
     UID,
     ImplicitVRLittleEndian,
     ExplicitVRLittleEndian,
+    ExplicitVRBigEndian,
     JPEGBaseline,
     JPEG2000,
     JPEG2000Lossless,
@@ -29,7 +30,9 @@ from pynetdicom import (
     AE, VerificationPresentationContexts, build_context, evt, _config,
     debug_logger, build_role
 )
-from pynetdicom.association import Association
+from pynetdicom.association import (
+    Association, AssociationRegistry, fan_out_c_store
+)
 from pynetdicom.dimse_primitives import C_STORE, C_FIND, C_GET, C_MOVE
 from pynetdicom.dsutils import encode, decode
 from pynetdicom.events import Event
@@ -101,6 +104,8 @@ COMP_DATASET = dcmread(os.path.join(TEST_DS_DIR, 'MRImageStorage_JPG2000_Lossles
 
 
 class DummyDIMSE(object):
+    is_receive_full = False
+
     def __init__(self):
         self.status = None
 
@@ -554,6 +559,97 @@ class TestAssociation(object):
         assert evt.EVT_USER_ID in assoc.get_events()
 
 
+class TestAssociationRegistry(object):
+    """Tests for AssociationRegistry."""
+    def setup(self):
+        self.ae = None
+
+    def teardown(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def create_assoc(self, mode, address):
+        """Return an unstarted Association."""
+        ae = AE()
+        assoc = Association(ae, mode)
+        if mode == MODE_REQUESTOR:
+            assoc.acceptor.address = address
+        else:
+            assoc.requestor.address = address
+
+        return assoc
+
+    def test_add_remove(self):
+        """Test adding and removing associations."""
+        registry = AssociationRegistry()
+        assert 0 == len(registry)
+        assert 0 == registry.count()
+        assert 0 == registry.count(mode=MODE_ACCEPTOR)
+
+        assoc_a = self.create_assoc(MODE_ACCEPTOR, '10.0.0.1')
+        assoc_b = self.create_assoc(MODE_ACCEPTOR, '10.0.0.2')
+        assoc_c = self.create_assoc(MODE_REQUESTOR, '10.0.0.1')
+        assert registry.add(assoc_a)
+        assert registry.add(assoc_b)
+        assert registry.add(assoc_c)
+        assert not registry.add(assoc_a)
+
+        assert 3 == len(registry)
+        assert 2 == registry.count(mode=MODE_ACCEPTOR)
+        assert 1 == registry.count(mode=MODE_REQUESTOR)
+        assert 2 == registry.count(peer='10.0.0.1')
+        assert 1 == registry.count(mode=MODE_ACCEPTOR, peer='10.0.0.1')
+        assert 0 == registry.count(peer='10.0.0.3')
+        assert 3 == registry.count(server=None)
+        assert [assoc_a, assoc_b, assoc_c] == registry.associations()
+        assert [assoc_c] == registry.associations(mode=MODE_REQUESTOR)
+
+        registry.remove(assoc_a)
+        registry.remove(assoc_a)
+        assert 2 == len(registry)
+        assert 1 == registry.count(mode=MODE_ACCEPTOR)
+        assert 1 == registry.count(peer='10.0.0.1')
+
+        registry.remove(assoc_b)
+        registry.remove(assoc_c)
+        assert 0 == len(registry)
+        assert {} == registry._counts
+
+    def test_running_associations(self):
+        """Test associations are registered while running."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+        assert 0 == len(ae.registry)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        time.sleep(0.1)
+        assert 2 == len(ae.registry)
+        assert 1 == ae.registry.count(mode=MODE_REQUESTOR)
+        assert 1 == ae.registry.count(mode=MODE_ACCEPTOR)
+        assert 1 == ae.registry.count(server=scp)
+        assert 1 == ae.registry.count(peer='localhost')
+        assert 1 == ae.registry.count(peer='127.0.0.1')
+        assert [assoc] == ae.registry.associations(mode=MODE_REQUESTOR)
+        assert scp.active_associations == ae.registry.associations(
+            server=scp
+        )
+        assert 2 == len(ae.active_associations)
+
+        assoc.release()
+        time.sleep(0.1)
+        assert 0 == len(ae.registry)
+        assert [] == ae.active_associations
+        assert [] == scp.active_associations
+
+        scp.shutdown()
+
+
 class TestCStoreSCP(object):
     """Tests for Association._c_store_scp()."""
     # Used with C-GET (always) and C-MOVE (over the same association)
@@ -871,6 +967,8 @@ class TestAssociationSendCEcho(object):
         ae.dimse_timeout = 5
         assoc = ae.associate('localhost', 11112)
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, None
 
@@ -896,6 +994,8 @@ class TestAssociationSendCEcho(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -1291,6 +1391,8 @@ class TestAssociationSendCStore(object):
         assoc = ae.associate('localhost', 11112)
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, None
 
@@ -1324,6 +1426,8 @@ class TestAssociationSendCStore(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return DummyResponse(), None
 
@@ -1570,6 +1674,133 @@ class TestAssociationSendCStore(object):
 
         scp.shutdown()
 
+    def test_iter_must_be_associated(self):
+        """Test send_c_store_iter raises if not associated or bad params."""
+        def handle_store(event):
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        msg = r"'prefetch' and 'readers' must be greater than or equal to 1"
+        with pytest.raises(ValueError, match=msg):
+            assoc.send_c_store_iter([DATASET], prefetch=0)
+
+        with pytest.raises(ValueError, match=msg):
+            assoc.send_c_store_iter([DATASET], readers=0)
+
+        assoc.release()
+        assert assoc.is_released
+        with pytest.raises(RuntimeError):
+            assoc.send_c_store_iter([DATASET])
+
+        scp.shutdown()
+
+    def test_iter(self):
+        """Test send_c_store_iter sends the datasets in order."""
+        msg_ids = []
+
+        def handle_store(event):
+            msg_ids.append(event.request.MessageID)
+            if event.request.AffectedSOPInstanceUID == '1.2.3.4':
+                return 0xA700
+
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        ds = Dataset()
+        ds.SOPClassUID = CTImageStorage
+        ds.SOPInstanceUID = '1.2.3.4'
+        ds.file_meta = Dataset()
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+
+        fpath = os.path.join(TEST_DS_DIR, 'CTImageStorage.dcm')
+        items = [
+            fpath, DATASET, COMP_DATASET, 'missing.dcm', ds, DATASET
+        ]
+        results = list(
+            assoc.send_c_store_iter(items, prefetch=2, msg_id=65534)
+        )
+        assert [item for item, _ in results] == items
+        statuses = [status for _, status in results]
+        assert statuses[0].Status == 0x0000
+        assert statuses[1].Status == 0x0000
+        assert statuses[2] is None
+        assert statuses[3] is None
+        assert statuses[4].Status == 0xA700
+        assert statuses[5].Status == 0x0000
+        # Message IDs of the unsent datasets are skipped
+        assert msg_ids == [65534, 65535, 3, 4]
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+    def test_iter_prefetch(self):
+        """Test send_c_store_iter only prepares `prefetch` datasets ahead."""
+        taken = []
+
+        def datasets():
+            for ii in range(20):
+                taken.append(ii)
+                yield DATASET
+
+        def handle_store(event):
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        results = assoc.send_c_store_iter(datasets(), prefetch=3, readers=2)
+        item, status = next(results)
+        assert status.Status == 0x0000
+        time.sleep(0.5)
+        # The dataset sent, those waiting and the one the feeder has taken
+        assert len(taken) <= 5
+
+        # Closing the generator stops the threads
+        results.close()
+        time.sleep(0.5)
+        assert len(taken) <= 5
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
     # Regression tests
     def test_no_send_mismatch(self):
         """Test sending a dataset with mismatched transfer syntax (206)."""
@@ -1610,6 +1841,151 @@ class TestAssociationSendCStore(object):
         scp.shutdown()
 
 
+class TestFanOutCStore(object):
+    """Run tests on fan_out_c_store."""
+    def setup(self):
+        """Run prior to each test"""
+        self.ae = None
+
+    def teardown(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_fan_out(self, monkeypatch):
+        """Test the dataset is encoded once per transfer syntax encoding."""
+        received = []
+
+        def handle_store(event):
+            received.append(
+                (event.context.transfer_syntax, event.request.DataSet.getvalue())
+            )
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        explicit = ae.associate(
+            'localhost', 11112,
+            contexts=[build_context(CTImageStorage, ExplicitVRLittleEndian)]
+        )
+        implicit = [
+            ae.associate(
+                'localhost', 11112,
+                contexts=[build_context(CTImageStorage, ImplicitVRLittleEndian)]
+            ) for ii in range(2)
+        ]
+        assocs = [implicit[0], explicit, implicit[1]]
+        assert all([assoc.is_established for assoc in assocs])
+
+        calls = []
+
+        def encode_counter(*args):
+            calls.append(args[1:])
+            return encode(*args)
+
+        monkeypatch.setattr(
+            'pynetdicom.association.encode', encode_counter
+        )
+        statuses = fan_out_c_store(DATASET, assocs)
+
+        assert [status.Status for status in statuses] == [0x0000] * 3
+        assert sorted(calls) == [(False, True), (True, True)]
+
+        # The requests using the same encoding received the same dataset
+        assert len(received) == 3
+        datasets = {}
+        for syntax, bytestream in received:
+            datasets.setdefault(syntax, set()).add(bytestream)
+
+        assert len(datasets[ImplicitVRLittleEndian]) == 1
+        assert len(datasets[ExplicitVRLittleEndian]) == 1
+
+        for assoc in assocs:
+            assoc.release()
+
+        scp.shutdown()
+
+    def test_unable_to_send(self):
+        """Test the status is None if a request can't be sent."""
+        def handle_store(event):
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        store = ae.associate('localhost', 11112)
+        released = ae.associate('localhost', 11112)
+        released.release()
+        echo = ae.associate(
+            'localhost', 11112, contexts=[build_context(VerificationSOPClass)]
+        )
+        assert store.is_established
+        assert echo.is_established
+
+        statuses = fan_out_c_store(DATASET, [released, echo, store])
+        assert statuses[0] is None
+        assert statuses[1] is None
+        assert statuses[2].Status == 0x0000
+
+        store.release()
+        echo.release()
+
+        scp.shutdown()
+
+    def test_send_raises(self, monkeypatch, caplog):
+        """Test an exception raised while sending is raised again."""
+        received = []
+
+        def handle_store(event):
+            received.append(event)
+            return 0x0000
+
+        handlers = [(evt.EVT_C_STORE, handle_store)]
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        scp = ae.start_server(('', 11112), block=False, evt_handlers=handlers)
+
+        ae.add_requested_context(CTImageStorage)
+        assocs = [ae.associate('localhost', 11112) for ii in range(2)]
+        assert all([assoc.is_established for assoc in assocs])
+
+        def send_request(req, context_id):
+            raise ValueError('Unable to send')
+
+        monkeypatch.setattr(assocs[0], '_send_c_store_request', send_request)
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            with pytest.raises(ValueError, match='Unable to send'):
+                fan_out_c_store(DATASET, assocs)
+
+        assert 'Exception raised while sending a C-STORE' in caplog.text
+        # The other request is still sent
+        assert len(received) == 1
+
+        for assoc in assocs:
+            assoc.release()
+
+        scp.shutdown()
+
+
 class TestAssociationSendCFind(object):
     """Run tests on Assocation send_c_find."""
     def setup(self):
@@ -1918,6 +2294,8 @@ class TestAssociationSendCFind(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return DummyResponse(), None
 
@@ -2003,6 +2381,8 @@ class TestAssociationSendCFind(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -2036,6 +2416,8 @@ class TestAssociationSendCFind(object):
         assoc = ae.associate('localhost', 11112)
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -2793,6 +3175,8 @@ class TestAssociationSendCGet(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -2841,6 +3225,8 @@ class TestAssociationSendCGet(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -3544,6 +3930,8 @@ class TestAssociationSendCMove(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -3586,6 +3974,8 @@ class TestAssociationSendCMove(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -4089,6 +4479,123 @@ class TestGetValidContext(object):
                                      ImplicitVRLittleEndian,
                                      'scu')
 
+    @staticmethod
+    def _accepted(assoc, transfer_syntaxes, scu=True, scp=False):
+        """Set the accepted contexts to CT Image Storage contexts."""
+        contexts = {}
+        for ii, syntax in enumerate(transfer_syntaxes):
+            cx = build_context(CTImageStorage, syntax)
+            cx.context_id = 2 * ii + 1
+            cx.result = 0x00
+            cx._as_scu = scu
+            cx._as_scp = scp
+            contexts[cx.context_id] = cx
+
+        assoc._accepted_cx = contexts
+
+    def test_prefer_same_transfer_syntax(self):
+        """Test the context with a matching transfer syntax is preferred."""
+        assoc = Association(AE(), 'requestor')
+        self._accepted(
+            assoc,
+            [ImplicitVRLittleEndian, ExplicitVRBigEndian,
+             ExplicitVRLittleEndian, JPEGBaseline]
+        )
+        for syntax, context_id in [
+            (ImplicitVRLittleEndian, 1), (ExplicitVRBigEndian, 3),
+            (ExplicitVRLittleEndian, 5), (JPEGBaseline, 7), ('', 1)
+        ]:
+            cx = assoc._get_valid_context(CTImageStorage, syntax, 'scu')
+            assert cx.context_id == context_id
+
+    def test_prefer_cheapest_conversion(self):
+        """Test the context with the cheapest conversion is preferred."""
+        assoc = Association(AE(), 'requestor')
+        self._accepted(
+            assoc, [JPEGBaseline, ExplicitVRBigEndian, ImplicitVRLittleEndian]
+        )
+        # Changing the VR encoding is cheaper than changing the byte order
+        cx = assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu'
+        )
+        assert cx.context_id == 5
+
+        self._accepted(assoc, [ExplicitVRBigEndian, JPEGBaseline])
+        cx = assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scu'
+        )
+        assert cx.context_id == 1
+
+        msg = (
+            r"No suitable presentation context for the SCU role has been "
+            r"accepted by the peer for the SOP Class 'CT Image Storage' "
+            r"with a transfer syntax of 'JPEG 2000 Image Compression'"
+        )
+        with pytest.raises(ValueError, match=msg):
+            assoc._get_valid_context(CTImageStorage, JPEG2000, 'scu')
+
+    def test_private_transfer_syntax(self):
+        """Test private transfer syntaxes are only matched exactly."""
+        assoc = Association(AE(), 'requestor')
+        self._accepted(assoc, [ImplicitVRLittleEndian, '1.2.3.4'])
+        cx = assoc._get_valid_context(CTImageStorage, '1.2.3.4', 'scu')
+        assert cx.context_id == 3
+
+        self._accepted(assoc, ['1.2.3.4'])
+        msg = (
+            r"No suitable presentation context for the SCU role has been "
+            r"accepted by the peer for the SOP Class 'CT Image Storage' "
+            r"with a transfer syntax of 'Implicit VR Little Endian'"
+        )
+        with pytest.raises(ValueError, match=msg):
+            assoc._get_valid_context(
+                CTImageStorage, ImplicitVRLittleEndian, 'scu'
+            )
+
+    def test_index(self):
+        """Test the accepted contexts are indexed."""
+        assoc = Association(AE(), 'requestor')
+        self._accepted(
+            assoc, [ImplicitVRLittleEndian, ExplicitVRLittleEndian], scp=True
+        )
+        cx = assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scp'
+        )
+        assert cx.context_id == 3
+
+        index = assoc._cx_index
+        assert index[(CTImageStorage, 'scu')] == assoc.accepted_contexts
+        assert index[(CTImageStorage, 'scp')] == assoc.accepted_contexts
+        assert index[(CTImageStorage, ExplicitVRLittleEndian, 'scp')] is cx
+
+        # The index and the results are reused
+        assert assoc._get_valid_context(
+            CTImageStorage, ExplicitVRLittleEndian, 'scp'
+        ) is cx
+        assert assoc._cx_index is index
+
+    def test_index_updated(self):
+        """Test the index is rebuilt if the accepted contexts change."""
+        assoc = Association(AE(), 'requestor')
+        self._accepted(assoc, [ImplicitVRLittleEndian])
+        cx = assoc._get_valid_context(CTImageStorage, '', 'scu')
+        assert cx.context_id == 1
+
+        self._accepted(assoc, [JPEGBaseline])
+        cx = assoc._get_valid_context(CTImageStorage, '', 'scu')
+        assert cx.context_id == 1
+        assert cx.transfer_syntax[0] == JPEGBaseline
+
+        new = build_context(CTImageStorage, ImplicitVRLittleEndian)
+        new.context_id = 3
+        new.result = 0x00
+        new._as_scu = True
+        assoc._accepted_cx[3] = new
+        cx = assoc._get_valid_context(
+            CTImageStorage, ImplicitVRLittleEndian, 'scu'
+        )
+        assert cx is new
+
 
 class TestEventHandlingAcceptor(object):
     """Test the transport events and handling as acceptor."""
@@ -5584,6 +6091,9 @@ class TestEventHandlingRequestor(object):
         while scp.active_associations:
             time.sleep(0.05)
 
+        while assoc.is_alive():
+            time.sleep(0.05)
+
         assert len(triggered) == 1
         event = triggered[0]
         assert isinstance(event, Event)
@@ -190,6 +190,8 @@ class TestAssociationSendNEventReport(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -408,6 +410,8 @@ class TestAssociationSendNEventReport(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -603,6 +607,8 @@ class TestAssociationSendNGet(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -814,6 +820,8 @@ class TestAssociationSendNGet(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -1031,6 +1039,8 @@ class TestAssociationSendNSet(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -1240,6 +1250,8 @@ class TestAssociationSendNSet(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -1463,6 +1475,8 @@ class TestAssociationSendNAction(object):
         assert assoc.is_established
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
 
             def get_msg(*args, **kwargs): return None, None
@@ -1502,6 +1516,8 @@ class TestAssociationSendNAction(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -1677,6 +1693,8 @@ class TestAssociationSendNAction(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -1887,6 +1905,8 @@ class TestAssociationSendNCreate(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -2092,6 +2112,8 @@ class TestAssociationSendNCreate(object):
             STATUS_OPTIONAL_KEYWORDS = []
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs):
                 return
 
@@ -2300,6 +2322,8 @@ class TestAssociationSendNDelete(object):
             is_valid_response = False
 
         class DummyDIMSE():
+            is_receive_full = False
+
             def send_msg(*args, **kwargs): return
             def get_msg(*args, **kwargs): return None, DummyResponse()
 
@@ -15,7 +15,8 @@ from pynetdicom.pdu_primitives import (
     A_ASSOCIATE, MaximumLengthNotification, ImplementationClassUIDNotification,
     ImplementationVersionNameNotification, SCP_SCU_RoleSelectionNegotiation,
     UserIdentityNegotiation, SOPClassExtendedNegotiation,
-    SOPClassCommonExtendedNegotiation, AsynchronousOperationsWindowNegotiation
+    SOPClassCommonExtendedNegotiation, AsynchronousOperationsWindowNegotiation,
+    UserInformationList
 )
 from pynetdicom.sop_class import VerificationSOPClass
 
@@ -85,13 +86,13 @@ class TestServiceUserAcceptor(object):
     def test_no_implementation_class_uid(self):
         """Test correct return if no class UID."""
         user = ServiceUser(self.assoc, mode='acceptor')
-        user._user_info = []
+        user._user_info = UserInformationList()
         assert user.implementation_class_uid is None
 
     def test_no_maximum_len(self):
         """Test correct reutrn if no maximum length."""
         user = ServiceUser(self.assoc, mode='acceptor')
-        user._user_info = []
+        user._user_info = UserInformationList()
         assert user.maximum_length is None
 
     def test_accepted_common(self):
@@ -467,6 +468,27 @@ class TestServiceUserAcceptor(object):
         assert len(cxs) == 1
         assert cxs[0].abstract_syntax == '1.2.840.10008.1.1'
 
+    def test_shared_contexts(self):
+        """Test shared contexts are copied before being returned."""
+        contexts = [build_context('1.2.840.10008.1.1')]
+        user = ServiceUser(self.assoc, mode='acceptor')
+        user._share_contexts(contexts)
+        assert user._get_shared_contexts() is contexts
+
+        cxs = user.supported_contexts
+        assert cxs is not contexts
+        assert cxs == contexts
+        assert cxs[0] is not contexts[0]
+        cxs[0].scp_role = True
+        assert contexts[0].scp_role is None
+        # Only copied once
+        assert user.supported_contexts is cxs
+        assert user._get_shared_contexts() is cxs
+
+        user._share_contexts(contexts)
+        user.supported_contexts = contexts
+        assert user.supported_contexts is contexts
+
     def test_get_contexts_pre_raises(self):
         """Test get_contexts prior to association raises if bad type."""
         user = ServiceUser(self.assoc, mode='acceptor')
@@ -1172,6 +1194,32 @@ class TestServiceUserAcceptor(object):
         assert item in user.user_information
         assert len(user.user_information) == 9
 
+    def test_user_info_post_changed(self):
+        """Test the lookups are updated if the user information changes."""
+        user = ServiceUser(self.assoc, mode='acceptor')
+        user.primitive = self.primitive_ac
+        assert user.maximum_length == 16383
+        assert user.asynchronous_operations == (1, 1)
+
+        item = AsynchronousOperationsWindowNegotiation()
+        item.maximum_number_operations_invoked = 2
+        item.maximum_number_operations_performed = 3
+        user.primitive.user_information.append(item)
+        assert user.asynchronous_operations == (2, 3)
+
+        user.primitive.user_information.remove(item)
+        assert user.asynchronous_operations == (1, 1)
+
+        user.primitive.user_information.pop(0)
+        assert user.maximum_length is None
+        assert user.implementation_class_uid == '1.2.3'
+
+        item = MaximumLengthNotification()
+        item.maximum_length_received = 0
+        user.primitive.user_information = [item]
+        assert user.maximum_length == 0
+        assert user.implementation_class_uid is None
+
     def test_writeable(self):
         """Test writeable."""
         user = ServiceUser(self.assoc, mode='acceptor')
@@ -32,6 +32,17 @@ LOGGER = logging.getLogger('pynetdicom')
 LOGGER.setLevel(logging.CRITICAL)
 
 
+@pytest.mark.parametrize(
+    'cls', [C_ECHO, C_MOVE, C_STORE, C_GET, C_FIND, C_CANCEL]
+)
+def test_primitive_slots(cls):
+    """Test the DIMSE-C primitives don't have an instance dict."""
+    primitive = cls()
+    assert not hasattr(primitive, '__dict__')
+    with pytest.raises(AttributeError):
+        primitive.unknown_attribute = None
+
+
 class TestPrimitive_C_CANCEL(object):
     """Test DIMSE C-CANCEL operations."""
     def test_assignment(self):
@@ -40,6 +40,17 @@ LOGGER = logging.getLogger('pynetdicom')
 LOGGER.setLevel(logging.CRITICAL)
 
 
+@pytest.mark.parametrize(
+    'cls', [N_EVENT_REPORT, N_GET, N_SET, N_ACTION, N_CREATE, N_DELETE]
+)
+def test_primitive_slots(cls):
+    """Test the DIMSE-N primitives don't have an instance dict."""
+    primitive = cls()
+    assert not hasattr(primitive, '__dict__')
+    with pytest.raises(AttributeError):
+        primitive.unknown_attribute = None
+
+
 class TestPrimitive_N_EVENT(object):
     """Test DIMSE N-EVENT-REPORT operations."""
     def setup(self):
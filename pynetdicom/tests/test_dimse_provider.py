@@ -19,7 +19,9 @@ from pydicom.dataset import Dataset
 
 from pynetdicom import evt, AE, Association, _config
 from pynetdicom.association import ServiceUser
-from pynetdicom.dimse import DIMSEServiceProvider
+from pynetdicom.dimse import (
+    DIMSEServiceProvider, MemoryBudget, MessageQueue, _BudgetAccount
+)
 from pynetdicom.dimse_messages import (
     C_STORE_RQ, C_STORE_RSP, C_FIND_RQ, C_FIND_RSP, C_GET_RQ, C_GET_RSP,
     C_MOVE_RQ, C_MOVE_RSP, C_ECHO_RQ,C_ECHO_RSP, C_CANCEL_RQ,
@@ -64,6 +66,9 @@ class DummyAssociation(object):
         self.acse_timeout = 11
         self.dimse_timeout = 1
         self.network_timeout = 13
+        self.receive_buffer_messages = None
+        self.receive_buffer_size = None
+        self._budget = _BudgetAccount(self.ae.memory_budget)
         self.is_killed = False
         self.is_aborted = False
         self.is_established = False
@@ -117,6 +122,10 @@ class DummyDUL(object):
     def peek_next_pdu():
         return 0x01
 
+    @staticmethod
+    def wake():
+        pass
+
 
 REFERENCE_MSG = [
     (C_ECHO(), ('C_ECHO_RQ', 'C_ECHO_RSP')),
@@ -156,6 +165,156 @@ class TestDIMSEProvider(object):
         dimse.msg_queue.put((14, primitive))
         assert dimse.peek_msg() == (14, primitive)
 
+    def test_message_queue(self):
+        """Test the message queue tracks the size of the datasets."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        assert isinstance(dimse.msg_queue, MessageQueue)
+        primitive = C_STORE()
+        primitive.DataSet = BytesIO(b'\x00' * 100)
+        primitive.DataSet.seek(10)
+        dimse.msg_queue.put((1, primitive))
+        dimse.msg_queue.put((1, C_ECHO()))
+        assert dimse.msg_queue.nr_bytes == 100
+        assert primitive.DataSet.tell() == 10
+
+        primitive.DataSet = BytesIO(b'\x00' * 50)
+        assert dimse.get_msg() == (1, primitive)
+        assert dimse.msg_queue.nr_bytes == 0
+        dimse.get_msg()
+        assert dimse.msg_queue.nr_bytes == 0
+
+    def test_is_receive_full(self):
+        """Test the receive buffer limits."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        primitive = C_STORE()
+        primitive.DataSet = BytesIO(b'\x00' * 100)
+        dimse.msg_queue.put((1, primitive))
+        dimse.msg_queue.put((1, C_ECHO()))
+        assert not dimse.is_receive_full
+
+        dimse.assoc.receive_buffer_messages = 3
+        assert not dimse.is_receive_full
+        dimse.assoc.receive_buffer_messages = 2
+        assert dimse.is_receive_full
+
+        dimse.assoc.receive_buffer_messages = None
+        dimse.assoc.receive_buffer_size = 101
+        assert not dimse.is_receive_full
+        dimse.assoc.receive_buffer_size = 100
+        assert dimse.is_receive_full
+
+        dimse.get_msg()
+        assert not dimse.is_receive_full
+
+    def test_receive_budget(self):
+        """Test the partially received data set is in the memory budget."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        budget = dimse.assoc.ae.memory_budget
+        budget.maxbytes = 10
+
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = '1.1.1'
+        primitive.AffectedSOPInstanceUID = '1.2.1'
+        primitive.Priority = 0x02
+        primitive.DataSet = BytesIO(b'\x00' * 40)
+        message = C_STORE_RQ()
+        message.primitive_to_message(primitive)
+        pdata = list(message.encode_msg(1, 16))
+
+        def nr_data(primitives):
+            """Return the size of the data set fragments in `primitives`"""
+            total = 0
+            for item in primitives:
+                for _, data in item.presentation_data_value_list:
+                    if not ord(data[:1]) & 1:
+                        total += len(data) - 1
+            return total
+
+        # Another association sharing the AE's budget
+        other = DIMSEServiceProvider(DummyAssociation())
+        woken = []
+        other.assoc.ae = dimse.assoc.ae
+        other.assoc._budget = _BudgetAccount(
+            budget, lambda: woken.append(True)
+        )
+
+        assert not dimse.is_receive_full
+        for item in pdata[:-1]:
+            dimse.receive_primitive(item)
+
+        assert budget.is_exhausted
+        assert budget.nr_bytes == nr_data(pdata[:-1])
+        # The oldest partial message still gets completed
+        assert not dimse.is_receive_full
+        # But other associations wait for it
+        assert other.is_receive_full
+        assert woken == []
+
+        dimse.receive_primitive(pdata[-1])
+        assert nr_data(pdata) == 40
+        assert woken == [True]
+        assert not other.is_receive_full
+        assert budget.high_water == 40
+        assert dimse.msg_queue.qsize() == 1
+
+        # The data set is held until the message has been processed
+        assert budget.nr_bytes == 40
+        assert dimse.get_msg()[1] is not None
+        assert budget.nr_bytes == 40
+        assert dimse.get_msg() == (None, None)
+        assert budget.nr_bytes == 0
+        assert not budget.is_exhausted
+
+        budget.maxbytes = None
+        assert not dimse.is_receive_full
+
+    def test_memory_budget(self):
+        """Test MemoryBudget and its association accounts."""
+        budget = MemoryBudget()
+        assert not budget.is_exhausted
+        budget.acquire(100)
+        assert not budget.is_exhausted
+        budget.maxbytes = 100
+        assert budget.is_exhausted
+        budget.release(60)
+        assert budget.nr_bytes == 40
+        assert budget.high_water == 100
+        budget.reset_high_water()
+        assert budget.high_water == 40
+
+        account = _BudgetAccount(budget)
+        account.acquire(30)
+        assert budget.nr_bytes == 70
+        account.release(10)
+        assert budget.nr_bytes == 60
+        account.close()
+        assert budget.nr_bytes == 40
+        account.acquire(30)
+        account.release(10)
+        account.close()
+        assert budget.nr_bytes == 40
+
+        # Waiting accounts are woken once the budget allows
+        woken = []
+        receiver = _BudgetAccount(budget)
+        account = _BudgetAccount(budget, lambda: woken.append(True))
+        receiver.start_message()
+        receiver.acquire(60)
+        assert not receiver.must_wait
+        assert account.must_wait
+        receiver.release(60)
+        assert woken == [True]
+        assert not account.must_wait
+
+        receiver.acquire(60)
+        assert account.must_wait
+        receiver.close()
+        assert woken == [True, True]
+        assert budget.nr_bytes == 40
+        assert not budget._receiving
+        assert not budget._waiting
+
     def test_invalid_message(self):
         class DummyDUL(object):
             def __init__(self):
@@ -2,6 +2,10 @@
 """DUL service testing"""
 
 import logging
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2 compatibility
 import socket
 import threading
 import time
@@ -9,7 +13,11 @@ import time
 import pytest
 
 from pynetdicom import AE
-from pynetdicom.dul import DULServiceProvider
+from pynetdicom._globals import MODE_REQUESTOR
+from pynetdicom.association import Association
+from pynetdicom.dimse import MemoryBudget
+from pynetdicom.dimse_primitives import C_ECHO
+from pynetdicom.dul import DULServiceProvider, ByteLimitedQueue
 from pynetdicom.pdu import A_ASSOCIATE_RQ, A_ASSOCIATE_AC, A_ASSOCIATE_RJ, \
                             A_RELEASE_RQ, A_RELEASE_RP, P_DATA_TF, A_ABORT_RQ
 from pynetdicom.pdu_primitives import A_ASSOCIATE, A_RELEASE, A_ABORT, P_DATA
@@ -171,3 +179,299 @@ class TestDUL(object):
         assert assoc.is_aborted
 
         scp.shutdown()
+
+    def test_wait_for_change(self):
+        """Test waiting for the DUL's generation to change."""
+        dul = DULServiceProvider(DummyAssociation())
+        generation = dul.generation
+
+        # Times out if no change
+        start = time.time()
+        assert dul.wait_for_change(generation, 0.05) == generation
+        assert time.time() - start >= 0.04
+
+        # Returns immediately if already changed
+        dul.notify_waiters()
+        assert dul.generation == generation + 1
+        assert dul.wait_for_change(generation, 5) == generation + 1
+
+        # Woken by another thread
+        generation = dul.generation
+        timer = threading.Timer(0.05, dul.notify_waiters)
+        timer.start()
+        start = time.time()
+        assert dul.wait_for_change(generation, 5) == generation + 1
+        assert time.time() - start < 1
+        timer.join()
+
+    def test_idle_timer_notifies(self):
+        """Test the idle timer expiring changes the generation."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._idle_timer.timeout = 0.05
+        generation = dul.generation
+        dul._restart_idle_timer()
+        assert dul.wait_for_change(generation, 5) == generation + 1
+        assert dul.idle_timer_expired()
+
+    def test_wait_for_change_stopped(self):
+        """Test waiting returns once the DUL thread has exited."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        dul.start()
+        assoc._dul_ready.wait()
+
+        generation = dul.generation
+        dul.kill_dul()
+        dul.wait_for_change(generation, 5)
+        assert not dul.is_alive()
+
+        # Doesn't block once stopped
+        start = time.time()
+        dul.wait_for_change(dul.generation, 5)
+        assert time.time() - start < 1
+
+    def test_artim_expiry(self):
+        """Test Evt18 is only issued if the ARTIM timer is still expired."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul.artim_timer.timeout = 0.05
+        dul.artim_timer.start()
+        time.sleep(0.2)
+        assert dul._artim_expired
+        dul._check_artim_timer()
+        assert dul.event_queue.get(block=False) == 'Evt18'
+        assert not dul._artim_expired
+
+        # Stopped by the state machine after the timer expired
+        dul.artim_timer.start()
+        time.sleep(0.2)
+        dul.artim_timer.stop()
+        assert dul._artim_expired
+        dul._check_artim_timer()
+        assert dul.event_queue.empty()
+
+        # Restarted after the timer expired
+        dul.artim_timer.start()
+        time.sleep(0.2)
+        dul.artim_timer.timeout = 5
+        dul.artim_timer.restart()
+        dul._check_artim_timer()
+        assert dul.event_queue.empty()
+        dul.artim_timer.stop()
+
+    def test_receive_full_stops_reading(self):
+        """Test the socket isn't read while the received messages are full."""
+        class DummySocket(object):
+            ready = True
+            nr_reads = 0
+
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        dul.socket = DummySocket()
+        dul._read_pdu_data = lambda: setattr(
+            dul.socket, 'nr_reads', dul.socket.nr_reads + 1
+        )
+        dul.state_machine.current_state = 'Sta6'
+        assoc.receive_buffer_messages = 1
+        assoc.dimse.msg_queue.put((1, C_ECHO()))
+
+        assert dul._is_transport_event() is False
+        assert dul._is_reading_paused
+        assert dul.socket.nr_reads == 0
+
+        # Still read when releasing so the peer's reply is received
+        assoc._is_releasing = True
+        assert dul._is_transport_event() is True
+        assert dul.socket.nr_reads == 1
+        assoc._is_releasing = False
+
+        # Reading resumes and the idle timer restarts once processed
+        assoc.dimse.get_msg()
+        assert dul._is_transport_event() is True
+        assert not dul._is_reading_paused
+        assert dul.socket.nr_reads == 2
+        dul._idle_timer.stop()
+
+    def test_idle_dul_waits(self):
+        """Test an idle DUL waits instead of looping."""
+        ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.add_supported_context('1.2.840.10008.1.1')
+        ae.add_requested_context('1.2.840.10008.1.1')
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        dul = assoc.dul
+        assert dul._waker.is_available
+
+        nr_loops = []
+        original = dul._check_artim_timer
+
+        def count_loops():
+            nr_loops.append(None)
+            original()
+
+        dul._check_artim_timer = count_loops
+        time.sleep(0.5)
+        assert len(nr_loops) < 5
+
+        # Woken to send and receive
+        status = assoc.send_c_echo()
+        assert status.Status == 0x0000
+        assert len(nr_loops) > 0
+
+        assoc.release()
+        assert assoc.is_released
+        dul.join(5)
+        assert not dul._waker.is_available
+
+        scp.shutdown()
+
+    def test_waker(self):
+        """Test the waker is set before and after it's opened."""
+        dul = DULServiceProvider(DummyAssociation())
+        waker = dul._waker
+        assert not waker.is_available
+        waker.set()
+        assert waker._is_set
+
+        waker.open()
+        assert waker.is_available
+        # The wake before opening isn't lost
+        dul._wait()
+        waker.clear()
+        assert not waker._is_set
+
+        # Events wake the DUL
+        dul.event_queue.put('Evt1')
+        assert waker._is_set
+        dul._wait()
+
+        waker.close()
+        assert not waker.is_available
+        waker.set()
+
+
+def _p_data(length):
+    """Return a P-DATA primitive with a PDV of `length` bytes."""
+    primitive = P_DATA()
+    primitive.presentation_data_value_list = [[1, b'\x00' * length]]
+    return primitive
+
+
+class TestByteLimitedQueue(object):
+    """Tests for ByteLimitedQueue."""
+    def test_unlimited(self):
+        """Test the queue with no limit."""
+        fifo = ByteLimitedQueue()
+        for ii in range(10):
+            fifo.put(_p_data(1000), block=False)
+
+        assert fifo.nr_bytes == 10000
+        assert fifo.qsize() == 10
+
+    def test_accounting(self):
+        """Test the size of the queued P-DATA is tracked."""
+        fifo = ByteLimitedQueue(1000)
+        fifo.put(_p_data(400))
+        fifo.put(A_ABORT())
+        fifo.put(_p_data(600))
+        assert fifo.nr_bytes == 1000
+        assert isinstance(fifo.get(), P_DATA)
+        assert fifo.nr_bytes == 600
+        assert isinstance(fifo.get(), A_ABORT)
+        assert isinstance(fifo.get(), P_DATA)
+        assert fifo.nr_bytes == 0
+
+    def test_full(self):
+        """Test putting P-DATA into a full queue."""
+        fifo = ByteLimitedQueue(1000)
+        fifo.put(_p_data(800))
+        with pytest.raises(queue.Full):
+            fifo.put(_p_data(201), block=False)
+
+        start = time.time()
+        with pytest.raises(queue.Full):
+            fifo.put(_p_data(201), timeout=0.1)
+        assert time.time() - start >= 0.09
+
+        # Other primitives are never blocked
+        fifo.put(A_ABORT(), block=False)
+        assert fifo.qsize() == 2
+
+    def test_oversized(self):
+        """Test a P-DATA larger than the limit is allowed if no other."""
+        fifo = ByteLimitedQueue(1000)
+        fifo.put(_p_data(5000), block=False)
+        assert fifo.nr_bytes == 5000
+        with pytest.raises(queue.Full):
+            fifo.put(_p_data(1), block=False)
+
+    def test_blocks_until_drained(self):
+        """Test a blocked put continues once the queue is drained."""
+        fifo = ByteLimitedQueue(1000)
+        fifo.put(_p_data(1000))
+        timer = threading.Timer(0.1, fifo.get)
+        timer.start()
+        start = time.time()
+        fifo.put(_p_data(1000), timeout=5)
+        assert time.time() - start >= 0.09
+        assert fifo.nr_bytes == 1000
+        timer.join()
+
+    def test_budget(self):
+        """Test the queued P-DATA is acquired from the memory budget."""
+        budget = MemoryBudget(1500)
+        fifo = ByteLimitedQueue(budget=budget)
+        fifo.put(_p_data(1000))
+        fifo.put(A_ABORT())
+        assert budget.nr_bytes == 1000
+
+        # Blocks while exhausted and there's P-DATA queued
+        fifo.put(_p_data(1000))
+        assert budget.is_exhausted
+        with pytest.raises(queue.Full):
+            fifo.put(_p_data(10), block=False)
+
+        fifo.get()
+        fifo.get()
+        assert budget.nr_bytes == 1000
+        fifo.get()
+        assert budget.nr_bytes == 0
+        assert budget.high_water == 2000
+
+        # Never blocks when there's nothing queued to release the budget
+        budget.acquire(2000)
+        fifo.put(_p_data(10), block=False)
+        assert budget.nr_bytes == 2010
+
+    def test_close(self):
+        """Test closing the queue stops put from blocking."""
+        fifo = ByteLimitedQueue(1000)
+        fifo.put(_p_data(1000))
+        timer = threading.Timer(0.1, fifo.close)
+        timer.start()
+        fifo.put(_p_data(1000), timeout=5)
+        assert fifo.qsize() == 2
+        timer.join()
+
+        fifo.put(_p_data(1000), block=False)
+        assert fifo.qsize() == 3
+
+    def test_dul(self):
+        """Test the DUL's provider queue is closed when it stops."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        assert isinstance(dul.to_provider_queue, ByteLimitedQueue)
+        assoc.send_buffer_size = 1000
+        assert dul.to_provider_queue.maxbytes == 1000
+        dul.start()
+        assoc._dul_ready.wait()
+        dul.kill_dul()
+        dul.join()
+
+        # Nothing is consuming the queue so putting doesn't block
+        dul.send_pdu(_p_data(1000))
+        dul.send_pdu(_p_data(1000))
+        assert dul.to_provider_queue.qsize() == 2
@@ -6,6 +6,7 @@ from io import BytesIO
 import logging
 import os
 import sys
+import threading
 import time
 
 import pytest
@@ -18,7 +19,7 @@ from pynetdicom import (
     AE, evt, _config, Association, debug_logger, build_context
 )
 from pynetdicom.events import (
-    Event, trigger, _async_ops_handler, _sop_common_handler,
+    Event, EventDispatcher, trigger, _async_ops_handler, _sop_common_handler,
     _sop_extended_handler, _user_identity_handler, _c_echo_handler,
     _c_get_handler, _c_find_handler, _c_move_handler, _c_store_handler,
     _n_action_handler, _n_create_handler, _n_delete_handler,
@@ -354,6 +355,162 @@ class TestEvent(object):
         assert tags[1] == 0x00100020
 
 
+class TestEventDispatcher(object):
+    """Tests for events.EventDispatcher."""
+    def setup(self):
+        self.ae = AE()
+        self.assoc = Association(self.ae, 'requestor')
+        self.dispatcher = None
+
+    def teardown(self):
+        if self.dispatcher:
+            self.dispatcher.stop()
+
+    def test_init_raises(self):
+        """Test exceptions raised by invalid parameters."""
+        msg = r"Invalid 'policy' value, must be 'block', 'drop' or 'sample'"
+        with pytest.raises(ValueError, match=msg):
+            EventDispatcher(policy='nope')
+
+        msg = r"'maxsize' must be an int greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            EventDispatcher(maxsize=0)
+
+        msg = r"Only notification events can be dispatched off-thread"
+        with pytest.raises(ValueError, match=msg):
+            EventDispatcher(events=[evt.EVT_DATA_RECV, evt.EVT_C_STORE])
+
+    def test_is_dispatched(self):
+        """Test EventDispatcher.is_dispatched()."""
+        self.dispatcher = EventDispatcher()
+        assert self.dispatcher.is_dispatched(evt.EVT_DATA_RECV)
+        assert not self.dispatcher.is_dispatched(evt.EVT_C_STORE)
+        self.dispatcher.stop()
+
+        self.dispatcher = EventDispatcher(events=[evt.EVT_PDU_RECV])
+        assert self.dispatcher.is_dispatched(evt.EVT_PDU_RECV)
+        assert not self.dispatcher.is_dispatched(evt.EVT_DATA_RECV)
+
+    def test_trigger_off_thread(self):
+        """Test trigger() delivers notification events off-thread."""
+        threads = []
+        def handle(event):
+            threads.append(threading.current_thread())
+
+        self.dispatcher = EventDispatcher()
+        self.ae.event_dispatcher = self.dispatcher
+        self.assoc.bind(evt.EVT_DATA_RECV, handle)
+        trigger(self.assoc, evt.EVT_DATA_RECV, {'data' : b'\x00'})
+        self.dispatcher.join()
+
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+        assert 'EventDispatcher' in threads[0].name
+        assert self.dispatcher.delivered == 1
+
+    def test_trigger_not_dispatched(self):
+        """Test events not in `events` are delivered synchronously."""
+        threads = []
+        def handle(event):
+            threads.append(threading.current_thread())
+
+        self.dispatcher = EventDispatcher(events=[evt.EVT_PDU_RECV])
+        self.ae.event_dispatcher = self.dispatcher
+        self.assoc.bind(evt.EVT_DATA_RECV, handle)
+        trigger(self.assoc, evt.EVT_DATA_RECV, {'data' : b'\x00'})
+
+        assert threads == [threading.current_thread()]
+        assert self.dispatcher.delivered == 0
+
+    def test_handler_exception(self, caplog):
+        """Test exceptions in dispatched handlers are logged."""
+        def handle(event):
+            raise ValueError("Exception raised")
+
+        self.dispatcher = EventDispatcher()
+        self.ae.event_dispatcher = self.dispatcher
+        self.assoc.bind(evt.EVT_DATA_RECV, handle)
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            trigger(self.assoc, evt.EVT_DATA_RECV, {'data' : b'\x00'})
+            self.dispatcher.join()
+
+        assert (
+            "Exception raised in user's 'evt.EVT_DATA_RECV' event handler "
+            "'handle'"
+        ) in caplog.text
+
+    def _blocked_dispatcher(self, policy):
+        """Return a dispatcher with a full queue and its blocking Event."""
+        block = threading.Event()
+        def handle(event):
+            block.wait()
+
+        self.dispatcher = EventDispatcher(
+            maxsize=2, policy=policy, sample_interval=2
+        )
+        # The first event is taken by the worker and blocks it
+        self.dispatcher.dispatch([handle], Event(None, evt.EVT_PDU_RECV))
+        while self.dispatcher.pending:
+            time.sleep(0.01)
+
+        for ii in range(2):
+            self.dispatcher.dispatch([handle], Event(None, evt.EVT_PDU_RECV))
+
+        return handle, block
+
+    def test_policy_drop(self):
+        """Test the 'drop' overflow policy."""
+        handle, block = self._blocked_dispatcher('drop')
+        assert not self.dispatcher.dispatch(
+            [handle], Event(None, evt.EVT_DATA_RECV)
+        )
+        assert not self.dispatcher.dispatch(
+            [handle], Event(None, evt.EVT_DATA_RECV)
+        )
+        assert self.dispatcher.dropped == 2
+        assert self.dispatcher.dropped_events == {'EVT_DATA_RECV' : 2}
+
+        block.set()
+        self.dispatcher.join()
+        assert self.dispatcher.delivered == 3
+
+    def test_policy_sample(self):
+        """Test the 'sample' overflow policy."""
+        handle, block = self._blocked_dispatcher('sample')
+        assert not self.dispatcher.dispatch(
+            [handle], Event(None, evt.EVT_DATA_RECV)
+        )
+        # Every second overflowing event replaces the oldest queued event
+        assert self.dispatcher.dispatch(
+            [handle], Event(None, evt.EVT_DATA_RECV)
+        )
+        assert self.dispatcher.dropped == 2
+        assert self.dispatcher.dropped_events == {
+            'EVT_DATA_RECV' : 1, 'EVT_PDU_RECV' : 1
+        }
+
+        block.set()
+        self.dispatcher.join()
+        assert self.dispatcher.delivered == 3
+
+    def test_policy_block(self):
+        """Test the 'block' overflow policy."""
+        handle, block = self._blocked_dispatcher('block')
+        def release():
+            time.sleep(0.1)
+            block.set()
+
+        thread = threading.Thread(target=release)
+        thread.start()
+        assert self.dispatcher.dispatch(
+            [handle], Event(None, evt.EVT_DATA_RECV)
+        )
+        thread.join()
+        self.dispatcher.join()
+        assert self.dispatcher.dropped == 0
+        assert self.dispatcher.delivered == 4
+
+
 # TODO: Should be able to remove in v1.4
 INTERVENTION_HANDLERS = [
     _async_ops_handler, _sop_common_handler,
@@ -185,6 +185,56 @@ class TestStateMachine(object):
             assert fsm.dul.is_killed is True
             assert fsm.current_state == state
 
+    def test_dispatch_table(self):
+        """Test the compiled dispatch table matches TRANSITION_TABLE."""
+        for event in EVENTS:
+            for state in STATES:
+                action = FINITE_STATE._DISPATCH[
+                    FINITE_STATE._EVENT_INDEX[event]
+                ][FINITE_STATE._STATE_INDEX[state]]
+                assert action == TRANSITION_TABLE.get((event, state))
+
+    def test_unknown_event_raises(self):
+        """Test StateMachine.do_action raises if the event is unknown."""
+        ae = AE()
+        assoc = Association(ae, mode='requestor')
+        fsm = assoc.dul.state_machine
+
+        msg = r"Invalid event 'Evt20' for the current state 'Sta1'"
+        with pytest.raises(InvalidEventError, match=msg):
+            fsm.do_action('Evt20')
+
+    def test_transition_event_unbound(self, monkeypatch):
+        """Test EVT_FSM_TRANSITION is only triggered if bound."""
+        triggered = []
+        original = evt.trigger
+        def trigger(assoc, event, attrs=None):
+            triggered.append(event)
+            return original(assoc, event, attrs)
+
+        monkeypatch.setattr(evt, 'trigger', trigger)
+
+        ae = AE()
+        assoc = Association(ae, mode='requestor')
+        fsm = assoc.dul.state_machine
+        fsm.current_state = 'Sta6'
+        assoc.dimse.receive_primitive = lambda primitive: None
+        fsm.do_action('Evt10')
+        assert evt.EVT_FSM_TRANSITION not in triggered
+        assert fsm.current_state == 'Sta6'
+
+        transitions = []
+        def handle(event):
+            transitions.append(event)
+
+        assoc.bind(evt.EVT_FSM_TRANSITION, handle)
+        fsm.do_action('Evt10')
+        assert evt.EVT_FSM_TRANSITION in triggered
+        assert transitions[0].current_state == 'Sta6'
+        assert transitions[0].fsm_event == 'Evt10'
+        assert transitions[0].action == 'DT-2'
+        assert transitions[0].next_state == 'Sta6'
+
 
 class TestStateBase(object):
     """Base class for State tests."""
@@ -219,6 +269,11 @@ class TestStateBase(object):
         cx.context_id = 1
         assoc.requestor.requested_contexts = [cx]
 
+        # The peer may end the association before `is_established` can be
+        #   polled, so record that it was established
+        self._established = threading.Event()
+        assoc.bind(evt.EVT_ESTABLISHED, lambda event: self._established.set())
+
         self.assoc = assoc
         self.fsm = self.monkey_patch(assoc.dul.state_machine)
 
@@ -227,6 +282,10 @@ class TestStateBase(object):
             if isinstance(thread, ThreadedParrot):
                 thread.shutdown()
 
+    def wait_for_established(self):
+        """Wait until the association has been established."""
+        assert self._established.wait(5)
+
     def get_associate(self, assoc_type):
         primitive = A_ASSOCIATE()
         if assoc_type == 'request':
@@ -3095,8 +3154,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('request'))
         time.sleep(0.1)
@@ -3135,8 +3193,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3172,8 +3229,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3216,8 +3272,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3250,8 +3305,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('accept'))
         time.sleep(0.1)
@@ -3280,8 +3334,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('reject'))
         time.sleep(0.1)
@@ -3311,8 +3364,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_pdata())
         time.sleep(0.1)
@@ -3344,8 +3396,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3373,8 +3424,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -3405,8 +3455,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3437,8 +3486,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3471,8 +3519,7 @@ class TestState06(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(True))
         time.sleep(0.1)
@@ -3503,8 +3550,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         self.assoc.abort()
@@ -3540,8 +3586,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3570,8 +3615,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3600,8 +3644,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         self.assoc.dul.artim_timer.timeout = 0.05
@@ -3634,8 +3677,7 @@ class TestState06(TestStateBase):
 
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -3672,8 +3714,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_associate('request'))
@@ -3713,8 +3754,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -3753,8 +3793,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -3800,8 +3839,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -3838,8 +3876,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_associate('accept'))
@@ -3871,8 +3908,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_associate('reject'))
@@ -3904,8 +3940,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_pdata())
@@ -3938,8 +3973,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -3973,8 +4007,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_release(False))
@@ -4007,8 +4040,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4041,8 +4073,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4076,8 +4107,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_release(True))
@@ -4110,8 +4140,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.send_pdu(self.get_abort())
@@ -4144,8 +4173,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4177,8 +4205,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4210,8 +4237,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         self.assoc.dul.artim_timer.timeout = 0.05
@@ -4246,8 +4272,7 @@ class TestState07(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4293,8 +4318,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('request'))
         time.sleep(0.1)
@@ -4340,8 +4364,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4379,8 +4402,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4425,8 +4447,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4461,8 +4482,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('accept'))
         time.sleep(0.1)
@@ -4498,8 +4518,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_associate('reject'))
         time.sleep(0.1)
@@ -4536,8 +4555,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_pdata())
         time.sleep(0.1)
@@ -4576,8 +4594,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4612,8 +4629,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -4652,8 +4668,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4691,8 +4706,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4728,8 +4742,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(True))
         time.sleep(0.1)
@@ -4766,8 +4779,7 @@ class TestState08(TestStateBase):
 
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_abort())
         time.sleep(0.1)
@@ -4806,8 +4818,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4843,8 +4854,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4880,8 +4890,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.artim_timer.timeout = 0.05
         self.assoc.dul.artim_timer.start()
@@ -4920,8 +4929,7 @@ class TestState08(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
         self.assoc.start()
 
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
 
         #self.print_fsm_scp(self.fsm, scp)
@@ -4961,8 +4969,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5016,8 +5023,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5066,8 +5072,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5123,8 +5128,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5171,8 +5175,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5217,8 +5220,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5263,8 +5265,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5311,8 +5312,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5359,8 +5359,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5407,8 +5406,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5457,8 +5455,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5506,8 +5503,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5556,8 +5552,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5607,8 +5602,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5652,8 +5646,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5697,8 +5690,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -5746,8 +5738,7 @@ class TestState09(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6641,8 +6632,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6701,8 +6691,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6753,8 +6742,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6812,8 +6800,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6861,8 +6848,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6911,8 +6897,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -6961,8 +6946,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7014,8 +6998,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7063,8 +7046,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7116,8 +7098,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7167,8 +7148,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7216,8 +7196,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7268,8 +7247,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.2)
@@ -7320,8 +7298,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7369,8 +7346,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7418,8 +7394,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -7472,8 +7447,7 @@ class TestState11(TestStateBase):
         self.assoc.acse.is_release_requested = is_release_requested
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
         time.sleep(0.2)
         self.assoc.dul.send_pdu(self.get_release(False))
         time.sleep(0.1)
@@ -8459,8 +8433,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8497,8 +8470,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8542,8 +8514,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8712,8 +8683,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8794,8 +8764,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8832,8 +8801,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8958,8 +8926,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -8994,8 +8961,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -9083,8 +9049,7 @@ class TestState13(TestStateBase):
         scp = self.start_server(commands)
 
         self.assoc.start()
-        while not self.assoc.is_established:
-            time.sleep(0.05)
+        self.wait_for_established()
 
         time.sleep(0.2)
 
@@ -9147,7 +9112,10 @@ class TestParrotAttack(TestStateBase):
             ('Sta6', 'Evt10', 'DT-2'),
             ('Sta6', 'Evt10', 'DT-2'),
             ('Sta6', 'Evt12', 'AR-2'),
-            ('Sta8', 'Evt17', 'AA-4'),
+            # The reactor responds to the release request before the peer
+            #   closes the connection
+            ('Sta8', 'Evt14', 'AR-4'),
+            ('Sta13', 'Evt17', 'AR-5'),
         ]
 
     def test_acceptor(self):
@@ -0,0 +1,222 @@
+"""Unit tests for the metrics module."""
+
+try:
+    from urllib.request import urlopen
+except ImportError:
+    from urllib2 import urlopen  # Python 2 compatibility
+
+import pytest
+
+from pynetdicom import AE, evt, debug_logger
+from pynetdicom.metrics import (
+    Counter, Gauge, Histogram, MetricsRegistry
+)
+from pynetdicom.sop_class import VerificationSOPClass
+
+
+#debug_logger()
+
+
+class TestMetrics(object):
+    """Tests for the metric types."""
+    def test_counter(self):
+        """Test Counter."""
+        metric = Counter('a_total', 'Some description', ('type', ))
+        assert metric.value('A') == 0
+        metric.inc(1, 'A')
+        metric.inc(3, 'A')
+        metric.inc(1, 'B')
+        assert metric.value('A') == 4
+        assert metric.render() == [
+            '# HELP a_total Some description',
+            '# TYPE a_total counter',
+            'a_total{type="A"} 4',
+            'a_total{type="B"} 1',
+        ]
+
+        metric.clear()
+        assert metric.value('A') == 0
+
+    def test_counter_no_labels(self):
+        """Test Counter without any labels."""
+        metric = Counter('a_total', 'Some description')
+        metric.inc(10)
+        assert metric.value() == 10
+        assert metric.render()[-1] == 'a_total 10'
+
+    def test_label_escaping(self):
+        """Test label values are escaped."""
+        metric = Counter('a_total', 'Some description', ('type', ))
+        metric.inc(1, 'A"\\\n')
+        assert metric.render()[-1] == r'a_total{type="A\"\\\n"} 1'
+
+    def test_gauge(self):
+        """Test Gauge."""
+        metric = Gauge('a', 'Some description', ('type', ))
+        metric.set(3, 'A')
+        metric.set(1, 'A')
+        assert metric.value('A') == 1
+        assert metric.render() == [
+            '# HELP a Some description',
+            '# TYPE a gauge',
+            'a{type="A"} 1',
+        ]
+
+    def test_gauge_set_all(self):
+        """Test Gauge.set_all() replaces the samples."""
+        metric = Gauge('a', 'Some description', ('type', ))
+        metric.set(3, 'A')
+        metric.set_all({('B', ) : 2, ('C', ) : 1})
+        assert metric.value('A') == 0
+        assert metric.value('B') == 2
+        assert metric.render()[2:] == ['a{type="B"} 2', 'a{type="C"} 1']
+
+    def test_histogram(self):
+        """Test Histogram."""
+        metric = Histogram('a', 'Some description', ('evt', ), (0.1, 1.0))
+        metric.observe(0.05, 'A')
+        metric.observe(0.1, 'A')
+        metric.observe(0.5, 'A')
+        metric.observe(5.0, 'A')
+        assert metric.value('A') == 4
+        assert metric.value('B') == 0
+        assert metric.render() == [
+            '# HELP a Some description',
+            '# TYPE a histogram',
+            'a_bucket{evt="A",le="0.1"} 2',
+            'a_bucket{evt="A",le="1.0"} 3',
+            'a_bucket{evt="A",le="+Inf"} 4',
+            'a_sum{evt="A"} 5.65',
+            'a_count{evt="A"} 4',
+        ]
+
+
+class TestMetricsRegistry(object):
+    """Tests for MetricsRegistry."""
+    def setup(self):
+        self.ae = None
+        self.server = None
+
+    def teardown(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_init(self):
+        """Test the registry is disabled by default."""
+        registry = MetricsRegistry()
+        assert registry.enabled is False
+        assert '# TYPE pynetdicom_bytes_sent_total counter' in registry.render()
+
+    def test_ae(self):
+        """Test the AE has a registry."""
+        ae = AE()
+        assert isinstance(ae.metrics, MetricsRegistry)
+        assert ae.metrics.enabled is False
+
+    def test_record_pdu(self):
+        """Test record_pdu()."""
+        registry = MetricsRegistry()
+        registry.record_pdu(0x04, 100, is_received=True)
+        registry.record_pdu(0x01, 50, is_received=False)
+        assert registry.pdus_received.value('P-DATA-TF') == 1
+        assert registry.bytes_received.value() == 100
+        assert registry.pdus_sent.value('A-ASSOCIATE-RQ') == 1
+        assert registry.bytes_sent.value() == 50
+
+    def test_disabled(self):
+        """Test nothing is recorded while disabled."""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.send_c_echo()
+        assoc.release()
+        scp.shutdown()
+
+        registry = ae.metrics
+        assert registry.bytes_sent.value() == 0
+        assert registry.bytes_received.value() == 0
+        assert registry.dimse_sent.value('C-ECHO-RQ') == 0
+        assert registry.associations_accepted.value('PYNETDICOM') == 0
+
+    def test_enabled(self):
+        """Test metrics are recorded for an association."""
+        def handle(event):
+            pass
+
+        self.ae = ae = AE()
+        ae.metrics.enabled = True
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_ECHO, handle)]
+        )
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assert 'pynetdicom_associations_active{calling_ae="PYNETDICOM"} 2' in (
+            ae.metrics.render()
+        )
+        assoc.send_c_echo()
+        assoc.release()
+        scp.shutdown()
+
+        registry = ae.metrics
+        # One for the requestor, one for the acceptor
+        assert registry.associations_accepted.value('PYNETDICOM') == 2
+        assert registry.associations_released.value('PYNETDICOM') == 2
+        assert registry.associations_rejected.value('PYNETDICOM') == 0
+        assert registry.pdus_sent.value('A-ASSOCIATE-RQ') == 1
+        assert registry.pdus_received.value('A-ASSOCIATE-RQ') == 1
+        assert registry.pdus_sent.value('P-DATA-TF') == 2
+        assert registry.bytes_sent.value() == registry.bytes_received.value()
+        assert registry.bytes_sent.value() > 0
+        assert registry.dimse_sent.value('C-ECHO-RQ') == 1
+        assert registry.dimse_sent.value('C-ECHO-RSP') == 1
+        assert registry.dimse_received.value('C-ECHO-RQ') == 1
+        assert registry.dimse_received.value('C-ECHO-RSP') == 1
+        assert registry.handler_duration.value('EVT_C_ECHO') == 1
+
+        output = registry.render()
+        assert 'pynetdicom_associations_active' in output
+        assert 'pynetdicom_dul_queue_depth{queue="event"} 0' in output
+        assert 'pynetdicom_memory_budget_bytes{usage="current"} 0' in output
+        assert (
+            'pynetdicom_handler_duration_seconds_count{event="EVT_C_ECHO"} 1'
+        ) in output
+
+    def test_rejected(self):
+        """Test rejected associations are recorded."""
+        self.ae = ae = AE()
+        ae.metrics.enabled = True
+        ae.require_called_aet = True
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = ae.associate('localhost', 11112, ae_title=b'BADAE')
+        assert assoc.is_rejected
+        scp.shutdown()
+
+        assert ae.metrics.associations_rejected.value('PYNETDICOM') == 2
+
+    def test_serve(self):
+        """Test serving the metrics over HTTP."""
+        self.ae = ae = AE()
+        ae.metrics.enabled = True
+        ae.metrics.bytes_sent.inc(12)
+        self.server = ae.metrics.serve(('127.0.0.1', 0))
+        port = self.server.server_address[1]
+
+        response = urlopen('http://127.0.0.1:{}/metrics'.format(port))
+        assert response.getcode() == 200
+        assert 'text/plain' in response.headers['Content-Type']
+        body = response.read().decode('utf-8')
+        assert 'pynetdicom_bytes_sent_total 12\n' in body
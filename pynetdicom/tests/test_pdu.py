@@ -3,6 +3,7 @@
 from datetime import datetime
 from io import BytesIO
 import logging
+import struct
 import sys
 import time
 
@@ -14,10 +15,10 @@ from pynetdicom import AE, evt, Association, _config
 from pynetdicom.events import Event
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ, A_ASSOCIATE_AC, A_ASSOCIATE_RJ, P_DATA_TF, A_RELEASE_RQ,
-    A_RELEASE_RP, A_ABORT_RQ, PDU, ApplicationContextItem,
+    A_RELEASE_RP, A_ABORT_RQ, PDU, ApplicationContextItem, AssociateRQCache,
     PresentationContextItemAC, PresentationContextItemRQ, UserInformationItem,
     PDU_ITEM_TYPES, PDU_TYPES,
-    PACK_UCHAR, UNPACK_UCHAR
+    PACK_UCHAR, UNPACK_UCHAR, _get_decoders, _get_encoders
 )
 from pynetdicom.pdu_items import (
     PresentationDataValueItem,
@@ -37,7 +38,8 @@ from pynetdicom.pdu_primitives import (
 from .encoded_pdu_items import (
     a_associate_rq, a_associate_ac, a_associate_rj, a_release_rq, a_release_rq,
     a_release_rp, a_abort, a_p_abort, p_data_tf,
-    a_associate_rq_user_id_ext_neg
+    a_associate_rq_user_id_ext_neg, a_associate_rq_role,
+    a_associate_rq_com_ext_neg
 )
 from pynetdicom.sop_class import VerificationSOPClass
 from pynetdicom.utils import pretty_bytes
@@ -202,6 +204,62 @@ class TestPDU(object):
         assert out == 1
 
 
+REFERENCE_PDUS = [
+    a_associate_rq, a_associate_rq_role, a_associate_rq_user_id_ext_neg,
+    a_associate_rq_com_ext_neg, a_associate_ac, a_associate_rj, p_data_tf,
+    a_release_rq, a_release_rp, a_abort, a_p_abort
+]
+
+
+class TestCompiledCoders(object):
+    """Tests for the compiled PDU encoders and decoders."""
+    @pytest.mark.parametrize('data', REFERENCE_PDUS)
+    def test_roundtrip(self, data):
+        """Test the compiled encoding is the same as the field encoders."""
+        pdu = PDU_TYPES[data[0]]()
+        pdu.decode(data)
+        assert pdu.encode() == data
+
+        # Reference encoding and decoding using the field (en|de)coders
+        bytestream = bytes()
+        for attr_name, func, args in pdu._encoders:
+            if attr_name:
+                bytestream += func(getattr(pdu, attr_name), *args)
+            else:
+                bytestream += func(*args)
+
+        assert bytestream == data
+
+        reference = PDU_TYPES[data[0]]()
+        for (offset, length), attr_name, func, args in reference._decoders:
+            end = offset + length if length else None
+            setattr(reference, attr_name, func(data[offset:end], *args))
+
+        assert reference == pdu
+
+    def test_compiled(self):
+        """Test the fixed length fields are combined."""
+        pdu = A_ASSOCIATE_RQ()
+        assert len(pdu._encoders) == 16
+        encoders = _get_encoders(pdu)
+        # Header, AE titles, reserved, variable items
+        assert len(encoders) == 5
+        assert _get_encoders(A_ASSOCIATE_RQ()) is encoders
+
+        assert len(pdu._decoders) == 4
+        assert len(_get_decoders(pdu)) == 4
+
+        pdu = A_ASSOCIATE_RJ()
+        assert len(_get_encoders(pdu)) == 1
+        assert len(_get_decoders(pdu)) == 1
+
+    def test_short_data_raises(self):
+        """Test decoding fixed length fields from short data raises."""
+        pdu = A_ASSOCIATE_RJ()
+        with pytest.raises(struct.error):
+            pdu.decode(a_associate_rj[:8])
+
+
 class TestASSOC_RQ(object):
     """Test the A_ASSOCIATE_RQ class."""
     def test_init(self):
@@ -513,6 +571,70 @@ class TestASSOC_RQ_UserInformation(object):
         assert user_info.user_identity is None
 
 
+class TestAssociateRQCache(object):
+    """Tests for the AssociateRQCache class."""
+    def setup(self):
+        pdu = A_ASSOCIATE_RQ()
+        pdu.decode(a_associate_rq)
+        self.primitive = pdu.to_primitive()
+
+    def test_encode(self):
+        """Test the encoded PDU is the same and is reused."""
+        cache = AssociateRQCache()
+        assert len(cache) == 0
+        pdu, encoded = cache.encode(self.primitive)
+        assert isinstance(pdu, A_ASSOCIATE_RQ)
+        assert encoded == a_associate_rq
+        assert len(cache) == 1
+
+        primitive = A_ASSOCIATE_RQ()
+        primitive.decode(a_associate_rq)
+        result = cache.encode(primitive.to_primitive())
+        assert result[0] is pdu
+        assert result[1] is encoded
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_key(self):
+        """Test changes to the request aren't encoded using the cache."""
+        cache = AssociateRQCache()
+        pdu, encoded = cache.encode(self.primitive)
+
+        self.primitive.called_ae_title = b'OTHER_SCP'
+        pdu_b, encoded_b = cache.encode(self.primitive)
+        assert pdu_b is not pdu
+        assert pdu_b.called_ae_title == b'OTHER_SCP       '
+        assert len(cache) == 2
+
+        for item in self.primitive.user_information:
+            if isinstance(item, MaximumLengthNotification):
+                item.maximum_length_received = 0
+        pdu_c, encoded_c = cache.encode(self.primitive)
+        assert pdu_c.user_information.maximum_length == 0
+        assert len(cache) == 3
+
+        cx = self.primitive.presentation_context_definition_list[0]
+        cx.add_transfer_syntax('1.2.840.10008.1.2.4.50')
+        pdu_d, encoded_d = cache.encode(self.primitive)
+        assert len(encoded_d) > len(encoded_c)
+        assert len(cache) == 4
+
+        assert len(set([encoded, encoded_b, encoded_c, encoded_d])) == 4
+
+    def test_maxsize(self):
+        """Test the least recently used PDUs are discarded."""
+        cache = AssociateRQCache(maxsize=2)
+        for ae_title in [b'A', b'B', b'A', b'C']:
+            self.primitive.called_ae_title = ae_title
+            cache.encode(self.primitive)
+
+        assert len(cache) == 2
+        keys = [key[1].strip() for key in cache._pdus]
+        assert keys == [b'A', b'C']
+
+
 class TestASSOC_AC(object):
     def test_init(self):
         """Test a new A_ASSOCIATE_AC PDU."""
@@ -23,7 +23,7 @@ from pynetdicom.pdu_items import (
     PresentationDataValueItem, AbstractSyntaxSubItem,
     SCP_SCU_RoleSelectionSubItem,
     PDUItem,
-    PACK_UCHAR, UNPACK_UCHAR
+    PACK_UCHAR, UNPACK_UCHAR, PDU_ITEM_TYPES, _get_decoders, _get_encoders
 )
 from pynetdicom.pdu_primitives import (
     SOPClassExtendedNegotiation, SOPClassCommonExtendedNegotiation,
@@ -82,6 +82,17 @@ def create_encoded_pdu():
     print_nice_bytes(pdu.encode())
 
 
+@pytest.mark.parametrize(
+    'cls', list(PDU_ITEM_TYPES.values()) + [PresentationDataValueItem]
+)
+def test_item_slots(cls):
+    """Test the PDU items don't have an instance dict."""
+    item = cls()
+    assert not hasattr(item, '__dict__')
+    with pytest.raises(AttributeError):
+        item.unknown_attribute = None
+
+
 class TestPDU(object):
     """Test the PDU equality/inequality operators."""
     def test_decode_raises(self):
@@ -260,6 +271,63 @@ class TestPDU(object):
         assert out == b'1.2.840.10008.1.10'
 
 
+REFERENCE_ITEMS = [
+    application_context, presentation_context_rq, presentation_context_ac,
+    abstract_syntax, transfer_syntax, user_information,
+    maximum_length_received, implementation_class_uid,
+    implementation_version_name, asynchronous_window_ops, role_selection,
+    role_selection_odd, extended_negotiation, common_extended_negotiation,
+    user_identity_rq_user_nopw, user_identity_rq_user_pass, user_identity_ac
+]
+
+
+class TestCompiledCoders(object):
+    """Tests for the compiled PDU item encoders and decoders."""
+    @pytest.mark.parametrize('data', REFERENCE_ITEMS)
+    def test_roundtrip(self, data):
+        """Test the compiled encoding is the same as the field encoders."""
+        item = PDU_ITEM_TYPES[data[0]]()
+        item.decode(data)
+        assert item.encode() == data
+
+        # Reference encoding using the field encoders
+        bytestream = bytes()
+        for attr_name, func, args in item._encoders:
+            if attr_name:
+                bytestream += func(getattr(item, attr_name), *args)
+            else:
+                bytestream += func(*args)
+
+        assert bytestream == data
+
+    def test_pdv_roundtrip(self):
+        """Test the compiled encoding of a presentation data value item."""
+        item = PresentationDataValueItem()
+        item.decode(presentation_data_value)
+        assert item.presentation_context_id == 1
+        assert item.presentation_data_value == presentation_data
+        assert item.encode() == presentation_data_value
+
+    def test_compiled(self):
+        """Test the fixed length fields are combined."""
+        item = TransferSyntaxSubItem()
+        assert len(item._encoders) == 4
+        # Header, UID
+        assert len(_get_encoders(item)) == 2
+        assert len(_get_decoders(item)) == 1
+
+        item = AsynchronousOperationsWindowSubItem()
+        assert len(_get_encoders(item)) == 1
+        assert len(_get_decoders(item)) == 1
+
+    def test_dynamic_decoders(self):
+        """Test decoders that depend on decoded values aren't compiled."""
+        item = SOPClassCommonExtendedNegotiationSubItem()
+        assert _get_decoders(item) is None
+        item.decode(common_extended_negotiation)
+        assert item.encode() == common_extended_negotiation
+
+
 class TestApplicationContext(object):
     def setup(self):
         self.default_conformance = _config.ENFORCE_UID_CONFORMANCE
@@ -1,16 +1,23 @@
 """Tests for the presentation module."""
+from copy import deepcopy
 import logging
+import os
 import sys
+import threading
 
 import pytest
 
 from pydicom._uid_dict import UID_dictionary
-from pydicom.uid import UID
+from pydicom.uid import (
+    UID, ExplicitVRLittleEndian, JPEGBaseline, JPEG2000
+)
 
 from pynetdicom import StoragePresentationContexts, AE, _config
 from pynetdicom.pdu_primitives import SCP_SCU_RoleSelectionNegotiation
 from pynetdicom.presentation import (
     PresentationContext,
+    NegotiationCache,
+    PeerCapabilityCache,
     negotiate_as_acceptor,
     negotiate_as_requestor,
     DEFAULT_TRANSFER_SYNTAXES,
@@ -33,6 +40,7 @@ from pynetdicom.sop_class import (
     VerificationSOPClass,
     CompositeInstanceRetrieveWithoutBulkDataGet,
     CTImageStorage,
+    MRImageStorage,
 )
 
 
@@ -365,6 +373,36 @@ class TestPresentationContext(object):
             context.scp_role = 1
 
 
+def test_deepcopy():
+    """Test deepcopy of a PresentationContext shares the UIDs."""
+    context = build_context('1.2.840.10008.1.1')
+    context.context_id = 1
+    context.scp_role = True
+    copied = deepcopy(context)
+    assert copied == context
+    assert copied is not context
+    assert copied.abstract_syntax is context.abstract_syntax
+    assert copied.transfer_syntax is not context.transfer_syntax
+    assert copied.transfer_syntax[0] is context.transfer_syntax[0]
+
+    copied.add_transfer_syntax('1.2.3')
+    copied.context_id = 3
+    assert '1.2.3' not in context.transfer_syntax
+    assert 1 == context.context_id
+
+    # Shared objects stay shared
+    copies = deepcopy([context, context])
+    assert copies[0] is copies[1]
+
+
+def test_slots():
+    """Test PresentationContext doesn't have an instance dict."""
+    context = build_context('1.2.840.10008.1.1')
+    assert not hasattr(context, '__dict__')
+    with pytest.raises(AttributeError):
+        context.unknown_attribute = None
+
+
 class TestNegotiateAsAcceptor(object):
     """Tests negotiation_as_acceptor."""
     def setup(self):
@@ -919,6 +957,148 @@ class TestNegotiateAsAcceptorWithRoleSelection(object):
             assert cx.as_scp is False
 
 
+class TestNegotiationCache(object):
+    """Tests for NegotiationCache."""
+    def teardown(self):
+        if getattr(self, 'ae', None):
+            self.ae.shutdown()
+
+    @staticmethod
+    def summary(contexts, roles):
+        """Return a comparable summary of negotiation results."""
+        return (
+            [(cx.context_id, cx.abstract_syntax, cx.transfer_syntax,
+              cx.result, cx.as_scu, cx.as_scp) for cx in contexts],
+            [(role.sop_class_uid, role.scu_role, role.scp_role)
+             for role in roles]
+        )
+
+    @pytest.mark.parametrize("req, acc, out", REFERENCE_ROLES)
+    def test_matches_negotiate(self, req, acc, out):
+        """Test the results match negotiate_as_acceptor()."""
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+        rq_roles = {'1.2.3.4' : (req[0], req[1])}
+
+        ac = build_context('1.2.3.4')
+        ac.scu_role = acc[0]
+        ac.scp_role = acc[1]
+
+        reference = self.summary(*negotiate_as_acceptor([rq], [ac], rq_roles))
+        cache = NegotiationCache([ac])
+        assert reference == self.summary(*cache.negotiate([rq], rq_roles))
+        # Cached
+        assert reference == self.summary(*cache.negotiate([rq], rq_roles))
+        assert 1 == len(cache)
+
+    def test_rejections(self):
+        """Test rejected and duplicate contexts match."""
+        ac = [build_context('1.2.3.4'), build_context('1.2.3.5', '1.2.3')]
+        rq = [
+            build_context('1.2.3.4'),
+            build_context('1.2.3.5'),
+            build_context('1.2.3.6'),
+            build_context('1.2.3.4', ['1.2.3', '1.2.4']),
+        ]
+        for ii, cx in enumerate(rq):
+            cx.context_id = ii * 2 + 1
+
+        reference = self.summary(*negotiate_as_acceptor(rq, ac))
+        assert [0x00, 0x04, 0x03, 0x04] == [cx[3] for cx in reference[0]]
+
+        cache = NegotiationCache(ac)
+        assert reference == self.summary(*cache.negotiate(rq))
+        assert reference == self.summary(*cache.negotiate(rq))
+
+        assert ([], []) == cache.negotiate([])
+        empty = self.summary(*NegotiationCache([]).negotiate(rq))
+        assert self.summary(*negotiate_as_acceptor(rq, [])) == empty
+
+    def test_cached(self):
+        """Test the cached results."""
+        ac = build_context('1.2.3.4')
+        rq = build_context('1.2.3.4')
+        rq.context_id = 1
+
+        cache = NegotiationCache([ac])
+        assert 0 == len(cache)
+        contexts, _ = cache.negotiate([rq])
+        assert 1 == len(cache)
+        contexts_b, _ = cache.negotiate([rq])
+        assert 1 == len(cache)
+        # New objects each time
+        assert contexts[0] is not contexts_b[0]
+        assert contexts[0] == contexts_b[0]
+
+        # Roles are part of the key
+        cache.negotiate([rq], {'1.2.3.4' : (True, True)})
+        assert 2 == len(cache)
+
+        cache.clear()
+        assert 0 == len(cache)
+
+    def test_maxsize(self):
+        """Test the least recently used results are discarded."""
+        cache = NegotiationCache([build_context('1.2.3.4')], maxsize=2)
+        contexts = []
+        for ii in range(3):
+            cx = build_context('1.2.3.4')
+            cx.context_id = ii * 2 + 1
+            contexts.append(cx)
+
+        cache.negotiate(contexts[:1])
+        cache.negotiate(contexts[1:2])
+        cache.negotiate(contexts[:1])
+        cache.negotiate(contexts[2:])
+        assert 2 == len(cache)
+        keys = [key[0][0][0] for key in cache._results]
+        assert [1, 5] == keys
+
+    def test_is_valid_for(self):
+        """Test checking the cache applies to the supported contexts."""
+        ac = build_context('1.2.3.4')
+        cache = NegotiationCache([ac])
+        assert cache.is_valid_for([build_context('1.2.3.4')])
+        assert not cache.is_valid_for([])
+        assert not cache.is_valid_for([build_context('1.2.3.5')])
+
+        ac.add_transfer_syntax('1.2.3')
+        assert not cache.is_valid_for([ac])
+        ac = build_context('1.2.3.4')
+        ac.scp_role = True
+        ac.scu_role = True
+        assert not cache.is_valid_for([ac])
+
+    def test_ae_cache(self):
+        """Test the AE's cache is used and reset."""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        assert ae._negotiation_cache is None
+        scp = ae.start_server(('', 11112), block=False)
+
+        for ii in range(2):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            assoc.release()
+
+        cache = ae._negotiation_cache
+        assert 1 == len(cache)
+
+        ae.add_supported_context(CTImageStorage)
+        assert ae._negotiation_cache is None
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.release()
+        assert ae._negotiation_cache is not cache
+        assert ae._negotiation_cache.is_valid_for(ae.supported_contexts)
+
+        ae.remove_supported_context(CTImageStorage)
+        assert ae._negotiation_cache is None
+
+        scp.shutdown()
+
+
 class TestNegotiateAsRequestorWithRoleSelection(object):
     """Tests negotiate_as_requestor with role selection."""
     @pytest.mark.parametrize("req, acc, out", REFERENCE_ROLES)
@@ -1610,6 +1790,237 @@ def test_build_context():
     assert context.context_id is None
 
 
+class TestPeerCapabilityCache(object):
+    """Tests for PeerCapabilityCache."""
+    def associate(self, requested, results, ae_title=b'ANY-SCP'):
+        """Return an Association with the negotiation `results` as
+        {context ID : (result, transfer syntax)}.
+        """
+        from pynetdicom.association import Association
+
+        assoc = Association(AE(), 'requestor')
+        assoc.acceptor.address = '127.0.0.1'
+        assoc.acceptor.port = 11112
+        assoc.acceptor.ae_title = ae_title
+
+        contexts = deepcopy(requested)
+        for ii, cx in enumerate(contexts):
+            cx.context_id = 2 * ii + 1
+
+        assoc.requestor.requested_contexts = contexts
+        for cx in contexts:
+            result, syntax = results[cx.context_id]
+            context = build_context(
+                cx.abstract_syntax, syntax or cx.transfer_syntax[0]
+            )
+            context.context_id = cx.context_id
+            context.result = result
+            if result == 0x00:
+                assoc._accepted_cx[cx.context_id] = context
+            else:
+                assoc._rejected_cx.append(context)
+
+        return assoc
+
+    def test_unknown_peer(self):
+        """Test the contexts are unchanged for an unknown peer."""
+        cache = PeerCapabilityCache()
+        assert len(cache) == 0
+        contexts = [build_context(CTImageStorage)]
+        assert cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP', contexts
+        ) is contexts
+        assert cache.get_capabilities('127.0.0.1', 11112, b'ANY-SCP') is None
+
+    def test_update(self):
+        """Test recording the negotiation results."""
+        cache = PeerCapabilityCache()
+        requested = [
+            build_context(CTImageStorage),
+            build_context(MRImageStorage),
+            build_context(VerificationSOPClass, ExplicitVRLittleEndian),
+            build_context(CTImageStorage, JPEGBaseline),
+        ]
+        assoc = self.associate(
+            requested,
+            {
+                1 : (0x00, ExplicitVRLittleEndian),
+                3 : (0x03, ''),
+                5 : (0x02, ''),
+                7 : (0x04, ''),
+            }
+        )
+        cache.update(assoc)
+        assert len(cache) == 1
+        # AE title padding is ignored
+        assert cache.get_capabilities('127.0.0.1', 11112, 'ANY-SCP') == {
+            'accepted' : {CTImageStorage : [ExplicitVRLittleEndian]},
+            'rejected' : {
+                CTImageStorage : [JPEGBaseline],
+                MRImageStorage : sorted(DEFAULT_TRANSFER_SYNTAXES),
+            },
+        }
+        assert cache.get_capabilities('127.0.0.1', 11113, 'ANY-SCP') is None
+        assert cache.get_capabilities('127.0.0.1', 11112, 'OTHER') is None
+
+        # The peer accepts a previously rejected transfer syntax
+        assoc = self.associate(
+            [build_context(CTImageStorage, JPEGBaseline)],
+            {1 : (0x00, JPEGBaseline)}
+        )
+        cache.update(assoc)
+        capabilities = cache.get_capabilities('127.0.0.1', 11112, 'ANY-SCP')
+        assert capabilities['accepted'] == {
+            CTImageStorage : sorted([ExplicitVRLittleEndian, JPEGBaseline])
+        }
+        assert CTImageStorage not in capabilities['rejected']
+
+        cache.remove('127.0.0.1', 11112, 'ANY-SCP')
+        assert len(cache) == 0
+
+    def test_filter_contexts(self):
+        """Test filtering the contexts to propose."""
+        cache = PeerCapabilityCache()
+        requested = [
+            build_context(CTImageStorage),
+            build_context(MRImageStorage),
+            build_context(VerificationSOPClass, ExplicitVRLittleEndian),
+            build_context(CTImageStorage, JPEGBaseline),
+        ]
+        assoc = self.associate(
+            requested,
+            {
+                1 : (0x00, ExplicitVRLittleEndian),
+                3 : (0x03, ''),
+                5 : (0x02, ''),
+                7 : (0x04, ''),
+            }
+        )
+        cache.update(assoc)
+
+        contexts = cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP', requested
+        )
+        assert len(contexts) == 2
+        assert contexts[0].abstract_syntax == CTImageStorage
+        # The accepted transfer syntax first, the rejected one removed and
+        #   the others kept
+        assert contexts[0].transfer_syntax == [ExplicitVRLittleEndian] + [
+            ts for ts in requested[0].transfer_syntax
+            if ts != ExplicitVRLittleEndian
+        ]
+        # Rejected for no reason, so still proposed
+        assert contexts[1] is requested[2]
+        # The originals are unchanged
+        assert len(requested[0].transfer_syntax) == 3
+
+        # Not previously proposed
+        contexts = cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP',
+            [build_context(CTImageStorage, JPEG2000)]
+        )
+        assert contexts[0].transfer_syntax == [JPEG2000]
+
+        # Only the rejected transfer syntax is removed
+        contexts = cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP',
+            [build_context(
+                CTImageStorage,
+                [JPEG2000, JPEGBaseline, ExplicitVRLittleEndian]
+            )]
+        )
+        assert contexts[0].transfer_syntax == [
+            ExplicitVRLittleEndian, JPEG2000
+        ]
+
+        # All previously rejected
+        requested = [build_context(MRImageStorage)]
+        contexts = cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP', requested
+        )
+        assert contexts is requested
+
+    def test_max_age(self):
+        """Test the capabilities aren't used once too old."""
+        cache = PeerCapabilityCache(max_age=60)
+        assoc = self.associate(
+            [build_context(CTImageStorage)],
+            {1 : (0x00, ExplicitVRLittleEndian)}
+        )
+        cache.update(assoc)
+        assert cache.get_capabilities('127.0.0.1', 11112, 'ANY-SCP')
+
+        cache._peers[('127.0.0.1', 11112, 'ANY-SCP')]['updated'] -= 61
+        assert cache.get_capabilities('127.0.0.1', 11112, 'ANY-SCP') is None
+        requested = [build_context(CTImageStorage)]
+        assert cache.filter_contexts(
+            '127.0.0.1', 11112, b'ANY-SCP', requested
+        ) is requested
+
+    def test_save_load(self, tmpdir):
+        """Test saving the capabilities to file and loading them."""
+        path = str(tmpdir.join('capabilities.json'))
+        cache = PeerCapabilityCache(path)
+        assert cache.path == path
+        assert len(cache) == 0
+        assoc = self.associate(
+            [build_context(CTImageStorage), build_context(MRImageStorage)],
+            {1 : (0x00, ExplicitVRLittleEndian), 3 : (0x03, '')}
+        )
+        cache.update(assoc)
+        assert os.listdir(str(tmpdir)) == ['capabilities.json']
+
+        other = PeerCapabilityCache(path)
+        assert len(other) == 1
+        capabilities = other.get_capabilities('127.0.0.1', 11112, 'ANY-SCP')
+        assert capabilities == cache.get_capabilities(
+            '127.0.0.1', 11112, 'ANY-SCP'
+        )
+        assert isinstance(
+            list(capabilities['accepted'].keys())[0], UID
+        )
+
+        other.clear()
+        assert len(other) == 0
+        other.load()
+        assert len(other) == 1
+
+    def test_save_concurrent(self, tmpdir):
+        """Test saving from more than one thread at once."""
+        path = str(tmpdir.join('capabilities.json'))
+        cache = PeerCapabilityCache(path)
+        associations = [
+            self.associate(
+                [build_context(CTImageStorage)],
+                {1 : (0x00, ExplicitVRLittleEndian)},
+                ae_title='SCP{}'.format(ii).encode('ascii')
+            ) for ii in range(10)
+        ]
+        threads = [
+            threading.Thread(target=cache.update, args=(assoc, ))
+            for assoc in associations
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert os.listdir(str(tmpdir)) == ['capabilities.json']
+        # The last save has all the peers
+        assert len(PeerCapabilityCache(path)) == 10
+
+    def test_load_invalid(self, tmpdir, caplog):
+        """Test loading an invalid file."""
+        path = tmpdir.join('capabilities.json')
+        path.write('not json')
+        with caplog.at_level(logging.WARNING, logger='pynetdicom'):
+            cache = PeerCapabilityCache(str(path))
+
+        assert len(cache) == 0
+        assert 'Unable to load the peer capabilities' in caplog.text
+
+
 class TestServiceContexts(object):
     def test_verification(self):
         """Test the verification service presentation contexts."""
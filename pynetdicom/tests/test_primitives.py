@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Test the service primitives."""
 
+import copy
 import logging
 
 import pytest
@@ -18,7 +19,7 @@ from pynetdicom.pdu_primitives import (
     P_DATA, A_RELEASE, A_ASSOCIATE, A_P_ABORT, A_ABORT,
     SCP_SCU_RoleSelectionNegotiation,
     AsynchronousOperationsWindowNegotiation,
-    UserIdentityNegotiation
+    UserIdentityNegotiation, UserInformationList
 )
 from pynetdicom.presentation import PresentationContext
 from pynetdicom.utils import pretty_bytes
@@ -977,6 +978,170 @@ class TestPrimitive_A_ASSOCIATE(object):
         )
 
 
+    def test_user_information_list(self):
+        """Test the user information is converted to a UserInformationList"""
+        assoc = A_ASSOCIATE()
+        assert isinstance(assoc.user_information, UserInformationList)
+        assert assoc.maximum_length_received is None
+
+        item = MaximumLengthNotification()
+        item.maximum_length_received = 16382
+        assoc.user_information = [item, 'not an item']
+        assert isinstance(assoc.user_information, UserInformationList)
+        assert assoc.user_information == [item]
+        assert assoc.maximum_length_received == 16382
+
+        assoc.maximum_length_received = 12
+        assert item.maximum_length_received == 12
+        assert len(assoc.user_information) == 1
+
+        assoc.user_information.remove(item)
+        assert assoc.maximum_length_received is None
+        with pytest.raises(ValueError):
+            assoc.implementation_class_uid
+
+        assoc.implementation_class_uid = '1.2.3'
+        assert assoc.implementation_class_uid == '1.2.3'
+        assert len(assoc.user_information) == 1
+
+    def test_user_information_decoded(self):
+        """Test the user information is indexed when decoded"""
+        assoc = A_ASSOCIATE()
+        assoc.application_context_name = "1.2.840.10008.3.1.1.1"
+        assoc.calling_ae_title = 'ECHOSCU'
+        assoc.called_ae_title = 'ANY-SCP'
+        assoc.maximum_length_received = 16382
+        assoc.implementation_class_uid = '1.2.826.0.1.3680043.9.3811.0.9.0'
+
+        pc = PresentationContext()
+        pc.context_id = 1
+        pc.abstract_syntax = '1.2.840.10008.1.1'
+        pc.transfer_syntax = ['1.2.840.10008.1.2']
+        assoc.presentation_context_definition_list = [pc]
+
+        pdu = A_ASSOCIATE_RQ()
+        pdu.from_primitive(assoc)
+        data = pdu.encode()
+
+        pdu = A_ASSOCIATE_RQ()
+        pdu.decode(data)
+        primitive = pdu.to_primitive()
+        user_info = primitive.user_information
+        assert isinstance(user_info, UserInformationList)
+        assert primitive.maximum_length_received == 16382
+        assert primitive.implementation_class_uid == (
+            '1.2.826.0.1.3680043.9.3811.0.9.0'
+        )
+        assert user_info.get_items(UserIdentityNegotiation) == []
+
+
+class TestUserInformationList(object):
+    """Tests for UserInformationList"""
+    def setup(self):
+        """Run prior to each test"""
+        self.max_length = MaximumLengthNotification()
+        self.version_name = ImplementationVersionNameNotification()
+        self.roles = []
+        for uid in ['1.2', '3.4']:
+            item = SCP_SCU_RoleSelectionNegotiation()
+            item.sop_class_uid = uid
+            self.roles.append(item)
+
+    def test_init(self):
+        """Test creating a new list"""
+        user_info = UserInformationList()
+        assert user_info == []
+        assert user_info.get_item(MaximumLengthNotification) is None
+        assert user_info.get_items(MaximumLengthNotification) == []
+
+        user_info = UserInformationList([self.max_length] + self.roles)
+        assert len(user_info) == 3
+        assert user_info.get_item(MaximumLengthNotification) is (
+            self.max_length
+        )
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == (
+            self.roles
+        )
+
+    def test_get_items_copy(self):
+        """Test changing the returned items doesn't change the index"""
+        user_info = UserInformationList(self.roles)
+        items = user_info.get_items(SCP_SCU_RoleSelectionNegotiation)
+        items.pop()
+        assert len(
+            user_info.get_items(SCP_SCU_RoleSelectionNegotiation)
+        ) == 2
+
+    def test_add(self):
+        """Test the index is updated when items are added"""
+        user_info = UserInformationList()
+        user_info.append(self.max_length)
+        assert user_info.get_item(MaximumLengthNotification) is (
+            self.max_length
+        )
+
+        user_info.extend(self.roles[:1])
+        user_info += self.roles[1:]
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == (
+            self.roles
+        )
+
+        user_info.insert(0, self.version_name)
+        assert user_info[0] is self.version_name
+        assert user_info.get_item(ImplementationVersionNameNotification) is (
+            self.version_name
+        )
+
+        user_info[0] = self.roles[0]
+        assert user_info.get_item(
+            ImplementationVersionNameNotification
+        ) is None
+        assert len(user_info.get_items(SCP_SCU_RoleSelectionNegotiation)) == 3
+
+    def test_remove(self):
+        """Test the index is updated when items are removed"""
+        user_info = UserInformationList(
+            [self.max_length, self.version_name] + self.roles
+        )
+        user_info.remove(self.max_length)
+        assert user_info.get_item(MaximumLengthNotification) is None
+
+        assert user_info.pop() is self.roles[1]
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == (
+            self.roles[:1]
+        )
+
+        del user_info[0]
+        assert user_info.get_item(
+            ImplementationVersionNameNotification
+        ) is None
+
+        user_info.clear()
+        assert user_info == []
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == []
+
+    def test_order(self):
+        """Test the indexed items are kept in the same order as the list"""
+        user_info = UserInformationList(self.roles)
+        user_info.reverse()
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == (
+            self.roles[::-1]
+        )
+        user_info.sort(key=lambda item: item.sop_class_uid)
+        assert user_info.get_items(SCP_SCU_RoleSelectionNegotiation) == (
+            self.roles
+        )
+
+    def test_copy(self):
+        """Test copying the list copies the index"""
+        user_info = UserInformationList([self.max_length])
+        other = copy.deepcopy(user_info)
+        assert isinstance(other, UserInformationList)
+        assert len(other.get_items(MaximumLengthNotification)) == 1
+        assert other.get_item(MaximumLengthNotification) is other[0]
+        assert other[0] is not self.max_length
+
+
 class TestPrimitive_A_RELEASE(object):
     def test_assignment(self):
         """ Check assignment works correctly """
@@ -1132,3 +1297,22 @@ class TestServiceParameter(object):
         prim_b.maximum_length_received = 12
         assert not prim_a == prim_b
         assert prim_a != prim_b
+
+
+@pytest.mark.parametrize(
+    'cls',
+    [
+        A_ASSOCIATE, A_RELEASE, A_ABORT, A_P_ABORT, P_DATA,
+        MaximumLengthNotification, ImplementationClassUIDNotification,
+        ImplementationVersionNameNotification,
+        AsynchronousOperationsWindowNegotiation,
+        SCP_SCU_RoleSelectionNegotiation, SOPClassExtendedNegotiation,
+        SOPClassCommonExtendedNegotiation, UserIdentityNegotiation
+    ]
+)
+def test_primitive_slots(cls):
+    """Test the primitives don't have an instance dict."""
+    primitive = cls()
+    assert not hasattr(primitive, '__dict__')
+    with pytest.raises(AttributeError):
+        primitive.unknown_attribute = None
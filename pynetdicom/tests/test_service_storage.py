@@ -66,7 +66,7 @@ class TestStorageServiceClass(object):
         req.MessageID = 1
         req.AffectedSOPClassUID = DATASET.SOPClassUID
         req.AffectedSOPInstanceUID = DATASET.SOPInstanceUID
-        req.Priorty = 0x0002
+        req.Priority = 0x0002
         req.DataSet = BytesIO(b'\x08\x00\x01\x00\x40\x40\x00\x00\x00\x00\x00\x08\x00\x49')
 
         # Send C-STORE request to DIMSE and get response
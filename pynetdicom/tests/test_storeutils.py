@@ -0,0 +1,219 @@
+"""Unit tests for the storage utilities."""
+
+import logging
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from pydicom.uid import (
+    ExplicitVRLittleEndian, ImplicitVRLittleEndian, ExplicitVRBigEndian,
+    JPEG2000Lossless, UID
+)
+
+from pynetdicom.sop_class import (
+    CTImageStorage, MRImageStorage, RTImageStorage
+)
+from pynetdicom.storeutils import (
+    FileQueue, Journal, get_files, is_uncompressed, plan_associations,
+    scan_files
+)
+
+
+LOGGER = logging.getLogger('pynetdicom')
+LOGGER.setLevel(logging.CRITICAL)
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), 'dicom_files')
+CT_FILE = os.path.join(TEST_DS_DIR, 'CTImageStorage.dcm')
+MR_FILE = os.path.join(TEST_DS_DIR, 'MRImageStorage_JPG2000_Lossless.dcm')
+RT_FILE = os.path.join(TEST_DS_DIR, 'RTImageStorage.dcm')
+
+
+class TestGetFiles(object):
+    """Tests for storeutils.get_files()."""
+    def test_files(self, tmpdir):
+        """Test getting the files in directories."""
+        sub = tmpdir.mkdir('sub')
+        tmpdir.join('b.dcm').write('')
+        tmpdir.join('a.dcm').write('')
+        sub.join('c.dcm').write('')
+
+        assert get_files([CT_FILE, str(tmpdir)]) == [
+            CT_FILE,
+            str(tmpdir.join('a.dcm')),
+            str(tmpdir.join('b.dcm')),
+        ]
+        assert get_files([str(tmpdir)], recurse=True) == [
+            str(tmpdir.join('a.dcm')),
+            str(tmpdir.join('b.dcm')),
+            str(sub.join('c.dcm')),
+        ]
+
+
+class TestScanFiles(object):
+    """Tests for storeutils.scan_files()."""
+    def test_groups(self, tmpdir):
+        """Test files are grouped by SOP Class and transfer syntax."""
+        ct_copy = str(tmpdir.join('ct.dcm'))
+        shutil.copy(CT_FILE, ct_copy)
+        groups = scan_files([CT_FILE, MR_FILE, RT_FILE, ct_copy])
+        assert list(groups.keys()) == [
+            (CTImageStorage, ExplicitVRLittleEndian),
+            (MRImageStorage, JPEG2000Lossless),
+            (RTImageStorage, ImplicitVRLittleEndian),
+        ]
+        assert groups[(CTImageStorage, ExplicitVRLittleEndian)] == [
+            CT_FILE, ct_copy
+        ]
+
+    def test_unreadable(self, tmpdir, caplog):
+        """Test files that can't be read are skipped."""
+        path = str(tmpdir.join('missing.dcm'))
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            groups = scan_files([path, CT_FILE])
+            assert list(groups.values()) == [[CT_FILE]]
+            assert 'Cannot read input file {}'.format(path) in caplog.text
+
+
+class TestPlanAssociations(object):
+    """Tests for storeutils.plan_associations()."""
+    def test_is_uncompressed(self):
+        """Test is_uncompressed()."""
+        assert is_uncompressed(ExplicitVRLittleEndian)
+        assert is_uncompressed(ImplicitVRLittleEndian)
+        assert not is_uncompressed(JPEG2000Lossless)
+        assert not is_uncompressed(UID('1.2.3.4'))
+
+    def test_plan(self):
+        """Test the contexts and groups for each association."""
+        groups = {
+            (CTImageStorage, ImplicitVRLittleEndian) : ['a'],
+            (CTImageStorage, ExplicitVRLittleEndian) : ['b', 'c'],
+            (MRImageStorage, JPEG2000Lossless) : ['d'],
+        }
+        plan = plan_associations(groups)
+        assert len(plan) == 1
+        contexts, keys = plan[0]
+        assert len(contexts) == 2
+        ct_cx = [
+            cx for cx in contexts if cx.abstract_syntax == CTImageStorage
+        ][0]
+        # Shared uncompressed context, most files first
+        assert ct_cx.transfer_syntax == [
+            ExplicitVRLittleEndian, ImplicitVRLittleEndian,
+            ExplicitVRBigEndian
+        ]
+        mr_cx = [
+            cx for cx in contexts if cx.abstract_syntax == MRImageStorage
+        ][0]
+        assert mr_cx.transfer_syntax == [JPEG2000Lossless]
+        assert sorted(keys) == sorted(groups.keys())
+
+    def test_transfer_syntax(self):
+        """Test proposing specific uncompressed transfer syntaxes."""
+        groups = {(CTImageStorage, ImplicitVRLittleEndian) : ['a']}
+        contexts, _ = plan_associations(groups, [ExplicitVRBigEndian])[0]
+        assert contexts[0].transfer_syntax == [ExplicitVRBigEndian]
+
+    def test_max_contexts(self):
+        """Test the contexts are split between associations."""
+        groups = {
+            (CTImageStorage, JPEG2000Lossless) : ['a'],
+            (MRImageStorage, JPEG2000Lossless) : ['b'],
+            (RTImageStorage, JPEG2000Lossless) : ['c'],
+        }
+        plan = plan_associations(groups, max_contexts=2)
+        assert [len(contexts) for contexts, _ in plan] == [2, 1]
+        assert [len(keys) for _, keys in plan] == [2, 1]
+
+
+class TestJournal(object):
+    """Tests for storeutils.Journal."""
+    def test_resume(self, tmpdir):
+        """Test a new journal skips the files already stored."""
+        path = str(tmpdir.join('journal.txt'))
+        journal = Journal(path)
+        assert journal.stored == set()
+        journal.add(CT_FILE)
+        journal.close()
+
+        journal = Journal(path)
+        assert journal.stored == set([os.path.abspath(CT_FILE)])
+        assert journal.filter([CT_FILE, MR_FILE]) == [MR_FILE]
+        journal.add(MR_FILE)
+        journal.close()
+
+        assert Journal(path).filter([CT_FILE, MR_FILE, RT_FILE]) == [RT_FILE]
+
+
+class TestFileQueue(object):
+    """Tests for storeutils.FileQueue."""
+    def test_get(self):
+        """Test getting files from the queue."""
+        work = FileQueue(['a', 'b'])
+        assert len(work) == 2
+        assert work.get() == 'a'
+        assert work.get() == 'b'
+        assert len(work) == 0
+        assert work.nr_outstanding == 2
+        work.done()
+        work.done()
+        assert work.nr_outstanding == 0
+        assert work.get() is None
+
+    def test_put_back(self):
+        """Test a file put back is got by a waiting reader."""
+        work = FileQueue(['a'])
+        assert work.get() == 'a'
+
+        items = []
+        thread = threading.Thread(target=lambda: items.append(work.get()))
+        thread.start()
+        # Waits while 'a' is outstanding
+        time.sleep(0.1)
+        assert thread.is_alive()
+
+        work.put_back('a')
+        thread.join(5)
+        assert items == ['a']
+        assert work.nr_outstanding == 1
+
+    def test_done_wakes(self):
+        """Test waiting readers finish once no files are outstanding."""
+        work = FileQueue(['a'])
+        assert work.get() == 'a'
+
+        items = []
+        thread = threading.Thread(target=lambda: items.append(work.get()))
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+
+        work.done()
+        thread.join(5)
+        assert items == [None]
+
+    def test_stop(self):
+        """Test waiting readers return once stopped."""
+        work = FileQueue(['a'])
+        assert work.get() == 'a'
+
+        stop = threading.Event()
+        items = []
+        thread = threading.Thread(
+            target=lambda: items.append(work.get(stop))
+        )
+        thread.start()
+        time.sleep(0.1)
+        assert thread.is_alive()
+
+        stop.set()
+        work.wake()
+        thread.join(5)
+        assert items == [None]
+        # Stopped readers don't get any more files
+        work.put_back('a')
+        assert work.get(stop) is None
+        assert work.get() == 'a'
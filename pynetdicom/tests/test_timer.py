@@ -5,7 +5,7 @@ import time
 
 import pytest
 
-from pynetdicom.timer import Timer
+from pynetdicom.timer import Timer, TimerScheduler
 
 LOGGER = logging.getLogger('pynetdicom')
 LOGGER.setLevel(logging.CRITICAL)
@@ -120,3 +120,95 @@ class TestTimer(object):
         assert timer.timeout == 0.1
         assert timer.expired is True
         assert timer.remaining < 0
+
+
+class TestTimerScheduler(object):
+    """Test the timer scheduler and Timer callbacks."""
+    def test_callback(self):
+        """Test the callback is called once when the timer expires."""
+        fired = []
+        timer = Timer(0.05, callback=lambda: fired.append(timer.expired))
+        timer.start()
+        assert fired == []
+        time.sleep(0.2)
+        assert fired == [True]
+        assert timer.expired is True
+
+        # Restarting after expiry schedules it again
+        timer.restart()
+        time.sleep(0.2)
+        assert fired == [True, True]
+
+    def test_callback_stop(self):
+        """Test the callback isn't called if the timer is stopped."""
+        fired = []
+        timer = Timer(0.05, callback=lambda: fired.append(True))
+        timer.start()
+        timer.stop()
+        time.sleep(0.15)
+        assert fired == []
+
+    def test_callback_restart(self):
+        """Test restarting postpones the callback."""
+        fired = []
+        timer = Timer(0.15, callback=lambda: fired.append(True))
+        timer.start()
+        time.sleep(0.1)
+        timer.restart()
+        time.sleep(0.1)
+        assert fired == []
+        time.sleep(0.15)
+        assert fired == [True]
+
+    def test_callback_timeout_change(self):
+        """Test changing the timeout of a running timer."""
+        fired = []
+        timer = Timer(10, callback=lambda: fired.append(True))
+        timer.start()
+        timer.timeout = 0.05
+        time.sleep(0.2)
+        assert fired == [True]
+
+        fired = []
+        timer = Timer(0.05, callback=lambda: fired.append(True))
+        timer.start()
+        timer.timeout = None
+        time.sleep(0.15)
+        assert fired == []
+
+    def test_callback_exception(self, caplog):
+        """Test an exception in the callback is logged."""
+        def callback():
+            raise ValueError()
+
+        timer = Timer(0.01, callback=callback)
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            timer.start()
+            time.sleep(0.1)
+
+        assert "Exception raised by a timer callback" in caplog.text
+
+    def test_restarts_single_entry(self):
+        """Test restarting a running timer doesn't add heap entries."""
+        scheduler = TimerScheduler()
+        timer = Timer(10)
+        timer.start()
+        for ii in range(100):
+            timer.restart()
+            scheduler.schedule(timer)
+
+        assert len(scheduler) == 1
+
+    def test_many_timers(self):
+        """Test many timers are called in deadline order."""
+        fired = []
+        timers = []
+        for ii in range(100):
+            timeout = 0.02 * (ii % 10)
+            timer = Timer(timeout, callback=lambda ii=ii: fired.append(ii))
+            timers.append(timer)
+            timer.start()
+
+        time.sleep(0.4)
+        assert sorted(fired) == list(range(100))
+        assert [ii % 10 for ii in fired] == sorted([ii % 10 for ii in fired])
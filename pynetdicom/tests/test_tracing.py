@@ -0,0 +1,318 @@
+"""Unit tests for the tracing module."""
+
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset
+
+from pynetdicom import AE, evt, debug_logger
+from pynetdicom.dsutils import encode
+from pynetdicom.sop_class import (
+    CTImageStorage, PatientRootQueryRetrieveInformationModelFind,
+    VerificationSOPClass
+)
+from pynetdicom.tracing import (
+    InMemoryExporter, Span, Tracer, current_span, start_span, traced
+)
+
+
+#debug_logger()
+
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), 'dicom_files')
+DATASET = dcmread(os.path.join(TEST_DS_DIR, 'CTImageStorage.dcm'))
+
+
+class TestTracer(object):
+    """Tests for Tracer, Span and InMemoryExporter."""
+    def setup(self):
+        self.exporter = InMemoryExporter()
+        self.tracer = Tracer(self.exporter)
+
+    def test_span(self):
+        """Test a span is started, ended and exported."""
+        span = self.tracer.start_span('some span', {'a' : 1})
+        assert isinstance(span, Span)
+        assert span.name == 'some span'
+        assert span.attributes == {'a' : 1}
+        assert span.parent is None
+        assert span.parent_id is None
+        assert span.status == 'UNSET'
+        assert span.duration is None
+        assert 'running' in str(span)
+        assert self.exporter.get_finished_spans() == []
+
+        span.set_attribute('b', 'c')
+        span.end()
+        span.end()
+        assert span.status == 'OK'
+        assert span.duration >= 0
+        assert span.attributes == {'a' : 1, 'b' : 'c'}
+        assert self.exporter.get_finished_spans() == [span]
+
+        self.exporter.clear()
+        assert self.exporter.get_finished_spans() == []
+
+    def test_context_manager(self):
+        """Test using a span as a context manager."""
+        assert current_span() is None
+        with self.tracer.start_span('parent') as parent:
+            assert current_span() is parent
+            with start_span(None, 'child') as child:
+                assert current_span() is child
+                assert child.tracer is self.tracer
+
+            assert current_span() is parent
+
+        assert current_span() is None
+        assert child.parent is parent
+        assert child.parent_id == parent.span_id
+        assert child.trace_id == parent.trace_id
+        spans = self.exporter.get_finished_spans()
+        assert spans == [child, parent]
+        assert self.exporter.get_finished_spans('child') == [child]
+
+    def test_exception(self):
+        """Test the span status if an exception is raised."""
+        with pytest.raises(ValueError):
+            with self.tracer.start_span('some span'):
+                raise ValueError('Some message')
+
+        span = self.exporter.get_finished_spans()[0]
+        assert span.status == 'ERROR'
+        assert span.attributes['exception.type'] == 'ValueError'
+        assert span.attributes['exception.message'] == 'Some message'
+        assert current_span() is None
+
+    def test_no_active_span(self):
+        """Test start_span() without a tracer or active span."""
+        with start_span(None, 'some span') as span:
+            span.set_attribute('a', 1)
+            assert current_span() is None
+
+        assert self.exporter.get_finished_spans() == []
+
+    def test_threads(self):
+        """Test the active span is per-thread."""
+        spans = []
+        def run():
+            spans.append(current_span())
+
+        with self.tracer.start_span('some span'):
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        assert spans == [None]
+
+    def test_exporter_exception(self, caplog):
+        """Test an exception in the exporter is logged."""
+        class Exporter(object):
+            def export(self, span):
+                raise ValueError()
+
+        tracer = Tracer(Exporter())
+        with caplog.at_level(logging.ERROR, logger='pynetdicom'):
+            tracer.start_span('some span').end()
+
+        assert "Exception raised by the span exporter" in caplog.text
+
+    def test_traced(self):
+        """Test the traced decorator."""
+        class Association(object):
+            def __init__(self, tracer):
+                self.ae = AE()
+                self.ae.tracer = tracer
+
+            @traced('Association.func')
+            def func(self):
+                with start_span(None, 'child'):
+                    return 1
+
+            @traced('Association.gen')
+            def gen(self):
+                for ii in range(3):
+                    with start_span(None, 'child'):
+                        pass
+                    yield ii
+
+        assoc = Association(None)
+        assert assoc.func() == 1
+        assert list(assoc.gen()) == [0, 1, 2]
+
+        assoc = Association(self.tracer)
+        assert assoc.func() == 1
+        spans = self.exporter.get_finished_spans()
+        assert [ss.name for ss in spans] == ['child', 'Association.func']
+        assert spans[0].parent is spans[1]
+
+        self.exporter.clear()
+        for ii in assoc.gen():
+            # The span shouldn't be active outside the generator
+            assert current_span() is None
+
+        spans = self.exporter.get_finished_spans()
+        assert [ss.name for ss in spans] == ['child'] * 3 + ['Association.gen']
+        assert all([ss.parent is spans[-1] for ss in spans[:3]])
+
+        # Closing the generator early ends the span
+        self.exporter.clear()
+        gen = assoc.gen()
+        next(gen)
+        gen.close()
+        spans = self.exporter.get_finished_spans('Association.gen')
+        assert len(spans) == 1
+
+    def test_traced_returns_generator(self):
+        """Test tracing a method that returns a generator."""
+        class Association(object):
+            def __init__(self, tracer):
+                self.ae = AE()
+                self.ae.tracer = tracer
+
+            def _responses(self):
+                for ii in range(3):
+                    with start_span(None, 'child'):
+                        pass
+                    yield ii
+
+            @traced('Association.func')
+            def func(self):
+                with start_span(None, 'request'):
+                    pass
+
+                return self._responses()
+
+        assoc = Association(None)
+        assert list(assoc.func()) == [0, 1, 2]
+
+        assoc = Association(self.tracer)
+        responses = assoc.func()
+        # The span stays open until the generator is exhausted
+        assert self.exporter.get_finished_spans('Association.func') == []
+        for ii in responses:
+            assert current_span() is None
+
+        spans = self.exporter.get_finished_spans()
+        assert [ss.name for ss in spans] == (
+            ['request'] + ['child'] * 3 + ['Association.func']
+        )
+        assert all([ss.parent is spans[-1] for ss in spans[:4]])
+
+
+class TestTracing(object):
+    """Tests for the traced operations."""
+    def setup(self):
+        self.ae = None
+        self.exporter = InMemoryExporter()
+
+    def teardown(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_default(self):
+        """Test tracing is disabled by default."""
+        assert AE().tracer is None
+
+    def test_c_echo(self):
+        """Test the spans recorded for a C-ECHO."""
+        self.ae = ae = AE()
+        ae.tracer = Tracer(self.exporter)
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.send_c_echo()
+        assoc.release()
+        scp.shutdown()
+
+        get_spans = self.exporter.get_finished_spans
+        assert len(get_spans('ACSE.negotiate_association')) == 2
+
+        echo = get_spans('Association.send_c_echo')
+        assert len(echo) == 1
+        children = [ss for ss in get_spans() if ss.parent is echo[0]]
+        assert 'DIMSEServiceProvider.send_msg' in [ss.name for ss in children]
+
+        scp_spans = get_spans('ServiceClass.SCP')
+        assert len(scp_spans) == 1
+        assert scp_spans[0].attributes['service_class'] == (
+            'VerificationServiceClass'
+        )
+        handlers = get_spans('handler.EVT_C_ECHO')
+        assert len(handlers) == 1
+        assert handlers[0].parent is scp_spans[0]
+
+        assert len(get_spans('DIMSEServiceProvider.receive_primitive')) >= 2
+
+    def test_c_store(self):
+        """Test dataset encoding and decoding spans."""
+        def handle(event):
+            event.dataset
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.tracer = Tracer(self.exporter)
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_STORE, handle)]
+        )
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        scp.shutdown()
+
+        get_spans = self.exporter.get_finished_spans
+        store = get_spans('Association.send_c_store')[0]
+        encodes = [ss for ss in get_spans('dsutils.encode')]
+        assert store in [ss.parent for ss in encodes]
+
+        handler = get_spans('handler.EVT_C_STORE')[0]
+        decodes = [ss for ss in get_spans('dsutils.decode')]
+        assert handler in [ss.parent for ss in decodes]
+
+    def test_c_find(self):
+        """Test tracing a generator operation."""
+        def handle(event):
+            time.sleep(0.2)
+            yield 0xFF00, event.identifier
+            yield 0x0000, None
+
+        self.ae = ae = AE()
+        ae.tracer = Tracer(self.exporter)
+        model = PatientRootQueryRetrieveInformationModelFind
+        ae.add_supported_context(model)
+        ae.add_requested_context(model)
+        scp = ae.start_server(
+            ('', 11112), block=False, evt_handlers=[(evt.EVT_C_FIND, handle)]
+        )
+
+        ds = Dataset()
+        ds.QueryRetrieveLevel = 'PATIENT'
+        ds.PatientName = '*'
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        responses = list(assoc.send_c_find(ds, query_model='P'))
+        assert len(responses) == 2
+        assoc.release()
+        scp.shutdown()
+
+        spans = self.exporter.get_finished_spans('Association.send_c_find')
+        assert len(spans) == 1
+        assert spans[0].status == 'OK'
+        # The span covers waiting for and decoding the responses
+        assert spans[0].duration >= 0.2
+        decodes = self.exporter.get_finished_spans('dsutils.decode')
+        assert spans[0] in [ss.parent for ss in decodes]
@@ -18,14 +18,17 @@ import time
 import pytest
 
 from pynetdicom import AE, evt, _config
-from pynetdicom.association import Association
+from pynetdicom.association import Association, AssociationRegistry
 from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR, MODE_ACCEPTOR
 from pynetdicom.transport import (
-    AssociationSocket, AssociationServer, ThreadedAssociationServer
+    AdmissionControl, AssociationSocket, AssociationServer, _is_readable,
+    ThreadedAssociationServer, WorkerPool
 )
 from pynetdicom.sop_class import VerificationSOPClass
 
+from .encoded_pdu_items import a_associate_rq
+
 
 # This is the directory that contains test data
 TEST_ROOT = os.path.abspath(os.path.dirname(__file__))
@@ -147,6 +150,21 @@ class TestAssociationSocket(object):
         assert sock.__str__() == sock.socket.__str__()
 
 
+def test_is_readable():
+    """Test _is_readable()."""
+    sock_a, sock_b = socket.socketpair()
+    assert not _is_readable(sock_a, 0)
+    sock_b.sendall(b'\x00')
+    assert _is_readable(sock_a, 0.5)
+    assert b'\x00' == sock_a.recv(1)
+    assert not _is_readable(sock_a, 0)
+
+    sock_a.close()
+    sock_b.close()
+    with pytest.raises((socket.error, ValueError)):
+        _is_readable(sock_a, 0)
+
+
 @pytest.fixture
 def server_context(request):
     """Return a good server SSLContext."""
@@ -286,6 +304,93 @@ class TestAssociationServer(object):
 
         scp.shutdown()
 
+    def test_request_queue_size(self):
+        """Test setting the listen backlog."""
+        self.ae = ae = AE()
+        ae.add_supported_context('1.2.840.10008.1.1')
+        ae.add_requested_context('1.2.840.10008.1.1')
+        scp = ae.start_server(('', 11112), block=False)
+        assert 5 == scp.request_queue_size
+        scp.shutdown()
+
+        scp = ae.start_server(
+            ('', 11112), block=False, request_queue_size=128
+        )
+        assert 128 == scp.request_queue_size
+        assert 5 == AssociationServer.request_queue_size
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        assoc.release()
+        scp.shutdown()
+
+    def test_shared_supported_contexts(self):
+        """Test acceptors share the supported contexts until modified."""
+        self.ae = ae = AE()
+        ae.add_supported_context('1.2.840.10008.1.1')
+        ae.add_requested_context('1.2.840.10008.1.1')
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc_a = ae.associate('localhost', 11112)
+        assoc_b = ae.associate('localhost', 11112)
+        assert assoc_a.is_established and assoc_b.is_established
+        time.sleep(0.1)
+
+        acc_a, acc_b = [a.acceptor for a in scp.active_associations]
+        shared = acc_a._get_shared_contexts()
+        assert shared is acc_b._get_shared_contexts()
+        assert shared is not ae.supported_contexts
+        assert shared == ae.supported_contexts
+
+        # Copied on access
+        contexts = acc_a.supported_contexts
+        assert contexts is not shared
+        assert shared is acc_b._get_shared_contexts()
+
+        assoc_a.release()
+        assoc_b.release()
+
+        # Changed contexts get a new copy
+        ae.add_supported_context('1.2.840.10008.1.1', '1.2.840.10008.1.2.4.50')
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+        acceptor = scp.active_associations[0].acceptor
+        assert acceptor._get_shared_contexts() is not shared
+        assert acceptor._get_shared_contexts() == ae.supported_contexts
+        assoc.release()
+
+        scp.shutdown()
+
+    def test_tls_handshake_not_blocking(self, server_context):
+        """Test a client that doesn't handshake doesn't block the server."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context('1.2.840.10008.1.1')
+        ae.add_requested_context('1.2.840.10008.1.1')
+        scp = ae.start_server(
+            ('', 11112), block=False, ssl_context=server_context
+        )
+
+        context = ssl.create_default_context(
+            ssl.Purpose.SERVER_AUTH, cafile=SERVER_CERT
+        )
+        context.check_hostname = False
+        context.options |= getattr(ssl, 'OP_NO_TLSv1_3', 0)
+        context.load_cert_chain(certfile=CLIENT_CERT, keyfile=CLIENT_KEY)
+
+        # Connects but never starts the TLS handshake
+        slow = socket.create_connection(('localhost', 11112))
+        time.sleep(0.1)
+
+        assoc = ae.associate('localhost', 11112, tls_args=(context, None))
+        assert assoc.is_established
+        assoc.release()
+        assert assoc.is_released
+
+        slow.close()
+        scp.shutdown()
+
     def test_init_handlers(self):
         """Test AssociationServer.__init__()."""
         def handle(event):
@@ -398,6 +503,8 @@ class TestAssociationServer(object):
         class DummyAE(object):
             network_timeout = 5
             _servers = []
+            _admission = AdmissionControl(AE())
+            registry = AssociationRegistry()
 
         dummy = DummyAE()
         server = ThreadedAssociationServer(dummy, ('', 11112))
@@ -421,6 +528,270 @@ class TestAssociationServer(object):
             assert server.socket.fileno() == -1
 
 
+class TestAdmissionControl(object):
+    """Tests for the admission control of association requests."""
+    def setup(self):
+        self.ae = None
+
+    def teardown(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def _associate(self, ae_title=b'PYNETDICOM'):
+        """Return an association requested using `ae_title`."""
+        ae = AE(ae_title=ae_title)
+        ae.acse_timeout = 5
+        ae.add_requested_context(VerificationSOPClass)
+        return ae.associate('localhost', 11112)
+
+    def test_defaults(self):
+        """Test the AE's admission control settings."""
+        self.ae = ae = AE()
+        assert ae.maximum_associations_per_ae is None
+        assert ae.admission_queue_size == 10
+        assert ae.admission_timeout is None
+        assert ae.priority_ae_titles == []
+        assert ae.reserved_associations == 0
+
+        ae.maximum_associations_per_ae = 0
+        assert ae.maximum_associations_per_ae is None
+        ae.admission_queue_size = -1
+        assert ae.admission_queue_size == 10
+        ae.admission_timeout = -1
+        assert ae.admission_timeout is None
+        ae.reserved_associations = 'a'
+        assert ae.reserved_associations == 0
+        ae.priority_ae_titles = [b'  PRIORITY']
+        assert ae.priority_ae_titles == [b'PRIORITY        ']
+
+    def test_global_limit(self):
+        """Test requests over the limit are rejected without a thread."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 1
+        ae.metrics.enabled = True
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = self._associate()
+        assert assoc.is_established
+        assoc_2 = self._associate()
+        assert assoc_2.is_rejected
+        assert assoc_2.acceptor.primitive.result == 0x02
+        assert assoc_2.acceptor.primitive.result_source == 0x03
+        assert assoc_2.acceptor.primitive.diagnostic == 0x02
+        # Only the requestor's threads were started
+        assert len(scp.active_associations) == 1
+        assert ae._admission.nr_admitted == 1
+        assert ae.metrics.associations_rejected.value('PYNETDICOM') == 0
+        assert ae.metrics.associations_rejected.value('') == 1
+
+        assoc.release()
+        assert assoc.is_released
+        time.sleep(0.1)
+        assert ae._admission.nr_admitted == 0
+        assoc = self._associate()
+        assert assoc.is_established
+        assoc.release()
+        scp.shutdown()
+
+    def test_per_ae_limit(self):
+        """Test the limit on associations with the same calling AE title."""
+        self.ae = ae = AE()
+        ae.maximum_associations_per_ae = 1
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = self._associate(b'MODALITY1')
+        assert assoc.is_established
+        assert self._associate(b'MODALITY1').is_rejected
+        assoc_2 = self._associate(b'MODALITY2')
+        assert assoc_2.is_established
+        assoc.release()
+        assoc_2.release()
+        scp.shutdown()
+
+    def test_slow_peer(self):
+        """Test a peer slow to send its AE title doesn't delay others."""
+        self.ae = ae = AE()
+        ae.maximum_associations_per_ae = 1
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        sock = socket.create_connection(('localhost', 11112))
+        time.sleep(0.1)
+        assert ae._admission._poller.nr_pending == 1
+        start = time.time()
+        assoc = self._associate(b'MODALITY1')
+        assert assoc.is_established
+        assert time.time() - start < 0.4
+        assoc.release()
+        sock.close()
+        scp.shutdown()
+
+    def test_reject_non_blocking(self):
+        """Test rejecting a request doesn't wait for the peer."""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        request, peer = socket.socketpair()
+        peer.settimeout(5)
+        start = time.time()
+        ae._admission._reject(scp, request, None)
+        assert time.time() - start < 0.1
+        # Replied to once the wait for the A-ASSOCIATE-RQ times out
+        assert peer.recv(10)[:1] == b'\x03'
+        assert time.time() - start >= 0.4
+        peer.close()
+        scp.shutdown()
+
+    def test_reserved(self):
+        """Test associations reserved for priority AE titles."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 2
+        ae.reserved_associations = 1
+        ae.priority_ae_titles = [b'PRIORITY']
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = self._associate(b'MODALITY1')
+        assert assoc.is_established
+        assert self._associate(b'MODALITY2').is_rejected
+        assoc_2 = self._associate(b'PRIORITY')
+        assert assoc_2.is_established
+        assert self._associate(b'PRIORITY').is_rejected
+        assoc.release()
+        assoc_2.release()
+        scp.shutdown()
+
+    def test_wait(self):
+        """Test requests wait for an association to end."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 1
+        ae.admission_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = self._associate()
+        assert assoc.is_established
+        timer = threading.Timer(0.5, assoc.release)
+        timer.start()
+        start = time.time()
+        assoc_2 = self._associate()
+        assert assoc_2.is_established
+        assert time.time() - start >= 0.4
+        timer.join()
+        assoc_2.release()
+        scp.shutdown()
+
+    def test_wait_timeout(self):
+        """Test waiting requests are rejected once timed out."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 1
+        ae.admission_timeout = 0.2
+        ae.admission_queue_size = 1
+        ae.add_supported_context(VerificationSOPClass)
+        scp = ae.start_server(('', 11112), block=False)
+
+        assoc = self._associate()
+        assert assoc.is_established
+        start = time.time()
+        assert self._associate().is_rejected
+        assert time.time() - start >= 0.2
+        assert ae._admission.nr_waiting == 0
+
+        ae.admission_queue_size = 0
+        start = time.time()
+        assert self._associate().is_rejected
+        assert time.time() - start < 0.2
+
+        assoc.release()
+        scp.shutdown()
+
+
+class TestWorkerPool(object):
+    """Tests for processing requests with a pool of worker threads."""
+    def setup(self):
+        self.ae = None
+
+    def teardown(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_workers(self):
+        """Test associations are run by the pre-started workers."""
+        self.ae = ae = AE()
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(
+            ('', 11112), block=False, worker_threads=2,
+            thread_stack_size=256 * 1024
+        )
+        pool = scp._pool
+        assert isinstance(pool, WorkerPool)
+        assert 2 == len(pool.workers)
+        assert all([t.is_alive() for t in pool.workers])
+        assert 2 == pool.nr_idle
+        assert 0 == pool.nr_waiting
+
+        for ii in range(3):
+            assoc = ae.associate('localhost', 11112)
+            assert assoc.is_established
+            assert 1 == len(scp.active_associations)
+            # The acceptor is run by a worker, not its own thread
+            child = scp.active_associations[0]
+            assert child.ident is None
+            assert child.is_alive()
+            assert 0x0000 == assoc.send_c_echo().Status
+            assoc.release()
+            assert assoc.is_released
+            child.join(5)
+            assert not child.is_alive()
+
+        time.sleep(0.1)
+        assert 2 == pool.nr_idle
+        assert 0 == len(scp.active_associations)
+        assert 0 == threading.stack_size()
+
+        scp.shutdown()
+        time.sleep(0.1)
+        assert not any([t.is_alive() for t in pool.workers])
+
+    def test_queue_full(self):
+        """Test requests are rejected when no worker is available."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.add_supported_context(VerificationSOPClass)
+        ae.add_requested_context(VerificationSOPClass)
+        scp = ae.start_server(
+            ('', 11112), block=False, worker_threads=1, worker_queue_size=1
+        )
+
+        assoc = ae.associate('localhost', 11112)
+        assert assoc.is_established
+
+        # Waits in the queue for the busy worker
+        sock = socket.create_connection(('localhost', 11112))
+        sock.sendall(a_associate_rq)
+        time.sleep(0.1)
+        assert 1 == scp._pool.nr_waiting
+
+        assoc_2 = ae.associate('localhost', 11112)
+        assert assoc_2.is_rejected
+        assert assoc_2.acceptor.primitive.result_source == 0x03
+        assert assoc_2.acceptor.primitive.diagnostic == 0x02
+
+        # The waiting request is processed once the worker is free
+        assoc.release()
+        assert assoc.is_released
+        sock.settimeout(5)
+        assert b'\x02' == sock.recv(1)
+        assert 0 == scp._pool.nr_waiting
+        sock.close()
+
+        scp.shutdown()
+
+
 class TestEventHandlingAcceptor(object):
     """Test the transport events and handling as acceptor."""
     def setup(self):
@@ -11,7 +11,7 @@ import pytest
 
 from pydicom.uid import UID
 
-from pynetdicom import _config
+from pynetdicom import _config, utils
 from pynetdicom.utils import validate_ae_title, pretty_bytes, validate_uid
 from .encoded_pdu_items import a_associate_rq
 
@@ -101,6 +101,19 @@ class TestValidateAETitle(object):
         with pytest.raises((TypeError, ValueError)):
             validate_ae_title(aet)
 
+    def test_cached(self):
+        """Test the validated AE titles are cached."""
+        utils._VALID_AE_TITLES.clear()
+        assert validate_ae_title('  CACHED') == b'CACHED          '
+        assert utils._VALID_AE_TITLES == {'  CACHED': b'CACHED          '}
+        assert validate_ae_title('  CACHED') == b'CACHED          '
+
+        # Invalid AE titles aren't cached
+        with pytest.raises(ValueError):
+            validate_ae_title('  ')
+
+        assert len(utils._VALID_AE_TITLES) == 1
+
 
 REFERENCE_UID = [
     # UID, (enforced, non-enforced conformance)
@@ -137,6 +150,31 @@ class TestValidateUID(object):
         _config.ENFORCE_UID_CONFORMANCE = False
         assert validate_uid(UID(uid)) == is_valid[1]
 
+    def test_cached(self):
+        """Test the results are cached for each conformance setting."""
+        utils._VALID_UIDS.clear()
+        _config.ENFORCE_UID_CONFORMANCE = False
+        assert validate_uid(UID('0.1.2.04'))
+        assert utils._VALID_UIDS == {('0.1.2.04', False): True}
+
+        _config.ENFORCE_UID_CONFORMANCE = True
+        assert not validate_uid(UID('0.1.2.04'))
+        assert utils._VALID_UIDS[('0.1.2.04', True)] is False
+
+        _config.ENFORCE_UID_CONFORMANCE = False
+        assert validate_uid(UID('0.1.2.04'))
+
+    def test_cache_size(self, monkeypatch):
+        """Test the cache is cleared when full."""
+        monkeypatch.setattr(utils, '_MAX_CACHED_RESULTS', 2)
+        utils._VALID_UIDS.clear()
+        for uid in ['1.2.1', '1.2.2', '1.2.3']:
+            assert validate_uid(UID(uid))
+
+        assert list(utils._VALID_UIDS) == [
+            ('1.2.3', _config.ENFORCE_UID_CONFORMANCE)
+        ]
+
 
 class TestWrapList(object):
     """Test pretty_bytes() function"""
@@ -1,8 +1,16 @@
 """
 A generic timer class suitable for use as the DICOM UL's ARTIM timer.
 """
+import heapq
+import itertools
 import logging
-import time
+import threading
+try:
+    from time import monotonic as _clock
+except ImportError:
+    # Python 2 compatibility
+    from time import time as _clock
+import weakref
 
 
 LOGGER = logging.getLogger('pynetdicom.artim')
@@ -30,12 +38,17 @@ class Timer(object):
       then returns True. `remaining` always returns the number of seconds
       until `expired` returns True.
 
+    If a `callback` is used then the timer's expiry is scheduled with the
+    process-wide ``TimerScheduler`` and `callback` will be called (from the
+    scheduler's thread) once each time the running timer expires. This
+    avoids the need to repeatedly check `expired`.
+
     References
     ----------
 
     * DICOM Standard, Part 8, Section 9.1.5.
     """
-    def __init__(self, timeout):
+    def __init__(self, timeout, callback=None):
         """Create a new Timer.
 
         Parameters
@@ -43,11 +56,28 @@ class Timer(object):
         timeout : numeric or None
             The number of seconds before the timer expires. A value of None
             means the timer never expires.
+        callback : callable, optional
+            A callable taking no arguments to be called when the running
+            timer expires.
         """
         self._start_time = None
         self._end_time = None
+        self._callback = callback
+        # The deadline the timer is currently scheduled for (or None)
+        self._scheduled = None
         self.timeout = timeout
 
+    @property
+    def deadline(self):
+        """Return the clock time when a running timer expires (or None)."""
+        if self._timeout is None or self._start_time is None:
+            return None
+
+        if self._end_time is not None:
+            return None
+
+        return self._start_time + self._timeout
+
     @property
     def expired(self):
         """Check if the timer has expired.
@@ -87,7 +117,7 @@ class Timer(object):
 
         # Timer has started and hasn't been stopped
         if self._end_time is None:
-            return self.timeout - (time.time() - self._start_time)
+            return self.timeout - (_clock() - self._start_time)
 
         # Time has been start and been stopped
         return self.timeout - (self._end_time - self._start_time)
@@ -98,12 +128,15 @@ class Timer(object):
 
     def start(self):
         """Resets and starts the timer running."""
-        self._start_time = time.time()
+        self._start_time = _clock()
         self._end_time = None
+        if self._callback is not None:
+            SCHEDULER.schedule(self)
 
     def stop(self):
         """Stops the timer and resets it."""
-        self._end_time = time.time()
+        # Any scheduled expiry is discarded by the scheduler when due
+        self._end_time = _clock()
 
     @property
     def timeout(self):
@@ -122,3 +155,111 @@ class Timer(object):
         """
         # pylint: disable=attribute-defined-outside-init
         self._timeout = value
+        if self._callback is not None and self.deadline is not None:
+            SCHEDULER.schedule(self)
+
+
+class TimerScheduler(object):
+    """Call the callbacks of expired timers from a single shared thread.
+
+    Running timers are kept in a heap ordered by their deadlines so the cost
+    of waiting is independent of the number of timers. Each timer has at
+    most one entry in the heap: restarting a running timer only moves its
+    deadline later, so the existing entry is kept and the timer rescheduled
+    when the entry becomes due. Entries for stopped timers are discarded
+    when they become due.
+
+    The scheduler thread is started the first time a timer is scheduled.
+    """
+    def __init__(self):
+        """Create a new TimerScheduler."""
+        self._heap = []
+        self._lock = threading.Condition()
+        # Tie-breaker for timers with the same deadline
+        self._counter = itertools.count()
+        self._thread = None
+
+    def __len__(self):
+        """Return the number of entries in the heap."""
+        with self._lock:
+            return len(self._heap)
+
+    def _push(self, deadline, timer):
+        """Add an entry for `timer` to the heap, must hold the lock."""
+        timer._scheduled = deadline
+        entry = (deadline, next(self._counter), weakref.ref(timer))
+        heapq.heappush(self._heap, entry)
+        # Wake the scheduler thread if the new entry is now the first due
+        if self._heap[0] is entry:
+            self._lock.notify()
+
+    def _run(self):
+        """Run the scheduler loop."""
+        # pylint: disable=broad-except
+        while True:
+            expired = []
+            with self._lock:
+                while not self._heap:
+                    self._lock.wait()
+
+                deadline, _, ref = self._heap[0]
+                now = _clock()
+                if deadline > now:
+                    self._lock.wait(deadline - now)
+                    continue
+
+                heapq.heappop(self._heap)
+                timer = ref()
+                # Discard entries for deleted timers and entries that have
+                #   been replaced by an earlier one
+                if timer is None or timer._scheduled != deadline:
+                    continue
+
+                timer._scheduled = None
+                current = timer.deadline
+                if current is None:
+                    # Stopped or never expires
+                    continue
+
+                if current > now:
+                    # Restarted since the entry was added
+                    self._push(current, timer)
+                    continue
+
+                expired.append(timer)
+
+            for timer in expired:
+                try:
+                    timer._callback()
+                except Exception as exc:
+                    LOGGER.error("Exception raised by a timer callback")
+                    LOGGER.exception(exc)
+
+    def schedule(self, timer):
+        """Schedule the expiry of a running `timer`.
+
+        Parameters
+        ----------
+        timer : timer.Timer
+            The timer to schedule.
+        """
+        deadline = timer.deadline
+        if deadline is None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='TimerScheduler'
+                )
+                self._thread.daemon = True
+                self._thread.start()
+
+            # An existing entry that's due later must be replaced so the
+            #   timer doesn't expire late
+            if timer._scheduled is None or deadline < timer._scheduled:
+                self._push(deadline, timer)
+
+
+# The process-wide scheduler used by timers with callbacks
+SCHEDULER = TimerScheduler()
@@ -0,0 +1,421 @@
+"""Tracing of association, DIMSE and dataset operations using spans.
+
+The interface is similar in shape to that of OpenTelemetry, a ``Tracer``
+creates ``Span`` instances which are passed to an exporter once they have
+ended, but has no dependencies. Spans started while another span is active
+in the same thread become that span's children.
+"""
+
+from functools import wraps
+import inspect
+import logging
+import random
+import threading
+import time
+
+
+LOGGER = logging.getLogger('pynetdicom.tracing')
+
+# Thread-local stack of the active spans
+_LOCAL = threading.local()
+
+
+def _active_spans():
+    """Return the current thread's stack of active spans as list."""
+    try:
+        return _LOCAL.spans
+    except AttributeError:
+        _LOCAL.spans = []
+        return _LOCAL.spans
+
+
+def current_span():
+    """Return the active span for the current thread.
+
+    Returns
+    -------
+    tracing.Span or None
+        The most recently activated span in the current thread that hasn't
+        yet ended, or ``None`` if there's no active span.
+    """
+    spans = _active_spans()
+    return spans[-1] if spans else None
+
+
+class Span(object):
+    """A single timed operation.
+
+    Attributes
+    ----------
+    attributes : dict
+        The span's attributes as {str : str or int or float or bool}.
+    end_time : float or None
+        The time the span ended (in seconds since the epoch) or ``None`` if
+        the span hasn't yet ended.
+    name : str
+        The name of the operation.
+    parent : tracing.Span or None
+        The parent span, or ``None`` if this is the root span.
+    span_id : int
+        The 64-bit ID of the span.
+    start_time : float
+        The time the span started (in seconds since the epoch).
+    status : str
+        The status of the span, one of ``'UNSET'``, ``'OK'`` or ``'ERROR'``.
+    trace_id : int
+        The 128-bit ID of the trace the span belongs to.
+    tracer : tracing.Tracer
+        The tracer the span belongs to.
+    """
+    def __init__(self, tracer, name, parent=None, attributes=None):
+        """Create and start a new Span.
+
+        Parameters
+        ----------
+        tracer : tracing.Tracer
+            The tracer the span belongs to.
+        name : str
+            The name of the operation.
+        parent : tracing.Span, optional
+            The parent span.
+        attributes : dict, optional
+            The span's initial attributes.
+        """
+        self.tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.span_id = random.getrandbits(64)
+        if parent is None:
+            self.trace_id = random.getrandbits(128)
+        else:
+            self.trace_id = parent.trace_id
+
+        self.status = 'UNSET'
+        self.start_time = time.time()
+        self.end_time = None
+
+    def __enter__(self):
+        """Activate the span for the current thread."""
+        _active_spans().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deactivate and end the span."""
+        self._deactivate()
+        if exc_type is not None:
+            self.record_exception(exc_value)
+
+        self.end()
+
+    def _deactivate(self):
+        """Remove the span from the current thread's active spans."""
+        spans = _active_spans()
+        if self in spans:
+            spans.remove(self)
+
+    @property
+    def duration(self):
+        """Return the duration of the span in seconds (or ``None``)."""
+        if self.end_time is None:
+            return None
+
+        return self.end_time - self.start_time
+
+    def end(self):
+        """End the span and pass it to the tracer's exporter.
+
+        Ending a span more than once has no effect.
+        """
+        if self.end_time is not None:
+            return
+
+        self.end_time = time.time()
+        if self.status == 'UNSET':
+            self.status = 'OK'
+
+        self.tracer.export(self)
+
+    @property
+    def parent_id(self):
+        """Return the ID of the parent span as int (or ``None``)."""
+        if self.parent is None:
+            return None
+
+        return self.parent.span_id
+
+    def record_exception(self, exc):
+        """Mark the span as failed due to the exception `exc`."""
+        self.status = 'ERROR'
+        self.attributes['exception.type'] = exc.__class__.__name__
+        self.attributes['exception.message'] = str(exc)
+
+    def set_attribute(self, key, value):
+        """Set the attribute `key` to `value`."""
+        self.attributes[key] = value
+
+    def __str__(self):
+        """Return a string representation of the span."""
+        if self.duration is None:
+            return "Span '{}' (running)".format(self.name)
+
+        return "Span '{}' ({:.6f} s, {})".format(
+            self.name, self.duration, self.status
+        )
+
+
+class Tracer(object):
+    """Create spans and pass them to an exporter once ended.
+
+    Examples
+    --------
+
+    >>> from pynetdicom import AE
+    >>> from pynetdicom.tracing import InMemoryExporter, Tracer
+    >>> exporter = InMemoryExporter()
+    >>> ae = AE()
+    >>> ae.tracer = Tracer(exporter)
+
+    Attributes
+    ----------
+    exporter : object or None
+        The exporter the ended spans are passed to, must have an
+        ``export(span)`` method. If ``None`` then ended spans are discarded.
+    """
+    def __init__(self, exporter=None):
+        """Create a new Tracer.
+
+        Parameters
+        ----------
+        exporter : object, optional
+            The exporter the ended spans will be passed to, must have an
+            ``export(span)`` method.
+        """
+        self.exporter = exporter
+
+    def export(self, span):
+        """Pass the ended `span` to the exporter."""
+        if self.exporter is None:
+            return
+
+        # pylint: disable=broad-except
+        try:
+            self.exporter.export(span)
+        except Exception as exc:
+            LOGGER.error("Exception raised by the span exporter")
+            LOGGER.exception(exc)
+
+    def start_span(self, name, attributes=None, parent=None):
+        """Return a new span.
+
+        The span isn't activated, use it as a context manager to make it
+        active for the current thread and end it on exit.
+
+        Parameters
+        ----------
+        name : str
+            The name of the operation.
+        attributes : dict, optional
+            The span's initial attributes.
+        parent : tracing.Span, optional
+            The parent span, if not used then the current thread's active
+            span will be the parent.
+
+        Returns
+        -------
+        tracing.Span
+            The new span.
+        """
+        if parent is None:
+            parent = current_span()
+
+        return Span(self, name, parent, attributes)
+
+
+class InMemoryExporter(object):
+    """A span exporter that keeps the ended spans in memory.
+
+    Intended for use with tests and benchmarks.
+    """
+    def __init__(self):
+        """Create a new InMemoryExporter."""
+        self._lock = threading.Lock()
+        self._spans = []
+
+    def clear(self):
+        """Remove all the exported spans."""
+        with self._lock:
+            self._spans = []
+
+    def export(self, span):
+        """Add the ended `span`."""
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self, name=None):
+        """Return the exported spans.
+
+        Parameters
+        ----------
+        name : str, optional
+            If used then only return the spans with a matching name.
+
+        Returns
+        -------
+        list of tracing.Span
+            The exported spans, in the order they ended.
+        """
+        with self._lock:
+            spans = list(self._spans)
+
+        if name is None:
+            return spans
+
+        return [span for span in spans if span.name == name]
+
+
+class _NoOpSpan(object):
+    """A span that records nothing, used when tracing isn't active."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def set_attribute(self, key, value):
+        """Do nothing."""
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+def start_span(tracer, name, attributes=None):
+    """Return a context manager for a new span.
+
+    Parameters
+    ----------
+    tracer : tracing.Tracer or None
+        The tracer to use to start the span. If ``None`` then the span will
+        be created using the tracer of the current thread's active span,
+        and if there's no active span then nothing will be recorded.
+    name : str
+        The name of the operation.
+    attributes : dict, optional
+        The span's initial attributes.
+
+    Returns
+    -------
+    tracing.Span or a no-op equivalent
+        The span to use as a context manager.
+    """
+    if tracer is None:
+        parent = current_span()
+        if parent is None:
+            return _NO_OP_SPAN
+
+        tracer = parent.tracer
+
+    return tracer.start_span(name, attributes)
+
+
+def _tracer_for(obj):
+    """Return the tracer for the AE that owns `obj` (or ``None``)."""
+    # Association instances have `ae`, the service providers and
+    #   service classes have `assoc`
+    try:
+        ae = obj.ae
+    except AttributeError:
+        ae = obj.assoc.ae
+
+    return ae.tracer
+
+
+def traced(name):
+    """Return a decorator that traces a method of an Association, service
+    provider or service class using the AE's tracer.
+
+    Generator methods are supported, in which case the span is active only
+    while the generator is running and ends once it's exhausted or closed.
+    If a method returns a generator, such as ``Association.send_c_find()``,
+    then the span is kept open until the returned generator is exhausted or
+    closed so it covers waiting for and decoding the peer's responses.
+
+    Parameters
+    ----------
+    name : str
+        The name of the span.
+    """
+    def decorator(func):
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def gen_wrapper(self, *args, **kwargs):
+                gen = func(self, *args, **kwargs)
+                span = start_span(_tracer_for(self), name)
+                if span is not _NO_OP_SPAN:
+                    gen = _trace_generator(span, gen)
+
+                try:
+                    for item in gen:
+                        yield item
+                finally:
+                    gen.close()
+
+            return gen_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            span = start_span(_tracer_for(self), name)
+            if span is _NO_OP_SPAN:
+                return func(self, *args, **kwargs)
+
+            with _Activated(span):
+                try:
+                    result = func(self, *args, **kwargs)
+                except Exception as exc:
+                    span.record_exception(exc)
+                    span.end()
+                    raise
+
+            if inspect.isgenerator(result):
+                return _trace_generator(span, result)
+
+            span.end()
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _trace_generator(span, gen):
+    """Yield the items from `gen` with `span` active while it's running.
+
+    The span ends once `gen` is exhausted or closed.
+    """
+    try:
+        while True:
+            with _Activated(span):
+                try:
+                    item = next(gen)
+                except StopIteration:
+                    break
+
+            yield item
+    except Exception as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        span.end()
+
+
+class _Activated(object):
+    """Activate a span without ending it on exit."""
+    def __init__(self, span):
+        self.span = span
+
+    def __enter__(self):
+        _active_spans().append(self.span)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.span._deactivate()
@@ -1,6 +1,7 @@
 """Implementation of the Transport Service."""
 
-from copy import deepcopy
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 import logging
 import select
@@ -12,6 +13,12 @@ except ImportError:
 import ssl
 from struct import pack
 import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue  # Python 2 compatibility
 
 from pynetdicom import evt, _config
 from pynetdicom._globals import MODE_ACCEPTOR
@@ -19,10 +26,669 @@ from pynetdicom._handlers import (
     standard_dimse_recv_handler, standard_dimse_sent_handler,
     standard_pdu_recv_handler, standard_pdu_sent_handler,
 )
+from pynetdicom.pdu import A_ASSOCIATE_RJ
+from pynetdicom.timer import Timer
 
 
 LOGGER = logging.getLogger('pynetdicom.transport')
 
+# threading.stack_size() is process-wide, so only change it under the lock
+_STACK_SIZE_LOCK = threading.Lock()
+
+
+def _is_readable(sock, timeout):
+    """Return ``True`` if `sock` has data to be read within `timeout`
+    seconds.
+
+    ``select.poll()`` is used where available as, unlike ``select.select()``,
+    it isn't limited to file descriptors below ``FD_SETSIZE`` (usually 1024).
+
+    Raises
+    ------
+    socket.error or ValueError
+        If `sock` is closed or otherwise not a valid socket.
+    """
+    if not hasattr(select, 'poll'):
+        ready, _, _ = select.select([sock], [], [], timeout)
+        return bool(ready)
+
+    poller = select.poll()
+    poller.register(sock, select.POLLIN)
+    events = poller.poll(int(timeout * 1000))
+    if events and events[0][1] & select.POLLNVAL:
+        raise ValueError("Invalid file descriptor")
+
+    return bool(events)
+
+
+def _wait_readable(socks, timeout=None):
+    """Block until any of `socks` has data to be read or `timeout` seconds
+    have passed.
+
+    Parameters
+    ----------
+    socks : list of socket.socket
+        The sockets to wait on, may be any object with a ``fileno()``
+        method.
+    timeout : float or None, optional
+        The maximum number of seconds to wait for, default ``None`` to wait
+        indefinitely.
+
+    Returns
+    -------
+    list
+        The items in `socks` that have data to be read.
+
+    Raises
+    ------
+    socket.error, select.error or ValueError
+        If any of `socks` is closed or otherwise not a valid socket.
+    """
+    if not hasattr(select, 'poll'):
+        ready, _, _ = select.select(socks, [], [], timeout)
+        return ready
+
+    poller = select.poll()
+    fds = {}
+    for sock in socks:
+        fds[sock.fileno()] = sock
+        poller.register(sock, select.POLLIN)
+
+    if timeout is not None:
+        timeout = int(timeout * 1000)
+
+    ready = []
+    for fd, flags in poller.poll(timeout):
+        if flags & select.POLLNVAL:
+            raise ValueError("Invalid file descriptor")
+
+        ready.append(fds[fd])
+
+    return ready
+
+
+class _Waker(object):
+    """Wakes a thread while it's waiting for a socket to become readable.
+
+    A connected pair of sockets is used so the thread can wait on the waker
+    and its other sockets at the same time. If ``socket.socketpair()`` isn't
+    available then `is_available` is False and the thread must check for
+    something to do at regular intervals instead.
+    """
+    def __init__(self):
+        """Create a new _Waker."""
+        self._lock = threading.Lock()
+        self._is_set = False
+        # Not created until the waiting thread is started
+        self._recv = self._send = None
+
+    def clear(self):
+        """Clear the waker so the next wait blocks."""
+        with self._lock:
+            if self._is_set and self._recv is not None:
+                try:
+                    self._recv.recv(16)
+                except socket.error:
+                    pass
+
+            self._is_set = False
+
+    def close(self):
+        """Close the waker's sockets, further use is ignored."""
+        with self._lock:
+            for sock in (self._recv, self._send):
+                if sock is not None:
+                    sock.close()
+
+            self._recv = self._send = None
+
+    def fileno(self):
+        """Return the file descriptor to wait on."""
+        return self._recv.fileno()
+
+    @property
+    def is_available(self):
+        """Return True if the waker can be waited on."""
+        return self._recv is not None
+
+    def open(self):
+        """Create the waker's sockets."""
+        with self._lock:
+            try:
+                self._recv, self._send = socket.socketpair()
+            except (AttributeError, socket.error):
+                return
+
+            self._recv.setblocking(False)
+            self._send.setblocking(False)
+            if self._is_set:
+                self._send.send(b'\x00')
+
+    def set(self):
+        """Wake the thread waiting on the waker, if any."""
+        with self._lock:
+            if self._is_set:
+                return
+
+            self._is_set = True
+            if self._send is None:
+                return
+
+            try:
+                self._send.send(b'\x00')
+            except socket.error:
+                pass
+
+
+@contextmanager
+def _thread_stack_size(size):
+    """Context manager for starting threads with a stack of `size` bytes.
+
+    Parameters
+    ----------
+    size : int or None
+        The stack size (in bytes) to use for any threads started within the
+        context, if ``None`` or ``0`` then the current size will be used.
+    """
+    if not size:
+        yield
+        return
+
+    with _STACK_SIZE_LOCK:
+        previous = threading.stack_size(size)
+        try:
+            yield
+        finally:
+            threading.stack_size(previous)
+
+
+class AdmissionControl(object):
+    """Admission control for the connections accepted by an AE's association
+    servers.
+
+    Connection requests are admitted, queued or rejected as soon as they're
+    accepted, before any ``Association`` or thread is created for them.
+    Requests that can't be admitted immediately wait for up to
+    ``AE.admission_timeout`` seconds in a queue of no more than
+    ``AE.admission_queue_size`` requests, after which they're sent an
+    A-ASSOCIATE-RJ with a *local-limit-exceeded* diagnostic and closed.
+
+    A request is admitted while:
+
+    * the number of admitted associations is less than
+      ``AE.maximum_associations``, less ``AE.reserved_associations`` unless
+      the *Calling AE Title* is one of ``AE.priority_ae_titles``
+    * the number of admitted associations with the same *Calling AE Title* is
+      less than ``AE.maximum_associations_per_ae``
+
+    When ``AE.maximum_associations_per_ae`` or ``AE.reserved_associations``
+    are used the *Calling AE Title* is read from the start of the
+    A-ASSOCIATE-RQ without removing it from the connection. This isn't
+    possible with TLS, so requests using TLS are treated as coming from an
+    unknown AE title: the per-AE limit doesn't apply to them and they can't
+    use the reserved associations. Reading the *Calling AE Title* and
+    rejecting requests is done by a single thread shared by all of the AE's
+    servers, so a slow peer never holds up accepting other connections.
+
+    Attributes
+    ----------
+    ae : ae.ApplicationEntity
+        The AE the admission control is for.
+    peek_timeout : float
+        The maximum time (in seconds) to wait for the start of the
+        A-ASSOCIATE-RQ when the *Calling AE Title* is needed to admit or
+        reject a request (default ``0.5``). If it hasn't been received in time
+        the request is treated as coming from an unknown AE title. Also the
+        maximum time to wait for the A-ASSOCIATE-RQ, or the TLS handshake, of
+        a rejected request before replying.
+    """
+    def __init__(self, ae):
+        """Create a new AdmissionControl.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The AE the admission control is for.
+        """
+        self.ae = ae
+        self.peek_timeout = 0.5
+
+        self._lock = threading.Lock()
+        # The number of admitted associations in total and per AE title
+        self._nr_admitted = 0
+        self._admitted = {}
+        # {request socket : AE title} for requests not yet claimed by their
+        #   Association
+        self._unclaimed = {}
+        # Requests waiting to be admitted, in the order they were received
+        self._waiting = deque()
+        # Reads the Calling AE Title of requests and rejects them
+        self._poller = _RequestPoller(self)
+
+    def _can_admit(self, ae_title):
+        """Return True if a request from `ae_title` can be admitted, must hold
+        the lock.
+        """
+        ae = self.ae
+        limit = ae.maximum_associations
+        if ae_title not in ae._priority_titles:
+            limit -= ae.reserved_associations
+
+        if self._nr_admitted >= limit:
+            return False
+
+        per_ae = ae.maximum_associations_per_ae
+        if per_ae and ae_title is not None:
+            return self._admitted.get(ae_title, 0) < per_ae
+
+        return True
+
+    def _admit(self, request, ae_title):
+        """Add an admitted request, must hold the lock."""
+        self._nr_admitted += 1
+        self._admitted[ae_title] = self._admitted.get(ae_title, 0) + 1
+        self._unclaimed[request] = ae_title
+
+    def claim(self, request):
+        """Return the admission for `request` so it can be released when the
+        association ends.
+
+        Parameters
+        ----------
+        request : socket.socket
+            The admitted request's client socket.
+
+        Returns
+        -------
+        tuple of bytes or None
+            The admission, which should be passed to :meth:`release`, or
+            ``None`` if `request` wasn't admitted by the admission control.
+        """
+        with self._lock:
+            if request not in self._unclaimed:
+                return None
+
+            return (self._unclaimed.pop(request), )
+
+    def close(self, server):
+        """Reject any requests waiting to be processed by `server`."""
+        with self._lock:
+            waiting = [item for item in self._waiting if item[0] is server]
+            for item in waiting:
+                self._waiting.remove(item)
+                item[4].stop()
+
+        for (_, request, _, ae_title, _) in waiting:
+            self._reject(server, request, ae_title)
+
+        self._poller.close(server)
+
+    @property
+    def nr_admitted(self):
+        """Return the number of admitted associations."""
+        return self._nr_admitted
+
+    @property
+    def nr_waiting(self):
+        """Return the number of requests waiting to be admitted."""
+        return len(self._waiting)
+
+    def _reject(self, server, request, ae_title):
+        """Send an A-ASSOCIATE-RJ (local-limit-exceeded) and close `request`,
+        never blocks.
+        """
+        LOGGER.info(
+            "Rejecting association request from {}: the local limit has "
+            "been exceeded".format(ae_title or 'an unknown AE')
+        )
+        metrics = self.ae.metrics
+        if metrics.enabled:
+            metrics.associations_rejected.inc(
+                1, (ae_title or b'').decode('ascii', errors='replace')
+            )
+
+        self._poller.add(_PendingRequest(
+            server, request, None, self.peek_timeout, ae_title, is_reject=True
+        ))
+
+    def release(self, admission):
+        """Release an `admission` once its association has ended, admitting
+        any waiting requests that now can be.
+
+        Parameters
+        ----------
+        admission : tuple of bytes or None
+            The admission returned by :meth:`claim`.
+        """
+        with self._lock:
+            ae_title = admission[0]
+            self._nr_admitted -= 1
+            self._admitted[ae_title] -= 1
+            if not self._admitted[ae_title]:
+                del self._admitted[ae_title]
+
+            admitted = []
+            for item in list(self._waiting):
+                if self._can_admit(item[3]):
+                    self._waiting.remove(item)
+                    item[4].stop()
+                    self._admit(item[1], item[3])
+                    admitted.append(item)
+
+        for (server, request, client_address, _, _) in admitted:
+            server._start_request(request, client_address)
+
+    def submit(self, server, request, client_address):
+        """Admit, queue or reject a connection request accepted by `server`.
+
+        Parameters
+        ----------
+        server : transport.AssociationServer
+            The server that accepted the connection.
+        request : socket.socket
+            The client socket.
+        client_address : 2-tuple
+            The ``(host, port)`` of the peer.
+        """
+        ae = self.ae
+        # MSG_PEEK isn't supported with TLS
+        if ((ae.maximum_associations_per_ae or ae.reserved_associations)
+                and not isinstance(request, ssl.SSLSocket)):
+            # Submitted again by the poller once the AE title has been read
+            self._poller.add(_PendingRequest(
+                server, request, client_address, self.peek_timeout
+            ))
+            return
+
+        self._submit(server, request, client_address, None)
+
+    def _submit(self, server, request, client_address, ae_title):
+        """Admit, queue or reject a connection request from `ae_title`."""
+        ae = self.ae
+        with self._lock:
+            is_admitted = self._can_admit(ae_title)
+            if is_admitted:
+                self._admit(request, ae_title)
+            elif ae.admission_timeout and len(self._waiting) < (
+                ae.admission_queue_size
+            ):
+                item = [server, request, client_address, ae_title, None]
+                item[4] = Timer(
+                    ae.admission_timeout, callback=lambda: self._expire(item)
+                )
+                item[4].start()
+                self._waiting.append(item)
+                return
+
+        if is_admitted:
+            server._start_request(request, client_address)
+        else:
+            self._reject(server, request, ae_title)
+
+    def _expire(self, item):
+        """Reject the waiting request `item` once its wait has timed out.
+
+        Called from the timer scheduler's thread, which the rejection doesn't
+        block as it's done by the poller.
+        """
+        with self._lock:
+            if item not in self._waiting:
+                return
+
+            self._waiting.remove(item)
+
+        self._reject(item[0], item[1], item[3])
+
+
+class _PendingRequest(object):
+    """A connection request waiting on a ``_RequestPoller``.
+
+    Attributes
+    ----------
+    ae_title : bytes or None
+        The *Calling AE Title* of the request, if known.
+    client_address : 2-tuple
+        The ``(host, port)`` of the peer.
+    deadline : float
+        The time at which to stop waiting for the peer.
+    is_closed : bool
+        True if the server has been shutdown.
+    is_handshaking : bool
+        True if the TLS handshake must be completed before the request can
+        be rejected.
+    is_reject : bool
+        True if the request is to be rejected, False if the start of its
+        A-ASSOCIATE-RQ is to be read.
+    request : socket.socket
+        The client socket.
+    retry : float or None
+        If not ``None`` then the time at which to try again without waiting
+        for the socket to become readable.
+    server : transport.AssociationServer
+        The server that accepted the request.
+    """
+    def __init__(self, server, request, client_address, timeout, ae_title=None,
+                 is_reject=False):
+        """Create a new _PendingRequest.
+
+        Parameters
+        ----------
+        server : transport.AssociationServer
+            The server that accepted the request.
+        request : socket.socket
+            The client socket.
+        client_address : 2-tuple
+            The ``(host, port)`` of the peer.
+        timeout : float
+            The maximum time (in seconds) to wait for the peer.
+        ae_title : bytes or None, optional
+            The *Calling AE Title* of the request, if known.
+        is_reject : bool, optional
+            True if the request is to be rejected (default False).
+        """
+        self.server = server
+        self.request = request
+        self.client_address = client_address
+        self.ae_title = ae_title
+        self.deadline = time.time() + timeout
+        self.is_reject = is_reject
+        self.is_closed = False
+        self.is_handshaking = is_reject and isinstance(request, ssl.SSLSocket)
+        self.retry = None
+        if self.is_handshaking:
+            # So the handshake can be done without blocking
+            request.setblocking(False)
+
+    def fileno(self):
+        """Return the request socket's file descriptor."""
+        return self.request.fileno()
+
+
+class _RequestPoller(object):
+    """Reads the start of the A-ASSOCIATE-RQ of connection requests and
+    rejects them for an ``AdmissionControl`` without blocking the server
+    that accepted them or the thread that expired them.
+
+    A single thread, started when the first request is added, waits on the
+    sockets of all the pending requests at once and only reads from those
+    with data available, so a slow or idle peer only delays its own
+    request.
+    """
+    def __init__(self, control):
+        """Create a new _RequestPoller.
+
+        Parameters
+        ----------
+        control : transport.AdmissionControl
+            The admission control the requests are for.
+        """
+        self.control = control
+        self._lock = threading.Lock()
+        # {request socket : _PendingRequest}
+        self._pending = {}
+        self._waker = _Waker()
+        self._thread = None
+
+    def add(self, item):
+        """Add the _PendingRequest `item`."""
+        with self._lock:
+            self._pending[item.request] = item
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='AdmissionPoller'
+                )
+                self._thread.daemon = True
+                self._thread.start()
+
+        self._waker.set()
+
+    def close(self, server):
+        """Stop waiting on the requests accepted by `server`, those waiting
+        to have their *Calling AE Title* read are rejected.
+        """
+        with self._lock:
+            for item in self._pending.values():
+                if item.server is server:
+                    item.is_closed = True
+                    item.deadline = 0
+
+        self._waker.set()
+
+    @property
+    def nr_pending(self):
+        """Return the number of pending requests."""
+        return len(self._pending)
+
+    def _peek(self, item, is_expired):
+        """Read the *Calling AE Title* of the request `item` without
+        removing it from the socket, then submit the request for admission.
+        """
+        data = b''
+        try:
+            if _is_readable(item.request, 0):
+                data = item.request.recv(42, socket.MSG_PEEK)
+        except (socket.error, ValueError):
+            pass
+
+        # PDU header (6), protocol version and reserved (4), called AE (16)
+        #   and calling AE (16)
+        if len(data) < 42 and data[:1] == b'\x01' and not is_expired:
+            # Only part of the PDU has arrived so far
+            item.retry = time.time() + 0.001
+            return
+
+        ae_title = None
+        if len(data) == 42 and data[:1] == b'\x01':
+            ae_title = data[26:42].strip()
+
+        self._remove(item)
+        if item.is_closed:
+            self.control._reject(item.server, item.request, ae_title)
+            return
+
+        self.control._submit(
+            item.server, item.request, item.client_address, ae_title
+        )
+
+    def _reject(self, item, is_expired):
+        """Send the request `item` an A-ASSOCIATE-RJ (local-limit-exceeded)
+        and close it.
+        """
+        request = item.request
+        if item.is_handshaking:
+            try:
+                request.do_handshake()
+                item.is_handshaking = False
+            except ssl.SSLWantReadError:
+                pass
+            except ssl.SSLWantWriteError:
+                item.retry = time.time() + 0.001
+            except (socket.error, ValueError):
+                is_expired = True
+
+            if item.is_handshaking:
+                if is_expired:
+                    # Can't reply without completing the handshake
+                    self._remove(item)
+                    item.server.shutdown_request(request)
+
+                return
+
+        try:
+            # Read the A-ASSOCIATE-RQ first so closing the connection with
+            #   unread data doesn't reset it before the peer gets the reply
+            if not isinstance(request, ssl.SSLSocket) and not is_expired:
+                while _is_readable(request, 0):
+                    if not request.recv(65536):
+                        break
+
+            pdu = A_ASSOCIATE_RJ()
+            pdu.result = 0x02
+            pdu.source = 0x03
+            pdu.reason_diagnostic = 0x02
+            request.sendall(pdu.encode())
+        except (socket.error, ValueError):
+            pass
+
+        self._remove(item)
+        item.server.shutdown_request(request)
+
+    def _remove(self, item):
+        """Remove the request `item`."""
+        with self._lock:
+            self._pending.pop(item.request, None)
+
+    def _run(self):
+        """Run the poller loop."""
+        # pylint: disable=broad-except
+        self._waker.open()
+        while True:
+            self._waker.clear()
+            with self._lock:
+                items = list(self._pending.values())
+
+            now = time.time()
+            timeout = None
+            socks = [self._waker]
+            if not self._waker.is_available:
+                timeout = 0.01
+                socks = []
+
+            for item in items:
+                until = item.deadline
+                if item.retry is not None:
+                    until = min(until, item.retry)
+                else:
+                    socks.append(item)
+
+                if timeout is None or until - now < timeout:
+                    timeout = max(until - now, 0)
+
+            try:
+                ready = _wait_readable(socks, timeout)
+            except (select.error, socket.error, ValueError):
+                # Shouldn't happen as only the poller closes the requests
+                ready = items
+
+            now = time.time()
+            for item in items:
+                is_expired = item.deadline <= now
+                is_due = item.retry is not None and item.retry <= now
+                if not (is_expired or is_due or item in ready):
+                    continue
+
+                item.retry = None
+                try:
+                    if item.is_reject:
+                        self._reject(item, is_expired)
+                    else:
+                        self._peek(item, is_expired)
+                except Exception as exc:
+                    LOGGER.error("Exception raised by the admission poller")
+                    LOGGER.exception(exc)
+                    self._remove(item)
+                    item.server.shutdown_request(item.request)
+
 
 class AssociationSocket(object):
     """A wrapper for a ``socket.socket`` object.
@@ -233,13 +899,13 @@ class AssociationSocket(object):
 
         try:
             # Use a timeout of 0 so we get an "instant" result
-            ready, _, _ = select.select([self.socket], [], [], 0)
+            ready = _is_readable(self.socket, 0)
         except (socket.error, socket.timeout, ValueError):
             # Evt17: Transport connection closed
             self.event_queue.put('Evt17')
             return False
 
-        return bool(ready)
+        return ready
 
     def recv(self, nr_bytes):
         """Read `nr_bytes` from the socket.
@@ -305,6 +971,12 @@ class AssociationSocket(object):
                 nr_sent = self.socket.send(bytestream[total_sent:])
                 total_sent += nr_sent
 
+            metrics = self.assoc.ae.metrics
+            if metrics.enabled:
+                metrics.record_pdu(
+                    ord(bytestream[0:1]), length_data, is_received=False
+                )
+
             evt.trigger(self.assoc, evt.EVT_DATA_SENT, {'data' : bytestream})
         except (socket.error, socket.timeout):
             # Evt17: Transport connection closed
@@ -343,6 +1015,8 @@ class RequestHandler(BaseRequestHandler):
 
         assoc = Association(self.ae, MODE_ACCEPTOR)
         assoc._server = self.server
+        # Released by the association once it ends
+        assoc._admission = self.ae._admission.claim(self.request)
 
         # Set the thread name
         timestamp = datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
@@ -362,9 +1036,8 @@ class RequestHandler(BaseRequestHandler):
         assoc.acceptor.implementation_version_name = (
             self.ae.implementation_version_name
         )
-        assoc.acceptor.supported_contexts = deepcopy(
-            self.ae.supported_contexts
-        )
+        # Shared with the other acceptors and only copied if modified
+        assoc.acceptor._share_contexts(self.ae._get_supported_snapshot())
 
         # Association Requestor object -> remote AE
         assoc.requestor.address = self.remote[0]
@@ -384,7 +1057,11 @@ class RequestHandler(BaseRequestHandler):
             assoc, evt.EVT_CONN_OPEN, {'address' : self.client_address}
         )
 
-        assoc.start()
+        if self.server._pool is not None:
+            # Already running in one of the server's worker threads
+            assoc._run_in_worker()
+        else:
+            assoc.start()
 
     @property
     def local(self):
@@ -412,14 +1089,20 @@ class AssociationServer(TCPServer):
     ae : ae.ApplicationEntity
         The parent AE that is running the server.
     request_queue_size : int
-        Default ``5``.
+        The maximum number of connections waiting to be accepted that the
+        listen socket will queue, further connection attempts may be refused
+        by the OS (default ``5``).
     server_address : 2-tuple
         The ``(host, port)`` that the server is running on.
     ssl_context : ssl.SSLContext or None
         The ``SSLContext`` used to wrap client sockets, or ``None`` if no TLS
         is required (default).
+    thread_stack_size : int or None
+        The stack size (in bytes) of the threads started for the server's
+        associations, or ``None`` to use the default size (default).
     """
-    def __init__(self, ae, address, ssl_context=None, evt_handlers=None):
+    def __init__(self, ae, address, ssl_context=None, evt_handlers=None,
+                 request_queue_size=None, thread_stack_size=None):
         """Create a new AssociationServer, bind a socket and start listening.
 
         Parameters
@@ -435,10 +1118,23 @@ class AssociationServer(TCPServer):
         evt_handlers : list of 2-tuple, optional
             A list of ``(event, callable)``, the *callable* function to run
             when *event* occurs.
+        request_queue_size : int, optional
+            The size of the listen socket's backlog of connections waiting
+            to be accepted, if not used then defaults to ``5``.
+        thread_stack_size : int, optional
+            The stack size (in bytes) to use for the threads started for the
+            server's associations, must be at least 32 KiB. If not used then
+            the default size will be used.
         """
         self.ae = ae
         self.ssl_context = ssl_context
         self.allow_reuse_address = True
+        if request_queue_size is not None:
+            self.request_queue_size = request_queue_size
+
+        self.thread_stack_size = thread_stack_size
+        # The pool of worker threads used to process requests, if any
+        self._pool = None
 
         TCPServer.__init__(
             self, address, RequestHandler, bind_and_activate=True
@@ -501,12 +1197,10 @@ class AssociationServer(TCPServer):
 
     @property
     def active_associations(self):
-        """Return the server's running ``Association`` acceptor instances"""
-        # Find all AcceptorThreads with `_server` as self
-        threads = [
-            tt for tt in threading.enumerate() if 'AcceptorThread' in tt.name
-        ]
-        return [tt for tt in threads if tt._server is self]
+        """Return the server's running ``Association`` acceptor instances,
+        including those run by worker threads.
+        """
+        return self.ae.registry.associations(server=self)
 
     def get_events(self):
         """Return a list of currently bound events."""
@@ -538,7 +1232,9 @@ class AssociationServer(TCPServer):
         """Handle a connection request.
 
         If ``ssl_context`` is set then the client socket will be wrapped using
-        ``ssl_context.wrap_socket()``.
+        ``ssl_context.wrap_socket()``. The TLS handshake isn't performed until
+        the request is processed so that a slow client doesn't hold up
+        accepting other connections.
 
         Returns
         -------
@@ -549,14 +1245,53 @@ class AssociationServer(TCPServer):
         """
         client_socket, address = self.socket.accept()
         if self.ssl_context:
-            client_socket = self.ssl_context.wrap_socket(client_socket,
-                                                         server_side=True)
+            client_socket = self.ssl_context.wrap_socket(
+                client_socket,
+                server_side=True,
+                do_handshake_on_connect=False
+            )
 
         return client_socket, address
 
+    def finish_request(self, request, client_address):
+        """Finish processing a connection request, performing the TLS
+        handshake first if required.
+        """
+        if isinstance(request, ssl.SSLSocket):
+            try:
+                request.do_handshake()
+            except (socket.error, ssl.SSLError) as exc:
+                LOGGER.error(
+                    "TLS handshake with {} failed: {}"
+                    .format(client_address[0], exc)
+                )
+                self.shutdown_request(request)
+                self._release_request(request)
+                return
+
+        TCPServer.finish_request(self, request, client_address)
+
     def process_request(self, request, client_address):
-        """Process a connection request."""
-        self.finish_request(request, client_address)
+        """Process a connection request, subject to the AE's admission
+        control.
+        """
+        self.ae._admission.submit(self, request, client_address)
+
+    def _release_request(self, request):
+        """Release the admission of a `request` that failed to start."""
+        admission = self.ae._admission.claim(request)
+        if admission is not None:
+            self.ae._admission.release(admission)
+
+    def _start_request(self, request, client_address):
+        """Start processing an admitted connection request."""
+        # pylint: disable=broad-except
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            self._release_request(request)
 
     def server_bind(self):
         """Bind the socket and set the socket options.
@@ -603,6 +1338,7 @@ class AssociationServer(TCPServer):
         """Completely shutdown the server and close it's socket."""
         TCPServer.shutdown(self)
         self.server_close()
+        self.ae._admission.close(self)
         self.ae._servers.remove(self)
 
     def unbind(self, event, handler):
@@ -637,7 +1373,60 @@ class AssociationServer(TCPServer):
 
 
 class ThreadedAssociationServer(ThreadingMixIn, AssociationServer):
-    """An ``AssociationServer`` suitable for threading."""
+    """An ``AssociationServer`` suitable for threading.
+
+    By default each connection request is processed in a new thread, which
+    then runs the ``Association``. If `worker_threads` is used then requests
+    are instead processed by a fixed pool of reusable worker threads, each of
+    which runs one association at a time.
+    """
+    # Admission control runs before a thread is started for the request
+    process_request = AssociationServer.process_request
+
+    def __init__(self, ae, address, ssl_context=None, evt_handlers=None,
+                 request_queue_size=None, thread_stack_size=None,
+                 worker_threads=None, worker_queue_size=10):
+        """Create a new ThreadedAssociationServer, bind a socket and start
+        listening.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The parent AE that's running the server.
+        address : 2-tuple
+            The ``(host, port)`` that the server should run on.
+        ssl_context : ssl.SSLContext, optional
+            If TLS is to be used then this should be the ``ssl.SSLContext``
+            used to wrap the client sockets, otherwise if ``None`` then no
+            TLS will beused (default).
+        evt_handlers : list of 2-tuple, optional
+            A list of ``(event, callable)``, the *callable* function to run
+            when *event* occurs.
+        request_queue_size : int, optional
+            The size of the listen socket's backlog of connections waiting
+            to be accepted, if not used then defaults to ``5``.
+        thread_stack_size : int, optional
+            The stack size (in bytes) to use for the threads started for the
+            server's associations, must be at least 32 KiB. If not used then
+            the default size will be used.
+        worker_threads : int, optional
+            If used then the number of worker threads to start for
+            processing connection requests, otherwise a new thread will be
+            started for each request (default).
+        worker_queue_size : int, optional
+            The maximum number of admitted connection requests waiting for a
+            free worker thread (default ``10``), further requests will be
+            rejected. Only used with `worker_threads`.
+        """
+        AssociationServer.__init__(
+            self, ae, address, ssl_context, evt_handlers=evt_handlers,
+            request_queue_size=request_queue_size,
+            thread_stack_size=thread_stack_size
+        )
+
+        if worker_threads:
+            self._pool = WorkerPool(self, worker_threads, worker_queue_size)
+
     def process_request_thread(self, request, client_address):
         """Process a connection request."""
         # pylint: disable=broad-except
@@ -646,3 +1435,156 @@ class ThreadedAssociationServer(ThreadingMixIn, AssociationServer):
         except Exception:
             self.handle_error(request, client_address)
             self.shutdown_request(request)
+            self._release_request(request)
+
+    def shutdown(self):
+        """Completely shutdown the server and close it's socket."""
+        AssociationServer.shutdown(self)
+        if self._pool is not None:
+            self._pool.close()
+
+    def _start_request(self, request, client_address):
+        """Start processing an admitted connection request in a new thread,
+        or in a worker thread if the server has a pool of them.
+        """
+        if self._pool is not None:
+            self._pool.submit(request, client_address)
+            return
+
+        # pylint: disable=broad-except
+        try:
+            with _thread_stack_size(self.thread_stack_size):
+                ThreadingMixIn.process_request(self, request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            self._release_request(request)
+
+
+class WorkerPool(object):
+    """A fixed pool of worker threads for processing the connection requests
+    accepted by a ``ThreadedAssociationServer``.
+
+    The worker threads are started when the pool is created and each
+    processes one connection request at a time, running its association to
+    completion before taking the next request. Requests waiting for a free
+    worker are kept in a queue of at most `queue_size` requests, if the queue
+    is full then the request is sent an A-ASSOCIATE-RJ with a
+    *local-limit-exceeded* diagnostic and closed.
+
+    Attributes
+    ----------
+    queue_size : int
+        The maximum number of requests waiting for a worker.
+    server : transport.ThreadedAssociationServer
+        The server the pool is processing requests for.
+    workers : list of threading.Thread
+        The pool's worker threads.
+    """
+    def __init__(self, server, nr_workers, queue_size=10):
+        """Create a new WorkerPool and start its worker threads.
+
+        Parameters
+        ----------
+        server : transport.ThreadedAssociationServer
+            The server to process connection requests for.
+        nr_workers : int
+            The number of worker threads to start.
+        queue_size : int, optional
+            The maximum number of requests waiting for a worker (default
+            ``10``).
+        """
+        self.server = server
+        self.queue_size = queue_size
+        # Unbounded so closing never blocks, `queue_size` is checked on submit
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._is_closed = False
+        # The number of workers waiting for a request
+        self._nr_idle = 0
+
+        self.workers = []
+        with _thread_stack_size(server.thread_stack_size):
+            for ii in range(nr_workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    name="AssociationWorker-{}".format(ii + 1)
+                )
+                thread.daemon = True
+                thread.start()
+                self.workers.append(thread)
+
+    def close(self):
+        """Stop the worker threads once they're idle and reject any waiting
+        requests.
+        """
+        with self._lock:
+            self._is_closed = True
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is not None:
+                self._reject(*item)
+
+        for _ in self.workers:
+            self._queue.put(None)
+
+    @property
+    def nr_idle(self):
+        """Return the number of worker threads waiting for a request."""
+        return self._nr_idle
+
+    @property
+    def nr_waiting(self):
+        """Return the number of requests waiting for a worker thread."""
+        return self._queue.qsize()
+
+    def _reject(self, request, client_address):
+        """Reject a connection request that can't be processed."""
+        server = self.server
+        server.ae._admission._reject(server, request, None)
+        server._release_request(request)
+
+    def _run(self):
+        """Process connection requests until the pool is closed."""
+        while True:
+            with self._lock:
+                self._nr_idle += 1
+
+            item = self._queue.get()
+            with self._lock:
+                self._nr_idle -= 1
+
+            if item is None:
+                break
+
+            self.server.process_request_thread(*item)
+
+    def submit(self, request, client_address):
+        """Queue a connection request to be processed by a worker thread.
+
+        Parameters
+        ----------
+        request : socket.socket
+            The client socket.
+        client_address : 2-tuple
+            The ``(host, port)`` of the peer.
+        """
+        with self._lock:
+            is_queued = (
+                not self._is_closed
+                and self._queue.qsize() < self.queue_size + self._nr_idle
+            )
+            if is_queued:
+                self._queue.put((request, client_address))
+
+        if not is_queued:
+            LOGGER.warning(
+                "No association worker available for the request from {}"
+                .format(client_address[0])
+            )
+            self._reject(request, client_address)
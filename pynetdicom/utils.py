@@ -11,6 +11,24 @@ from pynetdicom import _config
 
 LOGGER = logging.getLogger('pynetdicom.utils')
 
+# Cached validation results, {ae_title : valid AE title} and
+#   {(uid, _config.ENFORCE_UID_CONFORMANCE) : bool}. The same AE titles and
+#   UIDs are validated repeatedly so caching the results avoids the cost of
+#   validating them every time
+_VALID_AE_TITLES = {}
+_VALID_UIDS = {}
+# The maximum number of results to cache for each, the cache is cleared
+#   when full
+_MAX_CACHED_RESULTS = 4096
+
+
+def _cache_result(cache, key, value):
+    """Add `value` to `cache` as `key`, clearing `cache` first if full."""
+    if len(cache) >= _MAX_CACHED_RESULTS:
+        cache.clear()
+
+    cache[key] = value
+
 
 def pretty_bytes(bytestream, prefix='  ', delimiter='  ', items_per_line=16,
                  max_size=512, suffix=''):
@@ -115,6 +133,12 @@ def validate_ae_title(ae_title):
             "AE titles must be str or bytes"
         )
 
+    valid_ae_title = _VALID_AE_TITLES.get(ae_title)
+    if valid_ae_title is not None:
+        return valid_ae_title
+
+    original = ae_title
+
     # Python 2 - convert string to unicode
     if sys.version_info[0] == 2:
         ae_title = unicode(ae_title)
@@ -148,7 +172,10 @@ def validate_ae_title(ae_title):
         )
 
     # Return as bytes (python 3) or str (python 2)
-    return ae_title.encode('ascii', errors='strict')
+    ae_title = ae_title.encode('ascii', errors='strict')
+    _cache_result(_VALID_AE_TITLES, original, ae_title)
+
+    return ae_title
 
 
 def validate_uid(uid):
@@ -178,10 +205,16 @@ def validate_uid(uid):
     bool
         True if the value is considered valid, False otherwise.
     """
+    key = (uid, _config.ENFORCE_UID_CONFORMANCE)
+    is_valid = _VALID_UIDS.get(key)
+    if is_valid is not None:
+        return is_valid
+
     if _config.ENFORCE_UID_CONFORMANCE:
-        return uid.is_valid
+        is_valid = uid.is_valid
+    else:
+        is_valid = 0 < len(uid) < 65
 
-    if 0 < len(uid) < 65:
-        return True
+    _cache_result(_VALID_UIDS, key, is_valid)
 
-    return False
+    return is_valid